@@ -0,0 +1,66 @@
+{% macro runs_to_build() %}
+{#
+    Returns a subquery of the run_ids an incremental model has to (re)build.
+
+    A run needs building when the loader has (re)loaded any of its raw
+    partitions since the model last wrote rows for it, according to
+    raw_load_manifest.loaded_at and the model's own dbt_updated_at. Runs
+    already built from their current raw data are skipped, so a build after
+    loading one run only processes that run.
+
+    Only meaningful inside is_incremental(); use incremental_run_filter()
+    in model SQL.
+#}
+    select m.run_id
+    from (
+        select run_id, max(loaded_at) as loaded_at
+        from {{ source('raw', 'raw_load_manifest') }}
+        group by run_id
+    ) m
+    where m.loaded_at > coalesce(
+        (select max(t.dbt_updated_at) from {{ this }} t where t.run_id = m.run_id),
+        '-infinity'::timestamptz
+    )
+{% endmacro %}
+
+
+{% macro incremental_run_filter(column='run_id') %}
+{#
+    Restricts a model's input to the runs that need building.
+
+    Renders to `true` on the first build and with --full-refresh, so the
+    model is built for every run.
+
+    Args:
+        column: Run ID column (qualified if the query needs it)
+
+    Usage in model SQL:
+        {{ config(materialized='incremental', incremental_strategy='delete+insert', unique_key='run_id') }}
+
+        select * from {{ ref('stg_entity_results') }}
+        where {{ incremental_run_filter() }}
+#}
+    {%- if is_incremental() -%}
+        {{ column }} in ({{ runs_to_build() }})
+    {%- else -%}
+        true
+    {%- endif -%}
+{% endmacro %}
+
+
+{% macro delete_unloaded_runs() %}
+{#
+    Deletes rows for runs that are no longer in raw_load_manifest (e.g.
+    after loading with --drop-other-runs), which delete+insert by run_id
+    would otherwise keep forever.
+
+    Usage in model config:
+        {{ config(pre_hook="{{ delete_unloaded_runs() }}") }}
+#}
+    {%- if is_incremental() -%}
+        delete from {{ this }}
+        where run_id not in (select run_id from {{ source('raw', 'raw_load_manifest') }})
+    {%- else -%}
+        select 1
+    {%- endif -%}
+{% endmacro %}
@@ -26,6 +26,11 @@
         index_name: Name for the index (should follow naming convention: idx_{table}_{columns})
         columns: List of column names to index
         unique: Boolean, whether to create a unique index (default: false)
+
+    Table materializations swap the new relation in before post-hooks run
+    and drop the old one afterwards, so an index with the same name may
+    still exist on the old relation. That index is dropped first, otherwise
+    "if not exists" would skip creating it on the new table.
     
     Usage in model post-hook:
         {{ config(
@@ -37,7 +42,19 @@
 #}
     {% set unique_clause = 'unique' if unique else '' %}
     {% set column_list = columns | join(', ') %}
-    
+
+    do $$
+    begin
+        if exists (
+            select 1 from pg_indexes
+            where schemaname = '{{ this.schema }}'
+              and indexname = '{{ index_name }}'
+              and tablename <> '{{ this.identifier }}'
+        ) then
+            drop index {{ adapter.quote(this.schema) }}.{{ index_name }};
+        end if;
+    end $$;
+
     create {{ unique_clause }} index if not exists {{ index_name }}
     on {{ this }} ({{ column_list }})
 {% endmacro %}
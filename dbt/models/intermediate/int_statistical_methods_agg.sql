@@ -8,6 +8,7 @@
 --
 -- Output columns:
 --   - entity_result_id (PK)
+--   - run_id
 --   - statistical_methods (JSONB array of all methods)
 --   - primary_* columns (scalar values from simple_zscore method for display)
 --   - *_anomaly columns (pivoted anomaly labels)
@@ -16,9 +17,14 @@
 
 {{
     config(
-        materialized='table',
+        materialized='incremental',
+        incremental_strategy='delete+insert',
+        unique_key='run_id',
+        on_schema_change='append_new_columns',
+        pre_hook="{{ delete_unloaded_runs() }}",
         tags=['intermediate', 'statistics'],
         indexes=[
+            {'columns': ['run_id']},
             {'columns': ['entity_result_id']}
         ]
     )
@@ -26,6 +32,7 @@
 
 with statistical_methods as (
     select * from {{ ref('stg_statistical_methods') }}
+    where {{ incremental_run_filter() }}
 ),
 
 anomaly_labels as (
@@ -52,6 +59,8 @@ methods_with_anomalies as (
 aggregated as (
     select
         entity_result_id,
+        -- entity_result_id already includes run_id; carried for incremental builds
+        run_id,
 
         -- Aggregate all methods into a JSONB array
         jsonb_agg(
@@ -125,7 +134,7 @@ aggregated as (
         current_timestamp as dbt_updated_at
 
     from methods_with_anomalies
-    group by entity_result_id
+    group by entity_result_id, run_id
 )
 
 select * from aggregated
@@ -15,9 +15,14 @@
 
 {{
     config(
-        materialized='table',
+        materialized='incremental',
+        incremental_strategy='delete+insert',
+        unique_key='run_id',
+        on_schema_change='append_new_columns',
+        pre_hook="{{ delete_unloaded_runs() }}",
         tags=['intermediate', 'temporal'],
         indexes=[
+            {'columns': ['run_id']},
             {'columns': ['aggregate_node_id', 'run_id', 'facility_id', 'entity_dimensions_hash']}
         ]
     )
@@ -32,6 +37,7 @@ with edges as (
     from {{ ref('stg_node_edges') }}
     where edge_type = 'trends_to'
       and edge_direction = 'child'
+      and {{ incremental_run_filter() }}
 ),
 
 percentile_trends as (
@@ -42,6 +48,7 @@ percentile_trends as (
         run_id,
         percentile_trends
     from {{ ref('stg_percentile_trends') }}
+    where {{ incremental_run_filter() }}
     order by canonical_node_id, run_id, loaded_at desc
 ),
 
@@ -61,6 +68,7 @@ temporal_entity_results as (
     inner join edges e
         on er.canonical_node_id = e.temporal_node_id
         and er.run_id = e.run_id
+    where {{ incremental_run_filter('er.run_id') }}
 ),
 
 temporal_methods as (
@@ -78,6 +86,7 @@ temporal_methods as (
         sm.mean_robust_zscore,
         sm.monthly_z_scores
     from {{ ref('int_statistical_methods_agg') }} sm
+    where {{ incremental_run_filter('sm.run_id') }}
 ),
 
 joined as (
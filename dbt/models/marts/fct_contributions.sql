@@ -8,11 +8,25 @@
 -- 1. Signal detail panel: "Which sub-service lines drive this anomaly?"
 -- 2. Impact sorting: Rank signals by contribution_weight
 -- 3. Drill-down navigation: Navigate from parent to child signals
+--
+-- Index pack (post-hooks) for the backend query catalog, checked by
+-- tests/integration/test_mart_query_plans.py:
+--   - idx_fct_contributions_parent: downward lookup by parent node,
+--     facility and service line, ordered by contribution_rank
+--   - idx_fct_contributions_child: upward lookup by child facility,
+--     metric, service line and sub-service line
+--   - idx_fct_contributions_rank_weight: top contributors
+--     (contribution_rank = 1 ordered by contribution_weight)
 
 {{
     config(
         materialized='table',
-        tags=['marts', 'fact', 'contribution']
+        tags=['marts', 'fact', 'contribution'],
+        post_hook=[
+            "{{ create_index_if_not_exists('idx_fct_contributions_parent', ['parent_node_id', 'parent_facility_id', 'parent_service_line', 'contribution_rank']) }}",
+            "{{ create_index_if_not_exists('idx_fct_contributions_child', ['child_facility_id', 'metric_id', 'child_service_line', 'child_sub_service_line', 'contribution_rank']) }}",
+            "{{ create_index_if_not_exists('idx_fct_contributions_rank_weight', ['contribution_rank', 'contribution_weight']) }}"
+        ]
     )
 }}
 
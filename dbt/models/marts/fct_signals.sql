@@ -7,11 +7,31 @@
 --
 -- This model replaces JSON file loading in SignalHydrator by providing
 -- all signal data in a single queryable table.
+--
+-- Index pack (post-hooks) for the backend query catalog, checked by
+-- tests/integration/test_mart_query_plans.py:
+--   - idx_fct_signals_node_hash: technical details lookup by
+--     canonical_node_id + entity_dimensions_hash (SignalHydrator)
+--   - idx_fct_signals_node_metric: hydration scan ordered by
+--     canonical_node_id, metric_id (SignalHydrator)
+--   - idx_fct_signals_facility: in-database hydration chunks by facility_id
 
 {{
     config(
-        materialized='table',
-        tags=['marts', 'fact', 'signal']
+        materialized='incremental',
+        incremental_strategy='delete+insert',
+        unique_key='run_id',
+        on_schema_change='append_new_columns',
+        pre_hook="{{ delete_unloaded_runs() }}",
+        tags=['marts', 'fact', 'signal'],
+        indexes=[
+            {'columns': ['run_id']}
+        ],
+        post_hook=[
+            "{{ create_index_if_not_exists('idx_fct_signals_node_hash', ['canonical_node_id', 'entity_dimensions_hash']) }}",
+            "{{ create_index_if_not_exists('idx_fct_signals_node_metric', ['canonical_node_id', 'metric_id']) }}",
+            "{{ create_index_if_not_exists('idx_fct_signals_facility', ['facility_id', 'run_id']) }}"
+        ]
     )
 }}
 
@@ -35,6 +55,7 @@ with entity_base as (
         e.metric_timeline,
         e.metadata
     from {{ ref('stg_entity_results') }} e
+    where {{ incremental_run_filter('e.run_id') }}
 ),
 
 with_methods as (
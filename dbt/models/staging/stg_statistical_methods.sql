@@ -12,13 +12,21 @@
 
 {{
     config(
-        materialized='table',
-        tags=['staging', 'nodes', 'statistics']
+        materialized='incremental',
+        incremental_strategy='delete+insert',
+        unique_key='run_id',
+        on_schema_change='append_new_columns',
+        pre_hook="{{ delete_unloaded_runs() }}",
+        tags=['staging', 'nodes', 'statistics'],
+        indexes=[
+            {'columns': ['run_id']}
+        ]
     )
 }}
 
 with entity_results as (
     select * from {{ ref('stg_entity_results') }}
+    where {{ incremental_run_filter() }}
 ),
 
 -- Unnest statistical_methods array
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Benchmark list_signals throughput across connection pool settings.
+
+Runs GET /api/signals in-process (httpx ASGI transport, no network) with
+N concurrent clients for each pool configuration and concurrency level,
+and prints requests/second and latency percentiles. Each configuration gets
+its own engine built with src.db.session.engine_options, so the numbers
+reflect the pool and statement cache, not the HTTP server.
+
+Requires a populated signals table (DATABASE_URL).
+
+Usage:
+    # Default configurations at 50/200/500 clients
+    UV_CACHE_DIR=.uv-cache uv run python scripts/benchmark_pool_settings.py
+
+    # Custom configurations (DB_* setting names without the prefix)
+    UV_CACHE_DIR=.uv-cache uv run python scripts/benchmark_pool_settings.py \
+        --config pool_size=5,max_overflow=10 \
+        --config pool_size=20,max_overflow=0,pool_pre_ping=false \
+        --clients 50 --clients 200 --duration 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import Settings, settings
+from src.db.session import engine_options, get_async_read_session
+from src.main import create_app
+
+DEFAULT_CONFIGS = [
+    "pool_size=5,max_overflow=10",
+    "pool_size=5,max_overflow=10,pool_pre_ping=false",
+    "pool_size=20,max_overflow=20,pool_pre_ping=false",
+    "pool_size=20,max_overflow=20,pool_pre_ping=false,statement_cache_size=0",
+]
+DEFAULT_CLIENTS = [50, 200, 500]
+
+
+@dataclass
+class BenchmarkResult:
+    """Outcome of one configuration at one concurrency level."""
+
+    config: str
+    clients: int
+    elapsed: float
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """Successful requests per second."""
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, q: int) -> float:
+        """Latency percentile in milliseconds."""
+        if len(self.latencies) < 2:
+            return self.latencies[0] * 1000 if self.latencies else 0.0
+        return statistics.quantiles(self.latencies, n=100)[q - 1] * 1000
+
+
+def parse_config(spec: str) -> Settings:
+    """Build Settings from a "key=value,..." spec of DB_* overrides.
+
+    Args:
+        spec: Comma-separated overrides, e.g. "pool_size=20,pool_pre_ping=false".
+
+    Returns:
+        Settings with the overrides applied to the current settings.
+    """
+    overrides = {}
+    for item in filter(None, spec.split(",")):
+        key, _, value = item.partition("=")
+        overrides[f"DB_{key.strip().upper()}"] = value.strip()
+    return Settings.model_validate({**settings.model_dump(), **overrides})
+
+
+async def run_level(config: str, clients: int, duration: float, limit: int) -> BenchmarkResult:
+    """Run list_signals with a number of concurrent clients for a duration.
+
+    Args:
+        config: Pool configuration spec.
+        clients: Number of concurrent clients.
+        duration: Seconds to run.
+        limit: Page size requested from list_signals.
+
+    Returns:
+        BenchmarkResult with per-request latencies.
+    """
+    engine = create_async_engine(settings.DATABASE_URL, **engine_options(parse_config(config)))
+    session_maker = async_sessionmaker(engine.execution_options(postgresql_readonly=True), class_=AsyncSession, expire_on_commit=False)
+
+    async def read_session() -> AsyncGenerator[AsyncSession, None]:
+        async with session_maker() as session:
+            yield session
+
+    app = create_app()
+    app.dependency_overrides[get_async_read_session] = read_session
+    result = BenchmarkResult(config=config, clients=clients, elapsed=0.0)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        # Warm the pool and statement caches outside the measurement
+        await asyncio.gather(*(client.get("/api/signals", params={"limit": limit}) for _ in range(min(clients, 20))))
+
+        deadline = time.perf_counter() + duration
+
+        async def worker() -> None:
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await client.get("/api/signals", params={"limit": limit})
+                except Exception:
+                    result.errors += 1
+                    continue
+                if response.status_code == 200:
+                    result.latencies.append(time.perf_counter() - started)
+                else:
+                    result.errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        result.elapsed = time.perf_counter() - started
+
+    await engine.dispose()
+    return result
+
+
+async def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark list_signals across connection pool settings")
+    parser.add_argument(
+        "--config",
+        action="append",
+        help="Pool configuration as DB_* overrides without the prefix, e.g. pool_size=20,pool_pre_ping=false (repeatable)",
+    )
+    parser.add_argument(
+        "--clients",
+        action="append",
+        type=int,
+        help="Concurrent clients (repeatable, default: 50, 200, 500)",
+    )
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per run (default: 10)")
+    parser.add_argument("--limit", type=int, default=25, help="list_signals page size (default: 25)")
+    args = parser.parse_args()
+
+    configs = args.config or DEFAULT_CONFIGS
+    levels = args.clients or DEFAULT_CLIENTS
+
+    print(f"{'config':<72} {'clients':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for config in configs:
+        for clients in levels:
+            result = await run_level(config, clients, args.duration, args.limit)
+            print(
+                f"{config:<72} {clients:>7} {result.throughput:>9.1f} "
+                f"{result.percentile(50):>8.1f} {result.percentile(95):>8.1f} {result.percentile(99):>8.1f} {result.errors:>7}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -30,10 +30,25 @@ Environment Variables:
     RUNS_ROOT: Root directory for run outputs
     INSIGHT_GRAPH_RUN: Relative path to insight graph run
 
+Loading:
+    - Each table is loaded by a generator pipeline: file -> line iterator ->
+      batches of --batch-size rows -> COPY writer, so memory is bounded by
+      the batch and buffer size rather than the size of the run
+    - Rows are streamed into each table with PostgreSQL COPY FROM STDIN
+      through a bounded in-memory buffer (--copy-buffer-mb)
+    - Progress (rows, rows/sec, files done) is logged every few seconds
+    - With --workers N, files are parsed in N processes and the four tables
+      load concurrently, each through its own COPY connection; each table
+      keeps about N COPY buffers of source data in flight (or one file, if
+      larger), so memory does not grow with file count or size otherwise
+    - A per-table rows/sec report is logged at the end of the load
+
 Idempotency:
-    - Uses TRUNCATE before loading to ensure clean state
-    - Re-running the script replaces all data with fresh load
-    - Consider using partitioned tables for incremental loads in production
+    - Raw tables are partitioned by run_id; loading a run replaces only that
+      run's partition, so several runs can coexist for comparison
+    - raw_load_manifest records a checksum of each partition's source files;
+      re-loading a run whose files are unchanged is a no-op (--force reloads)
+    - --drop-other-runs keeps only the loaded run
 
 Author: Quality Compass Team
 """
@@ -41,16 +56,29 @@ Author: Quality Compass Team
 from __future__ import annotations
 
 import argparse
+import hashlib
+import io
+import itertools
+import json
 import logging
+import re
 import sys
+import time
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
 from sqlalchemy import create_engine, text
 
 if TYPE_CHECKING:
+    from types import TracebackType
+
     from sqlalchemy.engine import Engine
 
 # Configure logging
@@ -63,52 +91,89 @@ logger = logging.getLogger(__name__)
 
 
 # Table DDL definitions
+# Insight graph raw tables are list-partitioned by run_id: each load writes
+# one run's partition, so runs coexist and reloading a run touches only it.
 RAW_NODE_RESULTS_DDL = """
 CREATE TABLE IF NOT EXISTS raw_node_results (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     run_id VARCHAR(255) NOT NULL,
     file_path TEXT,
     json_data TEXT NOT NULL,
-    loaded_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-);
-CREATE INDEX IF NOT EXISTS idx_raw_node_results_run_id ON raw_node_results(run_id);
+    loaded_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (run_id, id)
+) PARTITION BY LIST (run_id);
 """
 
 RAW_CONTRIBUTIONS_DDL = """
 CREATE TABLE IF NOT EXISTS raw_contributions (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     run_id VARCHAR(255) NOT NULL,
     file_path TEXT,
     json_data TEXT NOT NULL,
-    loaded_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-);
-CREATE INDEX IF NOT EXISTS idx_raw_contributions_run_id ON raw_contributions(run_id);
+    loaded_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (run_id, id)
+) PARTITION BY LIST (run_id);
 """
 
 RAW_CLASSIFICATIONS_DDL = """
 CREATE TABLE IF NOT EXISTS raw_classifications (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     run_id VARCHAR(255) NOT NULL,
     file_path TEXT,
     json_data TEXT NOT NULL,
-    loaded_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-);
-CREATE INDEX IF NOT EXISTS idx_raw_classifications_run_id ON raw_classifications(run_id);
+    loaded_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (run_id, id)
+) PARTITION BY LIST (run_id);
 """
 
 RAW_ENTITY_RESULTS_DDL = """
 CREATE TABLE IF NOT EXISTS raw_entity_results (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     run_id VARCHAR(255) NOT NULL,
     canonical_node_id VARCHAR(512) NOT NULL,
     file_path TEXT,
     json_data TEXT NOT NULL,
-    loaded_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-);
-CREATE INDEX IF NOT EXISTS idx_raw_entity_results_run_id ON raw_entity_results(run_id);
+    loaded_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (run_id, id)
+) PARTITION BY LIST (run_id);
 CREATE INDEX IF NOT EXISTS idx_raw_entity_results_node_id ON raw_entity_results(canonical_node_id);
+-- Entity fields flattened at load time so stg_entity_results does not explode the JSON
+ALTER TABLE raw_entity_results
+    ADD COLUMN IF NOT EXISTS facility_id VARCHAR(255),
+    ADD COLUMN IF NOT EXISTS service_line TEXT,
+    ADD COLUMN IF NOT EXISTS sub_service_line TEXT,
+    ADD COLUMN IF NOT EXISTS system_name TEXT,
+    ADD COLUMN IF NOT EXISTS entity_dimensions JSONB,
+    ADD COLUMN IF NOT EXISTS entity_dimensions_hash VARCHAR(32),
+    ADD COLUMN IF NOT EXISTS metric_id VARCHAR(255),
+    ADD COLUMN IF NOT EXISTS metric_value NUMERIC,
+    ADD COLUMN IF NOT EXISTS metric_timeline JSONB,
+    ADD COLUMN IF NOT EXISTS entity_fields JSONB,
+    ADD COLUMN IF NOT EXISTS encounters INTEGER,
+    ADD COLUMN IF NOT EXISTS metadata JSONB,
+    ADD COLUMN IF NOT EXISTS metadata_per_period JSONB,
+    ADD COLUMN IF NOT EXISTS statistical_methods JSONB;
 """
 
+# One row per (table, run) partition; checksum identifies the source files loaded
+RAW_LOAD_MANIFEST_DDL = """
+CREATE TABLE IF NOT EXISTS raw_load_manifest (
+    table_name VARCHAR(255) NOT NULL,
+    run_id VARCHAR(255) NOT NULL,
+    partition_name VARCHAR(63) NOT NULL,
+    checksum VARCHAR(64) NOT NULL,
+    row_count BIGINT NOT NULL,
+    loaded_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (table_name, run_id)
+);
+"""
+
+# Tables partitioned by run_id
+PARTITIONED_RAW_TABLES = ["raw_node_results", "raw_contributions", "raw_classifications", "raw_entity_results"]
+
+# Mixed into source checksums; bump when the rows written for the same files change
+RAW_FORMAT_VERSION = 3
+
 # Modeling table stubs - created empty so dbt source tests pass even when
 # the modeling stage is skipped. When modeling runs, load_modeling_to_dbt.py
 # will truncate and reload these tables with actual data.
@@ -137,8 +202,179 @@ CREATE INDEX IF NOT EXISTS idx_raw_modeling_experiments_run_id ON raw_modeling_e
 """
 
 
+# Columns written per raw table, in COPY order
+RAW_TABLE_COLUMNS = ["run_id", "file_path", "json_data", "loaded_at"]
+RAW_ENTITY_RESULTS_COLUMNS = [
+    "run_id",
+    "canonical_node_id",
+    "file_path",
+    "json_data",
+    "loaded_at",
+    "facility_id",
+    "service_line",
+    "sub_service_line",
+    "system_name",
+    "entity_dimensions",
+    "entity_dimensions_hash",
+    "metric_id",
+    "metric_value",
+    "metric_timeline",
+    "entity_fields",
+    "encounters",
+    "metadata",
+    "metadata_per_period",
+    "statistical_methods",
+]
+
+# Entity keys stored in their own columns and left out of entity_dimensions
+BASE_ENTITY_KEYS = ("medicareId", "systemName")
+
+# Rows pulled from a file iterator per write batch
+DEFAULT_BATCH_SIZE = 10000
+
+# Flush the COPY buffer to the server once it holds this many characters
+DEFAULT_COPY_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Minimum seconds between progress log lines per table
+DEFAULT_PROGRESS_INTERVAL = 10.0
+
+# COPY text format escapes; backslash must be replaced first
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_field(value: Any) -> str:
+    """Format a value as a COPY text-format field.
+
+    Args:
+        value: Field value; None becomes NULL.
+
+    Returns:
+        Field text with backslashes, tabs and line breaks escaped.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def encode_copy_row(values: tuple[Any, ...]) -> str:
+    """Encode one row as a COPY text-format line, including the newline."""
+    return "\t".join(_copy_field(v) for v in values) + "\n"
+
+
+class CopyWriter:
+    """Stream rows into a table with COPY FROM STDIN.
+
+    Rows are encoded into an in-memory text buffer that is sent to the
+    server whenever it reaches buffer_size characters, so memory stays
+    bounded regardless of how many rows are written. All flushes share one
+    transaction, committed when the writer closes without error.
+
+    Usage:
+        with CopyWriter(engine, "raw_contributions", ["run_id", "json_data"]) as writer:
+            writer.write_row((run_id, line))
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        table_name: str,
+        columns: list[str],
+        buffer_size: int = DEFAULT_COPY_BUFFER_SIZE,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            engine: SQLAlchemy engine using the psycopg2 driver.
+            table_name: Target table.
+            columns: Target columns, in the order rows are written.
+            buffer_size: Buffered characters that trigger a flush.
+        """
+        self.table_name = table_name
+        self.rows = 0
+        self._sql = f"COPY {table_name} ({', '.join(columns)}) FROM STDIN"
+        self._buffer_size = buffer_size
+        self._buffer = io.StringIO()
+        self._engine = engine
+        self._connection: Any = None
+
+    def __enter__(self) -> CopyWriter:
+        """Open the raw DBAPI connection."""
+        self._connection = self._engine.raw_connection()
+        return self
+
+    def write_row(self, values: tuple[Any, ...]) -> None:
+        """Buffer one row, flushing when the buffer is full.
+
+        Args:
+            values: Field values in column order.
+        """
+        self.write_encoded(encode_copy_row(values), 1)
+
+    def write_encoded(self, data: str, rows: int) -> None:
+        """Buffer rows already encoded with encode_copy_row.
+
+        Args:
+            data: Concatenated COPY text lines.
+            rows: Number of rows in data.
+        """
+        self._buffer.write(data)
+        self.rows += rows
+        if self._buffer.tell() >= self._buffer_size:
+            self.flush()
+
+    def write_rows(self, rows: Iterable[tuple[Any, ...]]) -> None:
+        """Buffer several rows, flushing whenever the buffer fills.
+
+        Args:
+            rows: Rows of field values in column order.
+        """
+        for values in rows:
+            self.write_row(values)
+
+    def flush(self) -> None:
+        """Send buffered rows to the server."""
+        if not self._buffer.tell():
+            return
+        self._buffer.seek(0)
+        with self._connection.cursor() as cursor:
+            cursor.copy_expert(self._sql, self._buffer)
+        self._buffer = io.StringIO()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Flush and commit, or roll back if the block raised."""
+        try:
+            if exc_type is None:
+                self.flush()
+                self._connection.commit()
+            else:
+                self._connection.rollback()
+        finally:
+            self._connection.close()
+
+
+@dataclass
+class TableLoadStats:
+    """Row count and elapsed time for one table load."""
+
+    table_name: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Load throughput, or 0 when nothing was timed."""
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
 def get_sync_database_url(async_url: str) -> str:
-    """Convert async database URL to sync URL for pandas/SQLAlchemy.
+    """Convert async database URL to sync URL for SQLAlchemy/psycopg2.
 
     Args:
         async_url: PostgreSQL URL with asyncpg driver.
@@ -157,7 +393,9 @@ def create_tables(engine: Engine) -> None:
     """Create raw tables if they don't exist.
 
     Creates all raw tables including modeling stubs. This ensures dbt source
-    tests pass even when the modeling stage is skipped.
+    tests pass even when the modeling stage is skipped. Unpartitioned insight
+    graph raw tables left by earlier loader versions are dropped and
+    recreated partitioned by run_id.
 
     Args:
         engine: SQLAlchemy engine for database connection.
@@ -167,6 +405,17 @@ def create_tables(engine: Engine) -> None:
     """
     logger.info("Creating raw tables if not exists...")
     with engine.connect() as conn:
+        conn.execute(text(RAW_LOAD_MANIFEST_DDL))
+        for table_name in PARTITIONED_RAW_TABLES:
+            relkind = conn.execute(
+                text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:name)"),
+                {"name": table_name},
+            ).scalar()
+            if relkind == "r":
+                # Unpartitioned tables were truncated on every load, so no run history is lost
+                logger.warning(f"Replacing unpartitioned {table_name} with a run_id-partitioned table")
+                conn.execute(text(f"DROP TABLE {table_name}"))
+                conn.execute(text("DELETE FROM raw_load_manifest WHERE table_name = :name"), {"name": table_name})
         for ddl in [
             RAW_NODE_RESULTS_DDL,
             RAW_CONTRIBUTIONS_DDL,
@@ -180,20 +429,150 @@ def create_tables(engine: Engine) -> None:
     logger.info("Tables created/verified.")
 
 
-def truncate_table(engine: Engine, table_name: str) -> None:
-    """Truncate a table for clean reload.
+def _sql_literal(value: str) -> str:
+    """Quote a string as a SQL literal for DDL that cannot take bind parameters."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def files_checksum(files: Iterable[Path]) -> str:
+    """Compute a checksum over source file names and contents.
+
+    Args:
+        files: Source files for one table load.
+
+    Returns:
+        Hex SHA-256 digest, stable across file order.
+    """
+    digest = hashlib.sha256(f"raw-format-{RAW_FORMAT_VERSION}".encode())
+    for path in sorted(files):
+        with path.open("rb") as f:
+            file_digest = hashlib.file_digest(f, "sha256").hexdigest()
+        digest.update(f"\0{path.name}\0{file_digest}".encode())
+    return digest.hexdigest()
+
+
+def get_loaded_checksum(engine: Engine, table_name: str, run_id: str) -> tuple[str, int] | None:
+    """Return the checksum and row count recorded for a run's partition.
 
     Args:
         engine: SQLAlchemy engine.
-        table_name: Name of table to truncate.
+        table_name: Partitioned raw table.
+        run_id: Run identifier.
 
-    Raises:
-        SQLAlchemyError: If truncation fails.
+    Returns:
+        Tuple of (checksum, row_count), or None if the run was never loaded.
+    """
+    with engine.connect() as conn:
+        row = conn.execute(
+            text("SELECT checksum, row_count FROM raw_load_manifest WHERE table_name = :table_name AND run_id = :run_id"),
+            {"table_name": table_name, "run_id": run_id},
+        ).first()
+    return (row[0], row[1]) if row else None
+
+
+def create_load_partition(engine: Engine, table_name: str, run_id: str) -> str:
+    """Create an empty, detached table to load one run into.
+
+    The table matches the parent's columns and carries a CHECK constraint on
+    run_id, so attaching it later does not need to scan the rows.
+
+    Args:
+        engine: SQLAlchemy engine.
+        table_name: Partitioned raw table.
+        run_id: Run identifier.
+
+    Returns:
+        Name of the new table.
     """
+    run_part = re.sub(r"[^a-z0-9]+", "_", run_id.lower())[:20]
+    partition_name = f"{table_name}__{run_part}_{uuid.uuid4().hex[:8]}"
     with engine.connect() as conn:
-        conn.execute(text(f"TRUNCATE TABLE {table_name} RESTART IDENTITY"))
+        conn.execute(text(f"CREATE TABLE {partition_name} (LIKE {table_name} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+        conn.execute(text(f"ALTER TABLE {partition_name} ADD CHECK (run_id = {_sql_literal(run_id)})"))
         conn.commit()
-    logger.info(f"Truncated table: {table_name}")
+    return partition_name
+
+
+def attach_load_partition(
+    engine: Engine,
+    table_name: str,
+    run_id: str,
+    partition_name: str,
+    checksum: str,
+    row_count: int,
+) -> None:
+    """Swap a loaded table in as the run's partition and record it.
+
+    Any existing partition for the run is detached and dropped in the same
+    transaction, so readers see either the old or the new rows.
+
+    Args:
+        engine: SQLAlchemy engine.
+        table_name: Partitioned raw table.
+        run_id: Run identifier.
+        partition_name: Table created by create_load_partition.
+        checksum: Source file checksum.
+        row_count: Rows loaded into partition_name.
+    """
+    with engine.begin() as conn:
+        old_partitions = conn.execute(
+            text("""
+                SELECT c.relname
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = to_regclass(:table_name)
+                  AND pg_get_expr(c.relpartbound, c.oid) = :bound
+            """),
+            {"table_name": table_name, "bound": f"FOR VALUES IN ({_sql_literal(run_id)})"},
+        ).scalars()
+        for old_partition in list(old_partitions):
+            conn.execute(text(f"ALTER TABLE {table_name} DETACH PARTITION {old_partition}"))
+            conn.execute(text(f"DROP TABLE {old_partition}"))
+        conn.execute(text(f"ALTER TABLE {table_name} ATTACH PARTITION {partition_name} FOR VALUES IN ({_sql_literal(run_id)})"))
+        conn.execute(
+            text("""
+                INSERT INTO raw_load_manifest (table_name, run_id, partition_name, checksum, row_count, loaded_at)
+                VALUES (:table_name, :run_id, :partition_name, :checksum, :row_count, CURRENT_TIMESTAMP)
+                ON CONFLICT (table_name, run_id) DO UPDATE SET
+                    partition_name = EXCLUDED.partition_name,
+                    checksum = EXCLUDED.checksum,
+                    row_count = EXCLUDED.row_count,
+                    loaded_at = EXCLUDED.loaded_at
+            """),
+            {
+                "table_name": table_name,
+                "run_id": run_id,
+                "partition_name": partition_name,
+                "checksum": checksum,
+                "row_count": row_count,
+            },
+        )
+
+
+def drop_other_run_partitions(engine: Engine, table_name: str, keep_run_id: str) -> int:
+    """Drop every partition of a table except the given run's.
+
+    Args:
+        engine: SQLAlchemy engine.
+        table_name: Partitioned raw table.
+        keep_run_id: Run whose partition is kept.
+
+    Returns:
+        Number of partitions dropped.
+    """
+    with engine.begin() as conn:
+        partitions = conn.execute(
+            text("SELECT run_id, partition_name FROM raw_load_manifest WHERE table_name = :table_name AND run_id <> :run_id"),
+            {"table_name": table_name, "run_id": keep_run_id},
+        ).all()
+        for run_id, partition_name in partitions:
+            conn.execute(text(f"DROP TABLE IF EXISTS {partition_name}"))
+            logger.info(f"Dropped {table_name} partition for run {run_id}")
+        conn.execute(
+            text("DELETE FROM raw_load_manifest WHERE table_name = :table_name AND run_id <> :run_id"),
+            {"table_name": table_name, "run_id": keep_run_id},
+        )
+    return len(partitions)
 
 
 def extract_run_id(run_path: Path) -> str:
@@ -212,7 +591,513 @@ def extract_run_id(run_path: Path) -> str:
     return run_path.name
 
 
-def load_node_results(engine: Engine, insight_graph_path: Path, run_id: str) -> int:
+class LoadProgress:
+    """Periodic progress logging for one table load.
+
+    Logs at most once per interval with rows written, throughput and files
+    consumed, so progress stays visible on runs of any size without
+    flooding the log.
+    """
+
+    def __init__(self, table_name: str, total_files: int, interval: float = DEFAULT_PROGRESS_INTERVAL) -> None:
+        """Initialize progress tracking.
+
+        Args:
+            table_name: Table being loaded.
+            total_files: Number of source files.
+            interval: Minimum seconds between progress lines.
+        """
+        self.table_name = table_name
+        self.total_files = total_files
+        self.files_done = 0
+        self.rows = 0
+        self._interval = interval
+        self._started = time.perf_counter()
+        self._last_logged = self._started
+
+    def track_files(self, files: Iterable[Path]) -> Iterator[Path]:
+        """Yield files, counting each one as done when the next is requested."""
+        for path in files:
+            yield path
+            self.files_done += 1
+
+    def add_rows(self, count: int) -> None:
+        """Record written rows and log if the interval has passed."""
+        self.rows += count
+        now = time.perf_counter()
+        if now - self._last_logged >= self._interval:
+            self._last_logged = now
+            rate = self.rows / (now - self._started)
+            logger.info(f"{self.table_name}: {self.rows:,} rows ({rate:,.0f} rows/sec), {self.files_done}/{self.total_files} files")
+
+
+def iter_lines(path: Path) -> Iterator[tuple[int, str]]:
+    """Yield (line number, stripped line) for non-empty lines of a text file.
+
+    Args:
+        path: File to read.
+
+    Yields:
+        One-based line number and line content without surrounding whitespace.
+    """
+    with path.open(encoding="utf-8") as f:
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            if line:
+                yield line_num, line
+
+
+def batched(rows: Iterable[tuple[Any, ...]], batch_size: int) -> Iterator[list[tuple[Any, ...]]]:
+    """Group rows into lists of at most batch_size.
+
+    Args:
+        rows: Row iterator.
+        batch_size: Maximum rows per batch.
+
+    Yields:
+        Lists of rows; only the last may be shorter than batch_size.
+    """
+    iterator = iter(rows)
+    while batch := list(itertools.islice(iterator, batch_size)):
+        yield batch
+
+
+def write_rows(
+    engine: Engine,
+    table_name: str,
+    columns: list[str],
+    rows: Iterable[tuple[Any, ...]],
+    progress: LoadProgress,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    buffer_size: int = DEFAULT_COPY_BUFFER_SIZE,
+) -> int:
+    """Drain a row iterator into a table batch by batch.
+
+    Only one batch of rows and one COPY buffer are held in memory at a
+    time, independent of how many rows the iterator produces.
+
+    Args:
+        engine: SQLAlchemy engine.
+        table_name: Target table.
+        columns: Target columns, in row order.
+        rows: Row iterator.
+        progress: Progress tracker for this table.
+        batch_size: Rows pulled from the iterator per batch.
+        buffer_size: COPY buffer size in characters.
+
+    Returns:
+        Number of rows written.
+
+    Raises:
+        psycopg2.Error: If the COPY fails.
+    """
+    with CopyWriter(engine, table_name, columns, buffer_size) as writer:
+        for batch in batched(rows, batch_size):
+            writer.write_rows(batch)
+            progress.add_rows(len(batch))
+    return writer.rows
+
+
+RowSource = Callable[[Iterable[Path], str, datetime], Iterator[tuple[Any, ...]]]
+
+
+def _encode_files(row_source: RowSource, files: list[Path], run_id: str, loaded_at: datetime) -> tuple[str, int]:
+    """Parse files and encode their rows as COPY text (runs in a worker process).
+
+    Args:
+        row_source: Module-level row generator for the target table.
+        files: Source files for this task.
+        run_id: Run identifier.
+        loaded_at: Load timestamp.
+
+    Returns:
+        Tuple of encoded COPY text and row count.
+    """
+    buffer = io.StringIO()
+    count = 0
+    for row in row_source(files, run_id, loaded_at):
+        buffer.write(encode_copy_row(row))
+        count += 1
+    return buffer.getvalue(), count
+
+
+def _task_groups(files: list[Path], target_bytes: int) -> Iterator[tuple[list[Path], int]]:
+    """Group consecutive files into worker tasks of about target_bytes of source data.
+
+    Args:
+        files: Source files, in load order.
+        target_bytes: Source bytes per task; a larger file is a task of its own.
+
+    Yields:
+        Tuple of the task's files and their total size in bytes.
+    """
+    group: list[Path] = []
+    group_bytes = 0
+    for path in files:
+        size = path.stat().st_size
+        if group and group_bytes + size > target_bytes:
+            yield group, group_bytes
+            group, group_bytes = [], 0
+        group.append(path)
+        group_bytes += size
+    if group:
+        yield group, group_bytes
+
+
+@dataclass
+class LoadOptions:
+    """Tuning and reload options shared by the table loaders.
+
+    Attributes:
+        batch_size: Rows per write batch (serial path).
+        buffer_size: COPY buffer size in characters.
+        executor: Optional process pool for parsing source files.
+        max_in_flight_bytes: Source bytes of parse tasks submitted but not
+            yet written, beyond which no further task is submitted.
+        force: Reload partitions even when source checksums are unchanged.
+    """
+
+    batch_size: int = DEFAULT_BATCH_SIZE
+    buffer_size: int = DEFAULT_COPY_BUFFER_SIZE
+    executor: Executor | None = None
+    max_in_flight_bytes: int = DEFAULT_COPY_BUFFER_SIZE
+    force: bool = False
+
+
+def copy_files(
+    engine: Engine,
+    table_name: str,
+    columns: list[str],
+    row_source: RowSource,
+    files: list[Path],
+    run_id: str,
+    options: LoadOptions,
+) -> int:
+    """Copy rows generated from source files into a table.
+
+    Without an executor, rows stream through write_rows in this process,
+    holding one batch and one COPY buffer. With one, files are grouped into
+    tasks of about buffer_size source bytes that the executor's workers
+    parse and encode while this process only writes. A task is submitted
+    only while the tasks not yet written total at most
+    options.max_in_flight_bytes of source data, or when none is pending;
+    a whole task's COPY text is held until written, since files are not
+    split. Peak memory per table is therefore about
+    max(max_in_flight_bytes, largest file) times the encoded size per
+    source byte (about 2 for raw_entity_results, whose typed columns
+    repeat parts of the JSON), independent of the number of files. Rows
+    are written in file order either way.
+
+    Args:
+        engine: SQLAlchemy engine.
+        table_name: Target table.
+        columns: Target columns, in row order.
+        row_source: Module-level row generator taking (files, run_id, loaded_at).
+        files: Source files.
+        run_id: Run identifier.
+        options: Batch, buffer and executor settings.
+
+    Returns:
+        Number of rows written.
+
+    Raises:
+        psycopg2.Error: If the COPY fails.
+    """
+    progress = LoadProgress(table_name, len(files))
+    loaded_at = datetime.now(UTC)
+    executor = options.executor
+
+    if executor is None:
+        rows = row_source(progress.track_files(files), run_id, loaded_at)
+        return write_rows(engine, table_name, columns, rows, progress, options.batch_size, options.buffer_size)
+
+    # (future, file count, source bytes) of submitted tasks, oldest first
+    pending: deque[tuple[Future[tuple[str, int]], int, int]] = deque()
+    in_flight_bytes = 0
+
+    with CopyWriter(engine, table_name, columns, options.buffer_size) as writer:
+
+        def write_oldest() -> None:
+            nonlocal in_flight_bytes
+            future, file_count, task_bytes = pending.popleft()
+            data, count = future.result()
+            in_flight_bytes -= task_bytes
+            writer.write_encoded(data, count)
+            progress.files_done += file_count
+            progress.add_rows(count)
+
+        try:
+            for task_files, task_bytes in _task_groups(files, options.buffer_size):
+                while pending and in_flight_bytes + task_bytes > options.max_in_flight_bytes:
+                    write_oldest()
+                pending.append((executor.submit(_encode_files, row_source, task_files, run_id, loaded_at), len(task_files), task_bytes))
+                in_flight_bytes += task_bytes
+            while pending:
+                write_oldest()
+        except BaseException:
+            # Don't let queued tasks keep the shared pool busy after a failure
+            for future, _, _ in pending:
+                future.cancel()
+            raise
+
+    return writer.rows
+
+
+def load_files(
+    engine: Engine,
+    table_name: str,
+    columns: list[str],
+    row_source: RowSource,
+    files: list[Path],
+    run_id: str,
+    options: LoadOptions,
+) -> int:
+    """Load a run's partition of a raw table from its source files.
+
+    Skips the load when the run's partition was loaded from files with the
+    same checksum, unless options.force is set. Otherwise rows are copied
+    into a fresh table that then replaces the run's partition, leaving
+    other runs untouched.
+
+    Args:
+        engine: SQLAlchemy engine.
+        table_name: Partitioned raw table.
+        columns: Target columns, in row order.
+        row_source: Module-level row generator taking (files, run_id, loaded_at).
+        files: Source files.
+        run_id: Run identifier.
+        options: Load settings.
+
+    Returns:
+        Number of rows in the run's partition.
+
+    Raises:
+        psycopg2.Error: If the COPY fails.
+    """
+    checksum = files_checksum(files)
+    loaded = get_loaded_checksum(engine, table_name, run_id)
+    if loaded is not None and loaded[0] == checksum and not options.force:
+        logger.info(f"{table_name}: run {run_id} already loaded from identical files ({loaded[1]:,} rows), skipping")
+        return loaded[1]
+
+    partition_name = create_load_partition(engine, table_name, run_id)
+    try:
+        rows = copy_files(engine, partition_name, columns, row_source, files, run_id, options)
+        attach_load_partition(engine, table_name, run_id, partition_name, checksum, rows)
+    except BaseException:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {partition_name}"))
+        raise
+
+    return rows
+
+
+def iter_node_result_rows(files: Iterable[Path], run_id: str, loaded_at: datetime) -> Iterator[tuple[Any, ...]]:
+    """Yield raw_node_results rows, one per node file.
+
+    For JSONL files only the first line (node_metadata) is used; legacy JSON
+    files are loaded whole.
+    """
+    for node_file in files:
+        if node_file.suffix == ".jsonl":
+            # JSONL format: first line is node_metadata
+            with node_file.open(encoding="utf-8") as f:
+                json_content = f.readline().strip()
+            if not json_content:
+                logger.warning(f"Empty JSONL file: {node_file}")
+                continue
+        else:
+            # Legacy JSON format: entire file is the node result
+            json_content = node_file.read_text(encoding="utf-8")
+
+        yield run_id, str(node_file), json_content, loaded_at
+
+
+def iter_jsonl_rows(files: Iterable[Path], run_id: str, loaded_at: datetime) -> Iterator[tuple[Any, ...]]:
+    """Yield one raw row per non-empty line of each JSONL file."""
+    for jsonl_file in files:
+        file_path = str(jsonl_file)
+        for _, line in iter_lines(jsonl_file):
+            yield run_id, file_path, line, loaded_at
+
+
+def _json_text(value: Any) -> str | None:
+    """Return a JSON value as PostgreSQL's ->> operator would (text or NULL)."""
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+def jsonb_text(obj: dict[str, str | None]) -> str:
+    """Serialize a flat object exactly as PostgreSQL prints it as jsonb.
+
+    jsonb orders keys by byte length, then bytewise, and separates items
+    with ", " and keys from values with ": ". Matching this lets the
+    loader compute the same md5(entity_dimensions::text) hash that
+    stg_classifications computes in SQL.
+
+    Args:
+        obj: Object with string keys and string or null values.
+
+    Returns:
+        jsonb text representation.
+    """
+    items = sorted(obj.items(), key=lambda item: (len(item[0].encode()), item[0].encode()))
+    return "{" + ", ".join(f"{json.dumps(k, ensure_ascii=False)}: {json.dumps(v, ensure_ascii=False)}" for k, v in items) + "}"
+
+
+def _json_member(obj: Any, key: str) -> str | None:
+    """Return a member as JSON text, as PostgreSQL's -> operator would (JSON null stays 'null')."""
+    if not isinstance(obj, dict) or key not in obj:
+        return None
+    return json.dumps(obj[key], ensure_ascii=False)
+
+
+def _encounters(metadata: Any) -> int | None:
+    """Return metadata.encounters as (->>'encounters')::numeric::integer would.
+
+    Float values like 15166.0 (or "15166.0") are rounded half away from
+    zero; values that are not numbers give NULL instead of failing.
+    """
+    value = metadata.get("encounters") if isinstance(metadata, dict) else None
+    if value is None or isinstance(value, bool | dict | list):
+        return None
+    try:
+        return int(Decimal(str(value)).to_integral_value(rounding=ROUND_HALF_UP))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def flatten_entity_result(entity_result: dict[str, Any]) -> tuple[Any, ...]:
+    """Extract the typed raw_entity_results columns from an entity result.
+
+    Mirrors the JSON extraction stg_entity_results used to do in SQL:
+    entity keys from the entity array, systemName preferring metadata, the
+    scalar metric value for aggregate nodes or the latest non-null
+    timeline value (by period, where PostgreSQL's descending order puts a
+    missing period first) for temporal nodes, encounters from
+    metadata, and the entity array, metadata, metadata.per_period and
+    statistical_methods as JSON passthrough columns.
+
+    Args:
+        entity_result: Parsed entity result JSON object.
+
+    Returns:
+        Tuple of (facility_id, service_line, sub_service_line, system_name,
+        entity_dimensions, entity_dimensions_hash, metric_id, metric_value,
+        metric_timeline, entity_fields, encounters, metadata,
+        metadata_per_period, statistical_methods), with JSON columns as text.
+    """
+    fields: dict[str, str | None] = {}
+    entity = entity_result.get("entity")
+    for field in entity if isinstance(entity, list) else []:
+        if isinstance(field, dict) and field.get("id") is not None:
+            fields[str(field["id"])] = _json_text(field.get("value"))
+
+    metadata = entity_result.get("metadata")
+    system_name = _json_text(metadata.get("systemName")) if isinstance(metadata, dict) else None
+    dimensions = jsonb_text({key: value for key, value in fields.items() if key not in BASE_ENTITY_KEYS})
+
+    metric_id = metric_value = metric_timeline = None
+    metrics = entity_result.get("metric")
+    if isinstance(metrics, list) and metrics and isinstance(metrics[0], dict):
+        metric = metrics[0]
+        metric_metadata = metric.get("metadata")
+        if isinstance(metric_metadata, dict):
+            metric_id = _json_text(metric_metadata.get("metric_id"))
+        values = metric.get("values")
+        if isinstance(values, int | float) and not isinstance(values, bool):
+            metric_value = values
+        elif isinstance(values, dict):
+            metric_timeline = _json_member(values, "timeline")
+            timeline = values.get("timeline")
+            points = [p for p in timeline if isinstance(p, dict) and p.get("value") not in (None, "null")] if isinstance(timeline, list) else []
+            if points:
+                metric_value = max(points, key=lambda p: (p.get("period") is None, _json_text(p.get("period")) or ""))["value"]
+
+    return (
+        fields.get("medicareId"),
+        fields.get("vizientServiceLine"),
+        fields.get("vizientSubServiceLine"),
+        system_name if system_name is not None else fields.get("systemName"),
+        dimensions,
+        hashlib.md5(dimensions.encode()).hexdigest(),
+        metric_id,
+        metric_value,
+        metric_timeline,
+        _json_member(entity_result, "entity"),
+        _encounters(metadata),
+        _json_member(entity_result, "metadata"),
+        _json_member(metadata, "per_period"),
+        _json_member(entity_result, "statistical_methods"),
+    )
+
+
+def _entity_row(
+    run_id: str,
+    canonical_node_id: str,
+    file_path: str,
+    json_data: str,
+    loaded_at: datetime,
+    entity_result: Any,
+) -> tuple[Any, ...]:
+    """Build a raw_entity_results row, flattening the entity result if it parsed."""
+    flattened = flatten_entity_result(entity_result) if isinstance(entity_result, dict) else (None,) * len(RAW_ENTITY_RESULTS_COLUMNS[5:])
+    return (run_id, canonical_node_id, file_path, json_data, loaded_at, *flattened)
+
+
+def iter_entity_rows_from_jsonl(files: Iterable[Path], run_id: str, loaded_at: datetime) -> Iterator[tuple[Any, ...]]:
+    """Yield raw_entity_results rows from unified JSONL node files.
+
+    Each JSONL file contains:
+    - Line 1: {"type":"node_metadata", "canonical_node_id": "...", ...}
+    - Lines 2+: Entity result JSON objects
+
+    Each entity row also carries the columns from flatten_entity_result.
+    """
+    for jsonl_file in files:
+        file_path = str(jsonl_file)
+        canonical_node_id = jsonl_file.stem
+
+        for line_num, line in iter_lines(jsonl_file):
+            if line_num == 1:
+                # First line is node_metadata - extract canonical_node_id
+                try:
+                    canonical_node_id = json.loads(line).get("canonical_node_id", jsonl_file.stem)
+                except json.JSONDecodeError:
+                    logger.warning(f"Failed to parse metadata in {jsonl_file}")
+                continue  # Skip metadata line for entity loading
+
+            # Lines 2+ are entity results
+            try:
+                entity_result = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Failed to parse entity result at {jsonl_file}:{line_num}")
+                entity_result = None
+            yield _entity_row(run_id, canonical_node_id, file_path, line, loaded_at, entity_result)
+
+
+def iter_entity_rows_from_legacy_json(files: Iterable[Path], run_id: str, loaded_at: datetime) -> Iterator[tuple[Any, ...]]:
+    """Yield raw_entity_results rows from entity_results embedded in legacy JSON node files."""
+    for json_file in files:
+        try:
+            node_data = json.loads(json_file.read_text(encoding="utf-8"))
+            canonical_node_id = node_data.get("canonical_node_id", json_file.stem)
+            entity_results = node_data.get("entity_results", [])
+        except Exception as e:
+            logger.warning(f"Failed to parse entity results from {json_file}: {e}")
+            continue
+
+        for entity in entity_results:
+            yield _entity_row(run_id, str(canonical_node_id), str(json_file), json.dumps(entity), loaded_at, entity)
+
+
+def load_node_results(
+    engine: Engine,
+    insight_graph_path: Path,
+    run_id: str,
+    options: LoadOptions | None = None,
+) -> int:
     """Load node result files into raw_node_results table.
 
     Supports both legacy JSON format (*.json) and unified JSONL format (*.jsonl).
@@ -222,12 +1107,13 @@ def load_node_results(engine: Engine, insight_graph_path: Path, run_id: str) ->
         engine: SQLAlchemy engine.
         insight_graph_path: Path to insight graph run directory.
         run_id: Run identifier.
+        options: Load settings; defaults to LoadOptions().
 
     Returns:
         Number of rows loaded.
 
     Raises:
-        SQLAlchemyError: If database insert fails.
+        psycopg2.Error: If the COPY fails.
     """
     nodes_dir = insight_graph_path / "results" / "nodes"
     if not nodes_dir.exists():
@@ -243,42 +1129,28 @@ def load_node_results(engine: Engine, insight_graph_path: Path, run_id: str) ->
     if not all_files:
         return 0
 
-    truncate_table(engine, "raw_node_results")
-
-    loaded_at = datetime.now(UTC)
-    loaded_count = 0
+    options = options or LoadOptions()
 
-    for node_file in all_files:
-        if node_file.suffix == ".jsonl":
-            # JSONL format: first line is node_metadata
-            with node_file.open(encoding="utf-8") as f:
-                first_line = f.readline().strip()
-                if not first_line:
-                    logger.warning(f"Empty JSONL file: {node_file}")
-                    continue
-                json_content = first_line
-        else:
-            # Legacy JSON format: entire file is the node result
-            json_content = node_file.read_text(encoding="utf-8")
-
-        row = {
-            "run_id": run_id,
-            "file_path": str(node_file),
-            "json_data": json_content,
-            "loaded_at": loaded_at,
-        }
-        df = pd.DataFrame([row])
-        with engine.begin() as conn:
-            df.to_sql("raw_node_results", conn, if_exists="append", index=False)
-        loaded_count += 1
-        if loaded_count % 10 == 0:
-            logger.info(f"Loaded {loaded_count}/{len(all_files)} node results")
+    loaded = load_files(
+        engine,
+        "raw_node_results",
+        RAW_TABLE_COLUMNS,
+        iter_node_result_rows,
+        all_files,
+        run_id,
+        options,
+    )
 
-    logger.info(f"Loaded {loaded_count} node results")
-    return loaded_count
+    logger.info(f"Loaded {loaded} node results")
+    return loaded
 
 
-def load_contributions(engine: Engine, insight_graph_path: Path, run_id: str) -> int:
+def load_contributions(
+    engine: Engine,
+    insight_graph_path: Path,
+    run_id: str,
+    options: LoadOptions | None = None,
+) -> int:
     """Load contribution JSONL files into raw_contributions table.
 
     Each line in a JSONL file becomes one row in the table.
@@ -287,12 +1159,13 @@ def load_contributions(engine: Engine, insight_graph_path: Path, run_id: str) ->
         engine: SQLAlchemy engine.
         insight_graph_path: Path to insight graph run directory.
         run_id: Run identifier.
+        options: Load settings; defaults to LoadOptions().
 
     Returns:
         Number of rows loaded.
 
     Raises:
-        SQLAlchemyError: If database insert fails.
+        psycopg2.Error: If the COPY fails.
     """
     contrib_dir = insight_graph_path / "analysis" / "contribution"
     if not contrib_dir.exists():
@@ -306,39 +1179,28 @@ def load_contributions(engine: Engine, insight_graph_path: Path, run_id: str) ->
     if not jsonl_files:
         return 0
 
-    truncate_table(engine, "raw_contributions")
+    options = options or LoadOptions()
 
-    rows = []
-    loaded_at = datetime.now(UTC)
-    for jsonl_file in jsonl_files:
-        with jsonl_file.open(encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:  # Skip empty lines
-                    rows.append(
-                        {
-                            "run_id": run_id,
-                            "file_path": str(jsonl_file),
-                            "json_data": line,
-                            "loaded_at": loaded_at,
-                        }
-                    )
-
-    if rows:
-        # Load in batches to avoid memory issues
-        batch_size = 10000
-        with engine.begin() as conn:
-            for i in range(0, len(rows), batch_size):
-                batch = rows[i : i + batch_size]
-                df = pd.DataFrame(batch)
-                df.to_sql("raw_contributions", conn, if_exists="append", index=False)
-                logger.info(f"Loaded contributions batch {i // batch_size + 1}: {len(batch)} rows")
+    loaded = load_files(
+        engine,
+        "raw_contributions",
+        RAW_TABLE_COLUMNS,
+        iter_jsonl_rows,
+        jsonl_files,
+        run_id,
+        options,
+    )
 
-    logger.info(f"Loaded {len(rows)} total contributions")
-    return len(rows)
+    logger.info(f"Loaded {loaded} total contributions")
+    return loaded
 
 
-def load_classifications(engine: Engine, insight_graph_path: Path, run_id: str) -> int:
+def load_classifications(
+    engine: Engine,
+    insight_graph_path: Path,
+    run_id: str,
+    options: LoadOptions | None = None,
+) -> int:
     """Load classification JSONL files into raw_classifications table.
 
     The classification file contains signal classification outputs from the
@@ -349,51 +1211,42 @@ def load_classifications(engine: Engine, insight_graph_path: Path, run_id: str)
         engine: SQLAlchemy engine.
         insight_graph_path: Path to insight graph run directory.
         run_id: Run identifier.
+        options: Load settings; defaults to LoadOptions().
 
     Returns:
         Number of rows loaded.
 
     Raises:
-        SQLAlchemyError: If database insert fails.
+        psycopg2.Error: If the COPY fails.
     """
     classification_file = insight_graph_path / "analysis" / "classification" / "classifications.jsonl"
     if not classification_file.exists():
         logger.warning(f"Classification file not found: {classification_file}")
         return 0
 
-    truncate_table(engine, "raw_classifications")
-
-    rows = []
-    loaded_at = datetime.now(UTC)
-
-    with classification_file.open(encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:  # Skip empty lines
-                rows.append(
-                    {
-                        "run_id": run_id,
-                        "file_path": str(classification_file),
-                        "json_data": line,
-                        "loaded_at": loaded_at,
-                    }
-                )
-
-    if rows:
-        # Load in batches to avoid memory issues
-        batch_size = 10000
-        with engine.begin() as conn:
-            for i in range(0, len(rows), batch_size):
-                batch = rows[i : i + batch_size]
-                df = pd.DataFrame(batch)
-                df.to_sql("raw_classifications", conn, if_exists="append", index=False)
-                logger.info(f"Loaded classifications batch {i // batch_size + 1}: {len(batch)} rows")
+    options = options or LoadOptions()
+
+    # A single file gains nothing from the process pool, so it always streams in-process
+    loaded = load_files(
+        engine,
+        "raw_classifications",
+        RAW_TABLE_COLUMNS,
+        iter_jsonl_rows,
+        [classification_file],
+        run_id,
+        replace(options, executor=None),
+    )
 
-    logger.info(f"Loaded {len(rows)} total classifications")
-    return len(rows)
+    logger.info(f"Loaded {loaded} total classifications")
+    return loaded
 
 
-def load_entity_results(engine: Engine, insight_graph_path: Path, run_id: str) -> int:
+def load_entity_results(
+    engine: Engine,
+    insight_graph_path: Path,
+    run_id: str,
+    options: LoadOptions | None = None,
+) -> int:
     """Load entity result JSONL files into raw_entity_results table.
 
     Supports two formats:
@@ -407,12 +1260,13 @@ def load_entity_results(engine: Engine, insight_graph_path: Path, run_id: str) -
         engine: SQLAlchemy engine.
         insight_graph_path: Path to insight graph run directory.
         run_id: Run identifier.
+        options: Load settings; defaults to LoadOptions().
 
     Returns:
         Number of rows loaded.
 
     Raises:
-        SQLAlchemyError: If database insert fails.
+        psycopg2.Error: If the COPY fails.
     """
     nodes_dir = insight_graph_path / "results" / "nodes"
     if not nodes_dir.exists():
@@ -420,144 +1274,52 @@ def load_entity_results(engine: Engine, insight_graph_path: Path, run_id: str) -
         return 0
 
     # Check for unified JSONL format first
-    jsonl_files = list(nodes_dir.glob("*.jsonl"))
-    if jsonl_files:
-        logger.info(f"Found {len(jsonl_files)} JSONL node files for entity extraction")
-        return _load_entity_results_from_jsonl(engine, jsonl_files, run_id)
-
-    # Fall back to legacy JSON format
-    json_files = list(nodes_dir.glob("*.json"))
-    if json_files:
-        logger.info(f"Found {len(json_files)} legacy JSON node files for entity extraction")
-        return _load_entity_results_from_legacy_json(engine, json_files, run_id)
-
-    logger.warning("No node result files found for entity extraction")
-    return 0
-
-
-def _load_entity_results_from_jsonl(engine: Engine, jsonl_files: list[Path], run_id: str) -> int:
-    """Load entity results from unified JSONL node files.
-
-    Each JSONL file contains:
-    - Line 1: {"type":"node_metadata", "canonical_node_id": "...", ...}
-    - Lines 2+: Entity result JSON objects
-
-    Args:
-        engine: SQLAlchemy engine.
-        jsonl_files: List of JSONL node files.
-        run_id: Run identifier.
-
-    Returns:
-        Number of entity rows loaded.
-    """
-    import json as json_module
-
-    truncate_table(engine, "raw_entity_results")
-
-    rows = []
-    loaded_at = datetime.now(UTC)
-
-    for jsonl_file in jsonl_files:
-        canonical_node_id = None
-
-        with jsonl_file.open(encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-
-                if line_num == 1:
-                    # First line is node_metadata - extract canonical_node_id
-                    try:
-                        metadata = json_module.loads(line)
-                        canonical_node_id = metadata.get("canonical_node_id", jsonl_file.stem)
-                    except json_module.JSONDecodeError:
-                        logger.warning(f"Failed to parse metadata in {jsonl_file}")
-                        canonical_node_id = jsonl_file.stem
-                    continue  # Skip metadata line for entity loading
-
-                # Lines 2+ are entity results
-                if canonical_node_id is None:
-                    canonical_node_id = jsonl_file.stem
-
-                rows.append(
-                    {
-                        "run_id": run_id,
-                        "canonical_node_id": canonical_node_id,
-                        "file_path": str(jsonl_file),
-                        "json_data": line,
-                        "loaded_at": loaded_at,
-                    }
-                )
-
-    if rows:
-        # Load in batches to avoid memory issues
-        batch_size = 10000
-        with engine.begin() as conn:
-            for i in range(0, len(rows), batch_size):
-                batch = rows[i : i + batch_size]
-                df = pd.DataFrame(batch)
-                df.to_sql("raw_entity_results", conn, if_exists="append", index=False)
-                logger.info(f"Loaded entity results batch {i // batch_size + 1}: {len(batch)} rows")
-
-    logger.info(f"Loaded {len(rows)} total entity results from JSONL files")
-    return len(rows)
+    files = list(nodes_dir.glob("*.jsonl"))
+    if files:
+        logger.info(f"Found {len(files)} JSONL node files for entity extraction")
+        row_source: RowSource = iter_entity_rows_from_jsonl
+    else:
+        # Fall back to legacy JSON format
+        files = list(nodes_dir.glob("*.json"))
+        if not files:
+            logger.warning("No node result files found for entity extraction")
+            return 0
+        logger.info(f"Found {len(files)} legacy JSON node files for entity extraction")
+        row_source = iter_entity_rows_from_legacy_json
+
+    options = options or LoadOptions()
+
+    loaded = load_files(
+        engine,
+        "raw_entity_results",
+        RAW_ENTITY_RESULTS_COLUMNS,
+        row_source,
+        files,
+        run_id,
+        options,
+    )
 
+    logger.info(f"Loaded {loaded} total entity results")
+    return loaded
 
-def _load_entity_results_from_legacy_json(engine: Engine, json_files: list[Path], run_id: str) -> int:
-    """Load entity results from legacy JSON node files.
 
-    Legacy JSON format has entity_results embedded in each node JSON file.
-    This function extracts them and loads to raw_entity_results.
+def log_load_report(stats: list[TableLoadStats]) -> None:
+    """Log row counts, elapsed time and throughput per table.
 
     Args:
-        engine: SQLAlchemy engine.
-        json_files: List of JSON node files.
-        run_id: Run identifier.
-
-    Returns:
-        Number of rows loaded.
+        stats: Load stats per table, in load order.
     """
-    import json as json_module
-
-    logger.info(f"Extracting entity results from {len(json_files)} legacy JSON files")
-
-    truncate_table(engine, "raw_entity_results")
-
-    rows = []
-    loaded_at = datetime.now(UTC)
-
-    for json_file in json_files:
-        try:
-            node_data = json_module.loads(json_file.read_text(encoding="utf-8"))
-            canonical_node_id = node_data.get("canonical_node_id", json_file.stem)
-            entity_results = node_data.get("entity_results", [])
-
-            for entity in entity_results:
-                rows.append(
-                    {
-                        "run_id": run_id,
-                        "canonical_node_id": str(canonical_node_id),
-                        "file_path": str(json_file),
-                        "json_data": json_module.dumps(entity),
-                        "loaded_at": loaded_at,
-                    }
-                )
-        except Exception as e:
-            logger.warning(f"Failed to parse entity results from {json_file}: {e}")
-            continue
-
-    if rows:
-        batch_size = 10000
-        with engine.begin() as conn:
-            for i in range(0, len(rows), batch_size):
-                batch = rows[i : i + batch_size]
-                df = pd.DataFrame(batch)
-                df.to_sql("raw_entity_results", conn, if_exists="append", index=False)
-                logger.info(f"Loaded entity results batch {i // batch_size + 1}: {len(batch)} rows")
-
-    logger.info(f"Loaded {len(rows)} entity results from legacy JSON files")
-    return len(rows)
+    logger.info("=" * 60)
+    logger.info("LOAD SUMMARY")
+    logger.info("=" * 60)
+    logger.info(f"  {'table':<20} {'rows':>12} {'seconds':>9} {'rows/sec':>12}")
+    for entry in stats:
+        logger.info(f"  {entry.table_name:<20} {entry.rows:>12,} {entry.seconds:>9.2f} {entry.rows_per_second:>12,.0f}")
+    total_rows = sum(entry.rows for entry in stats)
+    total_seconds = sum(entry.seconds for entry in stats)
+    total_rate = total_rows / total_seconds if total_seconds > 0 else 0.0
+    logger.info(f"  {'TOTAL':<20} {total_rows:>12,} {total_seconds:>9.2f} {total_rate:>12,.0f}")
+    logger.info("=" * 60)
 
 
 def parse_args() -> argparse.Namespace:
@@ -602,6 +1364,34 @@ def parse_args() -> argparse.Namespace:
         default=default_insight_graph_run,
         help="Relative path to insight graph run",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for parsing source files; with more than one, tables also load concurrently (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Rows read from source files per write batch (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--copy-buffer-mb",
+        type=float,
+        default=DEFAULT_COPY_BUFFER_SIZE / (1024 * 1024),
+        help="COPY buffer size in MiB; rows are flushed to the server when it fills (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Reload the run's partitions even if its source files are unchanged",
+    )
+    parser.add_argument(
+        "--drop-other-runs",
+        action="store_true",
+        help="Drop partitions of all other runs after loading (keep only this run)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -621,7 +1411,7 @@ def main() -> int:
     """
     args = parse_args()
 
-    # Convert async URL to sync for pandas/SQLAlchemy
+    # Convert async URL to sync for SQLAlchemy/psycopg2
     sync_url = get_sync_database_url(args.database_url)
     logger.info(f"Database URL: {sync_url.split('@')[1] if '@' in sync_url else sync_url}")
 
@@ -660,26 +1450,42 @@ def main() -> int:
     logger.info(f"Insight graph run_id: {insight_graph_run_id}")
 
     # Load data
-    results = {}
+    batch_size = max(args.batch_size, 1)
+    buffer_size = max(int(args.copy_buffer_mb * 1024 * 1024), 1)
+    loaders = [
+        ("raw_node_results", load_node_results),
+        ("raw_entity_results", load_entity_results),
+        ("raw_contributions", load_contributions),
+        ("raw_classifications", load_classifications),
+    ]
+    workers = max(args.workers, 1)
+
+    def timed_load(table_name: str, loader: Callable[..., int], executor: Executor | None) -> TableLoadStats:
+        # About one buffer-sized task per worker per table; the four tables share the pool, keeping it busy
+        options = LoadOptions(batch_size, buffer_size, executor, workers * buffer_size, args.force)
+        started = time.perf_counter()
+        rows = loader(engine, insight_graph_path, insight_graph_run_id, options)
+        return TableLoadStats(table_name, rows, time.perf_counter() - started)
+
     try:
-        results["node_results"] = load_node_results(engine, insight_graph_path, insight_graph_run_id)
-        results["entity_results"] = load_entity_results(engine, insight_graph_path, insight_graph_run_id)
-        results["contributions"] = load_contributions(engine, insight_graph_path, insight_graph_run_id)
-        results["classifications"] = load_classifications(engine, insight_graph_path, insight_graph_run_id)
+        if workers > 1:
+            # One writer thread and COPY connection per table; parsing fans out to the shared process pool
+            logger.info(f"Loading tables concurrently with {workers} parser processes")
+            with ProcessPoolExecutor(workers) as pool, ThreadPoolExecutor(len(loaders)) as writers:
+                futures = [writers.submit(timed_load, table_name, loader, pool) for table_name, loader in loaders]
+                stats = [future.result() for future in futures]
+        else:
+            stats = [timed_load(table_name, loader, None) for table_name, loader in loaders]
 
     except Exception as e:
         logger.exception(f"Error loading data: {e}")
         return 1
 
-    # Summary
-    logger.info("=" * 50)
-    logger.info("LOAD SUMMARY")
-    logger.info("=" * 50)
-    for table, count in results.items():
-        logger.info(f"  {table}: {count:,} rows")
-    total = sum(results.values())
-    logger.info(f"  TOTAL: {total:,} rows")
-    logger.info("=" * 50)
+    if args.drop_other_runs:
+        for table_name in PARTITIONED_RAW_TABLES:
+            drop_other_run_partitions(engine, table_name, insight_graph_run_id)
+
+    log_load_report(stats)
 
     return 0
 
@@ -12,6 +12,7 @@
 #   --database-url URL         PostgreSQL connection (default: from config)
 #   --skip-load                Skip data loading (stages 8-9)
 #   --skip-dbt                 Skip dbt build (stage 10)
+#   --full-refresh             Rebuild incremental dbt models for every run
 #   --skip-hydrate             Skip signal hydration (stage 11)
 #   --skip-validate            Skip E2E validation (stage 13)
 #   --dry-run                  Show what would be executed
@@ -26,6 +27,7 @@ MODELING_RUN=""
 DATABASE_URL=""
 SKIP_LOAD=false
 SKIP_DBT=false
+FULL_REFRESH=false
 SKIP_HYDRATE=false
 SKIP_VALIDATE=false
 DRY_RUN=false
@@ -54,6 +56,7 @@ while [[ $# -gt 0 ]]; do
         --database-url) DATABASE_URL="$2"; shift 2 ;;
         --skip-load) SKIP_LOAD=true; shift ;;
         --skip-dbt) SKIP_DBT=true; shift ;;
+        --full-refresh) FULL_REFRESH=true; shift ;;
         --skip-hydrate) SKIP_HYDRATE=true; shift ;;
         --skip-validate) SKIP_VALIDATE=true; shift ;;
         --dry-run) DRY_RUN=true; shift ;;
@@ -120,12 +123,15 @@ fi
 if [[ "$SKIP_DBT" != "true" ]]; then
     log_info "=== Stage 10: Running dbt build ==="
 
+    DBT_BUILD_ARGS=""
+    [[ "$FULL_REFRESH" == "true" ]] && DBT_BUILD_ARGS="--full-refresh"
+
     if [[ "$DRY_RUN" == "true" ]]; then
-        log_info "[DRY-RUN] Would execute: cd dbt && UV_CACHE_DIR=../.uv-cache uv run dbt build"
+        log_info "[DRY-RUN] Would execute: cd dbt && UV_CACHE_DIR=../.uv-cache uv run dbt build $DBT_BUILD_ARGS"
     else
         cd dbt
         UV_CACHE_DIR=../.uv-cache uv run dbt deps
-        UV_CACHE_DIR=../.uv-cache uv run dbt build
+        UV_CACHE_DIR=../.uv-cache uv run dbt build $DBT_BUILD_ARGS
         cd ..
     fi
 fi
@@ -136,10 +142,14 @@ fi
 if [[ "$SKIP_HYDRATE" != "true" ]]; then
     log_info "=== Stage 11: Hydrating signals ==="
 
+    # fct_signals keeps every loaded run; hydrate only this one (the loader's
+    # run_id is the last component of the run path)
+    HYDRATE_RUN_ID="$(basename "$INSIGHT_GRAPH_RUN")"
+
     if [[ "$DRY_RUN" == "true" ]]; then
-        log_info "[DRY-RUN] Would execute: signal-cli hydrate"
+        log_info "[DRY-RUN] Would execute: signal-cli hydrate --run-id $HYDRATE_RUN_ID"
     else
-        UV_CACHE_DIR=.uv-cache uv run signal-cli hydrate
+        UV_CACHE_DIR=.uv-cache uv run signal-cli hydrate --run-id "$HYDRATE_RUN_ID"
     fi
 fi
 
@@ -14,7 +14,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models import ActivityEvent, EventType
-from src.db.session import get_async_db_session
+from src.db.session import get_async_db_session, get_async_read_session
 from src.schemas.activity import ActivityEventResponse, FeedResponse
 
 logger = logging.getLogger(__name__)
@@ -27,6 +27,7 @@ router = APIRouter(prefix="/feed", tags=["activity"])
 # =============================================================================
 
 DbSession = Annotated[AsyncSession, Depends(get_async_db_session)]
+ReadOnlySession = Annotated[AsyncSession, Depends(get_async_read_session)]
 
 # Query parameter annotations
 SignalIdFilter = Annotated[UUID | None, Query(description="Filter events by signal UUID")]
@@ -67,7 +68,7 @@ def _event_to_response(event: ActivityEvent) -> ActivityEventResponse:
 
 @router.get("", response_model=FeedResponse)
 async def get_feed(
-    session: DbSession,
+    session: ReadOnlySession,
     signal_id: SignalIdFilter = None,
     event_type: EventTypeFilter = None,
     limit: LimitQuery = 20,
@@ -152,7 +153,7 @@ async def get_feed(
 
 @router.get("/unread-count", response_model=dict[str, int])
 async def get_unread_count(
-    session: DbSession,
+    session: ReadOnlySession,
     signal_id: SignalIdFilter = None,
 ) -> dict[str, int]:
     """Get count of unread activity events.
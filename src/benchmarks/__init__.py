@@ -0,0 +1,8 @@
+"""Benchmark module - synthetic datasets and API load testing.
+
+- synthetic_data: generates N signals with assignments and activity events
+  and COPY-loads them into PostgreSQL
+- load_driver: drives the main API endpoints with concurrent httpx clients
+  and reports throughput and latency percentiles
+- cli: ``python -m src.benchmarks.cli seed|run|compare``
+"""
@@ -0,0 +1,137 @@
+"""CLI commands for API benchmarks.
+
+Usage:
+    # From backend directory
+    # Load 1e6 synthetic signals (replacing signals, assignments and events)
+    uv run python -m src.benchmarks.cli seed --signals 1000000 --reset
+
+    # Drive the main endpoints in-process and save a baseline
+    uv run python -m src.benchmarks.cli run --output benchmarks/baseline.json
+
+    # Against a running server, failing on regressions against the baseline
+    uv run python -m src.benchmarks.cli run --url http://localhost:8000 --compare benchmarks/baseline.json
+
+    # Compare two saved reports
+    uv run python -m src.benchmarks.cli compare benchmarks/baseline.json benchmarks/current.json
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any
+
+import click
+import httpx
+
+from src.benchmarks.load_driver import DEFAULT_SCENARIOS, Scenario, compare_reports, load_report, run_scenarios, save_report
+from src.benchmarks.synthetic_data import DEFAULT_BATCH_SIZE, SyntheticDataGenerator, load_synthetic_data
+from src.config import settings
+
+
+@click.group()
+def cli() -> None:
+    """API benchmark commands."""
+    pass
+
+
+@cli.command()
+@click.option("--signals", "-n", type=click.IntRange(min=1), default=10_000, show_default=True, help="Signals to generate (1e4-1e7 is typical).")
+@click.option("--seed", type=int, default=0, show_default=True, help="Random seed; equal seeds give identical data.")
+@click.option("--facilities", type=click.IntRange(min=1), default=None, help="Facilities (default: one per 500 signals, 20-5000).")
+@click.option("--users", type=click.IntRange(min=2), default=50, show_default=True, help="Users to assign signals to.")
+@click.option("--assignment-rate", type=click.FloatRange(0, 1), default=0.3, show_default=True, help="Fraction of signals with an assignment.")
+@click.option("--batch-size", type=click.IntRange(min=1), default=DEFAULT_BATCH_SIZE, show_default=True, help="Signals per COPY batch.")
+@click.option("--reset", is_flag=True, help="Truncate signals, assignments and activity events first.")
+def seed(signals: int, seed: int, facilities: int | None, users: int, assignment_rate: float, batch_size: int, reset: bool) -> None:
+    """COPY-load a synthetic dataset into DATABASE_URL."""
+    generator = SyntheticDataGenerator(signals, seed=seed, facilities=facilities, users=users, assignment_rate=assignment_rate)
+
+    def progress(loaded: int, total: int, elapsed: float) -> None:
+        click.echo(f"  {loaded:,}/{total:,} signals ({loaded / elapsed:,.0f}/s)")
+
+    counts = asyncio.run(load_synthetic_data(settings.DATABASE_URL, generator, batch_size=batch_size, reset=reset, progress=progress))
+    click.echo("\nSeed complete: " + ", ".join(f"{count:,} {table}" for table, count in counts.items()))
+
+
+@cli.command()
+@click.option("--url", default=None, help="Base URL of a running server (default: the app in-process).")
+@click.option("--concurrency", "-c", type=click.IntRange(min=1), default=50, show_default=True, help="Concurrent clients per scenario.")
+@click.option("--duration", "-d", type=click.FloatRange(min=0, min_open=True), default=10.0, show_default=True, help="Seconds per scenario.")
+@click.option("--scenario", "-s", "scenario_names", multiple=True, help="Scenario to run (repeatable, default: all).")
+@click.option("--output", "-o", type=click.Path(dir_okay=False, path_type=Path), default=None, help="Write the report as JSON.")
+@click.option(
+    "--compare", "baseline_path", type=click.Path(exists=True, dir_okay=False, path_type=Path), default=None, help="Baseline report to check for regressions."
+)
+@click.option("--tolerance", type=click.FloatRange(min=0), default=0.2, show_default=True, help="Allowed relative regression.")
+def run(
+    url: str | None,
+    concurrency: int,
+    duration: float,
+    scenario_names: tuple[str, ...],
+    output: Path | None,
+    baseline_path: Path | None,
+    tolerance: float,
+) -> None:
+    """Drive the main endpoints and report throughput and latency percentiles."""
+    known = {scenario.name: scenario for scenario in DEFAULT_SCENARIOS}
+    unknown = set(scenario_names) - set(known)
+    if unknown:
+        raise click.BadParameter(f"unknown scenario(s) {', '.join(sorted(unknown))}; choose from {', '.join(known)}", param_hint="--scenario")
+    scenarios = [known[name] for name in scenario_names] if scenario_names else DEFAULT_SCENARIOS
+
+    report = asyncio.run(_run(url, scenarios, concurrency, duration))
+    _print_report(report)
+    if output is not None:
+        save_report(report, output)
+        click.echo(f"\nReport written to {output}")
+    if baseline_path is not None:
+        _exit_on_regressions(load_report(baseline_path), report, tolerance)
+
+
+async def _run(url: str | None, scenarios: list[Scenario], concurrency: int, duration: float) -> dict[str, Any]:
+    """Run the scenarios against a server or the in-process app."""
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    if url is not None:
+        async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60.0) as client:
+            return await run_scenarios(client, scenarios, concurrency, duration)
+
+    from src.main import create_app
+
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=60.0) as client:
+        return await run_scenarios(client, scenarios, concurrency, duration)
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    """Print one line per scenario."""
+    click.echo(f"{'scenario':<24} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'errors':>7}")
+    for name, result in report["results"].items():
+        click.echo(
+            f"{name:<24} {result['throughput']:>9.1f} {result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} "
+            f"{result['p99_ms']:>8.1f} {result['max_ms']:>8.1f} {result['errors']:>7}"
+        )
+
+
+def _exit_on_regressions(baseline: dict[str, Any], current: dict[str, Any], tolerance: float) -> None:
+    """Print regressions and exit with status 1 if there are any."""
+    regressions = compare_reports(baseline, current, tolerance)
+    if not regressions:
+        click.echo(f"\nNo regressions beyond {tolerance:.0%}")
+        return
+    click.echo(f"\n{len(regressions)} regression(s) beyond {tolerance:.0%}:")
+    for regression in regressions:
+        click.echo(f"  {regression}")
+    sys.exit(1)
+
+
+@cli.command()
+@click.argument("baseline_path", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument("current_path", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--tolerance", type=click.FloatRange(min=0), default=0.2, show_default=True, help="Allowed relative regression.")
+def compare(baseline_path: Path, current_path: Path, tolerance: float) -> None:
+    """Compare a report against a baseline; exit 1 on regressions."""
+    _exit_on_regressions(load_report(baseline_path), load_report(current_path), tolerance)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,246 @@
+"""Concurrent httpx load driver for the main API endpoints.
+
+Each scenario is one endpoint request. run_scenarios drives the scenarios
+one after another, each with N concurrent clients for a fixed duration,
+against either the app in-process (httpx ASGI transport: no network, no
+HTTP server) or a running server (e.g. a local uvicorn). Results report
+throughput and latency percentiles. They can be saved as a baseline JSON
+file, and compare_reports flags regressions against a baseline.
+
+Usage:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=create_app()), base_url="http://benchmark") as client:
+        report = await run_scenarios(client, DEFAULT_SCENARIOS, concurrency=50, duration=10)
+    save_report(report, Path("benchmarks/baseline.json"))
+"""
+
+import asyncio
+import json
+import statistics
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One endpoint request driven by the load driver.
+
+    Attributes:
+        name: Result key.
+        path: Request path; "{signal_id}" is filled from sampled signals.
+        params: Query parameters.
+    """
+
+    name: str
+    path: str
+    params: dict[str, str | int] = field(default_factory=dict)
+
+
+DEFAULT_SCENARIOS = [
+    Scenario("list_signals", "/api/signals", {"limit": 25}),
+    Scenario("list_signals_filtered", "/api/signals", {"limit": 25, "domain": "Safety", "sort_by": "priority"}),
+    Scenario("list_signals_deep_page", "/api/signals", {"limit": 25, "offset": 5000}),
+    Scenario("filter_options", "/api/signals/filter-options"),
+    Scenario("facilities", "/api/signals/facilities"),
+    Scenario("signal_detail", "/api/signals/{signal_id}"),
+    Scenario("signal_assignment", "/api/signals/{signal_id}/assignment"),
+    Scenario("activity_feed", "/api/feed", {"limit": 20}),
+    Scenario("unread_count", "/api/feed/unread-count"),
+    Scenario("users", "/api/users"),
+]
+
+# Signals sampled for "{signal_id}" scenarios
+SIGNAL_SAMPLE_SIZE = 100
+
+
+@dataclass
+class ScenarioResult:
+    """Outcome of one scenario.
+
+    Attributes:
+        name: Scenario name.
+        elapsed: Seconds the scenario ran.
+        latencies: Seconds per successful request (2xx, or 404 for
+            sampled signals without an assignment).
+        errors: Failed requests (other statuses and transport errors).
+    """
+
+    name: str
+    elapsed: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """Successful requests per second."""
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, q: int) -> float:
+        """Latency percentile in milliseconds, within the observed latencies."""
+        if len(self.latencies) < 2:
+            return self.latencies[0] * 1000 if self.latencies else 0.0
+        # The default exclusive method extrapolates past the slowest request on short runs
+        return statistics.quantiles(self.latencies, n=100, method="inclusive")[q - 1] * 1000
+
+    def summary(self) -> dict[str, float | int]:
+        """Return the report entry for this scenario."""
+        return {
+            "requests": len(self.latencies),
+            "errors": self.errors,
+            "throughput": round(self.throughput, 2),
+            "mean_ms": round(statistics.fmean(self.latencies) * 1000, 3) if self.latencies else 0.0,
+            "p50_ms": round(self.percentile(50), 3),
+            "p90_ms": round(self.percentile(90), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "max_ms": round(max(self.latencies) * 1000, 3) if self.latencies else 0.0,
+        }
+
+
+async def sample_signal_ids(client: httpx.AsyncClient, count: int = SIGNAL_SAMPLE_SIZE) -> list[str]:
+    """Fetch signal IDs to fill "{signal_id}" scenario paths.
+
+    Args:
+        client: Client for the target API.
+        count: Number of signals to sample (most recently detected).
+
+    Returns:
+        Signal IDs; empty if the signals table is empty.
+    """
+    response = await client.get("/api/signals", params={"limit": min(count, 100)})
+    response.raise_for_status()
+    return [signal["id"] for signal in response.json()["signals"]]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    concurrency: int,
+    duration: float,
+    signal_ids: list[str],
+) -> ScenarioResult:
+    """Drive one scenario with concurrent clients for a duration.
+
+    Args:
+        client: Client for the target API.
+        scenario: Scenario to run.
+        concurrency: Number of concurrent clients.
+        duration: Seconds to run.
+        signal_ids: IDs used round-robin for "{signal_id}" paths.
+
+    Returns:
+        ScenarioResult with per-request latencies.
+    """
+    result = ScenarioResult(name=scenario.name)
+    needs_signal = "{signal_id}" in scenario.path
+    # A signal without an assignment answers 404, which is the normal case
+    ok_statuses = {200, 404} if needs_signal else {200}
+    counter = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        nonlocal counter
+        while time.perf_counter() < deadline:
+            path = scenario.path
+            if needs_signal:
+                path = path.format(signal_id=signal_ids[counter % len(signal_ids)])
+                counter += 1
+            started = time.perf_counter()
+            try:
+                response = await client.get(path, params=scenario.params)
+            except httpx.HTTPError:
+                result.errors += 1
+                continue
+            if response.status_code in ok_statuses:
+                result.latencies.append(time.perf_counter() - started)
+            else:
+                result.errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+async def run_scenarios(
+    client: httpx.AsyncClient,
+    scenarios: list[Scenario],
+    concurrency: int,
+    duration: float,
+    warmup: float = 1.0,
+) -> dict[str, Any]:
+    """Run scenarios one after another and build a report.
+
+    Scenarios that need a signal ID are skipped when there are no signals.
+
+    Args:
+        client: Client for the target API.
+        scenarios: Scenarios to run.
+        concurrency: Concurrent clients per scenario.
+        duration: Seconds per scenario.
+        warmup: Seconds each scenario runs before measuring (pool and
+            statement cache warm-up).
+
+    Returns:
+        Report with the run parameters and a summary per scenario.
+    """
+    signal_ids = await sample_signal_ids(client)
+    results: dict[str, dict[str, float | int]] = {}
+    for scenario in scenarios:
+        if "{signal_id}" in scenario.path and not signal_ids:
+            continue
+        if warmup > 0:
+            await run_scenario(client, scenario, min(concurrency, 10), warmup, signal_ids)
+        results[scenario.name] = (await run_scenario(client, scenario, concurrency, duration, signal_ids)).summary()
+    return {
+        "created_at": datetime.now(UTC).isoformat(),
+        "target": str(client.base_url),
+        "concurrency": concurrency,
+        "duration": duration,
+        "results": results,
+    }
+
+
+def save_report(report: dict[str, Any], path: Path) -> None:
+    """Write a report as JSON (e.g. a baseline for compare_reports)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    """Read a report written by save_report."""
+    report: dict[str, Any] = json.loads(path.read_text())
+    return report
+
+
+def compare_reports(baseline: dict[str, Any], current: dict[str, Any], tolerance: float = 0.2) -> list[str]:
+    """Find scenarios that regressed against a baseline.
+
+    A scenario regresses when its p95 latency grows, or its throughput
+    drops, by more than tolerance, or when it has errors the baseline did
+    not. Scenarios missing from either report are ignored.
+
+    Args:
+        baseline: Baseline report.
+        current: Report to check.
+        tolerance: Allowed relative change (0.2 = 20%).
+
+    Returns:
+        One message per regression; empty if none.
+    """
+    regressions = []
+    for name, before in baseline["results"].items():
+        after = current["results"].get(name)
+        if after is None:
+            continue
+        if before["p95_ms"] and after["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {before['p95_ms']:.1f} ms -> {after['p95_ms']:.1f} ms")
+        if before["throughput"] and after["throughput"] < before["throughput"] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {before['throughput']:.1f} -> {after['throughput']:.1f} req/s")
+        if after["errors"] and not before["errors"]:
+            regressions.append(f"{name}: {after['errors']} errors")
+    return regressions
@@ -0,0 +1,428 @@
+"""Synthetic signals, assignments and activity events for benchmarks.
+
+SyntheticDataGenerator produces a deterministic (seeded) dataset of any
+size with realistic shapes: facilities grouped into health systems with a
+long-tailed share of signals, weighted service lines and metrics, metric
+values around per-metric peer distributions, 12-month JSONB trend
+timelines, the 9 signal types with their severity bands, and assignments
+and activity events for a fraction of the signals.
+
+load_synthetic_data streams the rows into PostgreSQL in batches with
+asyncpg's binary COPY, so 1e7 signals load with bounded memory.
+
+Usage:
+    generator = SyntheticDataGenerator(signals=100_000, seed=42)
+    counts = await load_synthetic_data(settings.DATABASE_URL, generator)
+"""
+
+import hashlib
+import json
+import logging
+import math
+import random
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+logger = logging.getLogger(__name__)
+
+# Signals per COPY batch
+DEFAULT_BATCH_SIZE = 50_000
+
+# Emails of generated users, used to remove them on reset
+USER_EMAIL_DOMAIN = "benchmark.example"
+
+# Service line -> sub-service lines (None: no sub-service line), with the
+# share of signals each service line gets
+SERVICE_LINES: dict[str, tuple[float, list[str | None]]] = {
+    "Medicine": (0.20, ["Hospitalist", "Pulmonary", "Nephrology", "Gastroenterology"]),
+    "Surgery": (0.16, ["General Surgery", "Trauma", "Vascular Surgery", "Bariatric Surgery"]),
+    "Cardiology": (0.14, ["Cardiac Intensive Care", "Heart Failure", "Interventional Cardiology", "Electrophysiology"]),
+    "Orthopedics": (0.10, ["Spine Surgery", "Joint Replacement", "Sports Medicine"]),
+    "Oncology": (0.09, ["Medical Oncology", "Radiation Oncology", "Hematology"]),
+    "Emergency": (0.09, [None]),
+    "Neurology": (0.07, ["Stroke", "Epilepsy", "Neurosurgery"]),
+    "Pediatrics": (0.06, ["NICU", "General Pediatrics", "PICU"]),
+    "Women's Health": (0.05, ["Obstetrics", "Gynecology"]),
+    "Behavioral Health": (0.04, ["Inpatient Psychiatry", "Substance Use"]),
+}
+
+# metric_id -> (domain enum name, peer mean, peer std, share of signals)
+METRICS: dict[str, tuple[str, float, float, float]] = {
+    "losIndex": ("EFFICIENCY", 1.0, 0.15, 0.16),
+    "averageLos": ("EFFICIENCY", 4.6, 1.2, 0.12),
+    "throughput": ("EFFICIENCY", 252.0, 40.0, 0.06),
+    "readmissionRate": ("EFFECTIVENESS", 15.0, 4.0, 0.16),
+    "mortalityRate": ("EFFECTIVENESS", 2.5, 1.0, 0.12),
+    "sepsisMortality": ("EFFECTIVENESS", 12.0, 3.0, 0.06),
+    "clabsiRate": ("SAFETY", 1.2, 0.4, 0.09),
+    "cautiRate": ("SAFETY", 1.0, 0.3, 0.08),
+    "fallRate": ("SAFETY", 2.8, 0.8, 0.09),
+    "vaeRate": ("SAFETY", 6.0, 2.0, 0.06),
+}
+
+# Signal type -> (share of signals, severity range)
+SIGNAL_TYPES: dict[str, tuple[float, tuple[int, int]]] = {
+    "baseline": (0.33, (10, 30)),
+    "emerging_risk": (0.12, (50, 70)),
+    "chronic_underperformer": (0.10, (60, 80)),
+    "critical_trajectory": (0.05, (80, 95)),
+    "volatility_alert": (0.08, (40, 60)),
+    "recovering": (0.08, (30, 50)),
+    "improving_leader": (0.09, (10, 25)),
+    "sustained_excellence": (0.10, (5, 15)),
+    "suspect_data": (0.05, (20, 40)),
+}
+
+# Assignment status enum name -> share of assigned signals
+ASSIGNMENT_STATUSES: dict[str, float] = {"ASSIGNED": 0.35, "IN_PROGRESS": 0.30, "RESOLVED": 0.25, "CLOSED": 0.10}
+ASSIGNMENT_ROLE_TYPES = ["CLINICAL_LEADERSHIP", "NURSING_LEADERSHIP", "ADMINISTRATION"]
+USER_ROLES = ["CLINICAL_LEADERSHIP", "NURSING_LEADERSHIP", "ADMINISTRATION", "VIEWER"]
+
+_FACILITY_PREFIXES = ["St. Mary", "University", "Community", "Memorial", "Mercy", "Riverside", "Lakeview", "Providence", "Summit", "Valley"]
+_FACILITY_SUFFIXES = ["Medical Center", "General Hospital", "Regional Hospital", "Health Center", "Hospital"]
+_TIMELINE_PERIODS = 12
+
+SIGNAL_COLUMNS = [
+    "id",
+    "canonical_node_id",
+    "metric_id",
+    "domain",
+    "facility",
+    "facility_id",
+    "system_name",
+    "service_line",
+    "sub_service_line",
+    "description",
+    "metric_value",
+    "peer_mean",
+    "peer_std",
+    "percentile_rank",
+    "encounters",
+    "detected_at",
+    "simplified_signal_type",
+    "simplified_severity",
+    "simplified_severity_range",
+    "entity_dimensions",
+    "entity_dimensions_hash",
+    "groupby_label",
+    "group_value",
+    "metric_trend_timeline",
+    "trend_direction",
+]
+ASSIGNMENT_COLUMNS = ["id", "signal_id", "assignee_id", "assigner_id", "status", "role_type", "notes", "assigned_at", "started_at", "resolved_at", "closed_at"]
+EVENT_COLUMNS = ["id", "event_type", "signal_id", "user_id", "payload", "read", "created_at"]
+USER_COLUMNS = ["id", "email", "name", "hashed_password", "role", "is_active"]
+
+
+@dataclass(frozen=True)
+class Facility:
+    """A generated facility."""
+
+    name: str
+    facility_id: str
+    system_name: str
+
+
+@dataclass
+class GeneratedBatch:
+    """Rows for one COPY batch, as tuples in *_COLUMNS order."""
+
+    signals: list[tuple[Any, ...]] = field(default_factory=list)
+    assignments: list[tuple[Any, ...]] = field(default_factory=list)
+    events: list[tuple[Any, ...]] = field(default_factory=list)
+
+
+def _cumulative(weights: Iterable[float]) -> list[float]:
+    """Return running totals of weights, for random.choices(cum_weights=...)."""
+    totals: list[float] = []
+    total = 0.0
+    for weight in weights:
+        total += weight
+        totals.append(total)
+    return totals
+
+
+def _weighted(table: dict[str, Any], weight: Callable[[Any], float]) -> tuple[list[str], list[float]]:
+    """Split a lookup table into keys and cumulative weights."""
+    return list(table), _cumulative(weight(entry) for entry in table.values())
+
+
+class SyntheticDataGenerator:
+    """Deterministic generator of a benchmark dataset.
+
+    Attributes:
+        signal_count: Number of signals generated.
+        seed: Random seed; equal seeds give identical datasets.
+        assignment_rate: Fraction of signals with an assignment.
+        now: Reference time; signals are detected in the 180 days before it.
+    """
+
+    def __init__(
+        self,
+        signals: int,
+        seed: int = 0,
+        facilities: int | None = None,
+        users: int = 50,
+        assignment_rate: float = 0.3,
+        now: datetime | None = None,
+    ) -> None:
+        """Initialize the generator.
+
+        Args:
+            signals: Number of signals to generate.
+            seed: Random seed.
+            facilities: Number of facilities. Defaults to one per 500
+                signals, between 20 and 5000.
+            users: Number of users signals are assigned to.
+            assignment_rate: Fraction of signals with an assignment.
+            now: Reference time (default: current time).
+        """
+        self.signal_count = signals
+        self.seed = seed
+        self.assignment_rate = assignment_rate
+        self.now = now or datetime.now(tz=UTC)
+        rng = random.Random(seed)
+        self.facilities = self._make_facilities(rng, facilities or min(max(signals // 500, 20), 5000))
+        # Long tail: a few large facilities account for many signals
+        self._facility_weights = _cumulative(1 / (rank + 1) ** 0.8 for rank in range(len(self.facilities)))
+        self.user_ids = [UUID(int=rng.getrandbits(128), version=4) for _ in range(users)]
+        self._user_rows = [
+            (
+                user_id,
+                f"bench-user-{seed}-{i}@{USER_EMAIL_DOMAIN}",
+                f"Benchmark User {i}",
+                "$2b$12$benchmark_hash_not_real",
+                USER_ROLES[i % len(USER_ROLES)],
+                True,
+            )
+            for i, user_id in enumerate(self.user_ids)
+        ]
+        self._service_lines, self._service_line_weights = _weighted(SERVICE_LINES, lambda entry: entry[0])
+        self._metrics, self._metric_weights = _weighted(METRICS, lambda entry: entry[3])
+        self._signal_types, self._signal_type_weights = _weighted(SIGNAL_TYPES, lambda entry: entry[0])
+        self._statuses, self._status_weights = _weighted(ASSIGNMENT_STATUSES, lambda share: share)
+        self._periods = [_month_offset(self.now, months) for months in range(-_TIMELINE_PERIODS + 1, 1)]
+
+    @staticmethod
+    def _make_facilities(rng: random.Random, count: int) -> list[Facility]:
+        """Generate facilities grouped into systems of about 8."""
+        systems = [f"{rng.choice(_FACILITY_PREFIXES)} Health System {i + 1}" for i in range(max(count // 8, 1))]
+        return [
+            Facility(
+                name=f"{rng.choice(_FACILITY_PREFIXES)} {rng.choice(_FACILITY_SUFFIXES)} {i + 1}",
+                facility_id=f"{450000 + i:06d}",
+                system_name=systems[i % len(systems)],
+            )
+            for i in range(count)
+        ]
+
+    def users(self) -> list[tuple[Any, ...]]:
+        """Return the user rows in USER_COLUMNS order."""
+        return list(self._user_rows)
+
+    def batches(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[GeneratedBatch]:
+        """Generate the dataset in batches.
+
+        Each batch is generated from its own seeded RNG, so batches are
+        reproducible independently of batch_size boundaries elsewhere.
+
+        Args:
+            batch_size: Signals per batch.
+
+        Yields:
+            GeneratedBatch: Signals with their assignments and events.
+        """
+        for start in range(0, self.signal_count, batch_size):
+            rng = random.Random(f"{self.seed}:{start}")
+            batch = GeneratedBatch()
+            for index in range(start, min(start + batch_size, self.signal_count)):
+                self._add_signal(rng, index, batch)
+            yield batch
+
+    def _add_signal(self, rng: random.Random, index: int, batch: GeneratedBatch) -> None:
+        """Append one signal and its assignment and events to a batch."""
+        signal_id = UUID(int=rng.getrandbits(128), version=4)
+        facility = rng.choices(self.facilities, cum_weights=self._facility_weights)[0]
+        service_line = rng.choices(self._service_lines, cum_weights=self._service_line_weights)[0]
+        sub_service_line = rng.choice(SERVICE_LINES[service_line][1])
+        metric_id = rng.choices(self._metrics, cum_weights=self._metric_weights)[0]
+        domain, peer_mean, peer_std, _ = METRICS[metric_id]
+        signal_type = rng.choices(self._signal_types, cum_weights=self._signal_type_weights)[0]
+        severity_low, severity_high = SIGNAL_TYPES[signal_type][1]
+
+        z_score = rng.gauss(0, 1.2)
+        metric_value = max(peer_mean + z_score * peer_std, 0.0)
+        percentile = 100 * 0.5 * (1 + math.erf(z_score / math.sqrt(2)))
+        encounters = int(rng.lognormvariate(6, 1)) + 10
+        detected_at = self.now - timedelta(days=rng.uniform(0, 180))
+        timeline, trend_direction = self._timeline(rng, metric_value, peer_std, encounters)
+
+        dimensions = {"vizient_service_line": service_line}
+        if sub_service_line is not None:
+            dimensions["sub_service_line"] = sub_service_line
+        dimensions_json = json.dumps(dimensions, sort_keys=True)
+        batch.signals.append(
+            (
+                signal_id,
+                f"bench:{facility.facility_id}/{service_line.lower().replace(' ', '_')}/{index}",
+                metric_id,
+                domain,
+                facility.name,
+                facility.facility_id,
+                facility.system_name,
+                service_line,
+                sub_service_line,
+                f"{metric_id} at {metric_value:.2f} vs peer mean {peer_mean:.2f} ({z_score:+.1f} SD) for {service_line} at {facility.name}.",
+                Decimal(f"{metric_value:.4f}"),
+                Decimal(f"{peer_mean:.4f}"),
+                Decimal(f"{peer_std:.4f}"),
+                Decimal(f"{percentile:.2f}"),
+                encounters,
+                detected_at,
+                signal_type,
+                rng.randint(severity_low, severity_high),
+                json.dumps([severity_low, severity_high]),
+                dimensions_json,
+                hashlib.md5(dimensions_json.encode(), usedforsecurity=False).hexdigest(),
+                "Vizient Service Line",
+                service_line,
+                json.dumps(timeline),
+                trend_direction,
+            )
+        )
+        batch.events.append(self._event(rng, "NEW_SIGNAL", signal_id, None, detected_at, {"signal_type": signal_type, "service_line": service_line}))
+
+        if rng.random() < self.assignment_rate:
+            self._add_assignment(rng, signal_id, detected_at, batch)
+
+    def _timeline(self, rng: random.Random, metric_value: float, peer_std: float, encounters: int) -> tuple[list[dict[str, Any]], str]:
+        """Random walk ending at metric_value, with its trend direction."""
+        slope = rng.gauss(0, 0.05) * peer_std
+        noise = 0.1 * peer_std
+        timeline = []
+        for offset, period in enumerate(self._periods):
+            steps_back = len(self._periods) - 1 - offset
+            value = max(metric_value - slope * steps_back + rng.gauss(0, noise), 0.0)
+            timeline.append({"period": period, "value": round(value, 4), "encounters": max(int(encounters / _TIMELINE_PERIODS * rng.uniform(0.7, 1.3)), 1)})
+        if abs(slope) < 0.02 * peer_std:
+            return timeline, "stable"
+        return timeline, "increasing" if slope > 0 else "decreasing"
+
+    def _add_assignment(self, rng: random.Random, signal_id: UUID, detected_at: datetime, batch: GeneratedBatch) -> None:
+        """Append an assignment with its workflow events."""
+        status = rng.choices(self._statuses, cum_weights=self._status_weights)[0]
+        assignee, assigner = rng.sample(self.user_ids, 2) if len(self.user_ids) > 1 else (self.user_ids[0], self.user_ids[0])
+        assigned_at = detected_at + timedelta(hours=rng.uniform(1, 72))
+        started_at = assigned_at + timedelta(hours=rng.uniform(1, 48)) if status != "ASSIGNED" else None
+        resolved_at = started_at + timedelta(days=rng.uniform(1, 30)) if started_at and status in ("RESOLVED", "CLOSED") else None
+        closed_at = resolved_at + timedelta(days=rng.uniform(1, 7)) if resolved_at and status == "CLOSED" else None
+        batch.assignments.append(
+            (
+                UUID(int=rng.getrandbits(128), version=4),
+                signal_id,
+                assignee,
+                assigner,
+                status,
+                rng.choice(ASSIGNMENT_ROLE_TYPES),
+                "Review drivers and propose an intervention",
+                assigned_at,
+                started_at,
+                resolved_at,
+                closed_at,
+            )
+        )
+        batch.events.append(self._event(rng, "ASSIGNMENT", signal_id, assigner, assigned_at, {"assignee_id": str(assignee)}))
+        for changed_at, new_status in ((started_at, "in_progress"), (resolved_at, "resolved"), (closed_at, "closed")):
+            if changed_at is not None:
+                batch.events.append(self._event(rng, "STATUS_CHANGE", signal_id, assignee, changed_at, {"new_status": new_status}))
+        if rng.random() < 0.3:
+            batch.events.append(
+                self._event(
+                    rng, "COMMENT", signal_id, assignee, assigned_at + timedelta(hours=rng.uniform(1, 96)), {"text": "Data reviewed with unit leadership"}
+                )
+            )
+
+    def _event(
+        self, rng: random.Random, event_type: str, signal_id: UUID, user_id: UUID | None, created_at: datetime, payload: dict[str, Any]
+    ) -> tuple[Any, ...]:
+        """Build one activity event row."""
+        return (UUID(int=rng.getrandbits(128), version=4), event_type, signal_id, user_id, json.dumps(payload), rng.random() < 0.6, min(created_at, self.now))
+
+
+def _month_offset(moment: datetime, months: int) -> str:
+    """Return the YYYYMM period months away from moment."""
+    month_index = moment.year * 12 + moment.month - 1 + months
+    return f"{month_index // 12:04d}{month_index % 12 + 1:02d}"
+
+
+def asyncpg_dsn(database_url: str) -> str:
+    """Convert a SQLAlchemy URL (postgresql+asyncpg://...) to an asyncpg DSN."""
+    return make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+async def load_synthetic_data(
+    database_url: str,
+    generator: SyntheticDataGenerator,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    reset: bool = False,
+    progress: Callable[[int, int, float], None] | None = None,
+) -> dict[str, int]:
+    """COPY a generated dataset into the database.
+
+    Everything loads in one transaction, so an interrupted load leaves the
+    tables unchanged. Tables are analyzed afterwards so benchmarks see
+    representative plans.
+
+    Args:
+        database_url: SQLAlchemy database URL (asyncpg driver).
+        generator: Dataset to load.
+        batch_size: Signals per COPY batch.
+        reset: Truncate signals, assignments and activity events and remove
+            previously generated users first.
+        progress: Called after each batch with (signals loaded, total,
+            seconds elapsed).
+
+    Returns:
+        Rows loaded per table.
+
+    Raises:
+        asyncpg.PostgresError: If a COPY fails.
+    """
+    counts = {"users": 0, "signals": 0, "assignments": 0, "activity_events": 0}
+    started = time.perf_counter()
+    connection = await asyncpg.connect(asyncpg_dsn(database_url))
+    try:
+        async with connection.transaction():
+            if reset:
+                await connection.execute("TRUNCATE signals, assignments, activity_events")
+                await connection.execute("DELETE FROM users WHERE email LIKE $1", f"%@{USER_EMAIL_DOMAIN}")
+            await connection.executemany(
+                f"INSERT INTO users ({', '.join(USER_COLUMNS)}) VALUES ($1, $2, $3, $4, $5, $6) ON CONFLICT (email) DO NOTHING",
+                generator.users(),
+            )
+            counts["users"] = len(generator.user_ids)
+
+            for batch in generator.batches(batch_size):
+                await connection.copy_records_to_table("signals", records=batch.signals, columns=SIGNAL_COLUMNS)
+                await connection.copy_records_to_table("assignments", records=batch.assignments, columns=ASSIGNMENT_COLUMNS)
+                await connection.copy_records_to_table("activity_events", records=batch.events, columns=EVENT_COLUMNS)
+                counts["signals"] += len(batch.signals)
+                counts["assignments"] += len(batch.assignments)
+                counts["activity_events"] += len(batch.events)
+                if progress is not None:
+                    progress(counts["signals"], generator.signal_count, time.perf_counter() - started)
+
+        await connection.execute("ANALYZE signals, assignments, activity_events, users")
+    finally:
+        await connection.close()
+
+    logger.info("Loaded %d signals in %.1fs", counts["signals"], time.perf_counter() - started)
+    return counts
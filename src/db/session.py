@@ -1,21 +1,105 @@
 """Async SQLAlchemy session management.
 
-Provides the async engine, session factory, and FastAPI dependency
-for database session injection.
+Provides the async engines, session factories, and FastAPI dependencies
+for database session injection: a read-write session for endpoints that
+modify data and a read-only session for pure reads.
+
+Pool sizing, the asyncpg prepared statement cache, statement_timeout,
+application_name and PgBouncer compatibility come from the DB_* settings.
 """
 
+import os
+import time
+import uuid
 from collections.abc import AsyncGenerator
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection, QueuePool
+
+from src.config import Settings, settings
+from src.observability.metrics import DB_POOL_CHECKOUT_WAIT
+
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records checkout wait times.
+
+    Each connect() is observed in db_pool_checkout_wait_seconds, labelled
+    with the pool's logging name ("primary" or "read").
+    """
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, timing the wait."""
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started, pool=self.logging_name or "primary")
+
+
+def _unique_statement_name() -> str:
+    """Return a prepared statement name that cannot clash across PgBouncer backends."""
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def engine_options(config: Settings = settings) -> dict[str, Any]:
+    """Build create_async_engine keyword arguments from settings.
+
+    Args:
+        config: Settings to read the DB_* options from.
+
+    Returns:
+        Keyword arguments for create_async_engine.
+    """
+    connect_args: dict[str, Any] = {"server_settings": {}}
+    if config.DB_PGBOUNCER:
+        # Transaction pooling hands each transaction to any server backend,
+        # where a cached named statement may not exist (or may clash)
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_cache_size"] = 0
+        connect_args["prepared_statement_name_func"] = _unique_statement_name
+    else:
+        connect_args["statement_cache_size"] = config.DB_STATEMENT_CACHE_SIZE
+        connect_args["prepared_statement_cache_size"] = config.DB_STATEMENT_CACHE_SIZE
+        if config.DB_STATEMENT_TIMEOUT_MS:
+            connect_args["server_settings"]["statement_timeout"] = str(config.DB_STATEMENT_TIMEOUT_MS)
+
+    return {
+        "echo": config.DEBUG,  # Log SQL statements in debug mode
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
+
+
+def _create_engine(url: str, pool_name: str) -> AsyncEngine:
+    """Create an async engine configured from settings.
+
+    The application_name is set per connection so it carries the process ID
+    of the worker that opened it, also when workers are forked after import.
+
+    Args:
+        url: Database URL.
+        pool_name: Pool label in metrics ("primary" or "read").
+    """
+    async_engine = create_async_engine(url, poolclass=TimedAsyncAdaptedQueuePool, pool_logging_name=pool_name, **engine_options())
+
+    @event.listens_for(async_engine.sync_engine, "do_connect")
+    def _set_application_name(dialect: Any, conn_rec: Any, cargs: Any, cparams: dict[str, Any]) -> None:
+        cparams["server_settings"] = {
+            **cparams.get("server_settings", {}),
+            "application_name": f"{settings.DB_APPLICATION_NAME}:{os.getpid()}",
+        }
+
+    return async_engine
 
-from src.config import settings
 
 # Create async engine with connection pooling
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,  # Log SQL statements in debug mode
-    pool_pre_ping=True,  # Verify connections before use
-)
+engine = _create_engine(settings.DATABASE_URL, "primary")
 
 # Session factory for creating new sessions
 async_session_maker = async_sessionmaker(
@@ -24,6 +108,21 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False,  # Prevent lazy loading issues after commit
 )
 
+# Engine for read-only sessions: the read replica if configured, otherwise the
+# primary pool. postgresql_readonly makes asyncpg open every transaction with
+# BEGIN READ ONLY (no extra round trip) and is reset when the connection
+# returns to the pool, so the primary pool is shared safely.
+_read_base_engine = _create_engine(settings.DATABASE_READ_REPLICA_URL, "read") if settings.DATABASE_READ_REPLICA_URL else engine
+read_engine = _read_base_engine.execution_options(postgresql_readonly=True)
+
+# Session factory for read-only sessions (nothing to flush)
+async_read_session_maker = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
 
 async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Provide database session for FastAPI dependency injection.
@@ -53,3 +152,65 @@ async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+
+
+async def get_async_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Provide a read-only database session for FastAPI dependency injection.
+
+    The session runs in a READ ONLY transaction, on the read replica when
+    DATABASE_READ_REPLICA_URL is set, and is never committed: closing it
+    rolls the transaction back and returns the connection to the pool.
+    asyncpg's prepared statement cache lives on the pooled connection, so
+    it is reused across read-only requests as for read-write ones.
+
+    Yields:
+        AsyncSession: Database session that rejects writes.
+
+    Example:
+        >>> @router.get("/items")
+        ... async def list_items(
+        ...     db: Annotated[AsyncSession, Depends(get_async_read_session)]
+        ... ):
+        ...     result = await db.execute(select(Item))
+        ...     return result.scalars().all()
+    """
+    async with async_read_session_maker() as session:
+        yield session
+
+
+def engines() -> dict[str, AsyncEngine]:
+    """Return the application's engines, one per connection pool.
+
+    Returns:
+        The primary engine as "primary", plus the read replica engine as
+        "read" when DATABASE_READ_REPLICA_URL is set.
+    """
+    if _read_base_engine is engine:
+        return {"primary": engine}
+    return {"primary": engine, "read": _read_base_engine}
+
+
+def pool_usage() -> dict[str, dict[str, int]]:
+    """Report connection pool usage per engine.
+
+    A request that runs all of its queries on its injected session holds
+    one connection, so under load checked_out stays at or below the number
+    of in-flight requests.
+
+    Returns:
+        Gauges keyed by pool ("primary", plus "read" when a read replica
+        has its own pool): pool size, connections checked out, idle
+        connections, and current overflow (negative while the pool is
+        still filling up). Pools without a queue (e.g. NullPool) are omitted.
+    """
+    pools = {name: async_engine.sync_engine.pool for name, async_engine in engines().items()}
+    return {
+        name: {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+        }
+        for name, pool in pools.items()
+        if isinstance(pool, QueuePool)
+    }
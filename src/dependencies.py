@@ -3,12 +3,14 @@
 Provides type aliases and reusable dependencies for route handlers.
 """
 
+import secrets
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Header, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.session import get_async_db_session
+from src.config import settings
+from src.db.session import get_async_db_session, get_async_read_session
 
 # Type alias for cleaner route signatures
 DbSession = Annotated[AsyncSession, Depends(get_async_db_session)]
@@ -16,7 +18,34 @@ DbSession = Annotated[AsyncSession, Depends(get_async_db_session)]
 
 Use this in route handlers for automatic session injection:
 
+    @router.post("/items")
+    async def create_item(db: DbSession) -> Item:
+        ...
+"""
+
+ReadOnlySession = Annotated[AsyncSession, Depends(get_async_read_session)]
+"""Read-only database session dependency type alias.
+
+Use this for endpoints that only read; the transaction is READ ONLY,
+never committed, and may be served by the read replica:
+
     @router.get("/items")
-    async def list_items(db: DbSession) -> list[Item]:
+    async def list_items(db: ReadOnlySession) -> list[Item]:
         ...
 """
+
+
+async def require_admin_token(x_admin_token: Annotated[str | None, Header()] = None) -> None:
+    """Guard /admin endpoints with the ADMIN_TOKEN shared secret.
+
+    Args:
+        x_admin_token: Value of the X-Admin-Token request header.
+
+    Raises:
+        HTTPException: 404 if ADMIN_TOKEN is not configured, 403 if the
+            header is missing or wrong.
+    """
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if x_admin_token is None or not secrets.compare_digest(x_admin_token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin token")
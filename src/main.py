@@ -2,14 +2,20 @@
 
 This module creates and configures the FastAPI application with:
 - CORS middleware for frontend access
+- Optional per-request SQL instrumentation (SQL_INSTRUMENTATION)
+- Prometheus metrics at /metrics (METRICS_ENABLED)
+- Slow-query recorder at /admin/slow-queries (SLOW_QUERY_THRESHOLD_MS, ADMIN_TOKEN)
+- On-demand request profiling with X-Profile: 1 (PROFILING_ENABLED, ADMIN_TOKEN)
 - Health check endpoint
 - API router mounting
 - Startup hydration of signals from Project Needle data (only if DB is empty)
 """
 
+import asyncio
 import logging
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -17,7 +23,11 @@ from sqlalchemy import func, select
 
 from src.config import settings
 from src.db.models import Signal
-from src.db.session import async_session_maker
+from src.db.session import async_session_maker, engines, pool_usage
+from src.observability import SqlInstrumentationMiddleware, install_sql_listeners
+from src.observability.metrics import REGISTRY, MetricsMiddleware, write_snapshots_periodically
+from src.observability.profiling import PROFILES, ProfilingMiddleware
+from src.observability.slow_queries import SLOW_QUERIES
 from src.services.signal_hydrator import SignalHydrator
 
 logger = logging.getLogger(__name__)
@@ -30,6 +40,11 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     On startup:
     - Hydrates signals from Project Needle node result files into the database
       (only if the signals table is empty)
+    - Starts writing metrics snapshots in multiprocess mode
+
+    On shutdown:
+    - Writes a final metrics snapshot in multiprocess mode
+    - Closes the slow-query recorder's EXPLAIN connections
 
     Args:
         app: FastAPI application instance.
@@ -60,10 +75,19 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         logger.error("Signal hydration failed: %s", e)
         # Don't fail startup - the API can still work without hydrated data
 
+    metrics_dir = Path(settings.METRICS_MULTIPROC_DIR) if settings.METRICS_ENABLED and settings.METRICS_MULTIPROC_DIR else None
+    snapshot_task = asyncio.create_task(write_snapshots_periodically(REGISTRY, metrics_dir, settings.METRICS_FLUSH_INTERVAL)) if metrics_dir else None
+
     yield
 
     # Shutdown: cleanup if needed
     logger.info("Application shutting down")
+    if snapshot_task is not None and metrics_dir is not None:
+        snapshot_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await snapshot_task
+        REGISTRY.write_snapshot(metrics_dir)
+    await SLOW_QUERIES.dispose()
 
 
 def create_app() -> FastAPI:
@@ -92,9 +116,30 @@ def create_app() -> FastAPI:
         allow_origins=settings.cors_origins_list,
         allow_credentials=True,
         allow_methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
-        allow_headers=["content-type", "authorization", "accept"],
+        allow_headers=["content-type", "authorization", "accept", "x-profile", "x-admin-token"],
+        expose_headers=["server-timing", "x-profile-id"],
     )
 
+    # Per-request query count, DB time and N+1 detection (off by default)
+    if settings.SQL_INSTRUMENTATION:
+        for async_engine in engines().values():
+            install_sql_listeners(async_engine.sync_engine)
+        app.add_middleware(SqlInstrumentationMiddleware, n_plus_one_threshold=settings.SQL_N_PLUS_ONE_THRESHOLD)
+
+    # Slow statements with sampled EXPLAIN ANALYZE (off by default)
+    if settings.SLOW_QUERY_THRESHOLD_MS > 0:
+        for async_engine in engines().values():
+            SLOW_QUERIES.install(async_engine.sync_engine)
+
+    # Route latency histograms and in-flight gauge for /metrics
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+
+    # Sampling profiler for requests sent with X-Profile: 1 (off by default).
+    # Added last so it is outermost and the profile covers all middleware.
+    if settings.PROFILING_ENABLED:
+        app.add_middleware(ProfilingMiddleware, store=PROFILES, admin_token=settings.ADMIN_TOKEN, interval=settings.PROFILING_INTERVAL_MS / 1000)
+
     # Register routes
     _register_routes(app)
 
@@ -116,6 +161,8 @@ def _register_routes(app: FastAPI) -> None:
     from src.metrics import router as metrics_router
     from src.modeling import router as modeling_router
     from src.narratives import router as narratives_router
+    from src.observability.router import admin_router
+    from src.observability.router import router as observability_router
     from src.ontology.router import router as ontology_router
     from src.runs import router as runs_router
     from src.signals import router as signals_router
@@ -132,6 +179,20 @@ def _register_routes(app: FastAPI) -> None:
         """
         return {"status": "healthy", "version": settings.APP_VERSION}
 
+    @app.get("/health/pool", tags=["health"])
+    async def pool_health() -> dict[str, dict[str, int]]:
+        """Report database connection pool usage.
+
+        Returns:
+            dict: Pool gauges per engine (see src.db.session.pool_usage).
+        """
+        return pool_usage()
+
+    # Prometheus scrape endpoint at root
+    if settings.METRICS_ENABLED:
+        app.include_router(observability_router)
+    app.include_router(admin_router)
+
     # API routes
     app.include_router(signals_router, prefix="/api")
     app.include_router(workflow_router, prefix="/api")
@@ -0,0 +1,5 @@
+"""Observability module - request-level performance instrumentation."""
+
+from src.observability.sql_instrumentation import SqlInstrumentationMiddleware, install_sql_listeners
+
+__all__ = ["SqlInstrumentationMiddleware", "install_sql_listeners"]
@@ -0,0 +1,461 @@
+"""In-process metrics in the Prometheus text exposition format.
+
+A small dependency-free registry of counters, gauges and histograms. Values
+are plain per-process dicts updated without locks: updates are single
+dict operations made from the event loop (or the GIL-serialized threadpool),
+and a scrape reads them without blocking requests.
+
+With several uvicorn workers each process only sees its own requests, so
+with METRICS_MULTIPROC_DIR set every worker periodically writes a JSON
+snapshot to ``<dir>/metrics_<pid>.json`` and a scrape of any worker sums the
+snapshots of all workers. Counters and histograms of exited workers are
+kept (they are monotonic). Gauges are summed over live workers only, so a
+gauge must be additive across workers (counts and sizes, not ratios or
+maxima); derive ratios in PromQL from summed numerators and denominators.
+A count since start kept elsewhere is exported as a counter (set_total), so
+that the totals of exited workers are kept too.
+Clear the directory when the service is (re)deployed.
+
+Metrics the application records are defined at the bottom of this module.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+from typing import Any, Literal
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+MetricType = Literal["counter", "gauge", "histogram"]
+
+# Latency buckets in seconds, from 5 ms to 10 s
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+SNAPSHOT_PREFIX = "metrics_"
+
+
+class Metric:
+    """A named metric with labelled samples.
+
+    Attributes:
+        name: Metric name.
+        documentation: HELP text.
+        labelnames: Label names, in the order of sample keys.
+    """
+
+    type: MetricType
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        """Initialize the metric.
+
+        Args:
+            name: Metric name.
+            documentation: HELP text.
+            labelnames: Label names.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple[str, ...], Any] = {}
+
+    def _key(self, labels: dict[str, object]) -> tuple[str, ...]:
+        """Return the sample key for label values given by name."""
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> dict[tuple[str, ...], Any]:
+        """Return a copy of the current samples."""
+        return dict(self._values)
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._values.clear()
+
+
+class Counter(Metric):
+    """Monotonically increasing count."""
+
+    type: MetricType = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        """Increase the counter for a label set."""
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set_total(self, value: float, **labels: object) -> None:
+        """Set the counter for a label set to a total counted elsewhere.
+
+        Only for collectors mirroring a count since process start, such as
+        cache lookups; events counted here use inc.
+        """
+        self._values[self._key(labels)] = float(value)
+
+
+class Gauge(Metric):
+    """Value that goes up and down."""
+
+    type: MetricType = "gauge"
+
+    def set(self, value: float, **labels: object) -> None:
+        """Set the gauge for a label set."""
+        self._values[self._key(labels)] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        """Increase the gauge for a label set."""
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        """Decrease the gauge for a label set."""
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    """Distribution of observations in cumulative buckets.
+
+    Samples are [per-bucket counts..., +Inf count, sum] lists; rendering
+    makes the bucket counts cumulative.
+    """
+
+    type: MetricType = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            name: Metric name.
+            documentation: HELP text.
+            labelnames: Label names.
+            buckets: Upper bounds of the buckets, ascending (+Inf is implied).
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: object) -> None:
+        """Record one observation for a label set."""
+        key = self._key(labels)
+        counts = self._values.get(key)
+        if counts is None:
+            counts = self._values[key] = [0.0] * (len(self.buckets) + 2)
+        for position, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[position] += 1
+                break
+        else:
+            counts[len(self.buckets)] += 1
+        counts[-1] += value
+
+    def samples(self) -> dict[tuple[str, ...], Any]:
+        """Return a copy of the current samples."""
+        return {key: list(counts) for key, counts in self._values.items()}
+
+
+class MetricsRegistry:
+    """Metrics of this process plus collectors run before each export."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def register[M: Metric](self, metric: M) -> M:
+        """Add a metric to the registry and return it."""
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Add a function that updates gauges right before export.
+
+        Used for values read from elsewhere, such as pool and cache stats.
+        """
+        if collector not in self._collectors:
+            self._collectors.append(collector)
+
+    def collect(self) -> None:
+        """Run the collectors; a failing collector is logged and skipped."""
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception as e:
+                logger.warning("Metrics collector %s failed: %s", getattr(collector, "__name__", collector), e)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current values of this process as a JSON-compatible dict."""
+        self.collect()
+        return {
+            "pid": os.getpid(),
+            "metrics": {
+                metric.name: {
+                    "type": metric.type,
+                    "help": metric.documentation,
+                    "labelnames": list(metric.labelnames),
+                    "buckets": list(getattr(metric, "buckets", ())),
+                    "samples": [[list(key), value] for key, value in metric.samples().items()],
+                }
+                for metric in self._metrics.values()
+            },
+        }
+
+    def write_snapshot(self, directory: Path) -> None:
+        """Atomically write this process's snapshot into a multiprocess directory.
+
+        Args:
+            directory: Directory shared by all workers.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        target = directory / f"{SNAPSHOT_PREFIX}{os.getpid()}.json"
+        temporary = target.with_suffix(".tmp")
+        temporary.write_text(json.dumps(self.snapshot()))
+        temporary.replace(target)
+
+    def render(self, multiprocess_dir: Path | None = None) -> str:
+        """Render metrics in the Prometheus text exposition format.
+
+        Args:
+            multiprocess_dir: Directory with worker snapshots to aggregate.
+                If None, renders this process only.
+
+        Returns:
+            Exposition text.
+        """
+        if multiprocess_dir is None:
+            return render_snapshots([self.snapshot()])
+        self.write_snapshot(multiprocess_dir)
+        return render_snapshots(read_snapshots(multiprocess_dir))
+
+    def clear(self) -> None:
+        """Drop all samples of all metrics (for tests)."""
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+async def write_snapshots_periodically(registry: MetricsRegistry, directory: Path, interval: float) -> None:
+    """Write the process's snapshot every interval seconds until cancelled.
+
+    Args:
+        registry: Registry to export.
+        directory: Multiprocess directory.
+        interval: Seconds between writes.
+    """
+    while True:
+        try:
+            registry.write_snapshot(directory)
+        except OSError as e:
+            logger.warning("Failed to write metrics snapshot to %s: %s", directory, e)
+        await asyncio.sleep(interval)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process with this ID exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def read_snapshots(directory: Path) -> list[dict[str, Any]]:
+    """Read all worker snapshots in a multiprocess directory.
+
+    Gauge samples of workers that are no longer running are dropped.
+
+    Args:
+        directory: Directory shared by all workers.
+
+    Returns:
+        Snapshots, skipping unreadable files.
+    """
+    snapshots = []
+    for path in sorted(directory.glob(f"{SNAPSHOT_PREFIX}*.json")):
+        try:
+            snapshot = json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning("Skipping metrics snapshot %s: %s", path, e)
+            continue
+        if not _pid_alive(snapshot["pid"]):
+            for metric in snapshot["metrics"].values():
+                if metric["type"] == "gauge":
+                    metric["samples"] = []
+        snapshots.append(snapshot)
+    return snapshots
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    """Format a label set as {a="x",b="y"}, or "" without labels."""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def render_snapshots(snapshots: list[dict[str, Any]]) -> str:
+    """Sum snapshots per metric and label set and render them as exposition text.
+
+    Args:
+        snapshots: Snapshots from MetricsRegistry.snapshot or read_snapshots.
+
+    Returns:
+        Exposition text.
+    """
+    merged: dict[str, dict[str, Any]] = {}
+    for snapshot in snapshots:
+        for name, metric in snapshot["metrics"].items():
+            entry = merged.setdefault(name, {**metric, "values": {}})
+            values = entry["values"]
+            for key, value in metric["samples"]:
+                key = tuple(key)
+                if isinstance(value, list):
+                    current = values.get(key)
+                    values[key] = value if current is None else [a + b for a, b in zip(current, value, strict=True)]
+                else:
+                    values[key] = values.get(key, 0.0) + value
+
+    lines: list[str] = []
+    for name, metric in merged.items():
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        labelnames = metric["labelnames"]
+        for key, value in sorted(metric["values"].items()):
+            if metric["type"] != "histogram":
+                lines.append(f"{name}{_format_labels(labelnames, key)} {_format_value(value)}")
+                continue
+            cumulative = 0.0
+            for bound, count in zip([*metric["buckets"], math.inf], value[:-1], strict=True):
+                cumulative += count
+                bucket_labels = _format_labels([*labelnames, "le"], [*key, _format_value(bound)])
+                lines.append(f"{name}_bucket{bucket_labels} {_format_value(cumulative)}")
+            lines.append(f"{name}_sum{_format_labels(labelnames, key)} {_format_value(value[-1])}")
+            lines.append(f"{name}_count{_format_labels(labelnames, key)} {_format_value(cumulative)}")
+    return "\n".join(lines) + "\n"
+
+
+def route_template(scope: Scope) -> str:
+    """Return the route template of a handled request, e.g. "/api/signals/{signal_id}".
+
+    The matched route's path may lack the prefixes of the routers it was
+    included through, so those are taken from the request path: the
+    template replaces as many trailing path segments as it has.
+
+    Args:
+        scope: ASGI scope after the app handled the request.
+
+    Returns:
+        Route template, or "unmatched" if no route matched.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path_format", None) or getattr(route, "path", None)
+    if not template:
+        return "unmatched"
+    path_segments = scope["path"].rstrip("/").split("/")
+    template_segments = template.rstrip("/").split("/")
+    if ":path}" in template or len(template_segments) > len(path_segments):
+        return str(template)
+    # Both segment lists start with "" for the leading slash
+    prefix = "/".join(path_segments[: len(path_segments) - len(template_segments) + 1])
+    return f"{prefix}{template}"
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request latency per route template and in-flight requests.
+
+    Requests that match no route are labelled route="unmatched" so that
+    arbitrary paths cannot grow the label set.
+    """
+
+    def __init__(self, app: ASGIApp, excluded_paths: Iterable[str] = ("/metrics",)) -> None:
+        """Wrap an ASGI app.
+
+        Args:
+            app: Application to instrument.
+            excluded_paths: Paths not recorded (e.g. the scrape endpoint).
+        """
+        self.app = app
+        self.excluded_paths = frozenset(excluded_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Time the request and update the in-flight gauge."""
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc(method=method)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec(method=method)
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, method=method, route=route_template(scope), status=status_code)
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = REGISTRY.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by route template.",
+        ("method", "route", "status"),
+    )
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.register(
+    Gauge("http_requests_in_flight", "HTTP requests being handled.", ("method",)),
+)
+DB_POOL_CHECKOUT_WAIT = REGISTRY.register(
+    Histogram(
+        "db_pool_checkout_wait_seconds",
+        "Time to obtain a connection from the SQLAlchemy pool, including connecting and pre-ping.",
+        ("pool",),
+        buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0),
+    )
+)
+DB_POOL_CONNECTIONS = REGISTRY.register(
+    Gauge("db_pool_connections", "SQLAlchemy pool connections by state.", ("pool", "state")),
+)
+HYDRATION_BATCH_DURATION = REGISTRY.register(
+    Histogram(
+        "signal_hydration_batch_seconds",
+        "Duration of one signal hydration batch (Python) or facility chunk (in-database).",
+        ("mode",),
+        buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+    )
+)
+CACHE_REQUESTS = REGISTRY.register(
+    Counter("cache_requests_total", "Lookups per in-process cache, by result.", ("cache", "result")),
+)
+CACHE_ENTRIES = REGISTRY.register(
+    Gauge("cache_entries", "Entries held per in-process cache.", ("cache",)),
+)
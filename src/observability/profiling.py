@@ -0,0 +1,272 @@
+"""On-demand sampling profiler for single requests.
+
+A request sent with ``X-Profile: 1`` and a valid ``X-Admin-Token`` runs
+under a sampling profiler: a background thread snapshots the event loop
+thread's Python stack every PROFILING_INTERVAL_MS and counts the samples
+taken while the request's task is running. The result is kept as collapsed
+stacks ("frame;frame;frame count" lines), which flamegraph.pl, speedscope
+and inferno render directly, and the response carries an ``X-Profile-Id``
+header to fetch it from /admin/profiles/{id}.
+
+ProfilingMiddleware is only installed when PROFILING_ENABLED is set, so a
+disabled profiler adds nothing to the request path. Work a handler hands to
+the threadpool (sync dependencies, run_in_threadpool) is not sampled.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import secrets
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import lru_cache
+from pathlib import Path
+from types import CodeType, FrameType
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_SUFFIX = ".folded"
+_PROFILE_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+
+@lru_cache(maxsize=4096)
+def _frame_label(code: CodeType) -> str:
+    """Label a code object as "qualname (path:line)" for collapsed stacks."""
+    filename = code.co_filename
+    if "site-packages" + os.sep in filename:
+        filename = filename.rsplit("site-packages" + os.sep, 1)[1]
+    elif filename.startswith(os.getcwd() + os.sep):
+        filename = os.path.relpath(filename)
+    # ";" separates frames; the count follows the last space of a line
+    return f"{code.co_qualname} ({filename}:{code.co_firstlineno})".replace(";", ",")
+
+
+@dataclass
+class RequestProfile:
+    """Sampled stacks of one profiled request.
+
+    Attributes:
+        id: Profile identifier returned in the X-Profile-Id header.
+        method: HTTP method.
+        path: Request path.
+        started_at: When the request started.
+        interval: Sampling interval in seconds.
+        duration_ms: Request duration in milliseconds.
+        status_code: Response status code.
+        samples: Sample count per stack (root first).
+    """
+
+    id: str
+    method: str
+    path: str
+    started_at: datetime
+    interval: float
+    duration_ms: float = 0.0
+    status_code: int = 500
+    samples: Counter[tuple[str, ...]] = field(default_factory=Counter)
+
+    def collapsed(self) -> str:
+        """Render the samples in the collapsed stack format, heaviest first."""
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in self.samples.most_common())
+
+
+class SamplingProfiler:
+    """Samples one thread's Python stack from a background thread.
+
+    Stacks are trimmed to the frames below root_code, and with a task set
+    only samples taken while that task runs on the loop are counted, so
+    other requests served by the same event loop are left out.
+    """
+
+    def __init__(
+        self,
+        thread_id: int,
+        interval: float,
+        root_code: CodeType | None = None,
+        task: asyncio.Task[object] | None = None,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> None:
+        """Initialize the profiler.
+
+        Args:
+            thread_id: threading.get_ident() of the thread to sample.
+            interval: Seconds between samples.
+            root_code: Code object of the outermost frame to keep.
+            task: Only count samples while this task is running.
+            loop: Event loop the task runs on.
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.root_code = root_code
+        self.task = task
+        self.loop = loop
+        self.samples: Counter[tuple[str, ...]] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> Counter[tuple[str, ...]]:
+        """Stop sampling and return the sample counts."""
+        self._stop.set()
+        self._thread.join()
+        return self.samples
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            if self.task is not None and asyncio.current_task(self.loop) is not self.task:
+                continue
+            stack = self._stack(frame)
+            if stack:
+                self.samples[stack] += 1
+
+    def _stack(self, frame: FrameType | None) -> tuple[str, ...]:
+        """Return the stack from root_code (exclusive) down to frame."""
+        codes: list[CodeType] = []
+        while frame is not None:
+            if frame.f_code is self.root_code:
+                break
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        return tuple(_frame_label(code) for code in reversed(codes))
+
+
+class ProfileStore:
+    """The most recent request profiles, optionally persisted as files.
+
+    With a directory, each profile is also written to ``<dir>/<id>.folded``
+    so any worker can serve it.
+    """
+
+    def __init__(self, max_profiles: int = 20, directory: Path | None = None) -> None:
+        """Initialize the store.
+
+        Args:
+            max_profiles: Profiles kept in memory.
+            directory: Directory shared by the workers, or None.
+        """
+        self.max_profiles = max_profiles
+        self.directory = directory
+        self._profiles: OrderedDict[str, RequestProfile] = OrderedDict()
+
+    def add(self, profile: RequestProfile) -> None:
+        """Store a profile, dropping the oldest beyond max_profiles."""
+        self._profiles[profile.id] = profile
+        while len(self._profiles) > self.max_profiles:
+            self._profiles.popitem(last=False)
+        if self.directory is not None:
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                (self.directory / f"{profile.id}{PROFILE_SUFFIX}").write_text(profile.collapsed())
+            except OSError as e:
+                logger.warning("Failed to write profile %s: %s", profile.id, e)
+
+    def recent(self) -> list[RequestProfile]:
+        """Return the profiles in memory, newest first."""
+        return list(reversed(self._profiles.values()))
+
+    def collapsed(self, profile_id: str) -> str | None:
+        """Return a profile's collapsed stacks, or None if unknown."""
+        profile = self._profiles.get(profile_id)
+        if profile is not None:
+            return profile.collapsed()
+        if self.directory is not None and _PROFILE_ID_PATTERN.match(profile_id):
+            path = self.directory / f"{profile_id}{PROFILE_SUFFIX}"
+            if path.is_file():
+                return path.read_text()
+        return None
+
+    def clear(self) -> None:
+        """Drop the profiles in memory."""
+        self._profiles.clear()
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling requests that ask for it.
+
+    A request is profiled when it sends ``X-Profile: 1`` and an
+    ``X-Admin-Token`` matching admin_token; any other request passes
+    straight through.
+    """
+
+    def __init__(self, app: ASGIApp, store: ProfileStore, admin_token: str, interval: float = 0.001) -> None:
+        """Wrap an ASGI app.
+
+        Args:
+            app: Application to profile.
+            store: Where finished profiles are kept.
+            admin_token: Token required to profile a request; empty
+                disables profiling.
+            interval: Seconds between samples.
+        """
+        self.app = app
+        self.store = store
+        self.admin_token = admin_token
+        self.interval = interval
+
+    def _requested(self, scope: Scope) -> bool:
+        """Whether the request asks for profiling with a valid admin token."""
+        headers = Headers(scope=scope)
+        if headers.get("x-profile") != "1" or not self.admin_token:
+            return False
+        return secrets.compare_digest(headers.get("x-admin-token", ""), self.admin_token)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request, under the profiler if requested."""
+        if scope["type"] != "http" or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(
+            id=uuid.uuid4().hex,
+            method=scope["method"],
+            path=scope["path"],
+            started_at=datetime.now(UTC),
+            interval=self.interval,
+        )
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                profile.status_code = message["status"]
+                MutableHeaders(scope=message).append("X-Profile-Id", profile.id)
+            await send(message)
+
+        profiler = SamplingProfiler(
+            threading.get_ident(),
+            self.interval,
+            root_code=ProfilingMiddleware.__call__.__code__,
+            task=asyncio.current_task(),
+            loop=asyncio.get_running_loop(),
+        )
+        started = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profile.samples = profiler.stop()
+            profile.duration_ms = (time.perf_counter() - started) * 1000
+            self.store.add(profile)
+            logger.info("Profiled %s %s: %d samples, profile %s", profile.method, profile.path, profile.samples.total(), profile.id)
+
+
+PROFILES = ProfileStore(
+    max_profiles=settings.PROFILING_MAX_PROFILES,
+    directory=Path(settings.PROFILING_DIR) if settings.PROFILING_DIR else None,
+)
+"""Process-wide profile store served by /admin/profiles."""
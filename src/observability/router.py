@@ -0,0 +1,135 @@
+"""Prometheus metrics and admin diagnostics endpoints.
+
+Serves the metrics registry in the text exposition format at /metrics,
+aggregated across workers when METRICS_MULTIPROC_DIR is set. Pool and cache
+metrics are read when metrics are exported.
+
+admin_router serves per-worker diagnostics under /admin, guarded by the
+ADMIN_TOKEN shared secret.
+"""
+
+from pathlib import Path
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+
+from src.config import settings
+from src.db.session import pool_usage
+from src.dependencies import require_admin_token
+from src.observability.metrics import CACHE_ENTRIES, CACHE_REQUESTS, DB_POOL_CONNECTIONS, REGISTRY
+from src.observability.profiling import PROFILES
+from src.observability.schemas import ProfileSummary, SlowQueryGroup, SlowQueryReport
+from src.observability.slow_queries import SLOW_QUERIES
+from src.runs.services.file_cache import cache_stats
+
+router = APIRouter(tags=["observability"])
+admin_router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin_token)])
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def collect_pool_metrics() -> None:
+    """Update the pool gauges from the engines' pools."""
+    for pool, usage in pool_usage().items():
+        for state, value in usage.items():
+            DB_POOL_CONNECTIONS.set(value, pool=pool, state=state)
+
+
+def collect_cache_metrics() -> None:
+    """Update the cache metrics from the named in-process caches.
+
+    Lookups since start are counters, so the totals of exited workers are
+    kept and the hit ratio is left to PromQL over their rates.
+    """
+    for cache, counts in cache_stats().items():
+        CACHE_REQUESTS.set_total(counts["hits"], cache=cache, result="hit")
+        CACHE_REQUESTS.set_total(counts["misses"], cache=cache, result="miss")
+        CACHE_ENTRIES.set(counts["entries"], cache=cache)
+
+
+REGISTRY.add_collector(collect_pool_metrics)
+REGISTRY.add_collector(collect_cache_metrics)
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    """Export metrics in the Prometheus text exposition format.
+
+    Returns:
+        PlainTextResponse: Metrics of this worker, or of all workers in
+            multiprocess mode.
+    """
+    multiprocess_dir = Path(settings.METRICS_MULTIPROC_DIR) if settings.METRICS_MULTIPROC_DIR else None
+    return PlainTextResponse(REGISTRY.render(multiprocess_dir), media_type=CONTENT_TYPE)
+
+
+@admin_router.get("/slow-queries", response_model=SlowQueryReport)
+async def slow_queries() -> SlowQueryReport:
+    """Report this worker's slow statements grouped by fingerprint.
+
+    Requires the X-Admin-Token header. Each group has p50/p95/p99 durations
+    and the latest sampled EXPLAIN (ANALYZE, BUFFERS) plan, if any.
+
+    Returns:
+        SlowQueryReport: Groups ordered by p95, slowest first.
+    """
+    groups = [SlowQueryGroup(**group) for group in SLOW_QUERIES.summary()]
+    return SlowQueryReport(
+        threshold_ms=SLOW_QUERIES.threshold_ms,
+        explain_sample_rate=SLOW_QUERIES.explain_sample_rate,
+        total=sum(group.count for group in groups),
+        groups=groups,
+    )
+
+
+@admin_router.delete("/slow-queries", status_code=204)
+async def clear_slow_queries() -> None:
+    """Empty this worker's slow-query buffer. Requires the X-Admin-Token header."""
+    SLOW_QUERIES.clear()
+
+
+@admin_router.get("/profiles", response_model=list[ProfileSummary])
+async def list_profiles() -> list[ProfileSummary]:
+    """List this worker's request profiles, newest first.
+
+    Requests sent with ``X-Profile: 1`` and the admin token are profiled
+    when PROFILING_ENABLED is set. Requires the X-Admin-Token header.
+
+    Returns:
+        list[ProfileSummary]: Profiles kept in memory.
+    """
+    return [
+        ProfileSummary(
+            id=profile.id,
+            method=profile.method,
+            path=profile.path,
+            started_at=profile.started_at,
+            duration_ms=profile.duration_ms,
+            status_code=profile.status_code,
+            sample_count=profile.samples.total(),
+            interval_ms=profile.interval * 1000,
+        )
+        for profile in PROFILES.recent()
+    ]
+
+
+@admin_router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+async def get_profile(profile_id: str) -> PlainTextResponse:
+    """Download a request profile as collapsed stacks.
+
+    The "frame;frame;frame count" lines render as a flame graph with
+    flamegraph.pl, speedscope or inferno. Requires the X-Admin-Token header.
+
+    Args:
+        profile_id: ID from the X-Profile-Id response header.
+
+    Returns:
+        PlainTextResponse: Collapsed stacks, heaviest first.
+
+    Raises:
+        HTTPException: 404 if the profile is not known to this worker.
+    """
+    collapsed = PROFILES.collapsed(profile_id)
+    if collapsed is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Profile {profile_id} not found")
+    return PlainTextResponse(collapsed)
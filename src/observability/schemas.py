@@ -0,0 +1,43 @@
+"""Pydantic schemas for observability admin responses."""
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class SlowQueryGroup(BaseModel):
+    """Slow executions of one statement fingerprint."""
+
+    fingerprint: str = Field(description="Statement with literals and bind parameters replaced by ?")
+    count: int = Field(description="Slow executions in the buffer")
+    p50_ms: float = Field(description="Median duration in milliseconds")
+    p95_ms: float = Field(description="95th percentile duration in milliseconds")
+    p99_ms: float = Field(description="99th percentile duration in milliseconds")
+    max_ms: float = Field(description="Slowest duration in milliseconds")
+    last_seen: datetime = Field(description="When the latest slow execution finished")
+    example: str = Field(description="Latest slow statement as sent to the driver")
+    plan: dict[str, Any] | None = Field(default=None, description="Latest sampled EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) output")
+    plan_duration_ms: float | None = Field(default=None, description="Duration of the execution the plan was sampled for")
+
+
+class SlowQueryReport(BaseModel):
+    """Slow-query buffer of this worker grouped by fingerprint."""
+
+    threshold_ms: float = Field(description="Statements at least this slow are recorded")
+    explain_sample_rate: float = Field(description="Fraction of slow read-only statements explained")
+    total: int = Field(description="Slow executions in the buffer")
+    groups: list[SlowQueryGroup] = Field(description="Fingerprints, highest p95 first")
+
+
+class ProfileSummary(BaseModel):
+    """A stored request profile."""
+
+    id: str = Field(description="Profile ID, as returned in the X-Profile-Id header")
+    method: str = Field(description="HTTP method")
+    path: str = Field(description="Request path")
+    started_at: datetime = Field(description="When the request started")
+    duration_ms: float = Field(description="Request duration in milliseconds")
+    status_code: int = Field(description="Response status code")
+    sample_count: int = Field(description="Stack samples taken while the request was running")
+    interval_ms: float = Field(description="Sampling interval in milliseconds")
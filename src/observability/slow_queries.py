@@ -0,0 +1,275 @@
+"""Slow-query recorder with sampled EXPLAIN (ANALYZE, BUFFERS).
+
+Statements slower than SLOW_QUERY_THRESHOLD_MS are kept in a bounded ring
+buffer. A sampled fraction of the read-only ones is re-run as
+``EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)`` in a READ ONLY transaction on a
+separate, unpooled connection, so the plan the slow execution most likely
+used is captured without taking a connection from the application pool.
+
+The admin endpoint groups the buffer by statement fingerprint with
+p50/p95/p99 durations (see SlowQueryRecorder.summary). Bind parameter
+values are only kept until the EXPLAIN ran and are never exposed.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import random
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.config import settings
+from src.db.session import engine_options
+from src.observability.sql_instrumentation import fingerprint
+
+logger = logging.getLogger(__name__)
+
+# engine_options() keys only a queue pool accepts
+_QUEUE_POOL_OPTIONS = frozenset({"pool_size", "max_overflow", "pool_timeout"})
+
+# Statements that can write or take locks are never re-executed
+_WRITE_PATTERN = re.compile(
+    r"\b(insert|update|delete|merge|create|alter|drop|truncate|grant|revoke|copy|call|do|lock|vacuum|analyze|refresh|"
+    r"nextval|setval|pg_advisory_lock|for\s+(?:no\s+key\s+)?update|for\s+(?:key\s+)?share)\b",
+    re.IGNORECASE,
+)
+_READ_PREFIX = re.compile(r"^\s*(?:select|with)\b", re.IGNORECASE)
+
+
+def is_read_only(statement: str) -> bool:
+    """Whether a statement is a plain read that is safe to re-run under EXPLAIN ANALYZE.
+
+    Args:
+        statement: SQL statement.
+
+    Returns:
+        True for SELECT/WITH statements without write or locking keywords.
+    """
+    return bool(_READ_PREFIX.match(statement)) and not _WRITE_PATTERN.search(statement)
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of ascending values."""
+    rank = max(math.ceil(q / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class SlowQuery:
+    """One slow statement execution.
+
+    Attributes:
+        fingerprint: Normalized statement.
+        statement: Statement as executed.
+        duration_ms: Execution time in milliseconds.
+        recorded_at: When the statement finished.
+        plan: EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) output, once sampled and run.
+        explain_error: Why the sampled EXPLAIN failed, if it did.
+    """
+
+    fingerprint: str
+    statement: str
+    duration_ms: float
+    recorded_at: datetime
+    plan: dict[str, Any] | None = None
+    explain_error: str | None = None
+
+
+class SlowQueryRecorder:
+    """Ring buffer of slow statements with sampled EXPLAIN ANALYZE.
+
+    Attributes:
+        threshold_ms: Statements at or above this duration are recorded.
+        explain_sample_rate: Fraction of slow read-only statements explained.
+        explain_timeout_ms: statement_timeout for each EXPLAIN ANALYZE.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        buffer_size: int = 1000,
+        explain_sample_rate: float = 0.1,
+        explain_timeout_ms: int = 30000,
+    ) -> None:
+        """Initialize the recorder.
+
+        Args:
+            threshold_ms: Slow statement threshold in milliseconds.
+            buffer_size: Maximum number of slow executions kept.
+            explain_sample_rate: Fraction (0-1) of slow read-only statements
+                re-run with EXPLAIN ANALYZE.
+            explain_timeout_ms: statement_timeout for each EXPLAIN ANALYZE.
+        """
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self.explain_timeout_ms = explain_timeout_ms
+        self._entries: deque[SlowQuery] = deque(maxlen=max(buffer_size, 1))
+        self._explain_engines: dict[str, AsyncEngine] = {}
+        self._explain_running = False
+        self._tasks: set[asyncio.Task[None]] = set()
+        # Bound once so install() can detect listeners already attached
+        self._listeners: dict[str, Any] = {
+            "before_cursor_execute": self._before_cursor_execute,
+            "after_cursor_execute": self._after_cursor_execute,
+            "handle_error": self._handle_error,
+        }
+
+    def install(self, sync_engine: Engine) -> None:
+        """Time every statement executed through an engine.
+
+        Idempotent, so create_app can be called repeatedly.
+
+        Args:
+            sync_engine: Engine to watch (AsyncEngine.sync_engine for async
+                engines). Sampled EXPLAINs connect to the same URL.
+        """
+        if not event.contains(sync_engine, "before_cursor_execute", self._listeners["before_cursor_execute"]):
+            for name, listener in self._listeners.items():
+                event.listen(sync_engine, name, listener)
+
+    def _before_cursor_execute(self, conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        conn.info.setdefault("slow_query_start_time", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        start_times = conn.info.get("slow_query_start_time")
+        if start_times:
+            duration_ms = (time.perf_counter() - start_times.pop()) * 1000
+            if duration_ms >= self.threshold_ms:
+                self.record(statement, duration_ms, None if executemany else parameters, conn.engine.url.render_as_string(hide_password=False))
+
+    def _handle_error(self, exception_context: Any) -> None:
+        # A failed statement never reaches after_cursor_execute
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("slow_query_start_time"):
+            connection.info["slow_query_start_time"].pop()
+
+    def record(self, statement: str, duration_ms: float, parameters: Any = None, database_url: str | None = None) -> SlowQuery:
+        """Add a slow execution and maybe schedule its EXPLAIN.
+
+        Args:
+            statement: Statement as executed by the driver.
+            duration_ms: Execution time in milliseconds.
+            parameters: Driver-level bind parameters, if the statement may be explained.
+            database_url: Database to run the EXPLAIN on.
+
+        Returns:
+            The recorded entry.
+        """
+        entry = SlowQuery(
+            fingerprint=fingerprint(statement),
+            statement=statement,
+            duration_ms=duration_ms,
+            recorded_at=datetime.now(UTC),
+        )
+        self._entries.append(entry)
+        logger.warning("Slow query (%.1f ms): %s", duration_ms, entry.fingerprint[:500])
+
+        if database_url is not None and self._should_explain(statement):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return entry
+            self._explain_running = True
+            task = loop.create_task(self._explain(entry, parameters, database_url))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return entry
+
+    def _should_explain(self, statement: str) -> bool:
+        """Sample read-only statements, one EXPLAIN at a time."""
+        return not self._explain_running and random.random() < self.explain_sample_rate and is_read_only(statement)
+
+    async def _explain(self, entry: SlowQuery, parameters: Any, database_url: str) -> None:
+        """Run EXPLAIN ANALYZE for an entry on a separate connection."""
+        try:
+            engine = self._explain_engines.get(database_url)
+            if engine is None:
+                # Same connect_args as the application pool (PgBouncer-safe
+                # statement names); NullPool takes no pool sizing options.
+                # postgresql_readonly opens the transaction as READ ONLY, so
+                # the server rejects any write the pattern check missed
+                options = {k: v for k, v in engine_options(settings).items() if k not in _QUEUE_POOL_OPTIONS}
+                engine = create_async_engine(database_url, poolclass=NullPool, **options).execution_options(postgresql_readonly=True)
+                self._explain_engines[database_url] = engine
+            async with engine.connect() as conn:
+                await conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(self.explain_timeout_ms)}")
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {entry.statement}",
+                    tuple(parameters) if parameters is not None else (),
+                )
+                output = result.scalar()
+                await conn.rollback()
+            # FORMAT JSON returns a one-element list
+            plan: Any = json.loads(output) if isinstance(output, str) else output
+            entry.plan = plan[0] if isinstance(plan, list) and plan else plan
+        except Exception as e:
+            entry.explain_error = str(e)
+            logger.info("EXPLAIN of slow query failed: %s", e)
+        finally:
+            self._explain_running = False
+
+    def entries(self) -> list[SlowQuery]:
+        """Return the buffered slow executions, oldest first."""
+        return list(self._entries)
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Group the buffer by fingerprint.
+
+        Returns:
+            One dict per fingerprint, slowest p95 first: count, p50/p95/p99
+            and max duration in ms, last_seen, an example statement and the
+            most recent captured plan (or None).
+        """
+        groups: dict[str, list[SlowQuery]] = {}
+        for entry in self._entries:
+            groups.setdefault(entry.fingerprint, []).append(entry)
+
+        summary: list[dict[str, Any]] = []
+        for shape, entries in groups.items():
+            durations = sorted(entry.duration_ms for entry in entries)
+            explained = [entry for entry in entries if entry.plan is not None]
+            summary.append(
+                {
+                    "fingerprint": shape,
+                    "count": len(entries),
+                    "p50_ms": _percentile(durations, 50),
+                    "p95_ms": _percentile(durations, 95),
+                    "p99_ms": _percentile(durations, 99),
+                    "max_ms": durations[-1],
+                    "last_seen": entries[-1].recorded_at,
+                    "example": entries[-1].statement,
+                    "plan": explained[-1].plan if explained else None,
+                    "plan_duration_ms": explained[-1].duration_ms if explained else None,
+                }
+            )
+        summary.sort(key=lambda group: group["p95_ms"], reverse=True)
+        return summary
+
+    def clear(self) -> None:
+        """Drop all buffered entries."""
+        self._entries.clear()
+
+    async def dispose(self) -> None:
+        """Close the EXPLAIN engines."""
+        for engine in self._explain_engines.values():
+            await engine.dispose()
+        self._explain_engines.clear()
+
+
+SLOW_QUERIES = SlowQueryRecorder(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    buffer_size=settings.SLOW_QUERY_BUFFER_SIZE,
+    explain_sample_rate=settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+    explain_timeout_ms=settings.SLOW_QUERY_EXPLAIN_TIMEOUT_MS,
+)
+"""Process-wide recorder, installed on the application engines when SLOW_QUERY_THRESHOLD_MS > 0."""
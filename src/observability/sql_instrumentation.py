@@ -0,0 +1,237 @@
+"""Per-request SQL instrumentation.
+
+SQLAlchemy cursor events record every statement a request executes into a
+RequestQueryStats held in a context variable, and SqlInstrumentationMiddleware
+reports them: a Server-Timing header on the response, one structured log
+record per request, and a warning when one statement shape runs more than
+SQL_N_PLUS_ONE_THRESHOLD times (an N+1 query pattern).
+
+Nothing is installed unless SQL_INSTRUMENTATION is enabled; statements run
+outside an instrumented request (startup hydration, CLIs) are ignored.
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Literals and bind parameters, replaced by "?" in fingerprints
+_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'|\$\d+|%\(\w+\)s|(?<![:\w]):\w+|\b\d+(?:\.\d+)?\b")
+# Expanded IN lists: (?, ?, ?) or ($1::VARCHAR, $2::VARCHAR)
+_LIST_PATTERN = re.compile(r"\(\s*\?(?:::\w+)?(?:\s*,\s*\?(?:::\w+)?)+\s*\)")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+_current_stats: ContextVar["RequestQueryStats | None"] = ContextVar("sql_request_stats", default=None)
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(statement: str) -> str:
+    """Normalize a SQL statement to its shape.
+
+    Literals and bind parameters become "?", IN lists collapse to "(?...)"
+    and whitespace is collapsed, so executions that differ only in values
+    share a fingerprint.
+
+    Args:
+        statement: SQL statement as sent to the driver.
+
+    Returns:
+        Normalized statement.
+
+    Example:
+        >>> fingerprint("SELECT * FROM signals WHERE id IN ($1, $2)  AND x = 'a'")
+        'SELECT * FROM signals WHERE id IN (?...) AND x = ?'
+    """
+    normalized = _LITERAL_PATTERN.sub("?", statement)
+    normalized = _LIST_PATTERN.sub("(?...)", normalized)
+    return _WHITESPACE_PATTERN.sub(" ", normalized).strip()
+
+
+@dataclass
+class RequestQueryStats:
+    """SQL statements executed while handling one request.
+
+    Attributes:
+        started: perf_counter() when the request started.
+        query_count: Statements executed.
+        db_time: Total statement time in seconds.
+        slowest_time: Duration of the slowest statement in seconds.
+        slowest_fingerprint: Fingerprint of the slowest statement.
+        last_query_end: perf_counter() when the last statement finished.
+        shapes: Executions per statement fingerprint.
+    """
+
+    started: float = field(default_factory=time.perf_counter)
+    query_count: int = 0
+    db_time: float = 0.0
+    slowest_time: float = 0.0
+    slowest_fingerprint: str | None = None
+    last_query_end: float | None = None
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float) -> None:
+        """Record one executed statement.
+
+        Args:
+            statement: SQL statement.
+            duration: Execution time in seconds.
+        """
+        shape = fingerprint(statement)
+        self.query_count += 1
+        self.db_time += duration
+        self.shapes[shape] += 1
+        self.last_query_end = time.perf_counter()
+        if duration >= self.slowest_time:
+            self.slowest_time = duration
+            self.slowest_fingerprint = shape
+
+    def repeated_shapes(self, threshold: int) -> dict[str, int]:
+        """Return statement shapes executed more than threshold times."""
+        return {shape: count for shape, count in self.shapes.items() if count > threshold}
+
+    def server_timing(self, now: float) -> str:
+        """Build the Server-Timing header value.
+
+        Reports total DB time ("db"), the time after the last statement
+        until the response starts ("render": building and serializing the
+        response), and the total time until the response starts ("total").
+
+        Args:
+            now: perf_counter() at response start.
+
+        Returns:
+            Header value, durations in milliseconds.
+        """
+        render_start = self.last_query_end if self.last_query_end is not None else self.started
+        return (
+            f'db;dur={self.db_time * 1000:.1f};desc="{self.query_count} queries", '
+            f"render;dur={(now - render_start) * 1000:.1f}, "
+            f"total;dur={(now - self.started) * 1000:.1f}"
+        )
+
+
+def current_query_stats() -> RequestQueryStats | None:
+    """Return the SQL stats of the request being handled, if instrumented."""
+    return _current_stats.get()
+
+
+def _before_cursor_execute(conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    stats = _current_stats.get()
+    start_times = conn.info.get("query_start_time")
+    if stats is not None and start_times:
+        stats.record(statement, time.perf_counter() - start_times.pop())
+
+
+def _handle_error(exception_context: Any) -> None:
+    # A failed statement never reaches after_cursor_execute
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start_time"):
+        connection.info["query_start_time"].pop()
+
+
+def install_sql_listeners(sync_engine: Engine) -> None:
+    """Attach the statement timing listeners to an engine.
+
+    Idempotent, so create_app can be called repeatedly.
+
+    Args:
+        sync_engine: Engine to instrument (AsyncEngine.sync_engine for async engines).
+    """
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(sync_engine, "handle_error", _handle_error)
+
+
+class SqlInstrumentationMiddleware:
+    """ASGI middleware reporting the SQL executed by each HTTP request.
+
+    Adds a Server-Timing header, logs one "sql request" record per request
+    with the query count, DB time and slowest statement in ``extra["sql"]``,
+    and warns about statement shapes repeated more than n_plus_one_threshold
+    times.
+    """
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int = 10) -> None:
+        """Wrap an ASGI app.
+
+        Args:
+            app: Application to instrument.
+            n_plus_one_threshold: Executions of one statement shape per
+                request above which an N+1 warning is logged.
+        """
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request with a fresh RequestQueryStats in context."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _current_stats.set(stats)
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", stats.server_timing(time.perf_counter()))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+            self._report(scope, status_code, stats)
+
+    def _report(self, scope: Scope, status_code: int, stats: RequestQueryStats) -> None:
+        """Log the request's SQL stats and any N+1 pattern."""
+        method, path = scope.get("method", ""), scope.get("path", "")
+        elapsed = time.perf_counter() - stats.started
+        logger.info(
+            "sql request %s %s: %d queries, %.1f ms db, %.1f ms total",
+            method,
+            path,
+            stats.query_count,
+            stats.db_time * 1000,
+            elapsed * 1000,
+            extra={
+                "sql": {
+                    "method": method,
+                    "path": path,
+                    "status_code": status_code,
+                    "query_count": stats.query_count,
+                    "db_ms": round(stats.db_time * 1000, 3),
+                    "total_ms": round(elapsed * 1000, 3),
+                    "slowest_ms": round(stats.slowest_time * 1000, 3),
+                    "slowest_fingerprint": stats.slowest_fingerprint,
+                }
+            },
+        )
+        for shape, count in stats.repeated_shapes(self.n_plus_one_threshold).items():
+            logger.warning(
+                "Possible N+1 query in %s %s: statement executed %d times: %s",
+                method,
+                path,
+                count,
+                shape,
+                extra={"sql": {"method": method, "path": path, "n_plus_one_count": count, "fingerprint": shape}},
+            )
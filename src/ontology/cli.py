@@ -4,6 +4,7 @@ Usage:
     # From backend directory
     uv run python -m src.ontology.cli sync
     uv run python -m src.ontology.cli sync --dry-run
+    uv run python -m src.ontology.cli sync --batch-size 1000 --progress
 """
 
 import asyncio
@@ -12,7 +13,7 @@ import sys
 import click
 
 from src.db.session import async_session_maker
-from src.ontology.sync_service import GraphSyncService
+from src.ontology.sync_service import DEFAULT_BATCH_SIZE, GraphSyncService, SyncProgress
 
 
 @click.group()
@@ -27,17 +28,30 @@ def cli() -> None:
     is_flag=True,
     help="Preview sync without making changes.",
 )
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_BATCH_SIZE,
+    show_default=True,
+    help="Rows merged per Cypher statement.",
+)
+@click.option(
+    "--progress/--no-progress",
+    default=False,
+    help="Print running row counts after each batch.",
+)
 @click.option(
     "-v",
     "--verbose",
     is_flag=True,
     help="Enable verbose logging.",
 )
-def sync(dry_run: bool, verbose: bool) -> None:  # noqa: ARG001
+def sync(dry_run: bool, batch_size: int, progress: bool, verbose: bool) -> None:  # noqa: ARG001
     """Sync relational data to the healthcare ontology graph.
 
     Reads signals, facilities, metrics, and domains from PostgreSQL
-    and creates corresponding vertices and edges in the AGE graph.
+    and merges corresponding vertices and edges into the AGE graph
+    in batches of --batch-size rows.
 
     Note:
         The verbose flag is accepted for CLI consistency but logging
@@ -52,7 +66,7 @@ def sync(dry_run: bool, verbose: bool) -> None:  # noqa: ARG001
         return
 
     try:
-        stats = asyncio.run(_run_sync())
+        stats = asyncio.run(_run_sync(batch_size, _echo_progress if progress else None))
         _display_stats(stats)
         click.echo("Sync complete!")
     except Exception as e:
@@ -60,17 +74,29 @@ def sync(dry_run: bool, verbose: bool) -> None:  # noqa: ARG001
         sys.exit(1)
 
 
-async def _run_sync() -> dict[str, dict[str, int]]:
+async def _run_sync(
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: SyncProgress | None = None,
+) -> dict[str, dict[str, int]]:
     """Execute the sync operation.
 
+    Args:
+        batch_size: Rows merged per Cypher statement.
+        progress: Optional per-batch progress callback.
+
     Returns:
         Statistics from the sync operation.
     """
     async with async_session_maker() as session:
-        service = GraphSyncService(session)
+        service = GraphSyncService(session, batch_size=batch_size, progress=progress)
         return await service.sync_all()
 
 
+def _echo_progress(entity: str, processed: int) -> None:
+    """Print the running row count for an entity."""
+    click.echo(f"  {entity}: {processed} rows")
+
+
 def _display_stats(stats: dict[str, dict[str, int]]) -> None:
     """Display sync statistics in a formatted table.
 
@@ -105,6 +105,128 @@ def build_create_edge(
     )
 
 
+def build_merge_vertices(label: str, rows: list[dict[str, Any]]) -> str:
+    """Build a batched Cypher MERGE statement for vertices.
+
+    Each row is merged on its 'id' property and the remaining properties
+    are set on the vertex, so re-running with changed values updates it.
+
+    Args:
+        label: Vertex label (e.g., 'Facility', 'Signal').
+        rows: Vertex property dicts, each including 'id'.
+
+    Returns:
+        Cypher UNWIND/MERGE statement returning the number of rows merged.
+
+    Example:
+        >>> build_merge_vertices("Domain", [{"id": "Safety", "name": "Safety"}])
+        "UNWIND [{id: 'Safety', name: 'Safety'}] AS row MERGE (n:Domain {id: row.id}) SET n.name = row.name RETURN count(n)"
+    """
+    keys = list(dict.fromkeys(key for row in rows for key in row if key != "id"))
+    row_list = "[" + ", ".join(_build_properties(row) for row in rows) + "]"
+    set_clause = " SET " + ", ".join(f"n.{key} = row.{key}" for key in keys) if keys else ""
+    return f"UNWIND {row_list} AS row MERGE (n:{label} {{id: row.id}}){set_clause} RETURN count(n)"
+
+
+def build_merge_edges(
+    from_label: str,
+    edge_label: str,
+    to_label: str,
+    pairs: list[tuple[str, str]],
+) -> str:
+    """Build a batched Cypher MERGE statement for edges.
+
+    Endpoints are matched with id equality in WHERE, which AGE compiles to
+    the expression the build_id_index_sql btree indexes cover. Pairs whose
+    endpoints do not exist are ignored.
+
+    Args:
+        from_label: Source vertex label.
+        edge_label: Edge relationship label.
+        to_label: Target vertex label.
+        pairs: (source id, target id) tuples.
+
+    Returns:
+        Cypher UNWIND/MATCH/MERGE statement returning the number of edges merged.
+
+    Example:
+        >>> build_merge_edges("Facility", "has_signal", "Signal", [("F1", "S1")])
+        "UNWIND [{from_id: 'F1', to_id: 'S1'}] AS row MATCH (a:Facility), (b:Signal) WHERE a.id = row.from_id AND b.id = row.to_id MERGE (a)-[r:has_signal]->(b) RETURN count(r)"
+    """
+    row_list = "[" + ", ".join(_build_properties({"from_id": from_id, "to_id": to_id}) for from_id, to_id in pairs) + "]"
+    return (
+        f"UNWIND {row_list} AS row MATCH (a:{from_label}), (b:{to_label}) WHERE a.id = row.from_id AND b.id = row.to_id "
+        f"MERGE (a)-[r:{edge_label}]->(b) RETURN count(r)"
+    )
+
+
+def build_id_index_sql(label: str, graph_name: str = GRAPH_NAME) -> list[str]:
+    """Build SQL statements indexing a vertex label's id property.
+
+    Without them every MERGE or MATCH on id scans the whole label table, so
+    a batched sync is quadratic in the number of vertices. The btree index
+    covers id equality (n.id = x); the GIN index covers property map
+    patterns ({id: x}), which AGE compiles to containment on properties.
+    The label table must exist (see build_create_vlabel_sql).
+
+    Args:
+        label: Vertex label (e.g., 'Signal').
+        graph_name: Name of the graph (default: healthcare_ontology).
+
+    Returns:
+        CREATE INDEX IF NOT EXISTS statements.
+
+    Example:
+        >>> build_id_index_sql("Signal")[1]
+        'CREATE INDEX IF NOT EXISTS "Signal_properties_gin_idx" ON healthcare_ontology."Signal" USING gin (properties)'
+    """
+    table = f'{graph_name}."{label}"'
+    return [
+        f'CREATE INDEX IF NOT EXISTS "{label}_id_idx" ON {table} (ag_catalog.agtype_access_operator(VARIADIC ARRAY[properties, \'"id"\'::ag_catalog.agtype]))',
+        f'CREATE INDEX IF NOT EXISTS "{label}_properties_gin_idx" ON {table} USING gin (properties)',
+    ]
+
+
+def build_create_vlabel_sql(label: str, graph_name: str = GRAPH_NAME) -> str:
+    """Build SQL creating a vertex label's table if it does not exist yet.
+
+    AGE creates label tables on the first CREATE or MERGE; indexing them
+    before the first sync needs them to exist.
+
+    Args:
+        label: Vertex label (e.g., 'Signal').
+        graph_name: Name of the graph (default: healthcare_ontology).
+
+    Returns:
+        SELECT statement calling create_vlabel only for a missing label.
+    """
+    return (
+        f"SELECT ag_catalog.create_vlabel('{graph_name}', '{label}') WHERE NOT EXISTS ("
+        "SELECT 1 FROM ag_catalog.ag_label l JOIN ag_catalog.ag_graph g ON g.graphid = l.graph "
+        f"WHERE g.name = '{graph_name}' AND l.name = '{label}')"
+    )
+
+
+def build_count_vertices(label: str) -> str:
+    """Build Cypher statement counting vertices with a label.
+
+    Example:
+        >>> build_count_vertices("Facility")
+        "MATCH (n:Facility) RETURN count(n)"
+    """
+    return f"MATCH (n:{label}) RETURN count(n)"
+
+
+def build_count_edges(edge_label: str) -> str:
+    """Build Cypher statement counting edges with a label.
+
+    Example:
+        >>> build_count_edges("has_signal")
+        "MATCH ()-[r:has_signal]->() RETURN count(r)"
+    """
+    return f"MATCH ()-[r:{edge_label}]->() RETURN count(r)"
+
+
 def build_match_vertex(
     label: str,
     filters: dict[str, Any] | None = None,
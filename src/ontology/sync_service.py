@@ -3,20 +3,47 @@
 This service syncs data from relational tables to the Apache AGE graph database.
 It creates vertices for entities (Facility, Metric, Signal, etc.) and edges
 for their relationships.
+
+Rows are written in batches with one UNWIND ... MERGE statement per batch,
+so a sync costs a handful of round trips per batch instead of an existence
+check plus a create per vertex or edge. Re-running is idempotent: MERGE
+matches existing vertices by id and updates their properties. Before the
+first merge, each vertex label table gets indexes on its id property, so
+each row's MERGE or MATCH is an index lookup rather than a label scan.
 """
 
 import logging
-from typing import Any
+from collections.abc import AsyncIterator, Callable
+from typing import Any, TypeVar
 
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .cypher import _escape_value, age_query_wrapper, build_create_edge, build_create_vertex
+from .cypher import (
+    age_query_wrapper,
+    build_count_edges,
+    build_count_vertices,
+    build_create_vlabel_sql,
+    build_id_index_sql,
+    build_merge_edges,
+    build_merge_vertices,
+)
 from .schema import GRAPH_NAME
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Rows per UNWIND statement; bounds both query size and memory per batch
+DEFAULT_BATCH_SIZE = 500
+
+# Progress callback: (entity name, rows processed so far)
+SyncProgress = Callable[[str, int], None]
+
+# Vertex labels written by the sync, indexed on id by ensure_id_indexes
+SYNCED_VERTEX_LABELS = ("Domain", "Facility", "Metric", "Signal")
+
 
 class GraphSyncService:
     """Synchronizes relational data to the Apache AGE graph.
@@ -30,14 +57,30 @@ class GraphSyncService:
             stats = await service.sync_all()
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        progress: SyncProgress | None = None,
+    ) -> None:
         """Initialize the sync service.
 
         Args:
             session: SQLAlchemy async session for database operations.
+            batch_size: Number of rows merged per Cypher statement.
+            progress: Optional callback invoked after each batch with the
+                entity name and the number of rows processed so far.
+
+        Raises:
+            ValueError: If batch_size is not positive.
         """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
         self.session = session
+        self.batch_size = batch_size
+        self.progress = progress
         self._age_loaded = False
+        self._indexes_ensured = False
 
     async def _ensure_age_loaded(self) -> None:
         """Ensure AGE extension is loaded for this session.
@@ -58,6 +101,29 @@ class GraphSyncService:
             logger.error("Failed to load AGE extension: %s", exc)
             raise RuntimeError(f"Failed to initialize AGE: {exc}") from exc
 
+    async def ensure_id_indexes(self) -> None:
+        """Create the synced vertex label tables and their id indexes if missing.
+
+        Runs once per service instance, before the first merge.
+
+        Raises:
+            RuntimeError: If a label or index cannot be created.
+        """
+        if self._indexes_ensured:
+            return
+
+        await self._ensure_age_loaded()
+        try:
+            for label in SYNCED_VERTEX_LABELS:
+                await self.session.execute(text(build_create_vlabel_sql(label, GRAPH_NAME)))
+                for statement in build_id_index_sql(label, GRAPH_NAME):
+                    await self.session.execute(text(statement))
+        except SQLAlchemyError as exc:
+            logger.error("Failed to create graph id indexes: %s", exc)
+            raise RuntimeError(f"Failed to create graph id indexes: {exc}") from exc
+        self._indexes_ensured = True
+        logger.debug("Graph id indexes ensured for %s", ", ".join(SYNCED_VERTEX_LABELS))
+
     async def _execute_cypher(self, cypher: str) -> list[Any]:
         """Execute a Cypher query via AGE.
 
@@ -79,95 +145,92 @@ class GraphSyncService:
             logger.error("Cypher query failed: %s", cypher[:200])
             raise RuntimeError(f"Graph query failed: {exc}") from exc
 
-    async def _vertex_exists(self, label: str, vertex_id: str) -> bool:
-        """Check if a vertex already exists.
+    async def _count(self, cypher: str) -> int:
+        """Execute a Cypher count query and return the count.
 
         Args:
-            label: Vertex label.
-            vertex_id: Vertex id property.
+            cypher: Cypher query returning a single count column.
 
         Returns:
-            True if vertex exists, False otherwise.
+            The count, or 0 if the query returned no rows.
         """
-        cypher = f"MATCH (n:{label} {{id: {_escape_value(vertex_id)}}}) RETURN n LIMIT 1"
-        results = await self._execute_cypher(cypher)
-        return len(results) > 0
-
-    async def _create_vertex_if_not_exists(
+        rows = await self._execute_cypher(cypher)
+        if not rows:
+            return 0
+        # AGE returns agtype, which the driver hands back as its text form
+        return int(str(rows[0][0]))
+
+    def _report(self, entity: str, processed: int) -> None:
+        """Report batch progress to the progress callback, if any."""
+        logger.debug("Synced %d %s rows", processed, entity)
+        if self.progress is not None:
+            self.progress(entity, processed)
+
+    async def _merge_vertices(
         self,
         label: str,
-        properties: dict[str, Any],
-    ) -> bool:
-        """Create a vertex if it doesn't already exist.
-
-        Args:
-            label: Vertex label.
-            properties: Vertex properties (must include 'id').
-
-        Returns:
-            True if vertex was created, False if it already existed.
-        """
-        vertex_id = properties.get("id")
-        if not vertex_id:
-            raise ValueError("Vertex properties must include 'id'")
+        entity: str,
+        batches: AsyncIterator[list[dict[str, Any]]],
+    ) -> dict[str, int]:
+        """Merge vertex batches into the graph.
 
-        if await self._vertex_exists(label, vertex_id):
-            return False
-
-        cypher = build_create_vertex(label, properties)
-        await self._execute_cypher(cypher)
-        return True
-
-    async def _edge_exists(
-        self,
-        from_label: str,
-        from_id: str,
-        edge_label: str,
-        to_label: str,
-        to_id: str,
-    ) -> bool:
-        """Check if an edge already exists.
+        Created counts come from the label's vertex count before and after
+        the merge; every other input row is counted as skipped.
 
         Args:
-            from_label: Source vertex label.
-            from_id: Source vertex id.
-            edge_label: Edge label.
-            to_label: Target vertex label.
-            to_id: Target vertex id.
+            label: Vertex label.
+            entity: Entity name used for progress reporting.
+            batches: Batches of vertex properties, each including 'id'.
 
         Returns:
-            True if edge exists, False otherwise.
+            Stats dict with 'created' and 'skipped' counts.
         """
-        cypher = f"MATCH (a:{from_label} {{id: {_escape_value(from_id)}}})-[r:{edge_label}]->(b:{to_label} {{id: {_escape_value(to_id)}}}) RETURN r LIMIT 1"
-        results = await self._execute_cypher(cypher)
-        return len(results) > 0
-
-    async def _create_edge_if_not_exists(
-        self,
-        from_label: str,
-        from_id: str,
-        edge_label: str,
-        to_label: str,
-        to_id: str,
-    ) -> bool:
-        """Create an edge if it doesn't already exist.
+        await self.ensure_id_indexes()
+        before = await self._count(build_count_vertices(label))
+        total = 0
+        async for rows in batches:
+            if not rows:
+                continue
+            await self._execute_cypher(build_merge_vertices(label, rows))
+            total += len(rows)
+            self._report(entity, total)
+
+        created = await self._count(build_count_vertices(label)) - before if total else 0
+        return {"created": created, "skipped": total - created}
+
+    async def _batches(self, items: list[T]) -> AsyncIterator[list[T]]:
+        """Split an in-memory list into batches of batch_size."""
+        for start in range(0, len(items), self.batch_size):
+            yield items[start : start + self.batch_size]
+
+    async def _signal_batches(self, columns: str, where: str = "") -> AsyncIterator[list[Any]]:
+        """Stream signal rows in batches using keyset pagination on id.
 
         Args:
-            from_label: Source vertex label.
-            from_id: Source vertex id.
-            edge_label: Edge label.
-            to_label: Target vertex label.
-            to_id: Target vertex id.
+            columns: Comma-separated columns to select; must start with id.
+            where: Optional extra filter condition.
 
-        Returns:
-            True if edge was created, False if it already existed.
+        Yields:
+            Lists of up to batch_size rows ordered by id.
         """
-        if await self._edge_exists(from_label, from_id, edge_label, to_label, to_id):
-            return False
-
-        cypher = build_create_edge(from_label, from_id, edge_label, to_label, to_id)
-        await self._execute_cypher(cypher)
-        return True
+        after: Any = None
+        while True:
+            conditions = [c for c in (where, "id > :after" if after is not None else "") if c]
+            where_sql = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            params: dict[str, Any] = {"limit": self.batch_size}
+            if after is not None:
+                params["after"] = after
+            result = await self.session.execute(
+                text(f"SELECT {columns} FROM signals {where_sql} ORDER BY id LIMIT :limit"),
+                params,
+            )
+            rows = list(result.fetchall())
+            if not rows:
+                return
+            yield rows
+            if len(rows) < self.batch_size:
+                return
+            after = rows[-1][0]
 
     async def sync_domains(self) -> dict[str, int]:
         """Sync quality domains to graph vertices.
@@ -177,18 +240,11 @@ class GraphSyncService:
         """
         # Get distinct domains from signals table
         result = await self.session.execute(text("SELECT DISTINCT domain FROM signals WHERE domain IS NOT NULL"))
-        domains = [row[0] for row in result.fetchall()]
-
-        created = 0
-        skipped = 0
-        for domain in domains:
-            if await self._create_vertex_if_not_exists("Domain", {"id": domain, "name": domain}):
-                created += 1
-            else:
-                skipped += 1
+        domains = [{"id": row[0], "name": row[0]} for row in result.fetchall()]
 
-        logger.info("Synced %d domains (%d created, %d skipped)", len(domains), created, skipped)
-        return {"created": created, "skipped": skipped}
+        stats = await self._merge_vertices("Domain", "domains", self._batches(domains))
+        logger.info("Synced %d domains (%d created, %d skipped)", len(domains), stats["created"], stats["skipped"])
+        return stats
 
     async def sync_facilities(self) -> dict[str, int]:
         """Sync facilities to graph vertices.
@@ -197,23 +253,16 @@ class GraphSyncService:
             Stats dict with 'created' and 'skipped' counts.
         """
         result = await self.session.execute(text("SELECT DISTINCT facility_id FROM signals WHERE facility_id IS NOT NULL"))
-        facilities = [row[0] for row in result.fetchall()]
-
-        created = 0
-        skipped = 0
-        for facility_id in facilities:
-            if await self._create_vertex_if_not_exists("Facility", {"id": facility_id, "name": facility_id}):
-                created += 1
-            else:
-                skipped += 1
+        facilities = [{"id": row[0], "name": row[0]} for row in result.fetchall()]
 
+        stats = await self._merge_vertices("Facility", "facilities", self._batches(facilities))
         logger.info(
             "Synced %d facilities (%d created, %d skipped)",
             len(facilities),
-            created,
-            skipped,
+            stats["created"],
+            stats["skipped"],
         )
-        return {"created": created, "skipped": skipped}
+        return stats
 
     async def sync_metrics(self) -> dict[str, int]:
         """Sync metrics to graph vertices.
@@ -222,56 +271,41 @@ class GraphSyncService:
             Stats dict with 'created' and 'skipped' counts.
         """
         result = await self.session.execute(text("SELECT DISTINCT metric_id, domain FROM signals WHERE metric_id IS NOT NULL"))
-        metrics = result.fetchall()
-
-        created = 0
-        skipped = 0
-        for row in metrics:
-            metric_id, domain = row
-            if await self._create_vertex_if_not_exists("Metric", {"id": metric_id, "name": metric_id, "domain": domain}):
-                created += 1
-            else:
-                skipped += 1
+        metrics = [{"id": metric_id, "name": metric_id, "domain": domain} for metric_id, domain in result.fetchall()]
 
-        logger.info("Synced %d metrics (%d created, %d skipped)", len(metrics), created, skipped)
-        return {"created": created, "skipped": skipped}
+        stats = await self._merge_vertices("Metric", "metrics", self._batches(metrics))
+        logger.info("Synced %d metrics (%d created, %d skipped)", len(metrics), stats["created"], stats["skipped"])
+        return stats
 
     async def sync_signals(self) -> dict[str, int]:
-        """Sync signals to graph vertices.
+        """Sync all signals to graph vertices, batch_size rows at a time.
 
         Returns:
             Stats dict with 'created' and 'skipped' counts.
         """
-        result = await self.session.execute(
-            text("""
-                SELECT id, simplified_signal_type, simplified_severity, created_at
-                FROM signals
-                LIMIT 1000
-            """)
-        )
-        signals = result.fetchall()
 
-        created = 0
-        skipped = 0
-        for row in signals:
-            signal_id, signal_type, severity, created_at = row
-            properties: dict[str, Any] = {
-                "id": str(signal_id),
-            }
-            if signal_type:
-                properties["signal_type"] = signal_type
-            if severity is not None:
-                properties["severity"] = severity
-            if created_at:
-                properties["created_at"] = created_at.isoformat()
-
-            if await self._create_vertex_if_not_exists("Signal", properties):
-                created += 1
-            else:
-                skipped += 1
-
-        logger.info("Synced %d signals (%d created, %d skipped)", len(signals), created, skipped)
-        return {"created": created, "skipped": skipped}
+        async def signal_properties() -> AsyncIterator[list[dict[str, Any]]]:
+            async for rows in self._signal_batches("id, simplified_signal_type, simplified_severity, created_at"):
+                batch: list[dict[str, Any]] = []
+                for signal_id, signal_type, severity, created_at in rows:
+                    properties: dict[str, Any] = {"id": str(signal_id)}
+                    if signal_type:
+                        properties["signal_type"] = signal_type
+                    if severity is not None:
+                        properties["severity"] = severity
+                    if created_at:
+                        properties["created_at"] = created_at.isoformat()
+                    batch.append(properties)
+                yield batch
+
+        stats = await self._merge_vertices("Signal", "signals", signal_properties())
+        logger.info(
+            "Synced %d signals (%d created, %d skipped)",
+            stats["created"] + stats["skipped"],
+            stats["created"],
+            stats["skipped"],
+        )
+        return stats
 
     async def sync_edges(self) -> dict[str, int]:
         """Sync relationships as graph edges.
@@ -279,49 +313,39 @@ class GraphSyncService:
         Creates edges:
         - Facility -> Signal (has_signal)
         - Metric -> Signal (measures)
-        - Metric -> Domain (belongs_to)
+        - Metric -> Domain (belongs_to), once per distinct metric/domain pair
 
         Returns:
             Stats dict with 'created' and 'skipped' counts.
         """
+        await self.ensure_id_indexes()
+        edge_labels = ("has_signal", "measures", "belongs_to")
+        before = {label: await self._count(build_count_edges(label)) for label in edge_labels}
+        total = 0
+
+        async for rows in self._signal_batches(
+            "id, facility_id, metric_id",
+            "facility_id IS NOT NULL AND metric_id IS NOT NULL",
+        ):
+            await self._execute_cypher(build_merge_edges("Facility", "has_signal", "Signal", [(f, str(s)) for s, f, _ in rows]))
+            await self._execute_cypher(build_merge_edges("Metric", "measures", "Signal", [(m, str(s)) for s, _, m in rows]))
+            total += 2 * len(rows)
+            self._report("edges", total)
+
+        result = await self.session.execute(text("SELECT DISTINCT metric_id, domain FROM signals WHERE metric_id IS NOT NULL AND domain IS NOT NULL"))
+        metric_domains = [(metric_id, domain) for metric_id, domain in result.fetchall()]
+        async for pairs in self._batches(metric_domains):
+            await self._execute_cypher(build_merge_edges("Metric", "belongs_to", "Domain", pairs))
+            total += len(pairs)
+            self._report("edges", total)
+
         created = 0
-        skipped = 0
-
-        # Get signal relationships
-        result = await self.session.execute(
-            text("""
-                SELECT id, facility_id, metric_id, domain
-                FROM signals
-                WHERE facility_id IS NOT NULL AND metric_id IS NOT NULL
-                LIMIT 1000
-            """)
-        )
-        signals = result.fetchall()
-
-        for row in signals:
-            signal_id, facility_id, metric_id, domain = row
-
-            # Facility -> Signal
-            if await self._create_edge_if_not_exists("Facility", facility_id, "has_signal", "Signal", str(signal_id)):
-                created += 1
-            else:
-                skipped += 1
-
-            # Metric -> Signal
-            if await self._create_edge_if_not_exists("Metric", metric_id, "measures", "Signal", str(signal_id)):
-                created += 1
-            else:
-                skipped += 1
-
-            # Metric -> Domain
-            if domain:
-                if await self._create_edge_if_not_exists("Metric", metric_id, "belongs_to", "Domain", domain):
-                    created += 1
-                else:
-                    skipped += 1
-
-        logger.info("Synced edges (%d created, %d skipped)", created, skipped)
-        return {"created": created, "skipped": skipped}
+        if total:
+            for label in edge_labels:
+                created += await self._count(build_count_edges(label)) - before[label]
+
+        logger.info("Synced edges (%d created, %d skipped)", created, total - created)
+        return {"created": created, "skipped": total - created}
 
     async def sync_all(self) -> dict[str, dict[str, int]]:
         """Sync all entities and relationships to the graph.
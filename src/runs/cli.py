@@ -0,0 +1,61 @@
+"""CLI commands for insight graph run artifacts.
+
+Usage:
+    # From backend directory
+    uv run python -m src.runs.cli precompile
+    uv run python -m src.runs.cli precompile test_minimal --run-id 20260115105115
+"""
+
+import click
+
+from src.runs.services.dot_parser import DotParserService
+from src.runs.services.run_discovery import RunDiscoveryService
+
+
+@click.group()
+def cli() -> None:
+    """Insight graph run commands."""
+    pass
+
+
+@cli.command()
+@click.argument("graph_name", required=False)
+@click.option(
+    "--run-id",
+    "-r",
+    multiple=True,
+    help="Run ID to precompile (can be specified multiple times). Defaults to all runs.",
+)
+def precompile(graph_name: str | None, run_id: tuple[str, ...]) -> None:
+    """Precompile run DOT graphs to graph.vis.json.
+
+    Writes graphviz/graph.vis.json next to each run's graphviz_condensed.dot
+    so the graph endpoint can serve it as a static file. Compiles every
+    graph under RUNS_ROOT unless GRAPH_NAME is given.
+    """
+    discovery = RunDiscoveryService()
+    parser = DotParserService()
+
+    graph_names = [graph_name] if graph_name else [g.graph_name for g in discovery.discover_graphs()]
+    compiled = 0
+    skipped = 0
+
+    for name in graph_names:
+        run_ids = list(run_id) or [r.run_id for r in discovery.list_runs_for_graph(name)]
+        for rid in run_ids:
+            run_dir = discovery.get_run_dir(name, rid)
+            dot_path = run_dir / "graphviz" / "graphviz_condensed.dot" if run_dir else None
+            if dot_path is None or not dot_path.exists():
+                click.echo(f"  Skipped {name}/{rid}: no DOT file")
+                skipped += 1
+                continue
+
+            output_path = parser.compile_vis_json(dot_path)
+            click.echo(f"  Compiled {name}/{rid} -> {output_path}")
+            compiled += 1
+
+    click.echo(f"\nPrecompile complete: {compiled} compiled, {skipped} skipped")
+
+
+if __name__ == "__main__":
+    cli()
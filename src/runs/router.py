@@ -4,12 +4,13 @@ This module provides REST endpoints for browsing insight graph runs,
 parsing DOT files for visualization, and streaming entity results.
 """
 
-from pathlib import Path
+from collections.abc import Iterator
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
 
-from src.config import settings
 from src.runs.schemas import (
     EntityResultResponse,
     GraphListResponse,
@@ -19,15 +20,18 @@ from src.runs.schemas import (
     RunListResponse,
     RunMetadataResponse,
     RunSummaryResponse,
-    VisEdgeResponse,
-    VisNodeResponse,
 )
-from src.runs.services.dot_parser import DotParserService
+from src.runs.services.dot_parser import DotParserService, GraphStructure
+from src.runs.services.graph_index import Direction, GraphIndex, get_graph_index
 from src.runs.services.results_reader import ResultsReaderService
-from src.runs.services.run_discovery import RunDiscoveryService
+from src.runs.services.run_discovery import RunDiscoveryService, RunNodeIndex
+from src.services.path_validation import PathValidationError, validate_path_within_root
 
 router = APIRouter(prefix="/runs", tags=["runs"])
 
+# Number of nodes serialized per chunk when streaming run metadata
+NODE_STREAM_CHUNK_SIZE = 500
+
 
 # =============================================================================
 # Dependencies
@@ -58,6 +62,12 @@ ResultsReaderDep = Annotated[ResultsReaderService, Depends(get_results_reader_se
 LimitQuery = Annotated[int, Query(ge=1, le=100, description="Maximum results per page")]
 OffsetQuery = Annotated[int, Query(ge=0, description="Results offset")]
 
+# Query parameters for graph queries
+EdgeTypeQuery = Annotated[
+    list[str] | None,
+    Query(description="Edge types to include (e.g. trends_to, segments_into, potentially_driven_by). Repeat for several."),
+]
+
 
 # =============================================================================
 # Endpoints
@@ -104,26 +114,57 @@ async def list_runs(graph_name: str, service: RunDiscoveryDep) -> RunListRespons
     )
 
 
+def _stream_run_metadata(node_index: RunNodeIndex) -> Iterator[bytes]:
+    """Serialize a run's metadata as RunMetadataResponse JSON, chunk by chunk.
+
+    Args:
+        node_index: Cached node index for the run.
+
+    Yields:
+        bytes: Consecutive fragments of the JSON document.
+    """
+    header = to_json({"run_id": node_index.run_id, "created_at": node_index.created_at})
+    yield header[:-1] + b',"nodes":['
+
+    nodes = node_index.nodes
+    for start in range(0, len(nodes), NODE_STREAM_CHUNK_SIZE):
+        chunk = b",".join(node.model_dump_json().encode() for node in nodes[start : start + NODE_STREAM_CHUNK_SIZE])
+        yield chunk if start == 0 else b"," + chunk
+
+    yield b"]}"
+
+
 @router.get("/graphs/{graph_name}/runs/{run_id}", response_model=RunMetadataResponse)
-async def get_run_metadata(graph_name: str, run_id: str, service: RunDiscoveryDep) -> RunMetadataResponse:
+async def get_run_metadata(graph_name: str, run_id: str, service: RunDiscoveryDep) -> StreamingResponse:
     """Get detailed metadata for a specific run.
 
+    The node list is streamed from the cached per-run node index rather
+    than materialized as a single response model.
+
     Args:
         graph_name: Name of the insight graph.
         run_id: Run identifier (timestamp format).
         service: RunDiscoveryService dependency.
 
     Returns:
-        RunMetadataResponse: Full run metadata including node list.
+        StreamingResponse: RunMetadataResponse JSON including node list.
 
     Raises:
         HTTPException: 404 if run not found.
     """
-    metadata = service.get_run_metadata(graph_name, run_id)
-    if metadata is None:
+    node_index = service.get_node_index(graph_name, run_id)
+    if node_index is None:
         raise HTTPException(status_code=404, detail=f"Run not found: {graph_name}/{run_id}")
 
-    return RunMetadataResponse.model_validate(metadata, from_attributes=True)
+    return StreamingResponse(_stream_run_metadata(node_index), media_type="application/json")
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
 
 
 @router.get(
@@ -133,60 +174,174 @@ async def get_run_metadata(graph_name: str, run_id: str, service: RunDiscoveryDe
 async def get_graph_structure(
     graph_name: str,
     run_id: str,
+    request: Request,
     discovery: RunDiscoveryDep,
     parser: DotParserDep,
-) -> GraphStructureResponse:
+) -> Response:
     """Get graph structure in vis-network format.
 
-    Parses the DOT file from the run and converts to vis-network compatible
-    node/edge format.
+    Serves the run's precompiled graph.vis.json when present, otherwise
+    parses the DOT file (cached until it changes). Responses carry an ETag
+    and honour If-None-Match with 304 Not Modified.
 
     Args:
         graph_name: Name of the insight graph.
         run_id: Run identifier.
+        request: Incoming request (for conditional headers).
         discovery: RunDiscoveryService for validation.
         parser: DotParserService for DOT parsing.
 
     Returns:
-        GraphStructureResponse: Nodes and edges for vis-network rendering.
+        Response: GraphStructureResponse JSON for vis-network rendering.
 
     Raises:
         HTTPException: 404 if run not found.
     """
     # Validate run exists
-    metadata = discovery.get_run_metadata(graph_name, run_id)
-    if metadata is None:
+    node_index = discovery.get_node_index(graph_name, run_id)
+    if node_index is None:
         raise HTTPException(status_code=404, detail=f"Run not found: {graph_name}/{run_id}")
 
     # Build path to DOT file
-    runs_root = Path(settings.RUNS_ROOT).expanduser().resolve()
-    dot_path = runs_root / "insight_graph" / graph_name / run_id / "graphviz" / "graphviz_condensed.dot"
-
-    # Parse DOT file
-    structure = parser.parse_file(dot_path)
-
-    return GraphStructureResponse(
-        nodes=[
-            VisNodeResponse(
-                id=n.id,
-                label=n.label,
-                title=n.title,
-                shape=n.shape,
-                color=n.color,
-            )
-            for n in structure.nodes
-        ],
-        edges=[
-            VisEdgeResponse(
-                source=e.source,
-                target=e.target,
-                label=e.label,
-                dashes=e.dashes,
-                color=e.color,
-            )
-            for e in structure.edges
-        ],
-    )
+    dot_path = node_index.run_dir / "graphviz" / "graphviz_condensed.dot"
+
+    payload = parser.get_vis_json(dot_path)
+    headers = {"ETag": payload.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), payload.etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=payload.content, media_type="application/json", headers=headers)
+
+
+def _load_graph_index(discovery: RunDiscoveryService, parser: DotParserService, graph_name: str, run_id: str) -> GraphIndex:
+    """Resolve a run and return its graph index, raising 404 if unavailable."""
+    run_dir = discovery.get_run_dir(graph_name, run_id)
+    if run_dir is None:
+        raise HTTPException(status_code=404, detail=f"Run not found: {graph_name}/{run_id}")
+
+    graph_index = get_graph_index(run_dir, parser)
+    if graph_index is None:
+        raise HTTPException(status_code=404, detail=f"Graph not found for run: {graph_name}/{run_id}")
+    return graph_index
+
+
+def _structure_response(structure: GraphStructure) -> Response:
+    """Serialize a graph structure in GraphStructureResponse format."""
+    return Response(content=structure.model_dump_json(), media_type="application/json")
+
+
+@router.get(
+    "/graphs/{graph_name}/runs/{run_id}/graph/neighborhood/{node_id}",
+    response_model=GraphStructureResponse,
+)
+async def get_graph_neighborhood(
+    graph_name: str,
+    run_id: str,
+    node_id: str,
+    discovery: RunDiscoveryDep,
+    parser: DotParserDep,
+    edge_type: EdgeTypeQuery = None,
+    depth: Annotated[int, Query(ge=0, le=10, description="Maximum hops from the node")] = 1,
+    direction: Annotated[Direction, Query(description="Follow outgoing, incoming, or both edge directions")] = "both",
+) -> Response:
+    """Get the k-hop neighborhood of a node in vis-network format.
+
+    Args:
+        graph_name: Name of the insight graph.
+        run_id: Run identifier.
+        node_id: Center node identifier.
+        discovery: RunDiscoveryService for validation.
+        parser: DotParserService for DOT parsing.
+        edge_type: Only traverse these edge types.
+        depth: Maximum number of hops (0-10).
+        direction: Edge direction to follow.
+
+    Returns:
+        Response: GraphStructureResponse JSON with reached nodes and the edges between them.
+
+    Raises:
+        HTTPException: 404 if run, graph or node not found.
+    """
+    graph_index = _load_graph_index(discovery, parser, graph_name, run_id)
+    try:
+        structure = graph_index.neighborhood(node_id, depth=depth, direction=direction, edge_types=edge_type)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=f"Node not found: {node_id}") from e
+    return _structure_response(structure)
+
+
+@router.get(
+    "/graphs/{graph_name}/runs/{run_id}/graph/path",
+    response_model=GraphStructureResponse,
+)
+async def get_graph_path(
+    graph_name: str,
+    run_id: str,
+    source: Annotated[str, Query(description="Start node identifier")],
+    target: Annotated[str, Query(description="End node identifier")],
+    discovery: RunDiscoveryDep,
+    parser: DotParserDep,
+    edge_type: EdgeTypeQuery = None,
+    directed: Annotated[bool, Query(description="Only follow edges in their own direction")] = False,
+) -> Response:
+    """Get the shortest path between two nodes in vis-network format.
+
+    Args:
+        graph_name: Name of the insight graph.
+        run_id: Run identifier.
+        source: Start node identifier.
+        target: End node identifier.
+        discovery: RunDiscoveryService for validation.
+        parser: DotParserService for DOT parsing.
+        edge_type: Only traverse these edge types.
+        directed: Whether to respect edge direction.
+
+    Returns:
+        Response: GraphStructureResponse JSON with path nodes and edges in order.
+
+    Raises:
+        HTTPException: 404 if run, graph, nodes or a path is not found.
+    """
+    graph_index = _load_graph_index(discovery, parser, graph_name, run_id)
+    try:
+        structure = graph_index.shortest_path(source, target, directed=directed, edge_types=edge_type)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=f"Node not found: {e.args[0]}") from e
+    if structure is None:
+        raise HTTPException(status_code=404, detail=f"No path from {source} to {target}")
+    return _structure_response(structure)
+
+
+@router.get(
+    "/graphs/{graph_name}/runs/{run_id}/graph/subgraph",
+    response_model=GraphStructureResponse,
+)
+async def get_graph_subgraph(
+    graph_name: str,
+    run_id: str,
+    discovery: RunDiscoveryDep,
+    parser: DotParserDep,
+    metric_id: Annotated[list[str] | None, Query(description="Metric IDs to include. Repeat for several.")] = None,
+    edge_type: EdgeTypeQuery = None,
+) -> Response:
+    """Get the subgraph filtered by metric and/or edge type in vis-network format.
+
+    Args:
+        graph_name: Name of the insight graph.
+        run_id: Run identifier.
+        discovery: RunDiscoveryService for validation.
+        parser: DotParserService for DOT parsing.
+        metric_id: Keep only nodes for these metrics.
+        edge_type: Keep only these edge types (and the nodes they connect).
+
+    Returns:
+        Response: GraphStructureResponse JSON with the filtered graph.
+
+    Raises:
+        HTTPException: 404 if run or graph not found.
+    """
+    graph_index = _load_graph_index(discovery, parser, graph_name, run_id)
+    return _structure_response(graph_index.subgraph(metric_ids=metric_id, edge_types=edge_type))
 
 
 @router.get(
@@ -220,18 +375,20 @@ async def get_node_results(
         HTTPException: 404 if run or node not found.
     """
     # Validate run exists
-    metadata = discovery.get_run_metadata(graph_name, run_id)
-    if metadata is None:
+    node_index = discovery.get_node_index(graph_name, run_id)
+    if node_index is None:
         raise HTTPException(status_code=404, detail=f"Run not found: {graph_name}/{run_id}")
 
-    # Find node in metadata
-    node_meta = next((n for n in metadata.nodes if n.node_id == node_id), None)
+    # Find node in the run's node index
+    node_meta = node_index.get(node_id)
     if node_meta is None:
         raise HTTPException(status_code=404, detail=f"Node not found: {node_id}")
 
-    # Build path to JSONL file
-    runs_root = Path(settings.RUNS_ROOT).expanduser().resolve()
-    jsonl_path = runs_root / "insight_graph" / graph_name / run_id / node_meta.result_path
+    # Build path to JSONL file, keeping it inside the run directory
+    try:
+        jsonl_path = validate_path_within_root(node_index.run_dir / node_meta.result_path, node_index.run_dir)
+    except PathValidationError as e:
+        raise HTTPException(status_code=404, detail=f"Node results not found: {node_id}") from e
 
     # Read paginated results
     paginated = reader.read_results(jsonl_path, offset=offset, limit=limit)
@@ -1,18 +1,25 @@
 """Services for runs module."""
 
 from src.runs.services.dot_parser import DotParserService, GraphStructure, VisEdge, VisNode
+from src.runs.services.graph_index import GraphIndex, get_graph_index
 from src.runs.services.results_reader import EntityResult, PaginatedResults, ResultsReaderService
+from src.runs.services.run_catalog import RunCatalog, RunCatalogEntry, get_run_catalog
 from src.runs.services.run_discovery import GraphSummary, RunDiscoveryService, RunSummary
 
 __all__ = [
     "DotParserService",
     "EntityResult",
+    "GraphIndex",
     "GraphStructure",
     "GraphSummary",
     "PaginatedResults",
     "ResultsReaderService",
+    "RunCatalog",
+    "RunCatalogEntry",
     "RunDiscoveryService",
     "RunSummary",
     "VisEdge",
     "VisNode",
+    "get_graph_index",
+    "get_run_catalog",
 ]
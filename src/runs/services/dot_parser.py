@@ -1,14 +1,28 @@
-"""Service for parsing Graphviz DOT files to vis-network format."""
+"""Service for parsing Graphviz DOT files to vis-network format.
 
+Parsed structures and their serialized vis-network JSON are cached per DOT
+file and invalidated when the file's mtime or size changes. A run can also
+be precompiled to graph.vis.json so the graph endpoint becomes a static
+file read.
+"""
+
+import hashlib
 import logging
 import re
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from src.config import settings
+from src.runs.services.file_cache import FileSignatureCache, file_signature
+
 logger = logging.getLogger(__name__)
 
+# Precompiled vis-network JSON written next to the DOT file
+VIS_JSON_FILENAME = "graph.vis.json"
+
 
 class VisNode(BaseModel):
     """Node in vis-network format."""
@@ -42,6 +56,25 @@ class GraphStructure(BaseModel):
     edges: list[VisEdge] = Field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class VisGraphPayload:
+    """Serialized vis-network graph ready to send as a response body.
+
+    Attributes:
+        content: GraphStructure JSON bytes.
+        etag: Quoted strong ETag derived from the content.
+    """
+
+    content: bytes
+    etag: str
+
+    @classmethod
+    def from_bytes(cls, content: bytes) -> "VisGraphPayload":
+        """Build a payload, hashing the content for its ETag."""
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        return cls(content=content, etag=f'"{digest}"')
+
+
 class DotParserService:
     """Parse Graphviz DOT files to vis-network format.
 
@@ -98,6 +131,76 @@ class DotParserService:
 
         return GraphStructure(nodes=nodes, edges=edges)
 
+    def get_structure(self, dot_path: Path) -> GraphStructure:
+        """Parse a DOT file, reusing the cached structure if unchanged.
+
+        The returned structure is shared between callers and must not be
+        mutated.
+
+        Args:
+            dot_path: Path to the DOT file.
+
+        Returns:
+            GraphStructure with nodes and edges for vis-network.
+        """
+        try:
+            return _structure_cache.get_or_load(dot_path, self.parse_file)
+        except OSError:
+            return self.parse_file(dot_path)
+
+    def get_vis_json(self, dot_path: Path) -> VisGraphPayload:
+        """Get serialized vis-network JSON for a DOT file.
+
+        Serves the precompiled graph.vis.json beside the DOT file when it is
+        at least as new as the DOT file; otherwise serializes the cached
+        parsed structure. Both are cached until their source file changes.
+
+        Args:
+            dot_path: Path to the DOT file.
+
+        Returns:
+            VisGraphPayload with JSON bytes and ETag.
+        """
+        vis_path = dot_path.with_name(VIS_JSON_FILENAME)
+        try:
+            if not dot_path.exists() or file_signature(vis_path)[0] >= file_signature(dot_path)[0]:
+                return _payload_cache.get_or_load(vis_path, lambda path: VisGraphPayload.from_bytes(path.read_bytes()))
+        except OSError:
+            pass  # No usable precompiled file
+
+        try:
+            return _payload_cache.get_or_load(dot_path, lambda path: VisGraphPayload.from_bytes(self.get_structure(path).model_dump_json().encode()))
+        except OSError:
+            return VisGraphPayload.from_bytes(GraphStructure().model_dump_json().encode())
+
+    def compile_vis_json(self, dot_path: Path, output_path: Path | None = None) -> Path:
+        """Precompile a DOT file to vis-network JSON on disk.
+
+        Args:
+            dot_path: Path to the DOT file.
+            output_path: Destination file. Defaults to graph.vis.json beside the DOT file.
+
+        Returns:
+            Path of the written JSON file.
+
+        Raises:
+            FileNotFoundError: If the DOT file does not exist.
+            OSError: If the output cannot be written.
+        """
+        if not dot_path.exists():
+            raise FileNotFoundError(f"DOT file not found: {dot_path}")
+
+        if output_path is None:
+            output_path = dot_path.with_name(VIS_JSON_FILENAME)
+
+        content = self.parse_file(dot_path).model_dump_json().encode()
+        tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+        tmp_path.write_bytes(content)
+        tmp_path.replace(output_path)
+
+        logger.info("Precompiled %s -> %s", dot_path, output_path)
+        return output_path
+
     def _parse_nodes(self, content: str) -> list[VisNode]:
         """Extract nodes from DOT content."""
         nodes: list[VisNode] = []
@@ -178,3 +281,8 @@ class DotParserService:
             value = match.group(2)
             attrs[key] = value
         return attrs
+
+
+# Parsed structures and serialized payloads shared across requests
+_structure_cache: FileSignatureCache[GraphStructure] = FileSignatureCache(settings.RUNS_GRAPH_CACHE_SIZE, name="run_graph_structure")
+_payload_cache: FileSignatureCache[VisGraphPayload] = FileSignatureCache(settings.RUNS_GRAPH_CACHE_SIZE, name="run_graph_payload")
@@ -0,0 +1,119 @@
+"""Bounded in-process cache for values derived from files on disk.
+
+Entries are keyed by path and validated against the file's stat signature
+(mtime_ns, size), so a value is recomputed only after the file changes.
+Named caches report their hit/miss counts through cache_stats().
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+FileSignature = tuple[int, int]
+
+# Named caches by name, for cache_stats()
+_named_caches: dict[str, "FileSignatureCache[Any]"] = {}
+
+
+def file_signature(path: Path) -> FileSignature:
+    """Return the (mtime_ns, size) signature of a file.
+
+    Args:
+        path: File to stat.
+
+    Returns:
+        Tuple of modification time in nanoseconds and size in bytes.
+
+    Raises:
+        OSError: If the file cannot be stat'ed.
+    """
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class FileSignatureCache[T]:
+    """LRU cache of values derived from files, invalidated on file change.
+
+    Safe to share across threads; loaders run outside the lock, so two
+    concurrent misses on the same file may both load it.
+
+    Attributes:
+        max_entries: Maximum number of files kept in the cache.
+        name: Name reported by cache_stats(), or None for unlisted caches.
+    """
+
+    def __init__(self, max_entries: int, name: str | None = None) -> None:
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of files kept (at least 1).
+            name: Optional name to list the cache in cache_stats().
+        """
+        self.max_entries = max(max_entries, 1)
+        self.name = name
+        self._entries: OrderedDict[Path, tuple[FileSignature, T]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if name is not None:
+            _named_caches[name] = self
+
+    def get_or_load(self, path: Path, loader: Callable[[Path], T]) -> T:
+        """Return the cached value for path, loading it if missing or stale.
+
+        Args:
+            path: Source file.
+            loader: Function computing the value from the file.
+
+        Returns:
+            Cached or freshly loaded value.
+
+        Raises:
+            OSError: If the file cannot be stat'ed.
+        """
+        signature = file_signature(path)
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and cached[0] == signature:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+
+        value = loader(path)
+
+        with self._lock:
+            self._entries[path] = (signature, value)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def invalidate(self, path: Path | None = None) -> None:
+        """Drop one cached file, or everything when path is None.
+
+        Args:
+            path: File to drop, or None to clear the cache.
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+    def __len__(self) -> int:
+        """Number of cached files."""
+        return len(self._entries)
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    """Report hits, misses and size of every named cache.
+
+    Returns:
+        Counts keyed by cache name: "hits", "misses" and "entries".
+    """
+    return {name: {"hits": cache.hits, "misses": cache.misses, "entries": len(cache)} for name, cache in _named_caches.items()}
@@ -0,0 +1,270 @@
+"""Adjacency index for querying parts of a run's insight graph.
+
+The condensed graph of large runs is too big to render whole in the
+browser. GraphIndex builds in/out adjacency lists once per graph so the
+API can return k-hop neighborhoods, shortest paths and metric/edge-type
+filtered subgraphs without walking the full edge list per request.
+"""
+
+import json
+import logging
+from collections import deque
+from collections.abc import Collection, Iterable
+from pathlib import Path
+from typing import Literal
+
+from src.config import settings
+from src.runs.services.dot_parser import DotParserService, GraphStructure, VisEdge, VisNode
+from src.runs.services.file_cache import FileSignatureCache
+
+logger = logging.getLogger(__name__)
+
+Direction = Literal["in", "out", "both"]
+
+
+class GraphIndex:
+    """Adjacency lists over a vis-network graph structure.
+
+    Edges are referenced by their position in ``edges``; ``out_edges`` and
+    ``in_edges`` map node IDs to those positions.
+
+    Attributes:
+        nodes: Nodes keyed by ID, in source order.
+        edges: All edges in source order.
+        out_edges: Outgoing edge positions per node ID.
+        in_edges: Incoming edge positions per node ID.
+    """
+
+    def __init__(self, structure: GraphStructure, node_metrics: dict[str, str] | None = None) -> None:
+        """Build the index.
+
+        Args:
+            structure: Parsed graph structure.
+            node_metrics: Optional metric_id per node ID. Nodes without an
+                entry fall back to the node ID prefix before the first "__".
+        """
+        self.nodes: dict[str, VisNode] = {node.id: node for node in structure.nodes}
+        self.edges: list[VisEdge] = list(structure.edges)
+        self.out_edges: dict[str, list[int]] = {}
+        self.in_edges: dict[str, list[int]] = {}
+        self._node_metrics = node_metrics or {}
+
+        for position, edge in enumerate(self.edges):
+            self.out_edges.setdefault(edge.source, []).append(position)
+            self.in_edges.setdefault(edge.target, []).append(position)
+
+    def __contains__(self, node_id: object) -> bool:
+        """Whether the graph has a node with this ID."""
+        return node_id in self.nodes
+
+    def metric_of(self, node_id: str) -> str:
+        """Return the metric ID of a node."""
+        return self._node_metrics.get(node_id) or node_id.split("__", 1)[0]
+
+    def neighborhood(
+        self,
+        node_id: str,
+        depth: int = 1,
+        direction: Direction = "both",
+        edge_types: Collection[str] | None = None,
+    ) -> GraphStructure:
+        """Return the k-hop neighborhood around a node.
+
+        Args:
+            node_id: Center node ID.
+            depth: Maximum number of hops from the center node.
+            direction: Follow outgoing edges, incoming edges, or both.
+            edge_types: Only traverse edges with these types (all if None).
+
+        Returns:
+            Induced subgraph of the reached nodes over the allowed edges.
+
+        Raises:
+            KeyError: If node_id is not in the graph.
+        """
+        if node_id not in self.nodes:
+            raise KeyError(node_id)
+
+        visited = {node_id}
+        frontier = deque([(node_id, 0)])
+        while frontier:
+            current, distance = frontier.popleft()
+            if distance >= depth:
+                continue
+            for neighbor, _ in self._adjacent(current, direction, edge_types):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    frontier.append((neighbor, distance + 1))
+
+        return self._induced(visited, edge_types)
+
+    def shortest_path(
+        self,
+        source: str,
+        target: str,
+        directed: bool = False,
+        edge_types: Collection[str] | None = None,
+    ) -> GraphStructure | None:
+        """Return the shortest path between two nodes.
+
+        Args:
+            source: Start node ID.
+            target: End node ID.
+            directed: Only follow edges in their own direction.
+            edge_types: Only traverse edges with these types (all if None).
+
+        Returns:
+            Path nodes and edges in order, or None if unreachable.
+
+        Raises:
+            KeyError: If source or target is not in the graph.
+        """
+        for node_id in (source, target):
+            if node_id not in self.nodes:
+                raise KeyError(node_id)
+
+        direction: Direction = "out" if directed else "both"
+        parents: dict[str, tuple[str, int] | None] = {source: None}
+        frontier = deque([source])
+        while frontier and target not in parents:
+            current = frontier.popleft()
+            for neighbor, position in self._adjacent(current, direction, edge_types):
+                if neighbor not in parents:
+                    parents[neighbor] = (current, position)
+                    frontier.append(neighbor)
+
+        if target not in parents:
+            return None
+
+        path_nodes = [target]
+        path_edges: list[int] = []
+        step = parents[target]
+        while step is not None:
+            previous, position = step
+            path_nodes.append(previous)
+            path_edges.append(position)
+            step = parents[previous]
+
+        return GraphStructure(
+            nodes=[self.nodes[n] for n in reversed(path_nodes)],
+            edges=[self.edges[p] for p in reversed(path_edges)],
+        )
+
+    def subgraph(
+        self,
+        metric_ids: Collection[str] | None = None,
+        edge_types: Collection[str] | None = None,
+    ) -> GraphStructure:
+        """Return the subgraph filtered by node metric and/or edge type.
+
+        With edge_types, only nodes touched by a matching edge are kept.
+
+        Args:
+            metric_ids: Keep nodes whose metric is in this set (all if None).
+            edge_types: Keep edges with these types (all if None).
+
+        Returns:
+            Filtered graph structure.
+        """
+        node_ids = {n for n in self.nodes if metric_ids is None or self.metric_of(n) in metric_ids}
+
+        if edge_types is not None:
+            touched: set[str] = set()
+            for edge in self.edges:
+                if edge.label in edge_types and edge.source in node_ids and edge.target in node_ids:
+                    touched.update((edge.source, edge.target))
+            node_ids = touched
+
+        return self._induced(node_ids, edge_types)
+
+    def _adjacent(
+        self,
+        node_id: str,
+        direction: Direction,
+        edge_types: Collection[str] | None,
+    ) -> Iterable[tuple[str, int]]:
+        """Yield (neighbor ID, edge position) pairs for allowed edges."""
+        if direction in ("out", "both"):
+            for position in self.out_edges.get(node_id, ()):
+                edge = self.edges[position]
+                if (edge_types is None or edge.label in edge_types) and edge.target in self.nodes:
+                    yield edge.target, position
+        if direction in ("in", "both"):
+            for position in self.in_edges.get(node_id, ()):
+                edge = self.edges[position]
+                if (edge_types is None or edge.label in edge_types) and edge.source in self.nodes:
+                    yield edge.source, position
+
+    def _induced(self, node_ids: set[str], edge_types: Collection[str] | None) -> GraphStructure:
+        """Build the subgraph induced by node_ids over allowed edges."""
+        positions = sorted(
+            position
+            for node_id in node_ids
+            for position in self.out_edges.get(node_id, ())
+            if self.edges[position].target in node_ids and (edge_types is None or self.edges[position].label in edge_types)
+        )
+        return GraphStructure(
+            nodes=[node for node_id, node in self.nodes.items() if node_id in node_ids],
+            edges=[self.edges[position] for position in positions],
+        )
+
+
+def _structure_from_graph_json(graph_json_path: Path) -> tuple[GraphStructure, dict[str, str]]:
+    """Build a vis-network structure from a run's graph.json."""
+    data = json.loads(graph_json_path.read_text())
+
+    nodes: list[VisNode] = []
+    node_metrics: dict[str, str] = {}
+    for node in data.get("nodes", []):
+        node_id = node.get("id", "")
+        nodes.append(VisNode(id=node_id, label=node.get("name", node_id), title=node.get("description") or node_id))
+        if node.get("metric_id"):
+            node_metrics[node_id] = node["metric_id"]
+
+    edges: list[VisEdge] = []
+    for edge in data.get("edges", []):
+        edge_type = edge.get("type") or None
+        color = {"color": DotParserService.EDGE_COLORS[edge_type]} if edge_type in DotParserService.EDGE_COLORS else None
+        edges.append(
+            VisEdge(
+                source=edge.get("source", ""),
+                target=edge.get("target", ""),
+                label=edge_type,
+                dashes=edge_type in DotParserService.DASHED_EDGE_TYPES,
+                color=color,
+            )
+        )
+
+    return GraphStructure(nodes=nodes, edges=edges), node_metrics
+
+
+def get_graph_index(run_dir: Path, parser: DotParserService | None = None) -> GraphIndex | None:
+    """Get the cached graph index for a run.
+
+    Built from graphviz/graphviz_condensed.dot when present, otherwise from
+    graph.json. Rebuilt only when the source file changes.
+
+    Args:
+        run_dir: Validated run directory.
+        parser: DOT parser to use. Defaults to a new DotParserService.
+
+    Returns:
+        GraphIndex, or None if the run has no readable graph.
+    """
+    parser = parser or DotParserService()
+    dot_path = run_dir / "graphviz" / "graphviz_condensed.dot"
+    graph_json_path = run_dir / "graph.json"
+
+    try:
+        if dot_path.exists():
+            return _graph_index_cache.get_or_load(dot_path, lambda path: GraphIndex(parser.get_structure(path)))
+        if graph_json_path.exists():
+            return _graph_index_cache.get_or_load(graph_json_path, lambda path: GraphIndex(*_structure_from_graph_json(path)))
+    except (OSError, ValueError) as e:
+        logger.error("Failed to build graph index for %s: %s", run_dir, e)
+
+    return None
+
+
+# Graph indexes shared across requests, keyed by source file path
+_graph_index_cache: FileSignatureCache[GraphIndex] = FileSignatureCache(settings.RUNS_GRAPH_CACHE_SIZE, name="run_graph_index")
@@ -0,0 +1,144 @@
+"""Incremental parser for run results/index.json files.
+
+index.json is a single JSON object whose "nodes" array can hold tens of
+thousands of entries. Loading it with json.load materializes the whole
+document at once; this module instead reads the file in chunks and yields
+top-level keys and node entries one at a time using
+json.JSONDecoder.raw_decode, so callers can build lookups or count nodes
+without holding the full document in memory.
+"""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+# Read size per chunk; index entries are small, so this holds many nodes
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class IndexStreamError(ValueError):
+    """Raised when index.json is malformed or truncated."""
+
+
+class _ChunkReader:
+    """Sliding text buffer over a file for raw_decode-based parsing."""
+
+    def __init__(self, f: TextIO, chunk_size: int) -> None:
+        self._f = f
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer, compacting consumed text."""
+        if self._eof:
+            return False
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                raise IndexStreamError("Unexpected end of index.json")
+
+    def expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be char."""
+        found = self.peek()
+        if found != char:
+            raise IndexStreamError(f"Expected {char!r} in index.json, found {found!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more input as needed."""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise IndexStreamError(f"Malformed index.json: {e}") from e
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buf) and not isinstance(obj, (dict, list, str)) and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+
+def iter_index(f: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[tuple[str, Any]]:
+    """Iterate over an index.json document without loading it whole.
+
+    Yields ("nodes", node_dict) once per entry of the top-level "nodes"
+    array, and (key, value) for every other top-level key, in file order.
+
+    Args:
+        f: Text file object positioned at the start of the document.
+        chunk_size: Number of characters to read per chunk.
+
+    Yields:
+        Tuples of (top-level key, value or node entry).
+
+    Raises:
+        IndexStreamError: If the document is malformed or truncated.
+    """
+    reader = _ChunkReader(f, chunk_size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+
+    while True:
+        key = reader.value()
+        if not isinstance(key, str):
+            raise IndexStreamError("index.json object keys must be strings")
+        reader.expect(":")
+
+        if key == "nodes" and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() != "]":
+                while True:
+                    yield key, reader.value()
+                    if reader.peek() != ",":
+                        break
+                    reader.expect(",")
+            reader.expect("]")
+        else:
+            yield key, reader.value()
+
+        if reader.peek() != ",":
+            break
+        reader.expect(",")
+
+    reader.expect("}")
+
+
+def iter_index_file(index_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[tuple[str, Any]]:
+    """Iterate over an index.json file on disk.
+
+    Args:
+        index_path: Path to results/index.json.
+        chunk_size: Number of characters to read per chunk.
+
+    Yields:
+        Tuples of (top-level key, value or node entry); see iter_index.
+
+    Raises:
+        IndexStreamError: If the document is malformed or truncated.
+        OSError: If the file cannot be read.
+    """
+    with index_path.open(encoding="utf-8") as f:
+        yield from iter_index(f, chunk_size)
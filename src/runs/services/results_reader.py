@@ -32,6 +32,13 @@ class PaginatedResults(BaseModel):
     results: list[EntityResult] = Field(description="Entity results for this page")
 
 
+def _as_float(value: Any) -> float | None:
+    """Return value if it is a scalar number, else None."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
 class ResultsReaderService:
     """Read and paginate JSONL entity results.
 
@@ -112,11 +119,11 @@ class ResultsReaderService:
         if entity_dimensions:
             entity_id = str(entity_dimensions[0].get("value", ""))
 
-        # Extract metric value
+        # Extract metric value (temporal nodes store a timeline dict instead of a scalar)
         metric_value = None
         metrics = data.get("metric", [])
         if metrics:
-            metric_value = metrics[0].get("values")
+            metric_value = _as_float(metrics[0].get("values"))
 
         # Extract statistics from first statistical method
         z_score = None
@@ -129,8 +136,8 @@ class ResultsReaderService:
             stats = first_method.get("statistics", {})
 
             # Try different z-score field names
-            z_score = stats.get("simple_zscore") or stats.get("robust_zscore") or stats.get("trending_simple_zscore")
-            percentile_rank = stats.get("percentile_rank")
+            z_score = _as_float(stats.get("simple_zscore") or stats.get("robust_zscore") or stats.get("trending_simple_zscore"))
+            percentile_rank = _as_float(stats.get("percentile_rank"))
 
             # Get anomaly from first anomaly method
             anomalies = first_method.get("anomalies", [])
@@ -0,0 +1,300 @@
+"""Cached catalog of insight graph runs with filesystem change detection.
+
+Scanning $RUNS_ROOT on every request is expensive on network filesystems:
+each graph and run directory has to be listed and every results/index.json
+parsed just to count nodes. RunCatalog keeps per-run summaries keyed by the
+index.json stat signature (mtime_ns, size) and only re-parses runs whose
+index changed. While a graph directory's mtime is unchanged, its listing and
+the summaries of its completed runs are reused without touching the run
+directories; only runs still waiting for an index.json are re-checked.
+A completed run's index.json that is rewritten in place is therefore only
+picked up after invalidate(). The catalog can optionally be persisted to
+disk so a cold start does not rescan every run.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from src.config import settings
+from src.runs.services.index_stream import IndexStreamError, iter_index_file
+
+logger = logging.getLogger(__name__)
+
+# Bump when the persisted layout changes so stale files are ignored
+CATALOG_FORMAT_VERSION = 1
+
+
+@dataclass
+class RunCatalogEntry:
+    """Cached summary of a single run.
+
+    Attributes:
+        run_id: Run identifier (timestamp format).
+        mtime_ns: Modification time of results/index.json when summarized.
+        size: Size in bytes of results/index.json when summarized.
+        node_count: Number of nodes listed in index.json.
+        created_at: ISO-8601 creation timestamp, if known.
+    """
+
+    run_id: str
+    mtime_ns: int
+    size: int
+    node_count: int = 0
+    created_at: str | None = None
+
+    @property
+    def created_at_datetime(self) -> datetime | None:
+        """Parse created_at into a timezone-aware datetime."""
+        if self.created_at is None:
+            return None
+        try:
+            return datetime.fromisoformat(self.created_at)
+        except ValueError:
+            return None
+
+
+@dataclass
+class _GraphListing:
+    """Cached directory listing for a graph directory."""
+
+    mtime_ns: int
+    run_dirs: list[str]
+
+
+class RunCatalog:
+    """Incrementally refreshed catalog of runs under a runs root.
+
+    Each refresh stats the graph directory, and the index.json of runs that
+    were added since the last listing or had no index.json yet; index.json
+    files are only opened when their stat signature differs from the cached
+    entry.
+
+    Attributes:
+        runs_root: Root directory containing graph directories.
+        persist_path: Optional JSON file used to persist the catalog.
+    """
+
+    def __init__(self, runs_root: Path, persist_path: Path | None = None) -> None:
+        """Initialize catalog.
+
+        Args:
+            runs_root: Root directory containing graph directories.
+            persist_path: Optional JSON file to load from and save to.
+        """
+        self.runs_root = runs_root
+        self.persist_path = persist_path
+        self._graphs: dict[str, _GraphListing] = {}
+        self._entries: dict[str, dict[str, RunCatalogEntry]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        if persist_path is not None:
+            self._load()
+
+    def graph_names(self) -> list[str]:
+        """List graph directory names under the runs root.
+
+        Returns:
+            Sorted list of graph names (directories only).
+        """
+        if not self.runs_root.exists():
+            return []
+        return sorted(p.name for p in self.runs_root.iterdir() if p.is_dir())
+
+    def get_runs(self, graph_name: str) -> list[RunCatalogEntry]:
+        """Get up-to-date summaries for every valid run of a graph.
+
+        A valid run has a results/index.json file. Runs already summarized
+        and still listed in the graph directory are served from the cache
+        without a stat; see invalidate() for runs rewritten in place.
+
+        Args:
+            graph_name: Name of the graph directory (must already be validated).
+
+        Returns:
+            List of RunCatalogEntry objects in no particular order.
+        """
+        graph_dir = self.runs_root / graph_name
+        with self._lock:
+            run_dirs, known = self._list_run_dirs(graph_name, graph_dir)
+            cached = self._entries.setdefault(graph_name, {})
+            entries: list[RunCatalogEntry] = []
+            seen: set[str] = set()
+
+            for run_id in run_dirs:
+                entry = cached.get(run_id)
+                if entry is not None and run_id in known:
+                    seen.add(run_id)
+                    entries.append(entry)
+                    continue
+
+                index_path = graph_dir / run_id / "results" / "index.json"
+                try:
+                    stat = index_path.stat()
+                except OSError:
+                    continue
+                seen.add(run_id)
+
+                if entry is None or entry.mtime_ns != stat.st_mtime_ns or entry.size != stat.st_size:
+                    entry = self._summarize(run_id, index_path, stat)
+                    cached[run_id] = entry
+                    self._dirty = True
+                entries.append(entry)
+
+            for stale in set(cached) - seen:
+                del cached[stale]
+                self._dirty = True
+
+            if self._dirty:
+                self._save()
+
+        return entries
+
+    def invalidate(self, graph_name: str | None = None) -> None:
+        """Drop cached state for one graph or the whole catalog.
+
+        Args:
+            graph_name: Graph to invalidate, or None to clear everything.
+        """
+        with self._lock:
+            if graph_name is None:
+                self._graphs.clear()
+                self._entries.clear()
+            else:
+                self._graphs.pop(graph_name, None)
+                self._entries.pop(graph_name, None)
+            self._dirty = True
+
+    def _list_run_dirs(self, graph_name: str, graph_dir: Path) -> tuple[list[str], frozenset[str]]:
+        """List run subdirectories, reusing the cached listing if unchanged.
+
+        Returns:
+            The run directory names, and the subset that was already listed
+            by the previous call (all of them if the directory is unchanged).
+        """
+        try:
+            mtime_ns = graph_dir.stat().st_mtime_ns
+        except OSError:
+            self._graphs.pop(graph_name, None)
+            return [], frozenset()
+
+        listing = self._graphs.get(graph_name)
+        if listing is not None and listing.mtime_ns == mtime_ns:
+            return listing.run_dirs, frozenset(listing.run_dirs)
+
+        run_dirs: list[str] = []
+        with contextlib.suppress(OSError), os.scandir(graph_dir) as it:
+            for dir_entry in it:
+                if dir_entry.is_dir():
+                    run_dirs.append(dir_entry.name)
+
+        known = frozenset(listing.run_dirs) if listing is not None else frozenset()
+        self._graphs[graph_name] = _GraphListing(mtime_ns=mtime_ns, run_dirs=run_dirs)
+        return run_dirs, known
+
+    def _summarize(self, run_id: str, index_path: Path, stat: os.stat_result) -> RunCatalogEntry:
+        """Read index.json and build a catalog entry for a run."""
+        created_at = _parse_run_timestamp(run_id)
+        node_count = 0
+
+        # Count nodes incrementally instead of materializing the whole index
+        try:
+            for key, value in iter_index_file(index_path):
+                if key == "nodes":
+                    node_count += 1
+                elif key == "created_at":
+                    created_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except (IndexStreamError, ValueError, AttributeError, OSError) as e:
+            logger.warning("Failed to parse index.json for %s: %s", index_path.parent.parent, e)
+            created_at = _parse_run_timestamp(run_id)
+            node_count = 0
+
+        return RunCatalogEntry(
+            run_id=run_id,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            node_count=node_count,
+            created_at=created_at.isoformat() if created_at else None,
+        )
+
+    def _load(self) -> None:
+        """Load a persisted catalog, ignoring missing or incompatible files."""
+        if self.persist_path is None or not self.persist_path.exists():
+            return
+
+        try:
+            data: dict[str, Any] = json.loads(self.persist_path.read_text())
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning("Ignoring unreadable run catalog %s: %s", self.persist_path, e)
+            return
+
+        if data.get("version") != CATALOG_FORMAT_VERSION or data.get("runs_root") != str(self.runs_root):
+            logger.info("Ignoring run catalog %s: format or root mismatch", self.persist_path)
+            return
+
+        # Graph listings are not persisted: directory mtimes are cheap to
+        # re-check, while index.json parses are what we want to avoid.
+        for graph_name, runs in data.get("graphs", {}).items():
+            self._entries[graph_name] = {run["run_id"]: RunCatalogEntry(**run) for run in runs}
+
+        logger.info("Loaded run catalog from %s", self.persist_path)
+
+    def _save(self) -> None:
+        """Persist the catalog atomically if a persist path is configured."""
+        self._dirty = False
+        if self.persist_path is None:
+            return
+
+        payload = {
+            "version": CATALOG_FORMAT_VERSION,
+            "runs_root": str(self.runs_root),
+            "graphs": {graph_name: [asdict(entry) for entry in entries.values()] for graph_name, entries in self._entries.items()},
+        }
+
+        tmp_path = self.persist_path.with_suffix(f"{self.persist_path.suffix}.{os.getpid()}.tmp")
+        try:
+            self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload))
+            tmp_path.replace(self.persist_path)
+        except OSError as e:
+            logger.warning("Failed to persist run catalog to %s: %s", self.persist_path, e)
+
+
+def _parse_run_timestamp(run_id: str) -> datetime | None:
+    """Parse timestamp from a YYYYMMDDHHmmss run ID."""
+    try:
+        return datetime.strptime(run_id, "%Y%m%d%H%M%S").replace(tzinfo=UTC)
+    except ValueError:
+        return None
+
+
+# Catalog instances shared across requests, one per runs root
+_catalogs: dict[Path, RunCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_run_catalog(runs_root: Path) -> RunCatalog:
+    """Get or create the shared catalog for a runs root.
+
+    Persistence is enabled when settings.RUNS_CATALOG_PATH is set.
+
+    Args:
+        runs_root: Root directory containing graph directories.
+
+    Returns:
+        RunCatalog instance for the runs root.
+    """
+    with _catalogs_lock:
+        catalog = _catalogs.get(runs_root)
+        if catalog is None:
+            persist_path = Path(settings.RUNS_CATALOG_PATH).expanduser() if settings.RUNS_CATALOG_PATH else None
+            catalog = RunCatalog(runs_root, persist_path=persist_path)
+            _catalogs[runs_root] = catalog
+        return catalog
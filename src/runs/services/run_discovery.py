@@ -1,14 +1,18 @@
 """Service for discovering insight graph runs from filesystem."""
 
 import contextlib
-import json
 import logging
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 from src.config import settings
+from src.runs.services.file_cache import FileSignatureCache
+from src.runs.services.index_stream import IndexStreamError, iter_index_file
+from src.runs.services.run_catalog import RunCatalog, get_run_catalog
 from src.services.path_validation import PathValidationError, validate_path_within_root
 
 logger = logging.getLogger(__name__)
@@ -42,6 +46,52 @@ class RunMetadata(BaseModel):
     nodes: list[NodeMetadata] = Field(default_factory=list)
 
 
+@dataclass
+class RunNodeIndex:
+    """Per-run node lookup built once from index.json.
+
+    Nodes are addressable by both node_id and canonical_node_id in O(1).
+
+    Attributes:
+        run_id: Run identifier.
+        run_dir: Resolved run directory.
+        created_at: Run creation timestamp, if present in index.json.
+        nodes: Node metadata in index.json order.
+    """
+
+    run_id: str
+    run_dir: Path
+    created_at: datetime | None = None
+    nodes: list[NodeMetadata] = field(default_factory=list)
+    _by_id: dict[str, NodeMetadata] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Build the node lookup; node_id takes precedence over canonical_node_id."""
+        for node in self.nodes:
+            self._by_id.setdefault(node.node_id, node)
+        for node in self.nodes:
+            self._by_id.setdefault(node.canonical_node_id, node)
+
+    def __len__(self) -> int:
+        """Number of nodes in the run."""
+        return len(self.nodes)
+
+    def get(self, node_id: str) -> NodeMetadata | None:
+        """Look up a node by node_id or canonical_node_id.
+
+        Args:
+            node_id: Node identifier or canonical node identifier.
+
+        Returns:
+            NodeMetadata or None if the run has no such node.
+        """
+        return self._by_id.get(node_id)
+
+    def to_metadata(self) -> RunMetadata:
+        """Convert to a RunMetadata model."""
+        return RunMetadata(run_id=self.run_id, created_at=self.created_at, nodes=self.nodes)
+
+
 class GraphSummary(BaseModel):
     """Summary of an insight graph."""
 
@@ -54,19 +104,23 @@ class GraphSummary(BaseModel):
 class RunDiscoveryService:
     """Service for discovering insight graph runs from filesystem.
 
-    Scans $RUNS_ROOT/ for available graphs and runs.
+    Scans $RUNS_ROOT/ for available graphs and runs. Run summaries are
+    served from a shared RunCatalog that only re-reads index.json files
+    whose mtime or size changed.
     """
 
-    def __init__(self, runs_root: Path | None = None) -> None:
+    def __init__(self, runs_root: Path | None = None, catalog: RunCatalog | None = None) -> None:
         """Initialize service with runs root directory.
 
         Args:
             runs_root: Root directory for runs. Defaults to settings.RUNS_ROOT.
+            catalog: Run catalog cache. Defaults to the shared catalog for runs_root.
         """
         if runs_root is None:
             runs_root = Path(settings.RUNS_ROOT).expanduser().resolve()
         self.runs_root = runs_root
         self.insight_graph_root = runs_root
+        self.catalog = catalog if catalog is not None else get_run_catalog(runs_root)
 
     def discover_graphs(self) -> list[GraphSummary]:
         """Discover all available insight graphs.
@@ -80,11 +134,8 @@ class RunDiscoveryService:
             logger.warning("Insight graph root does not exist: %s", self.insight_graph_root)
             return graphs
 
-        for graph_dir in sorted(self.insight_graph_root.iterdir()):
-            if not graph_dir.is_dir():
-                continue
-
-            runs = self._get_valid_runs(graph_dir)
+        for graph_name in self.catalog.graph_names():
+            runs = [entry.run_id for entry in self.catalog.get_runs(graph_name)]
             if not runs:
                 continue
 
@@ -97,7 +148,7 @@ class RunDiscoveryService:
 
             graphs.append(
                 GraphSummary(
-                    graph_name=graph_dir.name,
+                    graph_name=graph_name,
                     run_count=len(runs),
                     latest_run_id=latest_run_id,
                     latest_run_timestamp=latest_timestamp,
@@ -127,46 +178,28 @@ class RunDiscoveryService:
         if not graph_dir.exists():
             return []
 
-        runs: list[RunSummary] = []
-        for run_id in self._get_valid_runs(graph_dir):
-            run_dir = graph_dir / run_id
-            index_path = run_dir / "results" / "index.json"
-
-            created_at = self._parse_run_timestamp(run_id)
-            node_count = 0
-
-            # Try to read node count from index.json
-            if index_path.exists():
-                try:
-                    with index_path.open() as f:
-                        index_data = json.load(f)
-                        node_count = len(index_data.get("nodes", []))
-                        if "created_at" in index_data:
-                            created_at = datetime.fromisoformat(index_data["created_at"].replace("Z", "+00:00"))
-                except (json.JSONDecodeError, ValueError) as e:
-                    logger.warning("Failed to parse index.json for %s/%s: %s", graph_name, run_id, e)
-
-            runs.append(
-                RunSummary(
-                    run_id=run_id,
-                    created_at=created_at,
-                    node_count=node_count,
-                )
+        runs = [
+            RunSummary(
+                run_id=entry.run_id,
+                created_at=entry.created_at_datetime,
+                node_count=entry.node_count,
             )
+            for entry in self.catalog.get_runs(graph_dir.relative_to(self.insight_graph_root.resolve()).as_posix())
+        ]
 
         # Sort by run_id descending (newest first)
         runs.sort(key=lambda r: r.run_id, reverse=True)
         return runs
 
-    def get_run_metadata(self, graph_name: str, run_id: str) -> RunMetadata | None:
-        """Get detailed metadata for a specific run.
+    def get_run_dir(self, graph_name: str, run_id: str) -> Path | None:
+        """Resolve and validate the directory of a run.
 
         Args:
             graph_name: Name of the insight graph.
             run_id: Run identifier.
 
         Returns:
-            RunMetadata or None if not found.
+            Resolved run directory, or None if invalid or missing index.json.
         """
         # Validate path to prevent traversal
         try:
@@ -178,65 +211,49 @@ class RunDiscoveryService:
             logger.warning("Invalid path rejected: %s/%s", graph_name, run_id)
             return None
 
-        index_path = run_dir / "results" / "index.json"
+        if not (run_dir / "results" / "index.json").exists():
+            return None
+        return run_dir
+
+    def get_node_index(self, graph_name: str, run_id: str) -> RunNodeIndex | None:
+        """Get the cached node index for a run, building it on first use.
+
+        The index is rebuilt only when results/index.json changes.
+
+        Args:
+            graph_name: Name of the insight graph.
+            run_id: Run identifier.
 
-        if not index_path.exists():
+        Returns:
+            RunNodeIndex or None if the run is not found or unreadable.
+        """
+        run_dir = self.get_run_dir(graph_name, run_id)
+        if run_dir is None:
             return None
 
+        index_path = run_dir / "results" / "index.json"
         try:
-            with index_path.open() as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
+            node_index = _node_index_cache.get_or_load(index_path, lambda path: _build_node_index(path, run_dir, run_id))
+        except (IndexStreamError, ValidationError, OSError, UnicodeDecodeError) as e:
             logger.error("Failed to read index.json for %s/%s: %s", graph_name, run_id, e)
             return None
 
-        created_at = None
-        if "created_at" in data:
-            with contextlib.suppress(ValueError):
-                created_at = datetime.fromisoformat(data["created_at"].replace("Z", "+00:00"))
-
-        nodes: list[NodeMetadata] = []
-        for node_data in data.get("nodes", []):
-            summary = node_data.get("summary", {})
-            entity_scope = summary.get("entity_scope", {})
-
-            nodes.append(
-                NodeMetadata(
-                    canonical_node_id=node_data.get("canonical_node_id", ""),
-                    node_id=node_data.get("node_id", ""),
-                    metric_id=node_data.get("metric_id", ""),
-                    result_path=node_data.get("result_path", ""),
-                    statistical_methods=node_data.get("statistical_methods", []),
-                    entity_scope_display_name=entity_scope.get("display_name"),
-                    comparison_group=entity_scope.get("comparison_group"),
-                )
-            )
-
-        return RunMetadata(
-            run_id=data.get("run_id", run_id),
-            created_at=created_at,
-            nodes=nodes,
-        )
-
-    def _get_valid_runs(self, graph_dir: Path) -> list[str]:
-        """Get valid run IDs from a graph directory.
+        return node_index
 
-        A valid run has a results/index.json file.
+    def get_run_metadata(self, graph_name: str, run_id: str) -> RunMetadata | None:
+        """Get detailed metadata for a specific run.
 
         Args:
-            graph_dir: Path to graph directory.
+            graph_name: Name of the insight graph.
+            run_id: Run identifier.
 
         Returns:
-            List of valid run ID strings.
+            RunMetadata or None if not found.
         """
-        valid_runs: list[str] = []
-        for run_dir in graph_dir.iterdir():
-            if not run_dir.is_dir():
-                continue
-            index_path = run_dir / "results" / "index.json"
-            if index_path.exists():
-                valid_runs.append(run_dir.name)
-        return valid_runs
+        node_index = self.get_node_index(graph_name, run_id)
+        if node_index is None:
+            return None
+        return node_index.to_metadata()
 
     def _parse_run_timestamp(self, run_id: str) -> datetime | None:
         """Parse timestamp from run ID.
@@ -253,3 +270,42 @@ class RunDiscoveryService:
             return datetime.strptime(run_id, "%Y%m%d%H%M%S").replace(tzinfo=UTC)
         except ValueError:
             return None
+
+
+# Node indexes shared across requests, keyed by index.json path
+_node_index_cache: FileSignatureCache[RunNodeIndex] = FileSignatureCache(settings.RUNS_NODE_INDEX_CACHE_SIZE, name="run_node_index")
+
+
+def _node_from_index_entry(node_data: dict[str, Any]) -> NodeMetadata:
+    """Build NodeMetadata from a single index.json node entry."""
+    summary = node_data.get("summary") or {}
+    entity_scope = summary.get("entity_scope") or {}
+
+    return NodeMetadata(
+        canonical_node_id=node_data.get("canonical_node_id", ""),
+        node_id=node_data.get("node_id", ""),
+        metric_id=node_data.get("metric_id", ""),
+        result_path=node_data.get("result_path", ""),
+        statistical_methods=node_data.get("statistical_methods", []),
+        entity_scope_display_name=entity_scope.get("display_name"),
+        comparison_group=entity_scope.get("comparison_group"),
+    )
+
+
+def _build_node_index(index_path: Path, run_dir: Path, run_id: str) -> RunNodeIndex:
+    """Stream index.json into a RunNodeIndex without loading the whole document."""
+    created_at: datetime | None = None
+    index_run_id = run_id
+    nodes: list[NodeMetadata] = []
+
+    for key, value in iter_index_file(index_path):
+        if key == "nodes":
+            if isinstance(value, dict):
+                nodes.append(_node_from_index_entry(value))
+        elif key == "run_id" and isinstance(value, str):
+            index_run_id = value
+        elif key == "created_at" and isinstance(value, str):
+            with contextlib.suppress(ValueError):
+                created_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+    return RunNodeIndex(run_id=index_run_id, run_dir=run_dir, created_at=created_at, nodes=nodes)
@@ -12,6 +12,8 @@ The contribution data flow:
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
@@ -176,12 +178,16 @@ class ContributionService:
         >>> records = await service.get_contributions_for_parent("losIndex__medicareId")
         >>> for record in records:
         ...     print(f"{record.child_entity}: {record.excess_over_parent}")
+
+        >>> # Inside a request, reuse the request's session and connection
+        >>> service = ContributionService(session=session)
     """
 
     def __init__(
         self,
         run_id: str | None = None,
         session_factory: async_sessionmaker[AsyncSession] | None = None,
+        session: AsyncSession | None = None,
     ) -> None:
         """Initialize the service.
 
@@ -190,9 +196,31 @@ class ContributionService:
             session_factory: Optional async session factory for database connections.
                 If None, uses the default async_session_maker from src.db.session.
                 Useful for testing with alternative database connections.
+            session: Optional open session to run every query on, e.g. the
+                request's session, so a request holds a single pooled
+                connection. The caller owns its transaction; each query runs
+                in a SAVEPOINT, so a failed query is rolled back without
+                aborting it. If None, each call opens its own session from
+                session_factory.
         """
         self.run_id = run_id
         self._session_factory = session_factory or async_session_maker
+        self._session = session
+
+    @asynccontextmanager
+    async def _session_scope(self) -> AsyncIterator[AsyncSession]:
+        """Yield the shared session inside a SAVEPOINT, or a new session.
+
+        The shared session is not closed on exit. An exception raised in the
+        block rolls back to the savepoint, so callers that handle the error
+        can keep using the shared session's transaction.
+        """
+        if self._session is not None:
+            async with self._session.begin_nested():
+                yield self._session
+            return
+        async with self._session_factory() as session:
+            yield session
 
     async def get_contributions_for_parent(
         self,
@@ -234,18 +262,18 @@ class ContributionService:
             >>> len(records)
             5
         """
-        async with self._session_factory() as session:
-            try:
+        try:
+            async with self._session_scope() as session:
                 rows = await self._query_contributions_by_parent(session, parent_node_id, parent_facility_id, parent_service_line)
-            except Exception as e:
-                logger.error(
-                    "Failed to query contributions for %s (facility %s, service_line %s): %s",
-                    parent_node_id,
-                    parent_facility_id,
-                    parent_service_line,
-                    e,
-                )
-                raise ContributionServiceError(f"Failed to query contributions: {e}", parent_node_id=parent_node_id) from e
+        except Exception as e:
+            logger.error(
+                "Failed to query contributions for %s (facility %s, service_line %s): %s",
+                parent_node_id,
+                parent_facility_id,
+                parent_service_line,
+                e,
+            )
+            raise ContributionServiceError(f"Failed to query contributions: {e}", parent_node_id=parent_node_id) from e
 
         records = [self._row_to_record(row) for row in rows]
 
@@ -279,12 +307,12 @@ class ContributionService:
             >>> len(top)
             5
         """
-        async with self._session_factory() as session:
-            try:
+        try:
+            async with self._session_scope() as session:
                 rows = await self._query_top_contributors(session, top_n)
-            except Exception as e:
-                logger.warning("Failed to query top contributors: %s", e)
-                return []
+        except Exception as e:
+            logger.warning("Failed to query top contributors: %s", e)
+            return []
 
         records = [self._row_to_record(row) for row in rows]
         logger.info("Found %d top contributors", len(records))
@@ -553,8 +581,8 @@ class ContributionService:
             >>> if record:
             ...     print(f"Cardiology contributes {record.excess_over_parent} to facility-wide")
         """
-        async with self._session_factory() as session:
-            try:
+        try:
+            async with self._session_scope() as session:
                 rows = await self._query_upward_contribution(
                     session,
                     child_facility_id,
@@ -562,15 +590,15 @@ class ContributionService:
                     child_sub_service_line,
                     metric_id,
                 )
-            except Exception as e:
-                logger.warning(
-                    "Failed to query upward contribution for facility %s, service_line %s, metric %s: %s",
-                    child_facility_id,
-                    child_service_line,
-                    metric_id,
-                    e,
-                )
-                return None
+        except Exception as e:
+            logger.warning(
+                "Failed to query upward contribution for facility %s, service_line %s, metric %s: %s",
+                child_facility_id,
+                child_service_line,
+                metric_id,
+                e,
+            )
+            return None
 
         if not rows:
             logger.debug(
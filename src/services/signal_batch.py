@@ -0,0 +1,302 @@
+"""Run-level signal generation across a node results directory.
+
+generate_run_signals parses every node JSONL file of a run's results/nodes
+directory in a process pool and yields each node's signals as soon as the
+node is done. Temporal nodes (trends_to targets) are indexed once, before
+the pool starts, into a TemporalIndexFile: the z-scores of every temporal
+entity in one .npy array that each worker memory-maps read-only, so the
+workers share its pages and never re-read temporal node files.
+
+Usage:
+    for node in generate_run_signals(run_dir / "results" / "nodes", workers=8):
+        for signal in node.signals:
+            print(signal.model_dump_json())
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+import time
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+from pydantic import ValidationError
+
+from src.schemas.signal import SignalCreate
+from src.services.signal_generator import (
+    SignalGenerator,
+    SignalGeneratorError,
+    TemporalIndex,
+    get_temporal_node_id,
+    read_node_header,
+)
+
+logger = logging.getLogger(__name__)
+
+Z_SCORES_FILENAME = "temporal_z_scores.npy"
+ENTITIES_FILENAME = "temporal_entities.json"
+
+# progress(nodes_done, nodes_total, signals, elapsed_seconds)
+ProgressCallback = Callable[[int, int, int, float], None]
+
+
+@dataclass
+class NodeSignals:
+    """Signals generated from one node file.
+
+    Attributes:
+        path: Node results JSONL file.
+        signals: Signals extracted from the node.
+        error: Error message if the node could not be parsed.
+    """
+
+    path: Path
+    signals: list[SignalCreate] = field(default_factory=list)
+    error: str | None = None
+
+
+class TemporalIndexFile(Mapping[str, TemporalIndex]):
+    """Precomputed temporal node indexes of a run, memory-mapped read-only.
+
+    The directory holds Z_SCORES_FILENAME, all z-score arrays concatenated,
+    and ENTITIES_FILENAME, which maps each temporal node ID to rows of
+    [facility, service_line, sub_service_line, start, stop] into that
+    array. ENTITIES_FILENAME also records the nodes directory and the
+    [mtime_ns, size] of each indexed temporal node file, so is_current can
+    tell whether the index still matches its sources. Looking up a node
+    returns array views, not copies.
+
+    Attributes:
+        directory: Directory holding the index files.
+
+    Example:
+        >>> index_file = TemporalIndexFile.build(nodes_directory, Path("/tmp/index"))
+        >>> generator = SignalGenerator(nodes_directory=nodes_directory, temporal_indexes=index_file)
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Open an index built by TemporalIndexFile.build.
+
+        Args:
+            directory: Directory holding the index files.
+        """
+        self.directory = directory
+        self._z_scores: npt.NDArray[np.float64] = np.load(directory / Z_SCORES_FILENAME, mmap_mode="r")
+        self._entities: dict[str, list[tuple[str, str, str | None, int, int]]] = json.loads((directory / ENTITIES_FILENAME).read_text())["entities"]
+
+    def __getitem__(self, temporal_node_id: str) -> TemporalIndex:
+        """Return the index of a temporal node as views into the z-score array."""
+        return {
+            (facility, service_line, sub_service_line): self._z_scores[start:stop]
+            for facility, service_line, sub_service_line, start, stop in self._entities[temporal_node_id]
+        }
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the indexed temporal node IDs."""
+        return iter(self._entities)
+
+    def __len__(self) -> int:
+        """Return the number of indexed temporal nodes."""
+        return len(self._entities)
+
+    @staticmethod
+    def exists(directory: Path) -> bool:
+        """Whether directory holds a built index."""
+        return (directory / Z_SCORES_FILENAME).is_file() and (directory / ENTITIES_FILENAME).is_file()
+
+    @staticmethod
+    def is_current(directory: Path, nodes_directory: Path) -> bool:
+        """Whether directory holds an index built from nodes_directory's current temporal files.
+
+        Args:
+            directory: Directory holding the index files.
+            nodes_directory: Directory containing the node JSONL files.
+
+        Returns:
+            bool: False if the index is missing, was built from another nodes
+                directory, or any indexed temporal file changed or disappeared.
+        """
+        if not TemporalIndexFile.exists(directory):
+            return False
+        try:
+            manifest = json.loads((directory / ENTITIES_FILENAME).read_text())
+            if manifest["nodes_directory"] != str(nodes_directory.resolve()):
+                return False
+            return all(
+                _file_signature(nodes_directory / f"{temporal_node_id}.jsonl") == signature for temporal_node_id, signature in manifest["sources"].items()
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+    @classmethod
+    def build(cls, nodes_directory: Path, directory: Path) -> "TemporalIndexFile":
+        """Index every temporal node referenced by a trends_to edge.
+
+        Only node headers are read to find the temporal nodes. Temporal
+        nodes that are missing or invalid are left out, so generators fall
+        back to loading them (and logging why they cannot).
+
+        Args:
+            nodes_directory: Directory containing the node JSONL files.
+            directory: Directory to write the index files to.
+
+        Returns:
+            TemporalIndexFile: The written index, opened read-only.
+        """
+        temporal_node_ids: set[str] = set()
+        for path in node_paths(nodes_directory):
+            try:
+                temporal_node_id = get_temporal_node_id(read_node_header(path))
+            except (json.JSONDecodeError, ValidationError, ValueError, OSError):
+                continue
+            if temporal_node_id:
+                temporal_node_ids.add(temporal_node_id)
+
+        generator = SignalGenerator(nodes_directory=nodes_directory)
+        arrays: list[npt.NDArray[np.float64]] = []
+        entities: dict[str, list[tuple[str, str, str | None, int, int]]] = {}
+        sources: dict[str, list[int]] = {}
+        offset = 0
+        for temporal_node_id in sorted(temporal_node_ids):
+            try:
+                # Taken before reading, so a file changed meanwhile is seen as stale
+                signature = _file_signature(nodes_directory / f"{temporal_node_id}.jsonl")
+            except OSError:
+                continue
+            temporal_index = generator.load_temporal_index(temporal_node_id)
+            if temporal_index is None:
+                continue
+            rows = []
+            for (facility, service_line, sub_service_line), z_scores in temporal_index.items():
+                rows.append((facility, service_line, sub_service_line, offset, offset + len(z_scores)))
+                arrays.append(z_scores)
+                offset += len(z_scores)
+            entities[temporal_node_id] = rows
+            sources[temporal_node_id] = signature
+
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / Z_SCORES_FILENAME, np.concatenate(arrays) if arrays else np.empty(0, dtype=np.float64))
+        manifest = {"nodes_directory": str(nodes_directory.resolve()), "sources": sources, "entities": entities}
+        (directory / ENTITIES_FILENAME).write_text(json.dumps(manifest))
+        logger.info("Indexed %d temporal nodes (%d z-scores) in %s", len(entities), offset, directory)
+        return cls(directory)
+
+
+def _file_signature(path: Path) -> list[int]:
+    """[mtime_ns, size] of a file, as stored in the index manifest."""
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def node_paths(nodes_directory: Path) -> list[Path]:
+    """Node JSONL files of a nodes directory, sorted by name."""
+    return sorted(nodes_directory.glob("*.jsonl"))
+
+
+def resolve_nodes_directory(path: Path) -> Path:
+    """Return the results/nodes directory of a run directory, or path itself."""
+    run_nodes = path / "results" / "nodes"
+    return run_nodes if run_nodes.is_dir() else path
+
+
+def _generate_node(generator: SignalGenerator, path: Path) -> NodeSignals:
+    """Generate the signals of one node, capturing any error so one node cannot stop the run."""
+    try:
+        return NodeSignals(path=path, signals=generator.parse_node_results(path))
+    except (SignalGeneratorError, FileNotFoundError) as e:
+        logger.warning("Failed to generate signals for %s: %s", path.name, e)
+        return NodeSignals(path=path, error=str(e))
+    except Exception as e:
+        logger.exception("Unexpected error generating signals for %s", path.name)
+        return NodeSignals(path=path, error=f"Unexpected error: {e!r}")
+
+
+# Generator of the current worker process, set by _init_worker
+_worker_generator: SignalGenerator | None = None
+
+
+def _init_worker(nodes_directory: Path, index_directory: Path, include_normal: bool) -> None:
+    """Create the worker's generator over the shared temporal index."""
+    global _worker_generator
+    _worker_generator = SignalGenerator(
+        include_normal=include_normal,
+        nodes_directory=nodes_directory,
+        temporal_indexes=TemporalIndexFile(index_directory),
+    )
+
+
+def _generate_node_in_worker(path: Path) -> NodeSignals:
+    """Generate the signals of one node in a worker process."""
+    if _worker_generator is None:
+        raise RuntimeError("Worker generator not initialized")
+    return _generate_node(_worker_generator, path)
+
+
+def generate_run_signals(
+    nodes_directory: Path,
+    *,
+    workers: int | None = None,
+    include_normal: bool = False,
+    temporal_index_directory: Path | None = None,
+    progress: ProgressCallback | None = None,
+) -> Iterator[NodeSignals]:
+    """Generate signals for every node of a run in a process pool.
+
+    Nodes are yielded in completion order, one NodeSignals per node file.
+    A node that cannot be parsed is yielded with its error instead of
+    failing the run.
+
+    Args:
+        nodes_directory: A run's results/nodes directory.
+        workers: Worker processes (default: CPU count). 1 runs in-process.
+        include_normal: Whether to include signals with "normal" anomaly level.
+        temporal_index_directory: Directory of a TemporalIndexFile. Reused if
+            it holds one built from nodes_directory's current temporal files,
+            (re)built there otherwise. Defaults to a temporary directory
+            removed afterwards.
+        progress: Called after each node as
+            progress(nodes_done, nodes_total, signals, elapsed_seconds).
+
+    Yields:
+        NodeSignals: Signals (or the error) of each node.
+    """
+    paths = node_paths(nodes_directory)
+    workers = workers or os.cpu_count() or 1
+
+    with ExitStack() as stack:
+        index_directory = temporal_index_directory or Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="temporal-index-")))
+        if not TemporalIndexFile.is_current(index_directory, nodes_directory):
+            if TemporalIndexFile.exists(index_directory):
+                logger.warning("Temporal index in %s does not match %s; rebuilding", index_directory, nodes_directory)
+            TemporalIndexFile.build(nodes_directory, index_directory)
+
+        results: Iterator[NodeSignals]
+        if workers == 1:
+            generator = SignalGenerator(include_normal=include_normal, nodes_directory=nodes_directory, temporal_indexes=TemporalIndexFile(index_directory))
+            results = (_generate_node(generator, path) for path in paths)
+        else:
+            executor = ProcessPoolExecutor(
+                max_workers=min(workers, max(len(paths), 1)),
+                initializer=_init_worker,
+                initargs=(nodes_directory, index_directory, include_normal),
+                # Workers start clean (fork is unsafe in threaded callers) and map the index file
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            # Cancel queued nodes if the caller stops iterating early
+            stack.callback(executor.shutdown, wait=True, cancel_futures=True)
+            results = (future.result() for future in as_completed([executor.submit(_generate_node_in_worker, path) for path in paths]))
+
+        started = time.perf_counter()
+        signal_count = 0
+        for done, node in enumerate(results, start=1):
+            signal_count += len(node.signals)
+            if progress is not None:
+                progress(done, len(paths), signal_count, time.perf_counter() - started)
+            yield node
@@ -2,27 +2,30 @@
 
 This service parses node result JSONL files from Project Needle's insight graph
 and extracts signals based on anomaly detection results.
+
+Node files are streamed one entity result at a time. Each line is validated
+straight from JSON against the TypedDict records below, which cover only the
+fields signal extraction reads, instead of building the full NodeResults
+Pydantic tree.
 """
 
 import json
 import logging
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
+from typing import NotRequired, TextIO, TypedDict
 
-from pydantic import ValidationError
+import numpy as np
+import numpy.typing as npt
+from pydantic import TypeAdapter, ValidationError
 
 from src.db.models import (
     SignalDomain,
 )
-from src.schemas.signal import (
-    NodeEntityResult,
-    NodeResults,
-    NodeStatisticalMethod,
-    NodeStatistics,
-    SignalCreate,
-    TemporalTimeline,
-)
+from src.schemas.signal import SignalCreate
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +75,12 @@ SIGNAL_ANOMALY_LEVELS = frozenset(
     }
 )
 
+# (facility, service_line, sub_service_line) identifying an entity across nodes
+EntityKey = tuple[str, str, str | None]
+
+# Monthly z-scores per entity of a temporal node
+TemporalIndex = dict[EntityKey, npt.NDArray[np.float64]]
+
 
 class SignalGeneratorError(Exception):
     """Base exception for signal generator errors.
@@ -96,45 +105,217 @@ class SignalGeneratorError(Exception):
         super().__init__(f"{message}" + (f" (file: {path})" if path else ""))
 
 
-def _load_node_jsonl(path: Path) -> dict[str, object]:
-    """Load a node JSONL file and return data in NodeResults-compatible format.
+# =============================================================================
+# Node Records
+# =============================================================================
+
+
+class EdgeRecord(TypedDict):
+    """Edge reference from a node header."""
+
+    edge_type: str
+    canonical_child_node_id: NotRequired[str | None]
+
+
+class NodeHeader(TypedDict):
+    """Node metadata (the first line of a node JSONL file)."""
+
+    canonical_node_id: str
+    canonical_child_node_ids: NotRequired[list[EdgeRecord]]
+
+
+class EntityFieldRecord(TypedDict):
+    """Entity dimension, e.g. id="medicareId", value="AFP658"."""
+
+    id: str
+    value: str
+
+
+class PeriodRecord(TypedDict):
+    """Single period of a temporal metric timeline."""
+
+    value: NotRequired[float | None]
+
+
+class TimelineRecord(TypedDict):
+    """Metric values of a temporal node."""
+
+    timeline: list[PeriodRecord]
+
+
+class MetricMetadataRecord(TypedDict):
+    """Metric metadata."""
+
+    metric_id: str
+
+
+class MetricRecord(TypedDict):
+    """Metric value: scalar for aggregate nodes, timeline for temporal nodes."""
+
+    metadata: MetricMetadataRecord
+    values: NotRequired[float | TimelineRecord | None]
+
+
+class InterpretationRecord(TypedDict):
+    """Rendered interpretation of an anomaly."""
+
+    rendered: str
+
+
+class AnomalyMethodRecord(TypedDict):
+    """Anomaly classification by one method."""
+
+    anomaly: str
+    interpretation: InterpretationRecord
+
+
+class AnomalyRecord(TypedDict):
+    """Anomaly profile results."""
+
+    methods: list[AnomalyMethodRecord]
+
+
+class StatisticsRecord(TypedDict, total=False):
+    """Statistics of a statistical method."""
+
+    peer_mean: float | None
+    peer_std: float | None
+    percentile_rank: float | None
+    simple_zscore: float | None
+
+
+class StatisticalMethodRecord(TypedDict):
+    """Statistical method results."""
+
+    statistical_method: str
+    anomalies: list[AnomalyRecord]
+    statistics: StatisticsRecord
+
+
+class EntityRecord(TypedDict):
+    """Entity result (one line of a node JSONL file)."""
+
+    encounters: int
+    entity: list[EntityFieldRecord]
+    metric: list[MetricRecord]
+    statistical_methods: list[StatisticalMethodRecord]
+
+
+# Built once: TypeAdapter construction compiles the validator
+_HEADER_ADAPTER = TypeAdapter(NodeHeader)
+_ENTITY_ADAPTER = TypeAdapter(EntityRecord)
+_ENTITIES_ADAPTER = TypeAdapter(list[EntityRecord])
+
+
+def _load_node_jsonl(path: Path) -> tuple[NodeHeader, Iterator[EntityRecord]]:
+    """Open a node JSONL file and stream its entity results.
 
     The JSONL format uses:
     - Line 1: Node metadata header with type="node_metadata"
     - Lines 2-N: Entity results (one per line)
 
+    The header is read and validated immediately. Entity results are read
+    and validated one line at a time as the iterator is consumed, so memory
+    use does not grow with the node size. The file is closed when the
+    iterator is exhausted or discarded.
+
     Args:
         path: Path to the node JSONL file.
 
     Returns:
-        dict: Data compatible with NodeResults.model_validate()
+        Tuple of the validated header and an iterator of validated entity results.
 
     Raises:
-        ValueError: If the file is empty or has invalid format.
-        json.JSONDecodeError: If JSON parsing fails.
+        ValueError: If the file is empty, has no metadata header or has a line
+            that is not valid JSON.
+        json.JSONDecodeError: If the header is not valid JSON.
+        ValidationError: If the header or an entity result does not match the
+            node records.
+        OSError: If the file cannot be read.
     """
-    content = path.read_text(encoding="utf-8")
-    lines = content.splitlines()
+    file = path.open(encoding="utf-8")
+    try:
+        header = _parse_node_header(file.readline(), path)
+    except BaseException:
+        file.close()
+        raise
+
+    return header, _iter_entity_results(file)
 
-    if not lines:
+
+def read_node_header(path: Path) -> NodeHeader:
+    """Read only the metadata header of a node JSONL file.
+
+    Args:
+        path: Path to the node JSONL file.
+
+    Returns:
+        NodeHeader: The validated header.
+
+    Raises:
+        ValueError: If the file is empty or has no metadata header.
+        json.JSONDecodeError: If the header is not valid JSON.
+        ValidationError: If the header does not match NodeHeader.
+        OSError: If the file cannot be read.
+    """
+    with path.open(encoding="utf-8") as file:
+        return _parse_node_header(file.readline(), path)
+
+
+def _parse_node_header(line: str, path: Path) -> NodeHeader:
+    """Validate the metadata header line of a node file."""
+    if not line.strip():
         raise ValueError(f"Empty node file: {path}")
 
-    # Parse header (line 1)
-    header = json.loads(lines[0])
-    if header.get("type") != "node_metadata":
+    header = json.loads(line)
+    if not isinstance(header, dict) or header.get("type") != "node_metadata":
         raise ValueError(f"Invalid JSONL format: missing metadata header in {path}")
+    return _HEADER_ADAPTER.validate_python(header)
 
-    # Parse entity results (lines 2-N)
-    entity_results = [json.loads(line) for line in lines[1:] if line.strip()]
 
-    # Construct NodeResults-compatible dict
-    return {
-        "canonical_node_id": header.get("canonical_node_id"),
-        "canonical_child_node_ids": header.get("canonical_child_node_ids", []),
-        "canonical_parent_node_ids": header.get("canonical_parent_node_ids", []),
-        "dataset_path": header.get("dataset_path"),
-        "entity_results": entity_results,
-    }
+def _iter_entity_results(file: TextIO) -> Iterator[EntityRecord]:
+    """Validate the remaining lines of an open node file one at a time."""
+    with file:
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                entity_result = _ENTITY_ADAPTER.validate_json(line)
+            except ValidationError as e:
+                if e.errors()[0]["type"] == "json_invalid":
+                    raise ValueError(f"Invalid entity result line: {e}") from e
+                raise
+            yield entity_result
+
+
+def get_temporal_node_id(header: NodeHeader) -> str | None:
+    """Get the temporal node ID linked via trends_to edge.
+
+    Args:
+        header: Node header.
+
+    Returns:
+        str: The canonical_child_node_id of the trends_to edge,
+            or None if no temporal node is linked.
+    """
+    for edge in header.get("canonical_child_node_ids", []):
+        child_node_id = edge.get("canonical_child_node_id")
+        if edge["edge_type"] == "trends_to" and child_node_id:
+            return child_node_id
+    return None
+
+
+@contextmanager
+def _node_errors(path: Path | None) -> Iterator[None]:
+    """Raise errors from reading or validating node results as SignalGeneratorError."""
+    try:
+        yield
+    except ValidationError as e:
+        raise SignalGeneratorError(f"Failed to validate node results schema: {e}", path=path) from e
+    except (json.JSONDecodeError, ValueError) as e:
+        raise SignalGeneratorError(f"Invalid JSONL format: {e}", path=path) from e
+    except OSError as e:
+        raise SignalGeneratorError(f"Failed to read file: {e}", path=path) from e
 
 
 class SignalGenerator:
@@ -148,6 +329,8 @@ class SignalGenerator:
         include_normal: Whether to include "normal" anomaly signals.
         nodes_directory: Optional directory containing node result files for
             loading temporal nodes via trends_to edges.
+        temporal_indexes: Optional precomputed temporal node indexes, used
+            before loading temporal nodes from nodes_directory.
 
     Example:
         >>> generator = SignalGenerator(nodes_directory=Path("results/nodes"))
@@ -160,6 +343,7 @@ class SignalGenerator:
         self,
         include_normal: bool = False,
         nodes_directory: Path | None = None,
+        temporal_indexes: Mapping[str, TemporalIndex] | None = None,
     ) -> None:
         """Initialize the signal generator.
 
@@ -169,26 +353,32 @@ class SignalGenerator:
             nodes_directory: Optional directory containing node result files.
                 When provided, enables loading of temporal nodes via trends_to
                 edges for signal classification.
+            temporal_indexes: Optional temporal node indexes by node ID, e.g.
+                a memory-mapped TemporalIndexFile shared by batch workers.
+                Temporal nodes missing from it are loaded from nodes_directory.
         """
         self.include_normal = include_normal
         self.nodes_directory = nodes_directory
-        self._temporal_cache: dict[str, NodeResults | None] = {}
+        self.temporal_indexes = temporal_indexes
+        self._temporal_cache: dict[str, TemporalIndex | None] = {}
 
-    def _load_temporal_node(self, temporal_node_id: str) -> NodeResults | None:
-        """Load temporal node data from file.
+    def load_temporal_index(self, temporal_node_id: str) -> TemporalIndex | None:
+        """Load and index temporal node data.
 
-        Attempts to load the temporal node JSONL file from the nodes directory.
-        Uses caching to avoid reloading the same node multiple times.
+        Uses the precomputed temporal_indexes when they contain the node;
+        otherwise loads the temporal node JSONL file from the nodes directory
+        and indexes its monthly z-scores by entity key. Uses caching to avoid
+        reloading the same node multiple times.
 
         Args:
             temporal_node_id: The canonical ID of the temporal node to load.
 
         Returns:
-            NodeResults: Parsed temporal node data, or None if unavailable.
+            TemporalIndex: Monthly z-scores per entity key, or None if unavailable.
 
         Example:
             >>> generator = SignalGenerator(nodes_directory=Path("results/nodes"))
-            >>> temporal_data = generator._load_temporal_node(
+            >>> temporal_index = generator.load_temporal_index(
             ...     "losIndex__medicareId__dischargeMonth"
             ... )
         """
@@ -196,6 +386,12 @@ class SignalGenerator:
         if temporal_node_id in self._temporal_cache:
             return self._temporal_cache[temporal_node_id]
 
+        # Then the precomputed indexes
+        if self.temporal_indexes is not None and temporal_node_id in self.temporal_indexes:
+            temporal_index = self.temporal_indexes[temporal_node_id]
+            self._temporal_cache[temporal_node_id] = temporal_index
+            return temporal_index
+
         # Cannot load without nodes directory
         if self.nodes_directory is None:
             self._temporal_cache[temporal_node_id] = None
@@ -213,15 +409,15 @@ class SignalGenerator:
             return None
 
         try:
-            data = _load_node_jsonl(temporal_path)
-            temporal_node = NodeResults.model_validate(data)
-            self._temporal_cache[temporal_node_id] = temporal_node
+            _, entity_results = _load_node_jsonl(temporal_path)
+            temporal_index = self._index_temporal_node(entity_results)
+            self._temporal_cache[temporal_node_id] = temporal_index
             logger.debug(
-                "Loaded temporal node: %s with %d entity results",
+                "Loaded temporal node: %s with %d entities indexed",
                 temporal_node_id,
-                len(temporal_node.entity_results),
+                len(temporal_index),
             )
-            return temporal_node
+            return temporal_index
         except (json.JSONDecodeError, ValidationError, ValueError, OSError) as e:
             logger.warning(
                 "Failed to load temporal node %s: %s",
@@ -231,21 +427,65 @@ class SignalGenerator:
             self._temporal_cache[temporal_node_id] = None
             return None
 
+    def _index_temporal_node(self, entity_results: Iterable[EntityRecord]) -> TemporalIndex:
+        """Index monthly z-scores of a temporal node by entity key.
+
+        Z-scores are computed per entity from the timeline values and the
+        simple_zscore method's peer mean and standard deviation; entities
+        without those statistics fall back to the timeline values as a
+        proxy. The first entity with a timeline wins for duplicate keys.
+
+        Args:
+            entity_results: Entity results of the temporal node.
+
+        Returns:
+            TemporalIndex: Monthly z-scores in chronological order per
+                (facility, service_line, sub_service_line) key.
+
+        Example:
+            >>> _, entity_results = _load_node_jsonl(temporal_path)
+            >>> index = generator._index_temporal_node(entity_results)
+            >>> index[("AFP658", "Cardiology", None)]
+            array([-1.2, -1.1, -1.3, -1.0, ...])
+        """
+        index: TemporalIndex = {}
+
+        for entity_result in entity_results:
+            if not entity_result["metric"]:
+                continue
+            values = entity_result["metric"][0].get("values")
+            if not isinstance(values, dict):
+                continue
+            timeline_values = [value for period in values["timeline"] if (value := period.get("value")) is not None]
+            if not timeline_values:
+                continue
+
+            entity_key = self._extract_entity_fields(entity_result)
+            if entity_key in index:
+                continue
+
+            z_scores = np.asarray(timeline_values, dtype=np.float64)
+            for stat_method in entity_result["statistical_methods"]:
+                peer_mean = stat_method["statistics"].get("peer_mean")
+                if "simple_zscore" in stat_method["statistical_method"] and peer_mean:
+                    peer_std = stat_method["statistics"].get("peer_std") or 1.0
+                    if peer_std > 0:
+                        z_scores = (z_scores - peer_mean) / peer_std
+                        break
+            index[entity_key] = z_scores
+
+        return index
+
     def _get_temporal_z_scores(
         self,
-        temporal_node: NodeResults,
-        entity_key: tuple[str, str, str | None],
+        temporal_index: TemporalIndex,
+        entity_key: EntityKey,
     ) -> list[float] | None:
-        """Extract monthly z-scores for an entity from temporal node data.
-
-        Matches the entity by (facility, service_line, sub_service_line) tuple
-        and extracts the z-score timeline from the temporal node's statistical
-        methods.
+        """Look up monthly z-scores for an entity in an indexed temporal node.
 
         Args:
-            temporal_node: The parsed temporal NodeResults.
-            entity_key: Tuple of (facility, service_line, sub_service_line)
-                to match against temporal entity results.
+            temporal_index: Index built by _index_temporal_node.
+            entity_key: Tuple of (facility, service_line, sub_service_line).
 
         Returns:
             list[float]: List of monthly z-scores in chronological order,
@@ -253,55 +493,19 @@ class SignalGenerator:
 
         Example:
             >>> z_scores = generator._get_temporal_z_scores(
-            ...     temporal_node,
+            ...     temporal_index,
             ...     ("AFP658", "Cardiology", None)
             ... )
             >>> print(z_scores)
             [-1.2, -1.1, -1.3, -1.0, ...]
         """
-        target_facility, target_service_line, target_sub_service_line = entity_key
-
-        for entity_result in temporal_node.entity_results:
-            # Extract entity fields for matching
-            facility, service_line, sub_service_line = self._extract_entity_fields(entity_result)
-
-            # Match entity and check for temporal metric
-            if (
-                facility == target_facility
-                and service_line == target_service_line
-                and sub_service_line == target_sub_service_line
-                and entity_result.metric
-                and len(entity_result.metric) > 0
-            ):
-                metric = entity_result.metric[0]
-                if isinstance(metric.values, TemporalTimeline):
-                    # Get z-scores from statistical methods if available
-                    for stat_method in entity_result.statistical_methods:
-                        if "simple_zscore" in stat_method.statistical_method:
-                            # Extract z-scores from each period's anomaly
-                            # The timeline values are the metric values;
-                            # we need the z-scores which are computed per period
-                            # For temporal nodes, we use latest_simple_zscore
-                            # as a proxy or compute from the values
-                            timeline_values = metric.get_timeline_values()
-                            if timeline_values and stat_method.statistics.peer_mean:
-                                # Compute z-scores from timeline values
-                                peer_mean = stat_method.statistics.peer_mean
-                                peer_std = stat_method.statistics.peer_std or 1.0
-                                if peer_std > 0:
-                                    z_scores = [(v - peer_mean) / peer_std for v in timeline_values]
-                                    return z_scores
-                    # Fallback: return timeline values as proxy
-                    timeline_values = metric.get_timeline_values()
-                    if timeline_values:
-                        return timeline_values
-
-        return None
+        z_scores = temporal_index.get(entity_key)
+        return None if z_scores is None else z_scores.tolist()
 
     def parse_node_results(self, path: Path) -> list[SignalCreate]:
         """Parse a node results JSONL file and extract signals.
 
-        Reads a node results JSONL file, validates its structure using Pydantic,
+        Streams the node results JSONL file, validates each entity result
         and extracts SignalCreate objects for each entity with anomalies.
 
         Args:
@@ -323,22 +527,36 @@ class SignalGenerator:
             >>> len(signals) > 0
             True
         """
+        return list(self.iter_node_results(path))
+
+    def iter_node_results(self, path: Path) -> Iterator[SignalCreate]:
+        """Stream signals from a node results JSONL file.
+
+        Like parse_node_results, but yields signals as entity results are
+        read, so arbitrarily large nodes are processed in bounded memory.
+        Invalid entity results raise when they are reached.
+
+        Args:
+            path: Path to the node results JSONL file.
+
+        Returns:
+            Iterator[SignalCreate]: Signals in entity result order.
+
+        Raises:
+            SignalGeneratorError: If the file cannot be read or has invalid format.
+            FileNotFoundError: If the path does not exist.
+
+        Example:
+            >>> for signal in generator.iter_node_results(path):
+            ...     print(signal.facility)
+        """
         if not path.exists():
             raise FileNotFoundError(f"Node results file not found: {path}")
 
-        try:
-            data = _load_node_jsonl(path)
-        except (json.JSONDecodeError, ValueError) as e:
-            raise SignalGeneratorError(f"Invalid JSONL format: {e}", path=path) from e
-        except OSError as e:
-            raise SignalGeneratorError(f"Failed to read file: {e}", path=path) from e
-
-        try:
-            node_results = NodeResults.model_validate(data)
-        except (ValidationError, ValueError) as e:
-            raise SignalGeneratorError(f"Failed to validate node results schema: {e}", path=path) from e
+        with _node_errors(path):
+            header, entity_results = _load_node_jsonl(path)
 
-        return self._extract_signals(node_results, path)
+        return self._extract_signals(header, entity_results, path)
 
     def parse_node_results_from_dict(self, data: dict[str, object], path: Path | None = None) -> list[SignalCreate]:
         """Parse node results from a dictionary.
@@ -360,63 +578,65 @@ class SignalGenerator:
             >>> data = {"canonical_node_id": "...", "entity_results": [...]}
             >>> signals = generator.parse_node_results_from_dict(data)
         """
-        try:
-            node_results = NodeResults.model_validate(data)
-        except (ValidationError, ValueError) as e:
-            raise SignalGeneratorError(f"Failed to validate node results schema: {e}", path=path) from e
+        with _node_errors(path):
+            header = _HEADER_ADAPTER.validate_python(data)
+            entity_results = _ENTITIES_ADAPTER.validate_python(data.get("entity_results"))
 
-        return self._extract_signals(node_results, path)
+        return list(self._extract_signals(header, entity_results, path))
 
-    def _extract_signals(self, node_results: NodeResults, path: Path | None) -> list[SignalCreate]:
+    def _extract_signals(self, header: NodeHeader, entity_results: Iterable[EntityRecord], path: Path | None) -> Iterator[SignalCreate]:
         """Extract signals from validated node results.
 
         Loads temporal node data via trends_to edge if available, then
         extracts signals with classification for each entity.
 
         Args:
-            node_results: Validated NodeResults object.
+            header: Validated node header.
+            entity_results: Validated entity results, consumed lazily.
             path: Optional path for metadata.
 
-        Returns:
-            list[SignalCreate]: List of extracted signals.
+        Yields:
+            SignalCreate: Extracted signals.
         """
-        signals: list[SignalCreate] = []
         detected_at = datetime.now(tz=UTC)
+        canonical_node_id = header["canonical_node_id"]
 
         # Get temporal node ID via trends_to edge
-        temporal_node_id = node_results.get_temporal_node_id()
-        temporal_node: NodeResults | None = None
+        temporal_node_id = get_temporal_node_id(header)
+        temporal_index: TemporalIndex | None = None
 
         if temporal_node_id:
-            temporal_node = self._load_temporal_node(temporal_node_id)
-
-        for entity_result in node_results.entity_results:
-            signal = self._extract_signal_from_entity(
-                entity_result=entity_result,
-                canonical_node_id=node_results.canonical_node_id,
-                detected_at=detected_at,
-                path=path,
-                temporal_node_id=temporal_node_id,
-                temporal_node=temporal_node,
-            )
-            if signal is not None:
-                signals.append(signal)
+            temporal_index = self.load_temporal_index(temporal_node_id)
+
+        signal_count = 0
+        with _node_errors(path):
+            for entity_result in entity_results:
+                signal = self._extract_signal_from_entity(
+                    entity_result=entity_result,
+                    canonical_node_id=canonical_node_id,
+                    detected_at=detected_at,
+                    path=path,
+                    temporal_node_id=temporal_node_id,
+                    temporal_index=temporal_index,
+                )
+                if signal is not None:
+                    signal_count += 1
+                    yield signal
 
         logger.info(
             "Extracted %d signals from node %s",
-            len(signals),
-            node_results.canonical_node_id,
+            signal_count,
+            canonical_node_id,
         )
-        return signals
 
     def _extract_signal_from_entity(
         self,
-        entity_result: NodeEntityResult,
+        entity_result: EntityRecord,
         canonical_node_id: str,
         detected_at: datetime,
         path: Path | None,
         temporal_node_id: str | None = None,
-        temporal_node: NodeResults | None = None,
+        temporal_index: TemporalIndex | None = None,
     ) -> SignalCreate | None:
         """Extract a signal from a single entity result.
 
@@ -426,32 +646,34 @@ class SignalGenerator:
             detected_at: Detection timestamp.
             path: Optional path for metadata.
             temporal_node_id: Optional ID of linked temporal node.
-            temporal_node: Optional parsed temporal node data.
+            temporal_index: Optional indexed temporal node data.
 
         Returns:
             SignalCreate if an anomaly signal should be generated, None otherwise.
         """
         # Get metric info
-        if not entity_result.metric:
+        if not entity_result["metric"]:
             return None
-        metric = entity_result.metric[0]
-        metric_id = metric.metadata.metric_id
+        metric = entity_result["metric"][0]
+        metric_id = metric["metadata"]["metric_id"]
+        values = metric.get("values")
 
         # Skip entities with null metric values (suppressed data)
-        if metric.values is None:
+        if values is None:
             return None
 
         # Handle temporal timeline values - use the latest value
-        if isinstance(metric.values, TemporalTimeline):
-            if metric.values.timeline:
-                metric_value = Decimal(str(metric.values.timeline[-1].value))
-            else:
+        if isinstance(values, dict):
+            latest_value = values["timeline"][-1].get("value") if values["timeline"] else None
+            # Skip entities whose latest period is missing or suppressed
+            if latest_value is None:
                 return None
+            metric_value = Decimal(str(latest_value))
         else:
-            metric_value = Decimal(str(metric.values))
+            metric_value = Decimal(str(values))
 
         # Find the most severe anomaly across all statistical methods
-        best_anomaly = self._find_best_anomaly(entity_result.statistical_methods)
+        best_anomaly = self._find_best_anomaly(entity_result["statistical_methods"])
         if best_anomaly is None:
             return None
 
@@ -474,9 +696,8 @@ class SignalGenerator:
         monthly_z_scores: list[float] | None = None
         slope_percentile: Decimal | None = None
 
-        if temporal_node is not None:
-            entity_key = (facility, service_line, sub_service_line)
-            monthly_z_scores = self._get_temporal_z_scores(temporal_node, entity_key)
+        if temporal_index is not None:
+            monthly_z_scores = self._get_temporal_z_scores(temporal_index, (facility, service_line, sub_service_line))
 
         return SignalCreate(
             canonical_node_id=canonical_node_id,
@@ -488,17 +709,17 @@ class SignalGenerator:
             sub_service_line=sub_service_line,
             description=interpretation,
             metric_value=metric_value,
-            peer_mean=Decimal(str(statistics.peer_mean)) if statistics.peer_mean else None,
-            percentile_rank=Decimal(str(statistics.percentile_rank)) if statistics.percentile_rank else None,
-            simple_zscore=Decimal(str(statistics.simple_zscore)) if statistics.simple_zscore else None,
-            encounters=entity_result.encounters,
+            peer_mean=Decimal(str(peer_mean)) if (peer_mean := statistics.get("peer_mean")) else None,
+            percentile_rank=Decimal(str(percentile_rank)) if (percentile_rank := statistics.get("percentile_rank")) else None,
+            simple_zscore=Decimal(str(simple_zscore)) if (simple_zscore := statistics.get("simple_zscore")) else None,
+            encounters=entity_result["encounters"],
             detected_at=detected_at,
             temporal_node_id=temporal_node_id,
             slope_percentile=slope_percentile,
             monthly_z_scores=monthly_z_scores,
         )
 
-    def _find_best_anomaly(self, statistical_methods: list[NodeStatisticalMethod]) -> tuple[str, str, NodeStatistics] | None:
+    def _find_best_anomaly(self, statistical_methods: list[StatisticalMethodRecord]) -> tuple[str, str, StatisticsRecord] | None:
         """Find the most significant anomaly across all statistical methods.
 
         Prioritizes simple_zscore method, then looks for the highest significance
@@ -512,7 +733,7 @@ class SignalGenerator:
             most significant anomaly, or None if no anomalies found.
         """
         best_significance_rank: float = 999  # Lower is more significant
-        best_result: tuple[str, str, NodeStatistics] | None = None
+        best_result: tuple[str, str, StatisticsRecord] | None = None
 
         significance_rank = {
             "extremely_high": 0,
@@ -528,11 +749,11 @@ class SignalGenerator:
 
         for stat_method in statistical_methods:
             # Prefer simple_zscore method
-            is_simple_zscore = "simple_zscore" in stat_method.statistical_method
+            is_simple_zscore = "simple_zscore" in stat_method["statistical_method"]
 
-            for anomaly in stat_method.anomalies:
-                for method in anomaly.methods:
-                    anomaly_level = method.anomaly
+            for anomaly in stat_method["anomalies"]:
+                for method in anomaly["methods"]:
+                    anomaly_level = method["anomaly"]
                     rank = significance_rank.get(anomaly_level, 5)
 
                     # Give bonus to simple_zscore method (subtract 0.5 from rank)
@@ -542,13 +763,13 @@ class SignalGenerator:
                         best_significance_rank = effective_rank
                         best_result = (
                             anomaly_level,
-                            method.interpretation.rendered,
-                            stat_method.statistics,
+                            method["interpretation"]["rendered"],
+                            stat_method["statistics"],
                         )
 
         return best_result
 
-    def _extract_entity_fields(self, entity_result: NodeEntityResult) -> tuple[str, str, str | None]:
+    def _extract_entity_fields(self, entity_result: EntityRecord) -> EntityKey:
         """Extract facility, service line, and sub-service line from entity.
 
         Args:
@@ -564,12 +785,12 @@ class SignalGenerator:
         service_line = "All"
         sub_service_line: str | None = None
 
-        for entity_field in entity_result.entity:
-            if entity_field.id == "medicareId":
-                facility = entity_field.value
-            elif entity_field.id == "vizientServiceLine":
-                service_line = entity_field.value
-            elif entity_field.id == "vizientSubServiceLine":
-                sub_service_line = entity_field.value
+        for entity_field in entity_result["entity"]:
+            if entity_field["id"] == "medicareId":
+                facility = entity_field["value"]
+            elif entity_field["id"] == "vizientServiceLine":
+                service_line = entity_field["value"]
+            elif entity_field["id"] == "vizientSubServiceLine":
+                sub_service_line = entity_field["value"]
 
         return facility, service_line, sub_service_line
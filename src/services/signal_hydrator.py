@@ -18,6 +18,8 @@ This separation allows:
 from __future__ import annotations
 
 import logging
+import time
+from contextlib import AbstractAsyncContextManager, nullcontext
 from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any
@@ -31,10 +33,15 @@ from src.db.models import (
     SignalDomain,
 )
 from src.db.session import async_session_maker
+from src.observability.metrics import HYDRATION_BATCH_DURATION
 
 logger = logging.getLogger(__name__)
 
 
+# Run hydrated when no run_id is given. Run IDs are run timestamps
+# (e.g. 20251210170210), so the latest run has the greatest ID.
+LATEST_RUN_QUERY = "SELECT max(run_id) FROM public_marts.fct_signals"
+
 # SQL query to fetch signals from dbt fct_signals table (public_marts schema)
 # Grain: One row per entity/metric combination (no statistical method fan-out)
 FCT_SIGNALS_QUERY = """
@@ -145,6 +152,113 @@ WHERE canonical_node_id = :canonical_node_id
 LIMIT 1
 """
 
+# Set-based equivalent of _prepare_signal_record for in-database hydration.
+# Each expression mirrors the Python mapping: domain strings to signaldomain
+# labels (default EFFICIENCY), "Unknown Facility"/"Unknown"/"Facility-wide"
+# defaults for empty values, the "<metric_id> anomaly detected" fallback
+# description and 0 for a missing metric_value. JSONB columns go through
+# to_jsonb so non-JSONB mart columns are stored as the Python path stores them,
+# and NULL becomes JSON null as SQLAlchemy's JSONB type persists Python None.
+# {where} and {limit} are filled in by SignalHydrator._in_database_query.
+SIGNAL_PROJECTION_QUERY = """
+SELECT
+    canonical_node_id,
+    metric_id,
+    CASE domain
+        WHEN 'Safety' THEN 'SAFETY'
+        WHEN 'Effectiveness' THEN 'EFFECTIVENESS'
+        ELSE 'EFFICIENCY'
+    END::signaldomain AS domain,
+    system_name,
+    coalesce(nullif(facility_id, ''), 'Unknown Facility') AS facility,
+    facility_id,
+    coalesce(nullif(service_line, ''), 'Unknown') AS service_line,
+    sub_service_line,
+    coalesce(nullif(description, ''), metric_id || ' anomaly detected') AS description,
+    coalesce(metric_value, 0) AS metric_value,
+    benchmark_value AS peer_mean,
+    percentile_rank,
+    encounters,
+    coalesce(detected_at, now()) AS detected_at,
+    temporal_node_id,
+    coalesce(to_jsonb(entity_dimensions), 'null') AS entity_dimensions,
+    entity_dimensions_hash,
+    coalesce(nullif(groupby_label, ''), 'Facility-wide') AS groupby_label,
+    coalesce(nullif(group_value, ''), 'Facility-wide') AS group_value,
+    coalesce(to_jsonb(metric_trend_timeline), 'null') AS metric_trend_timeline,
+    trend_direction,
+    simplified_signal_type,
+    simplified_severity,
+    coalesce(to_jsonb(simplified_severity_range), 'null') AS simplified_severity_range,
+    coalesce(to_jsonb(simplified_inputs), 'null') AS simplified_inputs,
+    coalesce(to_jsonb(simplified_indicators), 'null') AS simplified_indicators,
+    simplified_reasoning,
+    coalesce(to_jsonb(simplified_severity_calculation), 'null') AS simplified_severity_calculation,
+    coalesce(to_jsonb(metadata), 'null') AS metadata,
+    coalesce(to_jsonb(metadata_per_period), 'null') AS metadata_per_period,
+    coalesce(to_jsonb(peer_percentile_trends), 'null') AS peer_percentile_trends
+FROM public_marts.fct_signals
+{where}
+ORDER BY canonical_node_id, metric_id
+{limit}
+"""
+
+# Columns written by SIGNAL_PROJECTION_QUERY, in order
+SIGNAL_PROJECTION_COLUMNS = [
+    "canonical_node_id",
+    "metric_id",
+    "domain",
+    "system_name",
+    "facility",
+    "facility_id",
+    "service_line",
+    "sub_service_line",
+    "description",
+    "metric_value",
+    "peer_mean",
+    "percentile_rank",
+    "encounters",
+    "detected_at",
+    "temporal_node_id",
+    "entity_dimensions",
+    "entity_dimensions_hash",
+    "groupby_label",
+    "group_value",
+    "metric_trend_timeline",
+    "trend_direction",
+    "simplified_signal_type",
+    "simplified_severity",
+    "simplified_severity_range",
+    "simplified_inputs",
+    "simplified_indicators",
+    "simplified_reasoning",
+    "simplified_severity_calculation",
+    "metadata",
+    "metadata_per_period",
+    "peer_percentile_trends",
+]
+
+# Columns left untouched on conflict (the constraint key and insert-only fields)
+_INSERT_ONLY_COLUMNS = {"canonical_node_id", "metric_id", "domain", "facility", "facility_id", "service_line", "sub_service_line", "detected_at"}
+
+_UPSERT_SET_CLAUSE = ",\n    ".join(f"{column} = EXCLUDED.{column}" for column in SIGNAL_PROJECTION_COLUMNS if column not in _INSERT_ONLY_COLUMNS)
+
+# In-database hydration: one INSERT ... SELECT ... ON CONFLICT per chunk, counting
+# inserted (xmax = 0) vs updated rows without returning them to Python
+IN_DATABASE_HYDRATE_QUERY = f"""
+WITH upserted AS (
+    INSERT INTO signals ({", ".join(SIGNAL_PROJECTION_COLUMNS)})
+    {{projection}}
+    ON CONFLICT ON CONSTRAINT uq_signals_entity_metric_detected DO UPDATE SET
+    {_UPSERT_SET_CLAUSE}
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT
+    count(*) FILTER (WHERE inserted) AS created,
+    count(*) FILTER (WHERE NOT inserted) AS updated
+FROM upserted
+"""
+
 
 class SignalHydrator:
     """Service for hydrating signals from dbt mart tables into the application database.
@@ -152,17 +266,27 @@ class SignalHydrator:
     Queries the fct_signals dbt mart table and upserts records into the signals
     table. The dbt pipeline must be run before hydration to ensure fct_signals is populated.
 
+    Only one run is hydrated at a time: fct_signals keeps every loaded run,
+    and the rows of two runs would collide on uq_signals_entity_metric_detected.
+
     Attributes:
-        run_id: Optional run ID filter for the dbt tables.
+        run_id: Run ID to hydrate; set to the latest run in fct_signals
+            when hydration starts without one.
+        in_database: Hydrate with INSERT ... SELECT inside PostgreSQL
+            instead of reading fct_signals into Python.
 
     Example:
         >>> hydrator = SignalHydrator()
         >>> stats = await hydrator.hydrate_signals()
         >>> print(f"Processed {stats['signals_processed']} signals")
 
-        >>> # With run ID filter
+        >>> # A specific run instead of the latest one
         >>> hydrator = SignalHydrator(run_id="20251210170210")
         >>> stats = await hydrator.hydrate_signals()
+
+        >>> # Mart and app tables in the same database
+        >>> hydrator = SignalHydrator(in_database=True)
+        >>> stats = await hydrator.hydrate_signals()
     """
 
     def __init__(
@@ -171,12 +295,13 @@ class SignalHydrator:
         session_factory: async_sessionmaker[AsyncSession] | None = None,
         limit: int | None = None,
         facility_ids: list[str] | None = None,
+        in_database: bool = False,
     ) -> None:
         """Initialize the hydrator.
 
         Args:
-            run_id: Optional run ID to filter signals by.
-                If None, processes all signals in fct_signals.
+            run_id: Run ID to hydrate. If None, the latest run in
+                fct_signals is hydrated.
             session_factory: Optional async session factory for database connections.
                 If None, uses the default async_session_maker from src.db.session.
                 Useful for testing with alternative database connections.
@@ -184,12 +309,29 @@ class SignalHydrator:
                 Useful for testing with large datasets.
             facility_ids: Optional list of facility IDs to filter signals by.
                 If None, processes signals from all facilities.
+            in_database: Run the whole mapping as INSERT ... SELECT from
+                public_marts.fct_signals, one transaction per facility.
+                Requires the mart and signals tables in the same database.
         """
         self.run_id = run_id
+        self.in_database = in_database
         self._session_factory = session_factory or async_session_maker
         self._limit = limit
         self._facility_ids = facility_ids
 
+    async def _resolve_run_id(self, session: AsyncSession) -> None:
+        """Default run_id to the latest run in fct_signals.
+
+        Args:
+            session: Async database session.
+        """
+        if self.run_id is not None:
+            return
+        result = await session.execute(text(LATEST_RUN_QUERY))
+        self.run_id = result.scalar_one_or_none()
+        if self.run_id:
+            logger.info("No run ID given; hydrating the latest run %s", self.run_id)
+
     async def _query_fct_signals(self, session: AsyncSession) -> list[dict[str, Any]]:
         """Query signals from the dbt fct_signals mart table.
 
@@ -252,8 +394,9 @@ class SignalHydrator:
     async def hydrate_signals(self) -> dict[str, int]:
         """Hydrate signals from dbt fct_signals into the application database.
 
-        Queries the fct_signals dbt mart table and upserts all signals into
-        the signals table using PostgreSQL's ON CONFLICT clause.
+        Queries the run's rows of the fct_signals dbt mart table (the latest
+        run if no run_id was given) and upserts them into the signals table
+        using PostgreSQL's ON CONFLICT clause.
 
         Returns:
             dict[str, int]: Statistics about the hydration process:
@@ -268,6 +411,9 @@ class SignalHydrator:
             >>> print(stats)
             {'signals_processed': 500, 'signals_created': 450, 'signals_updated': 50, 'signals_skipped': 0}
         """
+        if self.in_database:
+            return await self._hydrate_in_database()
+
         stats = {
             "signals_processed": 0,
             "signals_created": 0,
@@ -278,6 +424,7 @@ class SignalHydrator:
         # Query signals data first in a separate session
         async with self._session_factory() as session:
             try:
+                await self._resolve_run_id(session)
                 fct_signals = await self._query_fct_signals(session)
             except Exception as e:
                 logger.error("Failed to query fct_signals: %s", e)
@@ -299,6 +446,7 @@ class SignalHydrator:
         total_batches = (len(fct_signals) + batch_size - 1) // batch_size
 
         for batch_num in range(total_batches):
+            batch_started = time.perf_counter()
             start_idx = batch_num * batch_size
             end_idx = min(start_idx + batch_size, len(fct_signals))
             batch = fct_signals[start_idx:end_idx]
@@ -336,6 +484,7 @@ class SignalHydrator:
                     logger.error("Failed to commit batch %d: %s", batch_num + 1, e)
                     await session.rollback()
                     stats["signals_skipped"] += len(records) + skipped
+            HYDRATION_BATCH_DURATION.observe(time.perf_counter() - batch_started, mode="python")
 
         logger.info(
             "Signal hydration complete: %d processed, %d created, %d updated, %d skipped",
@@ -346,6 +495,134 @@ class SignalHydrator:
         )
         return stats
 
+    def _in_database_query(self, facility_id: str | None = None, chunked: bool = False) -> tuple[str, dict[str, Any]]:
+        """Build the projection query and parameters for in-database hydration.
+
+        Args:
+            facility_id: Facility to restrict the projection to when chunked.
+            chunked: Whether to add the facility_id condition.
+
+        Returns:
+            Tuple of (SIGNAL_PROJECTION_QUERY with filters, bind parameters).
+        """
+        conditions: list[str] = []
+        params: dict[str, Any] = {}
+        if self.run_id:
+            conditions.append("run_id = :run_id")
+            params["run_id"] = self.run_id
+        if chunked and facility_id is None:
+            # Separate predicate so non-NULL chunks can use idx_fct_signals_facility
+            conditions.append("facility_id IS NULL")
+        elif chunked:
+            conditions.append("facility_id = :facility_id")
+            params["facility_id"] = facility_id
+        elif self._facility_ids:
+            conditions.append("facility_id = ANY(:facility_ids)")
+            params["facility_ids"] = list(self._facility_ids)
+
+        query = SIGNAL_PROJECTION_QUERY.format(
+            where=f"WHERE {' AND '.join(conditions)}" if conditions else "",
+            limit=f"LIMIT {int(self._limit)}" if self._limit else "",
+        )
+        return query, params
+
+    async def _list_facility_chunks(self, session: AsyncSession) -> list[tuple[str | None, int]]:
+        """List the facility IDs to hydrate, one chunk each.
+
+        Args:
+            session: Async database session.
+
+        Returns:
+            (facility_id, row count) of each distinct facility in fct_signals
+            matching the run and facility filters.
+        """
+        query = "SELECT facility_id, count(*) FROM public_marts.fct_signals"
+        params: dict[str, Any] = {}
+        if self.run_id:
+            query += " WHERE run_id = :run_id"
+            params["run_id"] = self.run_id
+        result = await session.execute(text(query + " GROUP BY facility_id ORDER BY facility_id"), params)
+        chunks: list[tuple[str | None, int]] = [(row[0], row[1]) for row in result.fetchall()]
+        if self._facility_ids:
+            wanted = set(self._facility_ids)
+            chunks = [chunk for chunk in chunks if chunk[0] in wanted]
+        return chunks
+
+    async def _hydrate_in_database(self) -> dict[str, int]:
+        """Hydrate signals with set-based INSERT ... SELECT statements.
+
+        Runs IN_DATABASE_HYDRATE_QUERY once per facility, each in its own
+        transaction, so row locks on signals are held for one facility at a
+        time. With a limit the signals are taken in a single statement, since
+        the limit applies across facilities. The rows of a failed chunk are
+        counted as skipped.
+
+        Returns:
+            dict[str, int]: Same statistics as hydrate_signals, with created and
+                updated counted separately, plus chunks_failed: the number of
+                statements that were rolled back.
+        """
+        stats = {
+            "signals_processed": 0,
+            "signals_created": 0,
+            "signals_updated": 0,
+            "signals_skipped": 0,
+            "chunks_failed": 0,
+        }
+
+        chunks: list[tuple[str | None, int]] | None = None
+        async with self._session_factory() as session:
+            try:
+                await self._resolve_run_id(session)
+                if not self._limit:
+                    chunks = await self._list_facility_chunks(session)
+            except Exception as e:
+                logger.error("Failed to query fct_signals: %s", e)
+                logger.info("Ensure dbt run has been executed and fct_signals table exists")
+                return stats
+
+        if not self._limit and not chunks:
+            logger.warning("No signals found in fct_signals table")
+            return stats
+
+        # (projection, params, rows); the row count of an unchunked limit query is unknown
+        queries = (
+            [(*self._in_database_query(facility_id, chunked=True), rows) for facility_id, rows in chunks]
+            if chunks is not None
+            else [(*self._in_database_query(), 0)]
+        )
+
+        for chunk_num, (projection, params, rows) in enumerate(queries, start=1):
+            chunk_started = time.perf_counter()
+            async with self._session_factory() as session:
+                try:
+                    result = await session.execute(text(IN_DATABASE_HYDRATE_QUERY.format(projection=projection.strip())), params)
+                    created, updated = result.one()
+                    await session.commit()
+                except Exception as e:
+                    logger.error("Failed to hydrate chunk %d/%d in database: %s", chunk_num, len(queries), e)
+                    await session.rollback()
+                    stats["signals_skipped"] += rows
+                    stats["chunks_failed"] += 1
+                    continue
+                finally:
+                    HYDRATION_BATCH_DURATION.observe(time.perf_counter() - chunk_started, mode="in_database")
+
+            stats["signals_processed"] += created + updated
+            stats["signals_created"] += created
+            stats["signals_updated"] += updated
+            logger.info("Chunk %d/%d: %d created, %d updated", chunk_num, len(queries), created, updated)
+
+        logger.info(
+            "In-database signal hydration complete: %d processed, %d created, %d updated, %d skipped (%d failed chunks)",
+            stats["signals_processed"],
+            stats["signals_created"],
+            stats["signals_updated"],
+            stats["signals_skipped"],
+            stats["chunks_failed"],
+        )
+        return stats
+
     @staticmethod
     def _to_decimal(value: Any) -> Decimal | None:
         """Convert a value to Decimal, returning None for null/invalid values."""
@@ -521,6 +798,7 @@ class SignalHydrator:
         self,
         canonical_node_id: str,
         entity_dimensions_hash: str | None = None,
+        session: AsyncSession | None = None,
     ) -> dict[str, Any] | None:
         """Fetch technical details for a signal from fct_signals.
 
@@ -528,13 +806,17 @@ class SignalHydrator:
             canonical_node_id: The signal's canonical node ID.
             entity_dimensions_hash: Optional hash for precise entity lookup.
                 If None, returns the first matching row for the node.
+            session: Optional open session to query on, e.g. the request's
+                session, instead of checking out a second pooled connection.
+                It is left open. If None, a new session is opened.
 
         Returns:
             Dict of technical details or None if not found.
         """
         to_decimal = self._to_decimal
 
-        async with self._session_factory() as session:
+        scope: AbstractAsyncContextManager[AsyncSession] = nullcontext(session) if session is not None else self._session_factory()
+        async with scope as session:
             # Use different queries based on whether hash is provided
             # (asyncpg doesn't support :param IS NULL pattern)
             if entity_dimensions_hash is not None:
@@ -3,14 +3,22 @@
 Provides commands for hydrating signals from dbt fct_signals table.
 The ETL script (load_insight_graph_to_dbt.py) must be run first to populate
 raw tables, followed by dbt build to create the fct_signals mart.
+
+The generate command builds signals straight from a run's node results:
+
+    uv run python -m src.signals.cli generate /data/runs/test_minimal/20260115105115 -o signals.ndjson
 """
 
 from __future__ import annotations
 
 import asyncio
+import sys
+import time
+from pathlib import Path
 
 import click
 
+from src.services.signal_batch import generate_run_signals, node_paths, resolve_nodes_directory
 from src.services.signal_hydrator import SignalHydrator
 
 
@@ -25,7 +33,7 @@ def cli() -> None:
     "--run-id",
     "-r",
     default=None,
-    help="Filter to specific run_id (optional, uses latest if not specified).",
+    help="Run ID to hydrate (optional, uses the latest run in fct_signals if not specified).",
 )
 @click.option(
     "--facility-id",
@@ -40,10 +48,17 @@ def cli() -> None:
     default=None,
     help="Limit number of signals to process.",
 )
+@click.option(
+    "--in-database",
+    is_flag=True,
+    default=False,
+    help="Hydrate with INSERT ... SELECT inside PostgreSQL, one facility per transaction (fct_signals and signals must be in the same database).",
+)
 def hydrate(
     run_id: str | None,
     facility_id: tuple[str, ...],
     limit: int | None,
+    in_database: bool,
 ) -> None:
     """Hydrate signals from dbt fct_signals table into the database.
 
@@ -54,6 +69,8 @@ def hydrate(
         1. Run load_insight_graph_to_dbt.py to load raw data
         2. Run dbt build to create fct_signals mart
         3. Then run this command to populate the signals table
+
+    Exits 1 if any in-database chunk failed and was rolled back.
     """
     # Convert tuple to list for filtering
     facility_ids = list(facility_id) if facility_id else None
@@ -65,21 +82,28 @@ def hydrate(
         click.echo(f"Filtering to facilities: {', '.join(facility_ids)}")
     if limit:
         click.echo(f"Limiting to {limit} signals")
+    if in_database:
+        click.echo("Mode: in-database")
 
     # Run the hydration
-    stats = asyncio.run(_hydrate_async(run_id, facility_ids, limit))
+    stats = asyncio.run(_hydrate_async(run_id, facility_ids, limit, in_database))
 
     # Report results
     click.echo("\nHydration complete:")
     click.echo(f"  Signals processed: {stats['signals_processed']}")
     click.echo(f"  Signals created: {stats['signals_created']}")
     click.echo(f"  Signals updated: {stats['signals_updated']}")
+    click.echo(f"  Signals skipped: {stats['signals_skipped']}")
+    if stats.get("chunks_failed"):
+        click.echo(f"\n{stats['chunks_failed']} chunk(s) failed and were rolled back; see the log for errors.", err=True)
+        sys.exit(1)
 
 
 async def _hydrate_async(
     run_id: str | None,
     facility_ids: list[str] | None,
     limit: int | None,
+    in_database: bool = False,
 ) -> dict[str, int]:
     """Async implementation of signal hydration."""
     from src.db.session import async_session_maker
@@ -89,6 +113,7 @@ async def _hydrate_async(
         session_factory=async_session_maker,
         facility_ids=facility_ids,
         limit=limit,
+        in_database=in_database,
     )
 
     return await hydrator.hydrate_signals()
@@ -127,5 +152,60 @@ def count(facility_id: str | None) -> None:
         click.echo(f"Total signals: {total}")
 
 
+@cli.command()
+@click.argument("run_path", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option("--output", "-o", default="-", show_default=True, help="NDJSON file to write signals to ('-' for stdout).")
+@click.option("--workers", "-w", type=click.IntRange(min=1), default=None, help="Worker processes (default: CPU count).")
+@click.option("--include-normal", is_flag=True, default=False, help="Include signals with the 'normal' anomaly level.")
+@click.option(
+    "--temporal-index",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Directory for the precomputed temporal index; reused if built from this run's current temporal files, rebuilt otherwise (default: a temporary directory).",
+)
+def generate(run_path: Path, output: str, workers: int | None, include_normal: bool, temporal_index: Path | None) -> None:
+    """Generate signals for every node of a run as NDJSON.
+
+    RUN_PATH is a run directory (containing results/nodes) or a nodes
+    directory. Nodes are parsed in parallel worker processes; one
+    SignalCreate JSON object is written per line, in node completion order.
+    Progress goes to stderr. Exits 1 if any node could not be parsed.
+    """
+    nodes_directory = resolve_nodes_directory(run_path)
+    total = len(node_paths(nodes_directory))
+    if total == 0:
+        raise click.BadParameter(f"no node JSONL files in {nodes_directory}", param_hint="RUN_PATH")
+    click.echo(f"Generating signals for {total:,} nodes in {nodes_directory}", err=True)
+
+    last_report = 0.0
+
+    def progress(done: int, nodes_total: int, signals: int, elapsed: float) -> None:
+        nonlocal last_report
+        if done == nodes_total or elapsed - last_report >= 1.0:
+            last_report = elapsed
+            click.echo(f"  {done:,}/{nodes_total:,} nodes, {signals:,} signals ({done / elapsed:,.1f} nodes/s, {signals / elapsed:,.0f} signals/s)", err=True)
+
+    started = time.perf_counter()
+    signal_count = 0
+    failed: list[tuple[str, str]] = []
+    with click.open_file(output, "w") as out:
+        for node in generate_run_signals(
+            nodes_directory, workers=workers, include_normal=include_normal, temporal_index_directory=temporal_index, progress=progress
+        ):
+            if node.error is not None:
+                failed.append((node.path.name, node.error))
+            for signal in node.signals:
+                out.write(signal.model_dump_json() + "\n")
+            signal_count += len(node.signals)
+    elapsed = time.perf_counter() - started
+
+    click.echo(f"\nGenerated {signal_count:,} signals from {total - len(failed):,} nodes in {elapsed:.1f}s ({signal_count / elapsed:,.0f} signals/s)", err=True)
+    if failed:
+        click.echo(f"{len(failed)} node(s) failed:", err=True)
+        for name, error in failed:
+            click.echo(f"  {name}: {error}", err=True)
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     cli()
@@ -19,7 +19,7 @@ from src.db.models import (
     Signal,
     SignalDomain,
 )
-from src.db.session import get_async_db_session
+from src.db.session import get_async_db_session, get_async_read_session
 from src.schemas.contribution import HierarchicalContributionsResponse
 from src.schemas.signal import (
     FilterOptionsResponse,
@@ -45,6 +45,9 @@ router = APIRouter(prefix="/signals", tags=["signals"])
 # Database session dependency
 DbSession = Annotated[AsyncSession, Depends(get_async_db_session)]
 
+# Read-only session for GET endpoints (READ ONLY transaction, never committed)
+ReadOnlySession = Annotated[AsyncSession, Depends(get_async_read_session)]
+
 # Query parameter annotations
 DomainFilter = Annotated[SignalDomain | None, Query(description="Filter by quality domain")]
 FacilityFilter = Annotated[str | None, Query(description="Filter by facility name(s) - comma-separated for multiple")]
@@ -164,7 +167,7 @@ def _signal_to_response(
 
 @router.get("", response_model=SignalListResponse)
 async def list_signals(
-    session: DbSession,
+    session: ReadOnlySession,
     domain: DomainFilter = None,
     facility: FacilityFilter = None,
     system_name: SystemNameFilter = None,
@@ -259,7 +262,7 @@ async def list_signals(
 
 @router.get("/filter-options", response_model=FilterOptionsResponse)
 async def get_filter_options(
-    session: DbSession,
+    session: ReadOnlySession,
     system_name: SystemNameFilter = None,
     facility: FacilityFilter = None,
 ) -> FilterOptionsResponse:
@@ -331,7 +334,7 @@ async def get_filter_options(
 
 @router.get("/facilities", response_model=list[str])
 async def list_facilities(
-    session: DbSession,
+    session: ReadOnlySession,
     system_name: SystemNameFilter = None,
 ) -> list[str]:
     """Return distinct facility names, optionally filtered by system.
@@ -362,7 +365,7 @@ async def list_facilities(
 @router.get("/{signal_id}", response_model=SignalResponse)
 async def get_signal(
     signal_id: UUID,
-    session: DbSession,
+    session: ReadOnlySession,
 ) -> SignalResponse:
     """Get a single signal by ID.
 
@@ -438,7 +441,7 @@ async def patch_signal(
 @router.get("/{signal_id}/temporal", response_model=SignalTemporalResponse)
 async def get_signal_temporal(
     signal_id: UUID,
-    session: DbSession,
+    session: ReadOnlySession,
 ) -> SignalTemporalResponse:
     """Get temporal trend data for a signal.
 
@@ -487,6 +490,7 @@ async def get_signal_temporal(
         details = await hydrator.get_technical_details(
             signal.canonical_node_id,
             entity_dimensions_hash=signal.entity_dimensions_hash,
+            session=session,
         )
         if details:
             slope_percentile = details.get("slope_percentile")
@@ -505,7 +509,7 @@ async def get_signal_temporal(
 @router.get("/{signal_id}/contributions", response_model=HierarchicalContributionsResponse)
 async def get_signal_contributions(
     signal_id: UUID,
-    session: DbSession,
+    session: ReadOnlySession,
     top_n: TopNQuery = 10,
 ) -> HierarchicalContributionsResponse:
     """Get hierarchical contribution breakdown for a signal.
@@ -558,7 +562,7 @@ async def get_signal_contributions(
         )
 
     # Query hierarchical contributions (both upward and downward)
-    service = ContributionService()
+    service = ContributionService(session=session)
     try:
         upward, downward, hierarchy_level = await service.get_hierarchical_contributions(
             signal=signal,
@@ -583,7 +587,7 @@ async def get_signal_contributions(
 @router.get("/{signal_id}/children", response_model=SignalChildrenResponse)
 async def get_signal_children(
     signal_id: UUID,
-    session: DbSession,
+    session: ReadOnlySession,
     limit: LimitQuery = 50,
 ) -> SignalChildrenResponse:
     """Get child signals reachable via drills_to edges.
@@ -637,7 +641,7 @@ async def get_signal_children(
 @router.get("/{signal_id}/related", response_model=list[SignalResponse])
 async def get_related_signals(
     signal_id: UUID,
-    session: DbSession,
+    session: ReadOnlySession,
 ) -> list[SignalResponse]:
     """Get signals related via same facility and service line.
 
@@ -690,7 +694,7 @@ async def get_related_signals(
 @router.get("/{signal_id}/parent", response_model=SignalParentResponse)
 async def get_signal_parent(
     signal_id: UUID,
-    session: DbSession,
+    session: ReadOnlySession,
 ) -> SignalParentResponse:
     """Get the parent signal reachable via drills_to edge.
 
@@ -745,7 +749,7 @@ async def get_signal_parent(
 )
 async def get_signal_technical_details(
     signal_id: UUID,
-    session: DbSession,
+    session: ReadOnlySession,
 ) -> SignalTechnicalDetails:
     """Get technical details for a specific signal.
 
@@ -782,6 +786,7 @@ async def get_signal_technical_details(
     details = await hydrator.get_technical_details(
         signal.canonical_node_id,
         entity_dimensions_hash=signal.entity_dimensions_hash,
+        session=session,
     )
 
     if details is None:
@@ -12,11 +12,11 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models import User
-from src.db.session import get_async_db_session
+from src.db.session import get_async_read_session
 
 router = APIRouter(prefix="/users", tags=["users"])
 
-DbSession = Annotated[AsyncSession, Depends(get_async_db_session)]
+ReadOnlySession = Annotated[AsyncSession, Depends(get_async_read_session)]
 
 
 class UserResponse(BaseModel):
@@ -38,7 +38,7 @@ class UserResponse(BaseModel):
 
 
 @router.get("", response_model=list[UserResponse])
-async def list_users(session: DbSession) -> list[UserResponse]:
+async def list_users(session: ReadOnlySession) -> list[UserResponse]:
     """List all users available for assignment.
 
     Returns:
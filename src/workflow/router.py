@@ -24,7 +24,7 @@ from src.db.models import (
     Signal,
     User,
 )
-from src.db.session import get_async_db_session
+from src.db.session import get_async_db_session, get_async_read_session
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +36,7 @@ router = APIRouter(prefix="/signals", tags=["workflow"])
 # =============================================================================
 
 DbSession = Annotated[AsyncSession, Depends(get_async_db_session)]
+ReadOnlySession = Annotated[AsyncSession, Depends(get_async_read_session)]
 
 
 # =============================================================================
@@ -376,7 +377,7 @@ async def update_signal_status(
 @router.get("/{signal_id}/assignment", response_model=AssignmentResponse)
 async def get_signal_assignment(
     signal_id: UUID,
-    session: DbSession,
+    session: ReadOnlySession,
 ) -> AssignmentResponse:
     """Get the current assignment for a signal.
 
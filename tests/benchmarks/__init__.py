@@ -0,0 +1 @@
+"""CPU-bound benchmarks (pytest-benchmark)."""
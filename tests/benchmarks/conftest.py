@@ -0,0 +1,339 @@
+"""Generated fixtures for the CPU-bound benchmarks.
+
+Benchmarks are skipped in the regular suite and run when tests/benchmarks
+(or a file in it) is passed explicitly, or with --benchmark-only:
+
+    uv run pytest tests/benchmarks --benchmark-autosave
+    uv run pytest tests/benchmarks --benchmark-compare --benchmark-compare-fail=mean:20%
+
+Fixtures are generated once per session from fixed seeds, so saved results
+are comparable between runs.
+"""
+
+import json
+import random
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from src.benchmarks.synthetic_data import SIGNAL_COLUMNS, SyntheticDataGenerator
+from src.db.models import Assignment, AssignmentStatus, Signal, SignalDomain
+
+BENCHMARK_DIR = Path(__file__).parent
+
+HYDRATOR_ROWS = 100_000
+RESPONSE_SIGNALS = 1_000
+CONTRIBUTION_ROWS = 10_000
+NARRATIVE_ROWS = 2_000
+DOT_NODES = 10_000
+RESULTS_ENTITIES = 200_000
+NODE_ENTITIES = 2_000
+
+NOW = datetime(2026, 1, 15, tzinfo=UTC)
+PERIODS = [f"2025{month:02d}" for month in range(1, 13)]
+ANOMALY_LEVELS = ["normal", "slightly", "moderately", "very", "extremely"]
+
+
+def _targets_benchmarks(config: pytest.Config) -> bool:
+    """Whether the command line selects benchmark files."""
+    for arg in config.args:
+        path = Path(arg.split("::")[0]).resolve()
+        if path == BENCHMARK_DIR or BENCHMARK_DIR in path.parents:
+            return True
+    return False
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip benchmarks unless they were selected explicitly."""
+    if _targets_benchmarks(config) or config.getoption("benchmark_only", default=False):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run with `pytest tests/benchmarks`")
+    for item in items:
+        if BENCHMARK_DIR in item.path.parents:
+            item.add_marker(skip)
+
+
+# =============================================================================
+# Signals
+# =============================================================================
+
+
+@pytest.fixture(scope="session")
+def fct_signal_rows() -> list[dict[str, Any]]:
+    """fct_signals rows as returned by the hydrator's query."""
+    generator = SyntheticDataGenerator(HYDRATOR_ROWS, seed=0, now=NOW)
+    rows = []
+    for batch in generator.batches():
+        for values in batch.signals:
+            row = dict(zip(SIGNAL_COLUMNS, values, strict=True))
+            row["domain"] = str(row["domain"]).title()
+            row["entity_dimensions"] = json.loads(row["entity_dimensions"])
+            row["metric_trend_timeline"] = json.loads(row["metric_trend_timeline"])
+            row["simplified_severity_range"] = json.loads(row["simplified_severity_range"])
+            rows.append(row)
+    return rows
+
+
+@pytest.fixture(scope="session")
+def signal_models(fct_signal_rows: list[dict[str, Any]]) -> list[Signal]:
+    """Signal ORM instances with timelines, percentile trends and assignments."""
+    statuses = list(AssignmentStatus)
+    peer_percentile_trends = {
+        "periods": PERIODS,
+        **{
+            name: [round(base + 0.01 * i, 4) for i in range(len(PERIODS))]
+            for name, base in (("p10", 0.8), ("p25", 0.9), ("p50", 1.0), ("p75", 1.1), ("p90", 1.2))
+        },
+        "sample_sizes": [400] * len(PERIODS),
+    }
+    signals = []
+    for index, row in enumerate(fct_signal_rows[:RESPONSE_SIGNALS]):
+        signal = Signal(
+            **{key: value for key, value in row.items() if key not in ("domain", "simplified_severity_range")},
+            domain=SignalDomain[row["domain"].upper()],
+            created_at=NOW,
+            peer_percentile_trends=peer_percentile_trends,
+            metadata_={"source": "benchmark"},
+        )
+        signal.assignment = Assignment(id=uuid4(), signal_id=row["id"], status=statuses[index % len(statuses)]) if index % 3 == 0 else None
+        signals.append(signal)
+    return signals
+
+
+# =============================================================================
+# Contributions and narratives
+# =============================================================================
+
+
+@pytest.fixture(scope="session")
+def fct_contribution_rows() -> list[dict[str, Any]]:
+    """fct_contributions rows for one parent with many children."""
+    rng = random.Random(0)
+    rows = []
+    for index in range(CONTRIBUTION_ROWS):
+        child_value = round(rng.uniform(0.5, 2.0), 4)
+        weight_share = rng.uniform(0.0, 0.1)
+        rows.append(
+            {
+                "parent_node_id": "losIndex__medicareId__aggregate_time_period",
+                "child_node_id": "losIndex__medicareId__vizientServiceLine__aggregate_time_period",
+                "parent_facility_id": "FAC001",
+                "parent_service_line": None,
+                "child_facility_id": "FAC001",
+                "child_service_line": f"Service Line {index % 40}",
+                "child_sub_service_line": f"Sub Service Line {index}" if index % 2 else None,
+                "metric_id": "losIndex",
+                "contribution_method": "weighted_mean",
+                "child_value": child_value,
+                "parent_value": 1.08,
+                "weight_field": "encounters",
+                "weight_value": rng.randint(10, 5000),
+                "weight_share": weight_share,
+                "excess_over_parent": round(child_value - 1.08, 4),
+                "contribution_pct": round(weight_share * 100, 2),
+            }
+        )
+    return rows
+
+
+def _drivers_table(rng: random.Random, sign: str) -> str:
+    """Drivers table with NARRATIVE_ROWS rows."""
+    lines = [
+        "| Rank | Dimension | Segment | LOS Index (Agg) | Weight | Excess (Agg) | Trend (12mo) | Slope %ile | Mean Z (12mo) | Z (Agg) | Peer Status | Multi-KPI | Interpretation |",
+        "|------|------|------|------|------|------|------|------|------|------|------|------|------|",
+    ]
+    for rank in range(1, NARRATIVE_ROWS + 1):
+        lines.append(
+            f"| {rank} | Dimension {rank % 12} | Segment {rank} | {rng.uniform(0.5, 5):.3f} | {rng.uniform(0, 20):.1f}% | {sign}{rng.uniform(0, 0.5):.4f} "
+            f"| ↑ -{rng.randint(0, 99)}% | {rng.randint(1, 99)} | {rng.uniform(-2, 2):+.2f} | {rng.uniform(-2, 2):+.2f} | moderately high | - "
+            f"| {rng.randint(1, 400)}% above avg; [Cum:{min(rank, 100)}%] |"
+        )
+    return "\n".join(lines)
+
+
+@pytest.fixture(scope="session")
+def narrative_markdown() -> str:
+    """Contribution narrative with large driver, insight and hierarchy sections."""
+    rng = random.Random(0)
+    pareto_bars = "\n".join(f"▓▓▓▓░░░░░░░░░░░░░░░░░░░░░░░░░░   {i / 10:.1f}% | Segment {i} (+{rng.uniform(0, 0.5):.4f})" for i in range(1, NARRATIVE_ROWS + 1))
+    insights = "\n".join(f"  - **Segment {i}**: excess +{rng.uniform(0, 0.5):.4f}, z=+{rng.uniform(1, 3):.2f} (moderately high)" for i in range(NARRATIVE_ROWS))
+    hierarchy_rows = []
+    for i in range(NARRATIVE_ROWS):
+        cells = [
+            f"Segment {i}",
+            f"{rng.uniform(0.5, 5):.3f}",
+            f"{rng.uniform(0, 100):.1f}%",
+            f"{rng.uniform(-2, 2):+.4f}",
+            f"{rng.uniform(-2, 2):+.2f}",
+            "moderately high",
+            "12% longer",
+        ]
+        # Every tenth row is a service line; the rows after it are its sub-service lines
+        row = ["**SL**", *(f"**{cell}**" for cell in cells)] if i % 10 == 0 else ["└─ SSL", *cells]
+        hierarchy_rows.append(f"| {' | '.join(row)} |")
+    hierarchy = "\n".join(hierarchy_rows)
+    cross_metric = "\n".join(f"| Metric {i} | {rng.uniform(0, 30):.3f} | {rng.uniform(-2, 2):+.2f} | slightly high |" for i in range(100))
+    return f"""# Contribution Analysis: Medicare ID AFP658
+
+**Facility LOS Index**: 1.1668
+**Generated**: 2025-12-13 16:46:14 UTC
+
+---
+
+## Executive Summary
+
+- **Facility LOS Index**: 1.1668
+- **Total segments analyzed**: {NARRATIVE_ROWS} (69 facility-level)
+- **Pareto Insight**: Top 5 positive-excess segments account for 44% of total excess
+
+**Top contributors to HIGHER LOS** (worse performance):
+  - [Discharge] Skilled nursing facility: +0.3117, - -79%
+  - [Payer] Unknown: +0.1634, ↑ -91%
+
+**Top contributors to LOWER LOS** (better performance):
+  - [Payer] Medicaid: -0.2593, ↑ +2%
+
+## Cross-Metric Peer Comparison
+
+| Metric | Value | Z-Score | Peer Status |
+|--------|-------|---------|-------------|
+{cross_metric}
+
+## Pareto Analysis: Cumulative Impact
+
+### Segments Adding to LOS Index (Positive Excess)
+
+```
+{pareto_bars}
+
+                                      [Top 5 = 44% of total positive excess]
+```
+
+## Top Drivers of Higher LOS (Positive Excess)
+
+{_drivers_table(rng, "+")}
+
+## Top Drivers of Lower LOS (Negative Excess)
+
+{_drivers_table(rng, "-")}
+
+## Insights: Internal vs External Comparison
+
+### ⚠️ Double Trouble (High Excess + Unusual vs Peers)
+
+These segments hurt your LOS Index AND are worse than peers:
+{insights}
+
+## Hierarchical Contribution Breakdown
+
+| Level | Segment | Value | Weight | Excess | Z-Score | Peer Status | Interpretation |
+|-------|---------|-------|--------|--------|---------|-------------|----------------|
+{hierarchy}
+"""
+
+
+# =============================================================================
+# Run artifacts
+# =============================================================================
+
+
+@pytest.fixture(scope="session")
+def dot_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Insight graph DOT file with DOT_NODES nodes and ~2 edges per node."""
+    rng = random.Random(0)
+    lines = ["digraph insight_graph {", "  rankdir=LR;"]
+    for index in range(DOT_NODES):
+        lines.append(
+            f'  "node{index}" [shape="box", style="rounded,filled", fillcolor="#FFFFFF", color="#696969", fontcolor="#696969", '
+            f'label="metric{index % 50}\nfacet{index % 7}\ngrain{index % 3}"];'
+        )
+    for index in range(1, DOT_NODES):
+        lines.append(f'  "node{rng.randrange(index)}" -> "node{index}" [color="#565EAA", style="dashed", penwidth="1.4", xlabel="drills_to"];')
+        lines.append(f'  "node{index}" -> "node{rng.randrange(DOT_NODES)}" [color="#999999", style="dotted", penwidth="1.0", xlabel="relates_to"];')
+    lines.append("}")
+    path = tmp_path_factory.mktemp("graph") / "graph.dot"
+    path.write_text("\n".join(lines))
+    return path
+
+
+def _entity_result(rng: random.Random, index: int, values: Any) -> dict[str, Any]:
+    """One entity result line for facility index."""
+    z_score = rng.gauss(0, 1.5)
+    level = ANOMALY_LEVELS[min(int(abs(z_score) * 2), len(ANOMALY_LEVELS) - 1)]
+    anomaly = level if level == "normal" else f"{level}_{'high' if z_score > 0 else 'low'}"
+    return {
+        "encounters": rng.randint(100, 20000),
+        "entity": [{"dataset_field": "medicareId", "id": "medicareId", "value": f"FAC{index:06d}"}],
+        "metric": [{"metadata": {"metric_id": "losIndex"}, "values": values}],
+        "statistical_methods": [
+            {
+                "statistical_method": "statistical_method__simple_zscore__aggregate_time_period",
+                "anomalies": [
+                    {
+                        "anomaly_profile": "anomaly_profiles__simple_zscore__aggregate",
+                        "methods": [
+                            {
+                                "anomaly": anomaly,
+                                "anomaly_method": "anomaly_method__simple_zscore",
+                                "applies_to": "simple_zscore",
+                                "interpretation": {"rendered": f"FAC{index:06d} LOS index is {anomaly.replace('_', ' ')}.", "template_id": "template_001"},
+                                "statistic_value": round(z_score, 4),
+                            }
+                        ],
+                    }
+                ],
+                "statistics": {
+                    "peer_mean": 1.0,
+                    "peer_std": 0.15,
+                    "percentile_rank": round(rng.uniform(0, 100), 2),
+                    "simple_zscore": round(z_score, 4),
+                    "suppressed": False,
+                },
+            }
+        ],
+    }
+
+
+def _write_node(path: Path, canonical_node_id: str, entity_results: list[dict[str, Any]], child_edges: list[dict[str, str]]) -> Path:
+    """Write a node JSONL file (metadata header, then one entity per line)."""
+    header = {"type": "node_metadata", "canonical_node_id": canonical_node_id, "canonical_child_node_ids": child_edges, "canonical_parent_node_ids": []}
+    with path.open("w") as f:
+        f.write(json.dumps(header) + "\n")
+        for entity_result in entity_results:
+            f.write(json.dumps(entity_result) + "\n")
+    return path
+
+
+@pytest.fixture(scope="session")
+def results_jsonl(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Node results JSONL with RESULTS_ENTITIES aggregate entity lines."""
+    rng = random.Random(0)
+    path = tmp_path_factory.mktemp("results") / "losIndex__medicareId__aggregate_time_period.jsonl"
+    entities = (_entity_result(rng, index, round(rng.uniform(0.5, 2.0), 4)) for index in range(RESULTS_ENTITIES))
+    return _write_node(path, "losIndex__medicareId__aggregate_time_period", list(entities), [])
+
+
+@pytest.fixture(scope="session")
+def nodes_directory(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Nodes directory with an aggregate node linked to its temporal node via trends_to."""
+    rng = random.Random(0)
+    directory = tmp_path_factory.mktemp("nodes")
+    temporal_id = "losIndex__medicareId__dischargeMonth"
+    aggregate = [_entity_result(rng, index, round(rng.uniform(0.5, 2.0), 4)) for index in range(NODE_ENTITIES)]
+    temporal = [
+        _entity_result(
+            rng, index, {"timeline": [{"period": period, "value": round(rng.uniform(0.5, 2.0), 4), "encounters": rng.randint(10, 2000)} for period in PERIODS]}
+        )
+        for index in reversed(range(NODE_ENTITIES))
+    ]
+    _write_node(directory / f"{temporal_id}.jsonl", temporal_id, temporal, [])
+    _write_node(
+        directory / "losIndex__medicareId__aggregate_time_period.jsonl",
+        "losIndex__medicareId__aggregate_time_period",
+        aggregate,
+        [{"canonical_child_node_id": temporal_id, "edge_type": "trends_to"}],
+    )
+    return directory
@@ -0,0 +1,43 @@
+"""Benchmarks for contribution records and narrative parsing."""
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from src.services.contribution_service import ContributionService
+from src.services.narrative_service import NarrativeService
+from tests.benchmarks.conftest import CONTRIBUTION_ROWS, NARRATIVE_ROWS
+
+pytest.importorskip("pytest_benchmark")
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def test_row_to_record(benchmark: "BenchmarkFixture", fct_contribution_rows: list[dict[str, Any]]) -> None:
+    """Convert CONTRIBUTION_ROWS fct_contributions rows to records."""
+    service = ContributionService()
+
+    records = benchmark(lambda: [service._row_to_record(row) for row in fct_contribution_rows])
+
+    assert len(records) == CONTRIBUTION_ROWS
+
+
+def test_to_response(benchmark: "BenchmarkFixture", fct_contribution_rows: list[dict[str, Any]]) -> None:
+    """Convert CONTRIBUTION_ROWS records to API responses."""
+    service = ContributionService()
+    records = [service._row_to_record(row) for row in fct_contribution_rows]
+
+    responses = benchmark(lambda: [service.to_response(record) for record in records])
+
+    assert len(responses) == CONTRIBUTION_ROWS
+
+
+def test_parse_markdown(benchmark: "BenchmarkFixture", narrative_markdown: str) -> None:
+    """Parse a narrative with NARRATIVE_ROWS rows per table."""
+    service = NarrativeService()
+
+    insights = benchmark(service.parse_markdown, narrative_markdown)
+
+    assert len(insights.top_drivers.higher_los) == NARRATIVE_ROWS
+    assert sum(1 + len(node.children) for node in insights.hierarchical_breakdown) == NARRATIVE_ROWS
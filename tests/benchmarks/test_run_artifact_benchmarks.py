@@ -0,0 +1,32 @@
+"""Benchmarks for reading run artifacts (DOT graphs and node results)."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.runs.services.dot_parser import DotParserService
+from src.runs.services.results_reader import ResultsReaderService
+from tests.benchmarks.conftest import DOT_NODES, RESULTS_ENTITIES
+
+pytest.importorskip("pytest_benchmark")
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def test_parse_dot_file(benchmark: "BenchmarkFixture", dot_file: Path) -> None:
+    """Parse a DOT_NODES-node insight graph."""
+    structure = benchmark.pedantic(DotParserService().parse_file, args=(dot_file,), rounds=5, warmup_rounds=1)
+
+    assert len(structure.nodes) == DOT_NODES
+    assert len(structure.edges) == 2 * (DOT_NODES - 1)
+
+
+@pytest.mark.parametrize("offset", [0, RESULTS_ENTITIES - 50], ids=["first_page", "last_page"])
+def test_read_results_page(benchmark: "BenchmarkFixture", results_jsonl: Path, offset: int) -> None:
+    """Read one page of a RESULTS_ENTITIES-entity results file."""
+    page = benchmark.pedantic(ResultsReaderService().read_results, args=(results_jsonl, offset, 50), rounds=5, warmup_rounds=1)
+
+    assert page.total_count == RESULTS_ENTITIES
+    assert len(page.results) == 50
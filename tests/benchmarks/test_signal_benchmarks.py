@@ -0,0 +1,44 @@
+"""Benchmarks for signal hydration, response conversion and node parsing."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from src.db.models import Signal
+from src.services.signal_generator import SignalGenerator
+from src.services.signal_hydrator import SignalHydrator
+from src.signals.router import _signal_to_response
+from tests.benchmarks.conftest import HYDRATOR_ROWS, NODE_ENTITIES, RESPONSE_SIGNALS
+
+pytest.importorskip("pytest_benchmark")
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def test_prepare_signal_records(benchmark: "BenchmarkFixture", fct_signal_rows: list[dict[str, Any]]) -> None:
+    """Prepare HYDRATOR_ROWS fct_signals rows for the bulk upsert."""
+    hydrator = SignalHydrator()
+
+    records = benchmark.pedantic(lambda: [hydrator._prepare_signal_record(row) for row in fct_signal_rows], rounds=5, warmup_rounds=1)
+
+    assert len(records) == HYDRATOR_ROWS
+
+
+def test_signal_to_response(benchmark: "BenchmarkFixture", signal_models: list[Signal]) -> None:
+    """Convert a page of RESPONSE_SIGNALS signals to API responses."""
+    responses = benchmark(lambda: [_signal_to_response(signal, has_children=True, edge_types=["drills_to"]) for signal in signal_models])
+
+    assert len(responses) == RESPONSE_SIGNALS
+    assert responses[0].metric_trend_timeline is not None
+
+
+def test_parse_node_results_with_temporal_node(benchmark: "BenchmarkFixture", nodes_directory: Path) -> None:
+    """Parse an aggregate node and look up its entities in the linked temporal node."""
+    path = nodes_directory / "losIndex__medicareId__aggregate_time_period.jsonl"
+
+    signals = benchmark.pedantic(lambda: SignalGenerator(nodes_directory=nodes_directory).parse_node_results(path), rounds=3, warmup_rounds=1)
+
+    assert 0 < len(signals) < NODE_ENTITIES
+    assert all(signal.monthly_z_scores for signal in signals)
@@ -0,0 +1,83 @@
+"""Tests for database session dependencies and per-route transaction policy."""
+
+import os
+from unittest.mock import patch
+
+from fastapi.routing import APIRoute
+
+from src.config import Settings
+from src.db.session import engine, engine_options, get_async_db_session, get_async_read_session, pool_usage, read_engine
+
+
+def _route_dependencies(route: APIRoute) -> set[object]:
+    """Return the dependency callables of a route."""
+    return {dependency.call for dependency in route.dependant.dependencies}
+
+
+def test_read_engine_is_read_only() -> None:
+    """Read sessions open READ ONLY transactions."""
+    assert read_engine.get_execution_options()["postgresql_readonly"] is True
+    assert "postgresql_readonly" not in engine.get_execution_options()
+
+
+def test_read_engine_shares_primary_pool_without_replica() -> None:
+    """Without a replica URL the read engine uses the primary pool."""
+    assert read_engine.sync_engine.pool is engine.sync_engine.pool
+
+
+def test_get_routes_use_read_only_sessions() -> None:
+    """GET endpoints use the read-only session; writes keep the read-write one."""
+    from src.activity.router import router as activity_router
+    from src.signals.router import router as signals_router
+    from src.users.router import router as users_router
+    from src.workflow.router import router as workflow_router
+
+    routes = [r for router in (signals_router, activity_router, users_router, workflow_router) for r in router.routes if isinstance(r, APIRoute)]
+    assert routes
+
+    for route in routes:
+        dependencies = _route_dependencies(route)
+        if route.methods == {"GET"}:
+            assert get_async_db_session not in dependencies, route.path
+            assert get_async_read_session in dependencies, route.path
+        else:
+            assert get_async_read_session not in dependencies, route.path
+
+
+def test_pool_usage_reports_primary_pool() -> None:
+    """Pool usage has gauges for the primary pool and nothing checked out at rest."""
+    usage = pool_usage()
+    assert set(usage) == {"primary"}
+    assert set(usage["primary"]) == {"size", "checked_out", "checked_in", "overflow"}
+    assert usage["primary"]["checked_out"] == 0
+
+
+def test_engine_options_from_settings() -> None:
+    """Pool and connection options come from the DB_* settings."""
+    env = {"DB_POOL_SIZE": "20", "DB_MAX_OVERFLOW": "0", "DB_POOL_PRE_PING": "false", "DB_STATEMENT_TIMEOUT_MS": "5000"}
+    with patch.dict(os.environ, env, clear=True):
+        options = engine_options(Settings())
+
+    assert options["pool_size"] == 20
+    assert options["max_overflow"] == 0
+    assert options["pool_pre_ping"] is False
+    assert options["connect_args"]["prepared_statement_cache_size"] == 100
+    assert options["connect_args"]["server_settings"] == {"statement_timeout": "5000"}
+
+
+def test_engine_options_pgbouncer_disables_statement_caches() -> None:
+    """PgBouncer mode disables statement caches and uses unique statement names."""
+    with patch.dict(os.environ, {"DB_PGBOUNCER": "true", "DB_STATEMENT_TIMEOUT_MS": "5000"}, clear=True):
+        connect_args = engine_options(Settings())["connect_args"]
+
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    assert connect_args["prepared_statement_name_func"]() != connect_args["prepared_statement_name_func"]()
+    assert "statement_timeout" not in connect_args["server_settings"]
+
+
+def test_engine_uses_configured_pool_size() -> None:
+    """The application engine's pool is sized from settings."""
+    from src.config import settings
+
+    assert engine.sync_engine.pool.size() == settings.DB_POOL_SIZE  # type: ignore[attr-defined]
@@ -174,3 +174,63 @@ class TestGetGraphStructure:
             assert "id" in node
             assert "label" in node
             assert "shape" in node
+
+
+class TestGraphStructureCaching:
+    """Tests for ETag handling on the graph structure endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_graph_structure_etag_not_modified(self, client: AsyncClient) -> None:
+        """Test a matching If-None-Match returns 304 without a body."""
+        runs_response = await client.get("/api/runs/graphs/test_minimal/runs")
+        if runs_response.status_code != 200 or not runs_response.json()["runs"]:
+            pytest.skip("No test runs available")
+
+        run_id = runs_response.json()["runs"][0]["run_id"]
+        response = await client.get(f"/api/runs/graphs/test_minimal/runs/{run_id}/graph")
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        cached = await client.get(
+            f"/api/runs/graphs/test_minimal/runs/{run_id}/graph",
+            headers={"If-None-Match": etag},
+        )
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+
+class TestGraphQueries:
+    """Tests for neighborhood, path and subgraph endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_neighborhood_and_subgraph(self, client: AsyncClient) -> None:
+        """Test graph query endpoints return vis-network structures."""
+        runs_response = await client.get("/api/runs/graphs/test_minimal/runs")
+        if runs_response.status_code != 200 or not runs_response.json()["runs"]:
+            pytest.skip("No test runs available")
+
+        run_id = runs_response.json()["runs"][0]["run_id"]
+        base = f"/api/runs/graphs/test_minimal/runs/{run_id}/graph"
+        full = (await client.get(base)).json()
+        if not full["nodes"]:
+            pytest.skip("No graph available")
+
+        node_id = full["nodes"][0]["id"]
+        neighborhood = await client.get(f"{base}/neighborhood/{node_id}", params={"depth": 1})
+        assert neighborhood.status_code == 200
+        assert node_id in {n["id"] for n in neighborhood.json()["nodes"]}
+
+        subgraph = await client.get(f"{base}/subgraph", params={"edge_type": "trends_to"})
+        assert subgraph.status_code == 200
+        assert all(e["label"] == "trends_to" for e in subgraph.json()["edges"])
+
+    @pytest.mark.asyncio
+    async def test_neighborhood_unknown_node(self, client: AsyncClient) -> None:
+        """Test unknown node returns 404."""
+        runs_response = await client.get("/api/runs/graphs/test_minimal/runs")
+        if runs_response.status_code != 200 or not runs_response.json()["runs"]:
+            pytest.skip("No test runs available")
+
+        run_id = runs_response.json()["runs"][0]["run_id"]
+        response = await client.get(f"/api/runs/graphs/test_minimal/runs/{run_id}/graph/neighborhood/missing_node")
+        assert response.status_code == 404
@@ -21,10 +21,11 @@ import os
 import time
 
 import pytest
-from sqlalchemy import text
+from sqlalchemy import Column, MetaData, Table, insert, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from src.services.signal_hydrator import SignalHydrator
+from src.db.models import Signal
+from src.services.signal_hydrator import SIGNAL_PROJECTION_COLUMNS, SignalHydrator
 
 logger = logging.getLogger(__name__)
 
@@ -463,3 +464,55 @@ class TestDataQuality:
 
         for signal in signals[:100]:  # Check first 100
             assert signal.get("canonical_node_id") is not None, "canonical_node_id is null"
+
+
+# =============================================================================
+# In-Database Hydration Parity Tests
+# =============================================================================
+
+
+class TestInDatabaseHydrationParity:
+    """Tests that in-database hydration writes the same rows as the Python path."""
+
+    @pytest.mark.asyncio
+    async def test_projection_matches_python_records(self, db_session: AsyncSession, session_maker) -> None:
+        """Test SIGNAL_PROJECTION_QUERY stores the same rows as _prepare_signal_record.
+
+        Both paths write one facility's signals into temporary copies of the
+        signals columns (Python records through SQLAlchemy's Core insert, the
+        projection through INSERT ... SELECT), and the tables are compared
+        with EXCEPT in both directions, so type coercion, numeric rounding and
+        JSONB null handling are compared as stored.
+        """
+        try:
+            row = (await db_session.execute(text("SELECT facility_id FROM public_marts.fct_signals WHERE facility_id IS NOT NULL LIMIT 1"))).first()
+            await db_session.execute(text("SELECT NULL::signaldomain"))
+        except Exception as e:
+            pytest.skip(f"fct_signals or signals schema not available: {e}")
+        if row is None:
+            pytest.skip("fct_signals is empty")
+        facility_id = row[0]
+
+        columns = ", ".join(SIGNAL_PROJECTION_COLUMNS)
+        for table_name in ("parity_python", "parity_sql"):
+            await db_session.execute(text(f"CREATE TEMP TABLE {table_name} ON COMMIT DROP AS SELECT {columns} FROM signals WITH NO DATA"))
+
+        # Python path: same query and record mapping as hydrate_signals
+        python_hydrator = SignalHydrator(session_factory=session_maker, facility_ids=[facility_id])
+        records = [python_hydrator._prepare_signal_record(r) for r in await python_hydrator._query_fct_signals(db_session)]
+        assert records, f"No signals for facility {facility_id}"
+        signals_columns = Signal.__table__.columns
+        parity_python = Table("parity_python", MetaData(), *[Column(name, signals_columns[name].type) for name in SIGNAL_PROJECTION_COLUMNS])
+        await db_session.execute(insert(parity_python).values(records))
+
+        # In-database path: the projection used by each hydration chunk
+        sql_hydrator = SignalHydrator(session_factory=session_maker, in_database=True)
+        projection, params = sql_hydrator._in_database_query(facility_id, chunked=True)
+        await db_session.execute(text(f"INSERT INTO parity_sql ({columns}) {projection}"), params)
+
+        python_only = (await db_session.execute(text("SELECT * FROM parity_python EXCEPT ALL SELECT * FROM parity_sql"))).fetchall()
+        sql_only = (await db_session.execute(text("SELECT * FROM parity_sql EXCEPT ALL SELECT * FROM parity_python"))).fetchall()
+        await db_session.rollback()
+
+        assert not python_only, f"{len(python_only)} rows only produced by the Python path, e.g. {python_only[0]}"
+        assert not sql_only, f"{len(sql_only)} rows only produced in the database, e.g. {sql_only[0]}"
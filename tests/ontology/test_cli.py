@@ -60,6 +60,23 @@ class TestSyncCommand:
 
             assert result.exit_code == 0
 
+    def test_sync_batch_size_and_progress(self, runner: CliRunner) -> None:
+        """Batch size and progress callback should be passed to the sync."""
+        with patch("src.ontology.cli._run_sync", new_callable=AsyncMock) as mock_sync:
+            mock_sync.return_value = {"signals": {"created": 0, "skipped": 0}}
+            result = runner.invoke(cli, ["sync", "--batch-size", "250", "--progress"])
+
+            assert result.exit_code == 0
+            batch_size, progress = mock_sync.call_args.args
+            assert batch_size == 250
+            assert progress is not None
+
+    def test_sync_rejects_zero_batch_size(self, runner: CliRunner) -> None:
+        """Batch size must be positive."""
+        result = runner.invoke(cli, ["sync", "--batch-size", "0"])
+
+        assert result.exit_code != 0
+
 
 class TestDisplayStats:
     """Tests for _display_stats function."""
@@ -6,7 +6,11 @@ from src.ontology.cypher import (
     age_query_wrapper,
     build_create_edge,
     build_create_vertex,
+    build_create_vlabel_sql,
+    build_id_index_sql,
     build_match_vertex,
+    build_merge_edges,
+    build_merge_vertices,
     build_traverse,
 )
 
@@ -101,6 +105,57 @@ class TestBuildCreateEdge:
         assert "RETURN r" in cypher
 
 
+class TestBuildMergeVertices:
+    """Tests for build_merge_vertices function."""
+
+    def test_merges_on_id_and_sets_properties(self) -> None:
+        """Should UNWIND rows, MERGE on id and SET remaining properties."""
+        cypher = build_merge_vertices("Metric", [{"id": "M1", "name": "LOS"}, {"id": "M2", "domain": "Efficiency"}])
+        assert cypher.startswith("UNWIND [{id: 'M1', name: 'LOS'}, {id: 'M2', domain: 'Efficiency'}] AS row")
+        assert "MERGE (n:Metric {id: row.id})" in cypher
+        assert "SET n.name = row.name, n.domain = row.domain" in cypher
+        assert cypher.endswith("RETURN count(n)")
+
+    def test_id_only_rows_have_no_set_clause(self) -> None:
+        """Should omit SET when rows only carry id."""
+        cypher = build_merge_vertices("Facility", [{"id": "F1"}])
+        assert "SET" not in cypher
+
+    def test_escapes_values(self) -> None:
+        """Should escape quotes in row values."""
+        cypher = build_merge_vertices("Facility", [{"id": "O'Brien"}])
+        assert "{id: 'O\\'Brien'}" in cypher
+
+
+class TestBuildMergeEdges:
+    """Tests for build_merge_edges function."""
+
+    def test_merge_has_signal_edges(self) -> None:
+        """Should match both endpoints per row and MERGE the edge."""
+        cypher = build_merge_edges("Facility", "has_signal", "Signal", [("F1", "S1"), ("F1", "S2")])
+        assert "UNWIND [{from_id: 'F1', to_id: 'S1'}, {from_id: 'F1', to_id: 'S2'}] AS row" in cypher
+        assert "MATCH (a:Facility), (b:Signal) WHERE a.id = row.from_id AND b.id = row.to_id" in cypher
+        assert "MERGE (a)-[r:has_signal]->(b)" in cypher
+        assert cypher.endswith("RETURN count(r)")
+
+
+class TestBuildIdIndexSql:
+    """Tests for build_id_index_sql and build_create_vlabel_sql."""
+
+    def test_indexes_id_expression_and_properties(self) -> None:
+        """Should index the id accessor (btree) and the properties map (GIN)."""
+        btree, gin = build_id_index_sql("Signal", "g")
+        assert btree.startswith('CREATE INDEX IF NOT EXISTS "Signal_id_idx" ON g."Signal"')
+        assert "agtype_access_operator(VARIADIC ARRAY[properties, '\"id\"'::ag_catalog.agtype])" in btree
+        assert gin == 'CREATE INDEX IF NOT EXISTS "Signal_properties_gin_idx" ON g."Signal" USING gin (properties)'
+
+    def test_creates_missing_label_only(self) -> None:
+        """Should call create_vlabel guarded by an ag_label existence check."""
+        sql = build_create_vlabel_sql("Signal", "g")
+        assert sql.startswith("SELECT ag_catalog.create_vlabel('g', 'Signal') WHERE NOT EXISTS")
+        assert "g.name = 'g' AND l.name = 'Signal'" in sql
+
+
 class TestBuildMatchVertex:
     """Tests for build_match_vertex function."""
 
@@ -1,5 +1,6 @@
 """Tests for graph sync service."""
 
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -8,6 +9,45 @@ from sqlalchemy.exc import SQLAlchemyError
 from src.ontology.sync_service import GraphSyncService
 
 
+def _result(rows: list[tuple[Any, ...]]) -> MagicMock:
+    """Create a mock result returning rows from fetchall."""
+    result = MagicMock()
+    result.fetchall.return_value = rows
+    return result
+
+
+class FakeGraphSession:
+    """Async session stand-in that answers sync queries by statement type.
+
+    Relational queries are answered from ``tables`` in order, count queries
+    from ``counts`` in order, and every executed Cypher MERGE is recorded.
+    """
+
+    def __init__(self, tables: list[list[tuple[Any, ...]]], counts: list[int]) -> None:
+        self.tables = list(tables)
+        self.counts = list(counts)
+        self.merges: list[str] = []
+        self.ddl: list[str] = []
+        self.relational_params: list[dict[str, Any]] = []
+        self.commit = AsyncMock()
+
+    async def execute(self, statement: Any, params: dict[str, Any] | None = None) -> MagicMock:
+        """Answer a statement from the canned tables and counts."""
+        sql = str(statement)
+        if "MERGE" in sql:
+            self.merges.append(sql)
+            return _result([("1",)])
+        if "CREATE INDEX" in sql or "create_vlabel" in sql:
+            self.ddl.append(sql)
+            return _result([])
+        if "count(" in sql:
+            return _result([(str(self.counts.pop(0)),)])
+        if "FROM signals" in sql:
+            self.relational_params.append(params or {})
+            return _result(self.tables.pop(0))
+        return _result([])
+
+
 class TestGraphSyncService:
     """Tests for GraphSyncService class."""
 
@@ -29,80 +69,10 @@ class TestGraphSyncService:
         service = GraphSyncService(mock_session)
         assert service.session is mock_session
 
-    @pytest.mark.asyncio
-    async def test_vertex_exists_returns_true_when_found(self, service: GraphSyncService, mock_session: AsyncMock) -> None:
-        """Should return True when vertex exists."""
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = [("vertex",)]
-        mock_session.execute.return_value = mock_result
-
-        exists = await service._vertex_exists("Facility", "F1")
-        assert exists is True
-
-    @pytest.mark.asyncio
-    async def test_vertex_exists_returns_false_when_not_found(self, service: GraphSyncService, mock_session: AsyncMock) -> None:
-        """Should return False when vertex doesn't exist."""
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = []
-        mock_session.execute.return_value = mock_result
-
-        exists = await service._vertex_exists("Facility", "F1")
-        assert exists is False
-
-    @pytest.mark.asyncio
-    async def test_create_vertex_if_not_exists_requires_id(self, service: GraphSyncService) -> None:
-        """Should raise ValueError when properties missing id."""
-        with pytest.raises(ValueError, match="must include 'id'"):
-            await service._create_vertex_if_not_exists("Facility", {"name": "Test"})
-
-    @pytest.mark.asyncio
-    async def test_create_vertex_if_not_exists_creates_when_new(self, service: GraphSyncService, mock_session: AsyncMock) -> None:
-        """Should create vertex when it doesn't exist."""
-        # First call checks existence (returns empty = doesn't exist)
-        # Second call creates the vertex
-        mock_result_empty = MagicMock()
-        mock_result_empty.fetchall.return_value = []
-        mock_result_created = MagicMock()
-        mock_result_created.fetchall.return_value = [("created",)]
-        mock_session.execute.side_effect = [mock_result_empty, mock_result_created]
-
-        created = await service._create_vertex_if_not_exists("Facility", {"id": "F1", "name": "Test"})
-
-        assert created is True
-        assert mock_session.execute.call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_create_vertex_if_not_exists_skips_when_exists(self, service: GraphSyncService, mock_session: AsyncMock) -> None:
-        """Should skip creation when vertex already exists."""
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = [("vertex",)]
-        mock_session.execute.return_value = mock_result
-
-        created = await service._create_vertex_if_not_exists("Facility", {"id": "F1", "name": "Test"})
-
-        assert created is False
-        # Only one call to check existence
-        assert mock_session.execute.call_count == 1
-
-    @pytest.mark.asyncio
-    async def test_edge_exists_returns_true_when_found(self, service: GraphSyncService, mock_session: AsyncMock) -> None:
-        """Should return True when edge exists."""
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = [("edge",)]
-        mock_session.execute.return_value = mock_result
-
-        exists = await service._edge_exists("Facility", "F1", "has_signal", "Signal", "S1")
-        assert exists is True
-
-    @pytest.mark.asyncio
-    async def test_edge_exists_returns_false_when_not_found(self, service: GraphSyncService, mock_session: AsyncMock) -> None:
-        """Should return False when edge doesn't exist."""
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = []
-        mock_session.execute.return_value = mock_result
-
-        exists = await service._edge_exists("Facility", "F1", "has_signal", "Signal", "S1")
-        assert exists is False
+    def test_init_rejects_non_positive_batch_size(self, mock_session: AsyncMock) -> None:
+        """Should raise ValueError when batch_size is less than 1."""
+        with pytest.raises(ValueError, match="batch_size"):
+            GraphSyncService(mock_session, batch_size=0)
 
     @pytest.mark.asyncio
     async def test_sync_all_calls_all_sync_methods(self, service: GraphSyncService, mock_session: AsyncMock) -> None:
@@ -129,56 +99,6 @@ class TestGraphSyncService:
         assert stats["signals"]["created"] == 4
         assert stats["edges"]["created"] == 5
 
-    @pytest.mark.asyncio
-    async def test_sync_domains_queries_distinct_domains(self, service: GraphSyncService, mock_session: AsyncMock) -> None:
-        """sync_domains should query distinct domains from signals table."""
-        # First call: query domains
-        mock_domain_result = MagicMock()
-        mock_domain_result.fetchall.return_value = [("Efficiency",), ("Safety",)]
-
-        # Subsequent calls: check existence and create
-        mock_empty_result = MagicMock()
-        mock_empty_result.fetchall.return_value = []
-        mock_created_result = MagicMock()
-        mock_created_result.fetchall.return_value = [("created",)]
-
-        mock_session.execute.side_effect = [
-            mock_domain_result,
-            mock_empty_result,
-            mock_created_result,
-            mock_empty_result,
-            mock_created_result,
-        ]
-
-        stats = await service.sync_domains()
-
-        assert stats["created"] == 2
-        assert stats["skipped"] == 0
-
-    @pytest.mark.asyncio
-    async def test_sync_facilities_queries_distinct_facilities(self, service: GraphSyncService, mock_session: AsyncMock) -> None:
-        """sync_facilities should query distinct facility_ids from signals table."""
-        # First call: query facilities
-        mock_facility_result = MagicMock()
-        mock_facility_result.fetchall.return_value = [("FAC001",)]
-
-        # Subsequent calls: check existence and create
-        mock_empty_result = MagicMock()
-        mock_empty_result.fetchall.return_value = []
-        mock_created_result = MagicMock()
-        mock_created_result.fetchall.return_value = [("created",)]
-
-        mock_session.execute.side_effect = [
-            mock_facility_result,
-            mock_empty_result,
-            mock_created_result,
-        ]
-
-        stats = await service.sync_facilities()
-
-        assert stats["created"] == 1
-        assert stats["skipped"] == 0
-
     @pytest.mark.asyncio
     async def test_sync_returns_stats_with_created_and_skipped(self, service: GraphSyncService, mock_session: AsyncMock) -> None:
         """All sync methods should return stats with created and skipped counts."""
@@ -201,6 +121,83 @@ class TestGraphSyncService:
     async def test_execute_cypher_handles_database_error(self, service: GraphSyncService, mock_session: AsyncMock) -> None:
         """Should raise RuntimeError when query fails."""
         mock_session.execute.side_effect = SQLAlchemyError("connection lost")
+        service._age_loaded = True
 
         with pytest.raises(RuntimeError, match="Graph query failed"):
             await service._execute_cypher("MATCH (n) RETURN n")
+
+
+class TestBulkSync:
+    """Tests for batched UNWIND/MERGE sync."""
+
+    @pytest.mark.asyncio
+    async def test_sync_domains_merges_in_batches(self) -> None:
+        """Domains should be merged batch_size rows per statement."""
+        session = FakeGraphSession(tables=[[("Efficiency",), ("Safety",), ("Quality",)]], counts=[1, 3])
+        service = GraphSyncService(session, batch_size=2)  # type: ignore[arg-type]
+
+        stats = await service.sync_domains()
+
+        assert len(session.merges) == 2
+        assert "MERGE (n:Domain {id: row.id})" in session.merges[0]
+        assert "'Quality'" in session.merges[1]
+        assert stats == {"created": 2, "skipped": 1}
+
+    @pytest.mark.asyncio
+    async def test_id_indexes_are_created_once_before_merging(self) -> None:
+        """Every synced label gets its id indexes before the first MERGE, once per service."""
+        domains = [("Efficiency",)]
+        session = FakeGraphSession(tables=[domains, domains], counts=[0, 1, 1, 1])
+        service = GraphSyncService(session)  # type: ignore[arg-type]
+
+        await service.sync_domains()
+        await service.sync_domains()
+
+        assert len(session.ddl) == 3 * 4
+        assert sum("Signal_id_idx" in sql for sql in session.ddl) == 1
+        assert sum("create_vlabel('healthcare_ontology', 'Facility')" in sql for sql in session.ddl) == 1
+
+    @pytest.mark.asyncio
+    async def test_sync_facilities_without_rows_skips_merge(self) -> None:
+        """No MERGE should run when there are no facilities."""
+        session = FakeGraphSession(tables=[[]], counts=[4])
+        service = GraphSyncService(session)  # type: ignore[arg-type]
+
+        stats = await service.sync_facilities()
+
+        assert session.merges == []
+        assert stats == {"created": 0, "skipped": 0}
+
+    @pytest.mark.asyncio
+    async def test_sync_signals_pages_all_rows(self) -> None:
+        """Signals should be read with keyset pagination, not capped."""
+        page_one = [("s1", "mortality", "high", None), ("s2", None, None, None)]
+        page_two = [("s3", "los", "low", None)]
+        session = FakeGraphSession(tables=[page_one, page_two], counts=[0, 3])
+        progress: list[tuple[str, int]] = []
+        service = GraphSyncService(session, batch_size=2, progress=lambda e, n: progress.append((e, n)))  # type: ignore[arg-type]
+
+        stats = await service.sync_signals()
+
+        assert stats == {"created": 3, "skipped": 0}
+        assert session.relational_params == [{"limit": 2}, {"limit": 2, "after": "s2"}]
+        assert len(session.merges) == 2
+        assert "signal_type: 'mortality'" in session.merges[0]
+        assert progress == [("signals", 2), ("signals", 3)]
+
+    @pytest.mark.asyncio
+    async def test_sync_edges_merges_each_edge_label(self) -> None:
+        """Edges should be merged per label and counted from label totals."""
+        signals = [("s1", "F1", "M1"), ("s2", "F1", "M2")]
+        metric_domains = [("M1", "Efficiency")]
+        # before: has_signal, measures, belongs_to; after: same order
+        session = FakeGraphSession(tables=[signals, metric_domains], counts=[0, 1, 0, 2, 2, 1])
+        service = GraphSyncService(session)  # type: ignore[arg-type]
+
+        stats = await service.sync_edges()
+
+        assert len(session.merges) == 3
+        assert "MERGE (a)-[r:has_signal]->(b)" in session.merges[0]
+        assert "MERGE (a)-[r:measures]->(b)" in session.merges[1]
+        assert "MERGE (a)-[r:belongs_to]->(b)" in session.merges[2]
+        assert stats == {"created": 4, "skipped": 1}
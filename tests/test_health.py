@@ -28,3 +28,15 @@ async def test_health_check_version(client: AsyncClient) -> None:
     response = await client.get("/health")
     data = response.json()
     assert data["version"] == "0.1.0"
+
+
+@pytest.mark.asyncio
+async def test_pool_health(client: AsyncClient) -> None:
+    """Test that the pool endpoint reports connection pool gauges.
+
+    Args:
+        client: Async test client fixture.
+    """
+    response = await client.get("/health/pool")
+    assert response.status_code == 200
+    assert "checked_out" in response.json()["primary"]
@@ -0,0 +1,152 @@
+"""Tests for the synthetic benchmark dataset and the load driver."""
+
+from collections import Counter
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from src.benchmarks.load_driver import Scenario, ScenarioResult, compare_reports, load_report, run_scenarios, save_report
+from src.benchmarks.synthetic_data import (
+    ASSIGNMENT_COLUMNS,
+    EVENT_COLUMNS,
+    SIGNAL_COLUMNS,
+    SIGNAL_TYPES,
+    SyntheticDataGenerator,
+    asyncpg_dsn,
+)
+from src.db.models import ActivityEvent, Assignment, Signal
+
+NOW = datetime(2026, 1, 15, tzinfo=UTC)
+
+
+def _signals(generator: SyntheticDataGenerator, batch_size: int = 1000) -> list[dict[str, object]]:
+    """Generate all signals as dicts keyed by column."""
+    return [dict(zip(SIGNAL_COLUMNS, row, strict=True)) for batch in generator.batches(batch_size) for row in batch.signals]
+
+
+class TestSyntheticDataGenerator:
+    """Tests for the generated dataset."""
+
+    def test_columns_exist_on_models(self) -> None:
+        """COPY column lists match the ORM tables."""
+        assert set(SIGNAL_COLUMNS) <= set(Signal.__table__.columns.keys())
+        assert set(ASSIGNMENT_COLUMNS) <= set(Assignment.__table__.columns.keys())
+        assert set(EVENT_COLUMNS) <= set(ActivityEvent.__table__.columns.keys())
+
+    def test_generates_requested_count_deterministically(self) -> None:
+        """Equal seeds give identical data in any batch size; other seeds differ."""
+        first = _signals(SyntheticDataGenerator(2500, seed=7, now=NOW), batch_size=1000)
+        again = _signals(SyntheticDataGenerator(2500, seed=7, now=NOW), batch_size=1000)
+        other = _signals(SyntheticDataGenerator(2500, seed=8, now=NOW), batch_size=1000)
+
+        assert len(first) == 2500
+        assert first == again
+        assert first != other
+
+    def test_rows_are_unique_and_valid(self) -> None:
+        """Signal keys are unique, severities fall in their type's band and timelines cover 12 months."""
+        signals = _signals(SyntheticDataGenerator(2000, seed=1, now=NOW))
+
+        keys = {(s["canonical_node_id"], s["metric_id"], s["facility_id"], s["entity_dimensions_hash"], s["detected_at"]) for s in signals}
+        assert len(keys) == len({s["id"] for s in signals}) == 2000
+        for signal in signals:
+            low, high = SIGNAL_TYPES[str(signal["simplified_signal_type"])][1]
+            assert low <= signal["simplified_severity"] <= high  # type: ignore[operator]
+            assert signal["domain"] in ("EFFICIENCY", "SAFETY", "EFFECTIVENESS")
+            assert signal["detected_at"] <= NOW  # type: ignore[operator]
+        assert str(signals[0]["metric_trend_timeline"]).count('"period"') == 12
+
+    def test_distributions_are_skewed(self) -> None:
+        """Facilities are long-tailed and roughly assignment_rate of signals are assigned."""
+        generator = SyntheticDataGenerator(20000, seed=3, assignment_rate=0.3, now=NOW)
+        batches = list(generator.batches(5000))
+        facility_counts = Counter(row[5] for batch in batches for row in batch.signals)
+        assignments = sum(len(batch.assignments) for batch in batches)
+        events = sum(len(batch.events) for batch in batches)
+
+        assert len(generator.facilities) == 40
+        assert facility_counts.most_common(1)[0][1] > 5 * min(facility_counts.values())
+        assert 0.27 < assignments / 20000 < 0.33
+        assert events > 20000 + assignments
+
+    def test_users_are_namespaced_by_seed(self) -> None:
+        """Generated users of different seeds never share an email."""
+        emails = {row[1] for row in SyntheticDataGenerator(10, seed=1, users=5).users()}
+
+        assert len(emails) == 5
+        assert emails.isdisjoint(row[1] for row in SyntheticDataGenerator(10, seed=2, users=5).users())
+
+    def test_asyncpg_dsn(self) -> None:
+        """The SQLAlchemy driver suffix is removed for asyncpg."""
+        assert asyncpg_dsn("postgresql+asyncpg://u:p@db:5432/qc") == "postgresql://u:p@db:5432/qc"
+
+
+class TestLoadDriver:
+    """Tests for scenario runs and baseline comparison."""
+
+    @pytest.fixture
+    def app(self) -> FastAPI:
+        """Minimal API with the endpoints the scenarios call."""
+        app = FastAPI()
+
+        @app.get("/api/signals")
+        async def list_signals() -> dict[str, object]:
+            return {"signals": [{"id": "a"}, {"id": "b"}]}
+
+        @app.get("/api/signals/{signal_id}/assignment")
+        async def assignment(signal_id: str) -> dict[str, str]:
+            if signal_id == "b":
+                raise HTTPException(status_code=404)
+            return {"signal_id": signal_id}
+
+        @app.get("/broken")
+        async def broken() -> None:
+            raise HTTPException(status_code=500)
+
+        return app
+
+    @pytest.mark.asyncio
+    async def test_reports_percentiles_per_scenario(self, app: FastAPI) -> None:
+        """Each scenario reports throughput and percentiles; 404s for sampled signals are not errors."""
+        scenarios = [
+            Scenario("list", "/api/signals", {"limit": 25}),
+            Scenario("assignment", "/api/signals/{signal_id}/assignment"),
+            Scenario("broken", "/broken"),
+        ]
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark") as client:
+            report = await run_scenarios(client, scenarios, concurrency=4, duration=0.05, warmup=0)
+
+        results = report["results"]
+        assert report["concurrency"] == 4
+        assert results["list"]["requests"] > 0
+        assert results["list"]["errors"] == 0
+        assert results["list"]["p50_ms"] <= results["list"]["p99_ms"] <= results["list"]["max_ms"]
+        assert results["assignment"]["errors"] == 0
+        assert results["broken"]["requests"] == 0
+        assert results["broken"]["errors"] > 0
+
+    def test_percentile_of_small_samples(self) -> None:
+        """Percentiles degrade gracefully on small samples and stay within the observed latencies."""
+        assert ScenarioResult("empty").percentile(95) == 0.0
+        assert ScenarioResult("one", latencies=[0.01]).percentile(95) == 10.0
+        few = ScenarioResult("few", latencies=[0.064, 0.030, 0.031])
+        assert few.percentile(50) <= few.percentile(99) <= 64.0
+
+    def test_compare_flags_regressions(self, tmp_path: Path) -> None:
+        """Latency, throughput and new errors beyond the tolerance are regressions."""
+        baseline = {"results": {"list": {"p95_ms": 10.0, "throughput": 100.0, "errors": 0}, "gone": {"p95_ms": 1.0, "throughput": 1.0, "errors": 0}}}
+        save_report(baseline, tmp_path / "baseline.json")
+        within = {"results": {"list": {"p95_ms": 11.5, "throughput": 85.0, "errors": 0}}}
+        worse = {"results": {"list": {"p95_ms": 13.0, "throughput": 70.0, "errors": 2}}}
+
+        loaded = load_report(tmp_path / "baseline.json")
+
+        assert compare_reports(loaded, within, tolerance=0.2) == []
+        assert compare_reports(loaded, worse, tolerance=0.2) == [
+            "list: p95 10.0 ms -> 13.0 ms",
+            "list: throughput 100.0 -> 70.0 req/s",
+            "list: 2 errors",
+        ]
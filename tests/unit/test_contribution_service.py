@@ -5,7 +5,10 @@ The ContributionService queries fct_contributions and transforms data into
 ContributionRecord and ContributionResponse objects for API output.
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from decimal import Decimal
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -219,6 +222,84 @@ class TestGetTopContributorsGlobal:
         assert records == []
 
 
+class _TransactionalSession:
+    """Session stand-in with PostgreSQL's aborted-transaction semantics.
+
+    A failed statement aborts the transaction, and every later statement
+    fails, until it is rolled back to a savepoint.
+    """
+
+    def __init__(self, result: MagicMock, failing_sql: str) -> None:
+        self.result = result
+        self.failing_sql = failing_sql
+        self.aborted = False
+        self.savepoints = 0
+        self.executed: list[str] = []
+
+    async def execute(self, statement: Any, params: dict[str, Any] | None = None) -> MagicMock:
+        if self.aborted:
+            raise RuntimeError("current transaction is aborted, commands ignored until end of transaction block")
+        self.executed.append(str(statement))
+        if self.failing_sql in str(statement):
+            self.aborted = True
+            raise RuntimeError("canceling statement due to statement timeout")
+        return self.result
+
+    @asynccontextmanager
+    async def begin_nested(self) -> AsyncIterator[None]:
+        self.savepoints += 1
+        try:
+            yield
+        except Exception:
+            # ROLLBACK TO SAVEPOINT
+            self.aborted = False
+            raise
+
+
+class TestSharedSession:
+    """Tests for running queries on a caller-provided session."""
+
+    @staticmethod
+    def _result(row: dict[str, object]) -> MagicMock:
+        result = MagicMock()
+        result.fetchall.return_value = [tuple(row.values())]
+        result.keys.return_value = list(row.keys())
+        return result
+
+    @pytest.mark.asyncio
+    async def test_uses_given_session_for_every_query(self, sample_fct_contribution_row: dict[str, object]) -> None:
+        """Test that all queries run on the given session in a savepoint each."""
+        session = _TransactionalSession(self._result(sample_fct_contribution_row), failing_sql="never")
+        mock_session_factory = MagicMock()
+
+        service = ContributionService(session_factory=mock_session_factory, session=session)  # type: ignore[arg-type]
+        await service.get_contributions_for_parent("losIndex__medicareId__aggregate_time_period", "TEST001")
+        await service.get_top_contributors_global(top_n=5)
+
+        assert len(session.executed) == 2
+        assert session.savepoints == 2
+        mock_session_factory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_upward_query_does_not_abort_downward_query(self, sample_fct_contribution_row: dict[str, object]) -> None:
+        """Test that a swallowed upward failure is rolled back so downward contributions still load."""
+        session = _TransactionalSession(self._result(sample_fct_contribution_row), failing_sql="WHERE child_facility_id = :child_facility_id")
+        signal = MagicMock()
+        signal.facility_id = "TEST001"
+        signal.service_line = "Cardiovascular"
+        signal.sub_service_line = None
+        signal.metric_id = "losIndex"
+        signal.canonical_node_id = "losIndex__medicareId__aggregate_time_period"
+
+        service = ContributionService(session=session)  # type: ignore[arg-type]
+        upward, downward, level = await service.get_hierarchical_contributions(signal)
+
+        assert upward is None
+        assert len(downward) == 1
+        assert level == "service_line"
+        assert not session.aborted
+
+
 class TestRowToRecord:
     """Tests for _row_to_record conversion."""
 
@@ -1,11 +1,13 @@
 """Unit tests for DotParserService."""
 
+import json
+import os
 from pathlib import Path
 from textwrap import dedent
 
 import pytest
 
-from src.runs.services.dot_parser import DotParserService
+from src.runs.services.dot_parser import VIS_JSON_FILENAME, DotParserService
 
 
 class TestDotParserService:
@@ -72,3 +74,54 @@ class TestDotParserService:
 
         assert len(result.nodes) == 0
         assert len(result.edges) == 0
+
+    def test_get_structure_cached_until_file_changes(self, dot_file: Path, sample_dot_content: str) -> None:
+        """Test parsed structures are reused until the DOT file changes."""
+        service = DotParserService()
+        first = service.get_structure(dot_file)
+
+        assert service.get_structure(dot_file) is first
+
+        dot_file.write_text(sample_dot_content.replace('"nodeA" -> "nodeB"', '"nodeB" -> "nodeA"') + "\n")
+        refreshed = service.get_structure(dot_file)
+
+        assert refreshed is not first
+        assert refreshed.edges[0].source == "nodeB"
+
+    def test_get_vis_json_matches_structure(self, dot_file: Path) -> None:
+        """Test serialized payload uses vis-network from/to edge keys."""
+        payload = DotParserService().get_vis_json(dot_file)
+        data = json.loads(payload.content)
+
+        assert {n["id"] for n in data["nodes"]} == {"nodeA", "nodeB"}
+        assert data["edges"][0]["from"] == "nodeA"
+        assert data["edges"][0]["to"] == "nodeB"
+        assert payload.etag.startswith('"')
+
+    def test_get_vis_json_prefers_precompiled(self, dot_file: Path) -> None:
+        """Test a fresh graph.vis.json is served instead of parsing."""
+        service = DotParserService()
+        vis_path = service.compile_vis_json(dot_file)
+        vis_path.write_text('{"nodes": [], "edges": []}')
+        os.utime(vis_path, ns=(dot_file.stat().st_atime_ns, dot_file.stat().st_mtime_ns + 1_000_000_000))
+
+        payload = service.get_vis_json(dot_file)
+
+        assert json.loads(payload.content) == {"nodes": [], "edges": []}
+
+    def test_get_vis_json_ignores_stale_precompiled(self, dot_file: Path) -> None:
+        """Test graph.vis.json older than the DOT file is ignored."""
+        service = DotParserService()
+        vis_path = dot_file.with_name(VIS_JSON_FILENAME)
+        vis_path.write_text('{"nodes": [], "edges": []}')
+        os.utime(vis_path, ns=(dot_file.stat().st_atime_ns, dot_file.stat().st_mtime_ns - 1_000_000_000))
+
+        payload = service.get_vis_json(dot_file)
+
+        assert len(json.loads(payload.content)["nodes"]) == 2
+
+    def test_get_vis_json_missing_file(self, tmp_path: Path) -> None:
+        """Test missing DOT file yields an empty graph payload."""
+        payload = DotParserService().get_vis_json(tmp_path / "nonexistent.dot")
+
+        assert json.loads(payload.content) == {"nodes": [], "edges": []}
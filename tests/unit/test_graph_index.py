@@ -0,0 +1,93 @@
+"""Unit tests for GraphIndex neighborhood, path and subgraph queries."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.runs.services.dot_parser import GraphStructure, VisEdge, VisNode
+from src.runs.services.graph_index import GraphIndex, get_graph_index
+
+
+def _edge(source: str, target: str, edge_type: str) -> VisEdge:
+    """Build an edge with an edge type label."""
+    return VisEdge(source=source, target=target, label=edge_type)
+
+
+class TestGraphIndex:
+    """Tests for GraphIndex queries."""
+
+    @pytest.fixture
+    def graph_index(self) -> GraphIndex:
+        """Build a small chain: a -> b -> c -> d, plus a -> x (other metric)."""
+        node_ids = ["los__a", "los__b", "los__c", "los__d", "mort__x"]
+        structure = GraphStructure(
+            nodes=[VisNode(id=n, label=n) for n in node_ids],
+            edges=[
+                _edge("los__a", "los__b", "segments_into"),
+                _edge("los__b", "los__c", "trends_to"),
+                _edge("los__c", "los__d", "segments_into"),
+                _edge("los__a", "mort__x", "potentially_driven_by"),
+            ],
+        )
+        return GraphIndex(structure)
+
+    def test_neighborhood_one_hop(self, graph_index: GraphIndex) -> None:
+        """Test 1-hop neighborhood includes direct neighbors in both directions."""
+        result = graph_index.neighborhood("los__b", depth=1)
+
+        assert {n.id for n in result.nodes} == {"los__a", "los__b", "los__c"}
+        assert {(e.source, e.target) for e in result.edges} == {("los__a", "los__b"), ("los__b", "los__c")}
+
+    def test_neighborhood_direction_and_edge_type(self, graph_index: GraphIndex) -> None:
+        """Test direction and edge type filters limit traversal."""
+        outgoing = graph_index.neighborhood("los__a", depth=3, direction="out", edge_types={"segments_into"})
+        incoming = graph_index.neighborhood("los__c", depth=5, direction="in")
+
+        assert {n.id for n in outgoing.nodes} == {"los__a", "los__b"}
+        assert {n.id for n in incoming.nodes} == {"los__a", "los__b", "los__c"}
+
+    def test_neighborhood_unknown_node(self, graph_index: GraphIndex) -> None:
+        """Test unknown center node raises KeyError."""
+        with pytest.raises(KeyError):
+            graph_index.neighborhood("missing")
+
+    def test_shortest_path(self, graph_index: GraphIndex) -> None:
+        """Test path nodes and edges are returned in order."""
+        result = graph_index.shortest_path("mort__x", "los__d")
+
+        assert result is not None
+        assert [n.id for n in result.nodes] == ["mort__x", "los__a", "los__b", "los__c", "los__d"]
+        assert len(result.edges) == 4
+
+    def test_shortest_path_directed_unreachable(self, graph_index: GraphIndex) -> None:
+        """Test directed search does not walk edges backwards."""
+        assert graph_index.shortest_path("los__d", "los__a", directed=True) is None
+
+    def test_subgraph_by_metric_and_edge_type(self, graph_index: GraphIndex) -> None:
+        """Test subgraph filters by metric prefix and edge type."""
+        by_metric = graph_index.subgraph(metric_ids={"los"})
+        by_type = graph_index.subgraph(edge_types={"segments_into"})
+
+        assert {n.id for n in by_metric.nodes} == {"los__a", "los__b", "los__c", "los__d"}
+        assert len(by_metric.edges) == 3
+        assert {n.id for n in by_type.nodes} == {"los__a", "los__b", "los__c", "los__d"}
+        assert {e.label for e in by_type.edges} == {"segments_into"}
+
+    def test_get_graph_index_from_graph_json(self, tmp_path: Path) -> None:
+        """Test runs without a DOT file fall back to graph.json."""
+        (tmp_path / "graph.json").write_text(
+            json.dumps(
+                {
+                    "nodes": [{"id": "n1", "metric_id": "m1"}, {"id": "n2", "metric_id": "m2"}],
+                    "edges": [{"source": "n1", "target": "n2", "type": "trends_to"}],
+                }
+            )
+        )
+
+        graph_index = get_graph_index(tmp_path)
+
+        assert graph_index is not None
+        assert graph_index.metric_of("n2") == "m2"
+        assert graph_index.edges[0].dashes is True
+        assert get_graph_index(tmp_path / "missing") is None
@@ -0,0 +1,46 @@
+"""Unit tests for incremental index.json parsing."""
+
+import io
+import json
+
+import pytest
+
+from src.runs.services.index_stream import IndexStreamError, iter_index
+
+SAMPLE_INDEX = {
+    "created_at": "2026-01-15T16:52:46+00:00",
+    "nodes": [
+        {"node_id": "a", "canonical_node_id": "a", "summary": {"entity_scope": {"display_name": "Facility"}}},
+        {"node_id": "b", "canonical_node_id": "b_canonical", "statistical_methods": ["m1", "m2"]},
+    ],
+    "run_id": "20260115105115",
+    "total": 12345,
+}
+
+
+class TestIterIndex:
+    """Tests for iter_index."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 65536])
+    def test_matches_json_load(self, chunk_size: int) -> None:
+        """Test streamed output matches json.load for any chunk size."""
+        text = json.dumps(SAMPLE_INDEX, indent=2)
+        items = list(iter_index(io.StringIO(text), chunk_size=chunk_size))
+
+        assert [v for k, v in items if k == "nodes"] == SAMPLE_INDEX["nodes"]
+        assert {k: v for k, v in items if k != "nodes"} == {
+            "created_at": SAMPLE_INDEX["created_at"],
+            "run_id": SAMPLE_INDEX["run_id"],
+            "total": 12345,
+        }
+
+    def test_empty_object_and_nodes(self) -> None:
+        """Test empty documents and empty nodes arrays."""
+        assert list(iter_index(io.StringIO("{}"))) == []
+        assert list(iter_index(io.StringIO('{"nodes": []}'))) == []
+
+    @pytest.mark.parametrize("text", ["not valid json{", '{"nodes": [{"a": 1}', '{"nodes": [1, 2]'])
+    def test_malformed_raises(self, text: str) -> None:
+        """Test malformed or truncated documents raise IndexStreamError."""
+        with pytest.raises(IndexStreamError):
+            list(iter_index(io.StringIO(text), chunk_size=4))
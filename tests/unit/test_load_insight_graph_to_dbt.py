@@ -0,0 +1,502 @@
+"""Unit tests for the insight graph raw loader (scripts/load_insight_graph_to_dbt.py).
+
+Tests cover:
+- COPY text-format encoding and CopyWriter flushing
+- The generator pipeline (batched, write_rows, copy_files) keeping row order
+- Parsing in worker processes: same rows as serial, bounded in-flight
+  source bytes, errors propagated
+- Flattening entity results into the typed raw_entity_results columns with
+  the semantics of the SQL stg_entity_results used to run
+"""
+
+import hashlib
+import io
+import json
+import re
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from scripts.load_insight_graph_to_dbt import (
+    RAW_ENTITY_RESULTS_COLUMNS,
+    CopyWriter,
+    LoadOptions,
+    LoadProgress,
+    _encounters,
+    batched,
+    copy_files,
+    encode_copy_row,
+    flatten_entity_result,
+    iter_entity_rows_from_jsonl,
+    jsonb_text,
+    write_rows,
+)
+
+RUN_ID = "20251210170210"
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def _entity_result(**overrides: Any) -> dict[str, Any]:
+    """Build a facility + service line entity result of an aggregate node."""
+    entity_result: dict[str, Any] = {
+        "entity": [
+            {"dataset_field": "medicareId", "id": "medicareId", "value": "AFP658"},
+            {"dataset_field": "vizientServiceLine", "id": "vizientServiceLine", "value": "Cardiology"},
+            {"dataset_field": "admissionSource", "id": "admissionSource", "value": "ED"},
+        ],
+        "metadata": {"systemName": "North Health", "encounters": 15166.0},
+        "metric": [{"metadata": {"metric_id": "losIndex"}, "values": 1.166847}],
+        "statistical_methods": [{"statistical_method": "statistical_method__simple_zscore", "anomalies": []}],
+    }
+    entity_result.update(overrides)
+    return entity_result
+
+
+def _timeline_result(timeline: Any) -> dict[str, Any]:
+    """Build an entity result of a temporal node with the given timeline."""
+    return _entity_result(metric=[{"metadata": {"metric_id": "losIndex"}, "values": {"timeline": timeline}}])
+
+
+def _decode_copy_line(line: str) -> tuple[str | None, ...]:
+    """Parse one COPY text-format line the way PostgreSQL does (for the escapes the loader emits)."""
+    assert line.endswith("\n") and "\n" not in line[:-1] and "\r" not in line
+    escapes = {"\\\\": "\\", "\\t": "\t", "\\n": "\n", "\\r": "\r"}
+    return tuple(None if field == "\\N" else re.sub(r"\\[\\tnr]", lambda m: escapes[m.group()], field) for field in line[:-1].split("\t"))
+
+
+class _FakeCursor:
+    """DBAPI cursor recording what each copy_expert call sends."""
+
+    def __init__(self, copies: list[tuple[str, str]]) -> None:
+        self._copies = copies
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def copy_expert(self, sql: str, file: io.StringIO) -> None:
+        self._copies.append((sql, file.read()))
+
+
+class _FakeConnection:
+    """Raw DBAPI connection for CopyWriter."""
+
+    def __init__(self) -> None:
+        self.copies: list[tuple[str, str]] = []
+        self.committed = self.rolled_back = self.closed = False
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self.copies)
+
+    def commit(self) -> None:
+        self.committed = True
+
+    def rollback(self) -> None:
+        self.rolled_back = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeEngine:
+    """Engine handing out one recording raw connection."""
+
+    def __init__(self) -> None:
+        self.connection = _FakeConnection()
+
+    def raw_connection(self) -> _FakeConnection:
+        return self.connection
+
+
+class _TrackedFuture(Future[Any]):
+    """Completed future that counts its task as written once its result is taken."""
+
+    def __init__(self, executor: "_InlineExecutor", task_bytes: int) -> None:
+        super().__init__()
+        self._executor = executor
+        self._task_bytes = task_bytes
+
+    def result(self, timeout: float | None = None) -> Any:
+        self._executor.in_flight_bytes -= self._task_bytes
+        return super().result(timeout)
+
+
+class _InlineExecutor(Executor):
+    """Executor running tasks at submit, tracking the source bytes not yet written."""
+
+    def __init__(self) -> None:
+        self.in_flight_bytes = 0
+        self.peak_in_flight_bytes = 0
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:
+        task_bytes = sum(path.stat().st_size for path in args[1])
+        future = _TrackedFuture(self, task_bytes)
+        future.set_result(fn(*args, **kwargs))
+        self.in_flight_bytes += task_bytes
+        self.peak_in_flight_bytes = max(self.peak_in_flight_bytes, self.in_flight_bytes)
+        return future
+
+
+def _without_loaded_at(rows: list[tuple[str | None, ...]]) -> list[tuple[str | None, ...]]:
+    """Drop the loaded_at column, which differs between loads."""
+    loaded_at = RAW_ENTITY_RESULTS_COLUMNS.index("loaded_at")
+    return [row[:loaded_at] + row[loaded_at + 1 :] for row in rows]
+
+
+def _copied_rows(engine: _FakeEngine) -> list[tuple[str | None, ...]]:
+    """Decode every row the engine received through COPY, in order."""
+    return [_decode_copy_line(line) for _, data in engine.connection.copies for line in data.splitlines(keepends=True)]
+
+
+@pytest.fixture
+def node_files(tmp_path: Path) -> list[Path]:
+    """Write a run's results/nodes directory with JSONL node files of different sizes.
+
+    Returns:
+        list[Path]: The node files, in load order.
+    """
+    nodes_directory = tmp_path / "graph" / RUN_ID / "results" / "nodes"
+    nodes_directory.mkdir(parents=True)
+    files = []
+    for node_index, entity_count in enumerate([3, 40, 1, 12]):
+        node_id = f"metric{node_index}__medicareId__aggregate"
+        lines = [json.dumps({"type": "node_metadata", "canonical_node_id": node_id})]
+        lines += [json.dumps(_entity_result(entity=[{"id": "medicareId", "value": f"F{node_index:02d}{i:03d}"}])) for i in range(entity_count)]
+        path = nodes_directory / f"{node_id}.jsonl"
+        path.write_text("\n".join(lines) + "\n")
+        files.append(path)
+    return files
+
+
+def _copy_entity_files(engine: _FakeEngine, files: list[Path], options: LoadOptions) -> int:
+    """Copy raw_entity_results rows of JSONL node files into the fake engine."""
+    return copy_files(engine, "raw_entity_results", RAW_ENTITY_RESULTS_COLUMNS, iter_entity_rows_from_jsonl, files, RUN_ID, options)  # type: ignore[arg-type]
+
+
+def _expected_facility_order(node_files: list[Path]) -> list[str]:
+    """Facility IDs of the fixture's entity rows in file, then line, order."""
+    return [json.loads(line)["entity"][0]["value"] for path in node_files for line in path.read_text().splitlines()[1:]]
+
+
+# Column positions in the flatten_entity_result tuple
+SYSTEM_NAME, DIMENSIONS, DIMENSIONS_HASH, METRIC_VALUE, METRIC_TIMELINE = 3, 4, 5, 7, 8
+ENTITY_FIELDS, METADATA, PER_PERIOD, STATISTICAL_METHODS = 9, 11, 12, 13
+
+
+# =============================================================================
+# COPY encoding
+# =============================================================================
+
+
+class TestEncodeCopyRow:
+    """Tests for COPY text-format encoding."""
+
+    def test_round_trips_awkward_values(self) -> None:
+        """Tabs, line breaks and backslashes survive; NULL differs from an empty string and a literal backslash-N."""
+        values = (None, "", "\\N", "a\tb", "line1\nline2\r\n", "C:\\path\\n", "\\", "ü ☃ 🏥", '{"k": "v\\n"}')
+
+        line = encode_copy_row(values)
+
+        assert line.count("\t") == len(values) - 1
+        assert _decode_copy_line(line) == values
+
+    def test_formats_numbers_json_and_timestamps(self) -> None:
+        """Numbers use repr, JSON text passes through, datetimes use ISO 8601 with offset."""
+        loaded_at = datetime(2025, 12, 10, 17, 2, 10, 123456, tzinfo=UTC)
+        row = (12000, 1.166847, 0.1, 1e-07, 1e20, -0.0, loaded_at, json.dumps({"a": [1, None]}))
+
+        assert encode_copy_row(row) == '12000\t1.166847\t0.1\t1e-07\t1e+20\t-0.0\t2025-12-10T17:02:10.123456+00:00\t{"a": [1, null]}\n'
+        assert float(_decode_copy_line(encode_copy_row((0.1 + 0.2,)))[0] or "") == 0.1 + 0.2
+
+
+class TestCopyWriter:
+    """Tests for buffered COPY FROM STDIN."""
+
+    def test_write_rows_flushes_in_batches(self) -> None:
+        """Rows are sent whenever the buffer fills, whole lines only, then committed once."""
+        engine = _FakeEngine()
+        rows = [("run1", f"line {i}\twith tab") for i in range(10)]
+        row_size = len(encode_copy_row(rows[0]))
+
+        with CopyWriter(engine, "raw_contributions", ["run_id", "json_data"], buffer_size=3 * row_size) as writer:  # type: ignore[arg-type]
+            writer.write_rows(rows)
+            assert len(engine.connection.copies) == 3
+            assert not engine.connection.committed
+
+        copies = engine.connection.copies
+        assert [sql for sql, _ in copies] == ["COPY raw_contributions (run_id, json_data) FROM STDIN"] * 4
+        assert [data.count("\n") for _, data in copies] == [3, 3, 3, 1]
+        assert [_decode_copy_line(line) for _, data in copies for line in data.splitlines(keepends=True)] == rows
+        assert writer.rows == 10
+        assert engine.connection.committed and engine.connection.closed
+
+    def test_rolls_back_on_error(self) -> None:
+        """An error inside the block rolls back without sending the rest of the buffer."""
+        engine = _FakeEngine()
+
+        with pytest.raises(ValueError), CopyWriter(engine, "raw_contributions", ["run_id", "json_data"]) as writer:  # type: ignore[arg-type]
+            writer.write_row(("run1", "{}"))
+            raise ValueError("bad row")
+
+        assert engine.connection.copies == []
+        assert engine.connection.rolled_back and not engine.connection.committed
+        assert engine.connection.closed
+
+
+# =============================================================================
+# Generator pipeline
+# =============================================================================
+
+
+class TestPipeline:
+    """Tests for streaming rows from files to COPY in order."""
+
+    def test_batched_keeps_order_and_pulls_lazily(self) -> None:
+        """Batches are full except the last, in input order, and only pulled when needed."""
+        pulled: list[int] = []
+
+        def rows() -> Iterator[tuple[Any, ...]]:
+            for i in range(7):
+                pulled.append(i)
+                yield (i,)
+
+        batches = batched(rows(), 3)
+
+        assert next(batches) == [(0,), (1,), (2,)]
+        assert pulled == [0, 1, 2]
+        assert list(batches) == [[(3,), (4,), (5,)], [(6,)]]
+        assert list(batched(iter([]), 3)) == []
+
+    def test_write_rows_keeps_order(self) -> None:
+        """Rows reach COPY in iterator order across batches and buffer flushes."""
+        engine = _FakeEngine()
+        rows = [(RUN_ID, f"row {i}") for i in range(25)]
+        progress = LoadProgress("raw_contributions", total_files=1)
+
+        written = write_rows(engine, "raw_contributions", ["run_id", "json_data"], iter(rows), progress, batch_size=4, buffer_size=50)  # type: ignore[arg-type]
+
+        assert written == progress.rows == 25
+        assert len(engine.connection.copies) > 1
+        assert _copied_rows(engine) == rows
+
+    def test_copy_files_serial_keeps_file_order(self, node_files: list[Path]) -> None:
+        """Without an executor, rows stream in file order and then line order."""
+        engine = _FakeEngine()
+
+        written = _copy_entity_files(engine, node_files, LoadOptions(batch_size=5, buffer_size=4096))
+
+        rows = _copied_rows(engine)
+        assert written == len(rows) == 56
+        assert [row[5] for row in rows] == _expected_facility_order(node_files)
+        assert [row[1] for row in rows[:3]] == ["metric0__medicareId__aggregate"] * 3
+
+
+# =============================================================================
+# Worker processes
+# =============================================================================
+
+
+class TestWorkers:
+    """Tests for copy_files with files parsed in an executor."""
+
+    def test_workers_match_serial(self, node_files: list[Path]) -> None:
+        """Parsing in a process pool writes the same rows, in the same order, as the serial path."""
+        serial_engine, pool_engine = _FakeEngine(), _FakeEngine()
+        _copy_entity_files(serial_engine, node_files, LoadOptions(batch_size=5, buffer_size=2048))
+
+        with ProcessPoolExecutor(2) as pool:
+            written = _copy_entity_files(pool_engine, node_files, LoadOptions(buffer_size=2048, executor=pool, max_in_flight_bytes=4096))
+
+        assert written == 56
+        assert _without_loaded_at(_copied_rows(pool_engine)) == _without_loaded_at(_copied_rows(serial_engine))
+
+    def test_in_flight_source_bytes_are_bounded(self, node_files: list[Path]) -> None:
+        """Tasks wait for written ones once the budget is used; a larger file runs on its own."""
+        executor = _InlineExecutor()
+        sizes = [path.stat().st_size for path in node_files]
+        budget = sorted(sizes)[-2]
+        assert max(sizes) > budget
+
+        engine = _FakeEngine()
+        _copy_entity_files(engine, node_files, LoadOptions(buffer_size=min(sizes), executor=executor, max_in_flight_bytes=budget))
+
+        assert executor.peak_in_flight_bytes <= max(sizes)
+        assert executor.in_flight_bytes == 0
+        assert [row[5] for row in _copied_rows(engine)] == _expected_facility_order(node_files)
+
+    def test_worker_error_propagates(self, node_files: list[Path]) -> None:
+        """A file that fails to parse in a worker fails the copy and rolls it back."""
+        node_files[1].write_bytes(b'{"type": "node_metadata"}\n\xff\xfe not utf-8\n')
+        engine = _FakeEngine()
+
+        with ProcessPoolExecutor(2) as pool, pytest.raises(UnicodeDecodeError):
+            _copy_entity_files(engine, node_files, LoadOptions(buffer_size=1, executor=pool, max_in_flight_bytes=1))
+
+        assert engine.connection.rolled_back
+        assert not engine.connection.committed
+
+
+# =============================================================================
+# jsonb_text
+# =============================================================================
+
+
+class TestJsonbText:
+    """Tests for reproducing PostgreSQL's jsonb text output."""
+
+    def test_orders_keys_by_byte_length_then_bytes(self) -> None:
+        """Shorter keys come first; keys of one length sort bytewise (UTF-8)."""
+        text = jsonb_text({"bb": "1", "é": "2", "ab": "3", "a": "4", "B": "5"})
+
+        assert text == '{"B": "5", "a": "4", "ab": "3", "bb": "1", "é": "2"}'
+
+    def test_escapes_like_postgres(self) -> None:
+        """Quotes, backslashes and control characters are escaped; non-ASCII is kept."""
+        text = jsonb_text({"k": 'say "hi"\\ \n\t\r\b\f\x01 ü/'})
+
+        assert text == '{"k": "say \\"hi\\"\\\\ \\n\\t\\r\\b\\f\\u0001 ü/"}'
+
+    def test_null_values_and_empty_object(self) -> None:
+        """Null values print as null and an empty object as {} (md5 as in SQL)."""
+        assert jsonb_text({"admissionSource": None}) == '{"admissionSource": null}'
+        assert jsonb_text({}) == "{}"
+        assert hashlib.md5(jsonb_text({}).encode()).hexdigest() == "99914b932bd37a50b983c5e7c90ae93b"
+
+
+# =============================================================================
+# _encounters
+# =============================================================================
+
+
+class TestEncounters:
+    """Tests for metadata.encounters as (->>'encounters')::numeric::integer."""
+
+    @pytest.mark.parametrize(
+        ("metadata", "expected"),
+        [
+            ({"encounters": 12000}, 12000),
+            ({"encounters": 15166.0}, 15166),
+            ({"encounters": "15166.0"}, 15166),
+            ({"encounters": 2.5}, 3),
+            ({"encounters": -2.5}, -3),
+            ({"encounters": 2.4999}, 2),
+        ],
+    )
+    def test_rounds_half_away_from_zero(self, metadata: dict[str, Any], expected: int) -> None:
+        """Integers pass through; floats and numeric strings round as numeric::integer."""
+        assert _encounters(metadata) == expected
+
+    @pytest.mark.parametrize("metadata", [None, [], {}, {"encounters": None}, {"encounters": True}, {"encounters": "n/a"}, {"encounters": {"total": 1}}])
+    def test_missing_or_not_a_number_is_null(self, metadata: Any) -> None:
+        """Missing metadata or encounters, JSON null and non-numbers give NULL."""
+        assert _encounters(metadata) is None
+
+
+# =============================================================================
+# flatten_entity_result
+# =============================================================================
+
+
+class TestFlattenEntityResult:
+    """Tests for the typed raw_entity_results columns."""
+
+    def test_full_row(self) -> None:
+        """An aggregate entity result flattens to every column."""
+        entity_result = _entity_result()
+        dimensions = '{"admissionSource": "ED", "vizientServiceLine": "Cardiology"}'
+
+        assert flatten_entity_result(entity_result) == (
+            "AFP658",
+            "Cardiology",
+            None,
+            "North Health",
+            dimensions,
+            hashlib.md5(dimensions.encode()).hexdigest(),
+            "losIndex",
+            1.166847,
+            None,
+            json.dumps(entity_result["entity"], ensure_ascii=False),
+            15166,
+            json.dumps(entity_result["metadata"], ensure_ascii=False),
+            None,
+            json.dumps(entity_result["statistical_methods"], ensure_ascii=False),
+        )
+
+    def test_null_and_missing_members(self) -> None:
+        """JSON null members stay 'null' (->); missing members give NULL, as in SQL."""
+        present = flatten_entity_result(_entity_result(statistical_methods=None, metadata={"per_period": None}))
+        missing = flatten_entity_result({"metric": [{"values": 1.0}]})
+
+        assert present[STATISTICAL_METHODS] == "null"
+        assert present[PER_PERIOD] == "null"
+        assert missing[ENTITY_FIELDS] is None
+        assert missing[METADATA] is None
+        assert missing[PER_PERIOD] is None
+        assert missing[STATISTICAL_METHODS] is None
+        assert missing[DIMENSIONS] == "{}"
+        assert missing[DIMENSIONS_HASH] == "99914b932bd37a50b983c5e7c90ae93b"
+        assert missing[METRIC_VALUE] == 1.0
+
+    def test_null_entity_values(self) -> None:
+        """Entity fields with a null or missing value are null dimensions; fields without an id are dropped."""
+        entity = [
+            {"id": "medicareId", "value": "AFP658"},
+            {"id": "admissionSource", "value": None},
+            {"id": "dischargeStatus"},
+            {"value": "orphan"},
+            {"id": "ageGroup", "value": 65},
+        ]
+
+        row = flatten_entity_result(_entity_result(entity=entity))
+
+        assert row[0] == "AFP658"
+        assert row[DIMENSIONS] == '{"ageGroup": "65", "admissionSource": null, "dischargeStatus": null}'
+
+    def test_system_name_prefers_metadata(self) -> None:
+        """metadata.systemName wins; a null or missing one falls back to the entity field."""
+        entity = [{"id": "medicareId", "value": "AFP658"}, {"id": "systemName", "value": "Entity Health"}]
+
+        assert flatten_entity_result(_entity_result(entity=entity))[SYSTEM_NAME] == "North Health"
+        assert flatten_entity_result(_entity_result(entity=entity, metadata={"systemName": None}))[SYSTEM_NAME] == "Entity Health"
+        assert flatten_entity_result(_entity_result(entity=entity, metadata=None))[SYSTEM_NAME] == "Entity Health"
+        # systemName is a base key, never a dimension
+        assert flatten_entity_result(_entity_result(entity=entity))[DIMENSIONS] == "{}"
+
+    def test_latest_timeline_value(self) -> None:
+        """The latest period with a value (not null or "null") is the metric value, whatever the array order."""
+        timeline = [
+            {"period": "202403", "value": 0.91},
+            {"period": "202405", "value": None},
+            {"period": "202401", "value": 0.95},
+            {"period": "202404", "value": "null"},
+            {"period": "202402", "value": 0.93},
+        ]
+
+        row = flatten_entity_result(_timeline_result(timeline))
+
+        assert row[METRIC_VALUE] == 0.91
+        assert row[METRIC_TIMELINE] == json.dumps(timeline)
+
+    def test_timeline_point_without_period_sorts_first(self) -> None:
+        """A value without a period wins: descending order puts a NULL period first."""
+        timeline = [{"period": "202412", "value": 0.9}, {"value": 1.2}]
+
+        assert flatten_entity_result(_timeline_result(timeline))[METRIC_VALUE] == 1.2
+
+    def test_timeline_without_values(self) -> None:
+        """A timeline with no usable value, or one that is not an array, has no metric value."""
+        empty = flatten_entity_result(_timeline_result([{"period": "202401", "value": None}]))
+        not_array = flatten_entity_result(_timeline_result(None))
+
+        assert empty[METRIC_VALUE] is None
+        assert not_array[METRIC_VALUE] is None
+        assert not_array[METRIC_TIMELINE] == "null"
@@ -0,0 +1,174 @@
+"""Tests for the in-process Prometheus metrics registry and /metrics endpoint."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.observability.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsMiddleware,
+    MetricsRegistry,
+    read_snapshots,
+    render_snapshots,
+)
+from src.runs.services.file_cache import FileSignatureCache, cache_stats
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    """Registry with one metric of each type."""
+    registry = MetricsRegistry()
+    registry.register(Counter("jobs_total", "Jobs run.", ("kind",)))
+    registry.register(Gauge("queue_depth", "Queued jobs."))
+    registry.register(Histogram("job_seconds", "Job duration.", ("kind",), buckets=(0.1, 1.0)))
+    return registry
+
+
+def _metrics(registry: MetricsRegistry) -> tuple[Counter, Gauge, Histogram]:
+    """Return the fixture registry's metrics."""
+    return registry._metrics["jobs_total"], registry._metrics["queue_depth"], registry._metrics["job_seconds"]  # type: ignore[return-value]
+
+
+class TestRender:
+    """Tests for the text exposition format."""
+
+    def test_renders_all_metric_types(self, registry: MetricsRegistry) -> None:
+        """Counters, gauges and cumulative histogram buckets are rendered."""
+        jobs, depth, duration = _metrics(registry)
+        jobs.inc(kind="load")
+        jobs.inc(2, kind="load")
+        depth.set(4)
+        duration.observe(0.05, kind="load")
+        duration.observe(0.5, kind="load")
+        duration.observe(3.0, kind="load")
+
+        lines = registry.render().splitlines()
+
+        assert "# TYPE jobs_total counter" in lines
+        assert 'jobs_total{kind="load"} 3.0' in lines
+        assert "queue_depth 4.0" in lines
+        assert 'job_seconds_bucket{kind="load",le="0.1"} 1.0' in lines
+        assert 'job_seconds_bucket{kind="load",le="1.0"} 2.0' in lines
+        assert 'job_seconds_bucket{kind="load",le="+Inf"} 3.0' in lines
+        assert 'job_seconds_sum{kind="load"} 3.55' in lines
+        assert 'job_seconds_count{kind="load"} 3.0' in lines
+
+    def test_escapes_label_values(self, registry: MetricsRegistry) -> None:
+        """Quotes and backslashes in label values are escaped."""
+        jobs, _, _ = _metrics(registry)
+        jobs.inc(kind='a"b\\c')
+        assert 'jobs_total{kind="a\\"b\\\\c"} 1.0' in registry.render()
+
+    def test_collectors_run_before_export(self, registry: MetricsRegistry) -> None:
+        """Collectors update gauges right before rendering."""
+        _, depth, _ = _metrics(registry)
+        registry.add_collector(lambda: depth.set(7))
+        assert "queue_depth 7.0" in registry.render()
+
+
+class TestMultiprocess:
+    """Tests for aggregating worker snapshots."""
+
+    def test_sums_workers_and_drops_gauges_of_exited_workers(self, registry: MetricsRegistry, tmp_path: Path) -> None:
+        """Counters of all workers are summed; gauges only of live workers."""
+        jobs, depth, duration = _metrics(registry)
+        jobs.inc(kind="load")
+        depth.set(2)
+        duration.observe(0.5, kind="load")
+        registry.write_snapshot(tmp_path)
+
+        # A worker that has exited (PIDs above pid_max do not exist)
+        exited = registry.snapshot()
+        exited["pid"] = 2**22 + 1
+        (tmp_path / f"metrics_{exited['pid']}.json").write_text(json.dumps(exited))
+
+        lines = render_snapshots(read_snapshots(tmp_path)).splitlines()
+
+        assert 'jobs_total{kind="load"} 2.0' in lines
+        assert 'job_seconds_count{kind="load"} 2.0' in lines
+        assert "queue_depth 2.0" in lines
+
+    def test_keeps_collected_totals_of_exited_workers(self, registry: MetricsRegistry, tmp_path: Path) -> None:
+        """Counters set from totals kept elsewhere survive a worker exit, so the sum never goes back."""
+        jobs, _, _ = _metrics(registry)
+        totals = {"load": 5.0}
+        registry.add_collector(lambda: jobs.set_total(totals["load"], kind="load"))
+        exited = registry.snapshot()
+        exited["pid"] = 2**22 + 1
+        (tmp_path / f"metrics_{exited['pid']}.json").write_text(json.dumps(exited))
+
+        # The replacement worker starts counting from zero
+        totals["load"] = 1.0
+        lines = registry.render(tmp_path).splitlines()
+
+        assert 'jobs_total{kind="load"} 6.0' in lines
+
+    def test_render_writes_own_snapshot(self, registry: MetricsRegistry, tmp_path: Path) -> None:
+        """Rendering in multiprocess mode includes this worker's latest values."""
+        jobs, _, _ = _metrics(registry)
+        jobs.inc(kind="load")
+        assert 'jobs_total{kind="load"} 1.0' in registry.render(tmp_path)
+        assert (tmp_path / f"metrics_{os.getpid()}.json").exists()
+
+
+class TestMetricsMiddleware:
+    """Tests for route latency recording."""
+
+    @pytest.mark.asyncio
+    async def test_records_route_template_with_router_prefixes(self) -> None:
+        """Latency is labelled with the full route template, not the raw path."""
+        from src.observability.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT
+
+        router = APIRouter(prefix="/signals")
+
+        @router.get("/{signal_id}")
+        async def get_signal(signal_id: str) -> dict[str, str]:
+            return {"id": signal_id}
+
+        app = FastAPI()
+        app.include_router(router, prefix="/api")
+        app.add_middleware(MetricsMiddleware)
+
+        HTTP_REQUEST_DURATION.clear()
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            await client.get("/api/signals/abc")
+            await client.get("/api/signals/def")
+            await client.get("/missing/path")
+
+        samples = HTTP_REQUEST_DURATION.samples()
+        assert sum(samples[("GET", "/api/signals/{signal_id}", "200")][:-1]) == 2
+        assert ("GET", "unmatched", "404") in samples
+        assert HTTP_REQUESTS_IN_FLIGHT.samples()[("GET",)] == 0
+
+
+def test_named_caches_report_stats(tmp_path: Path) -> None:
+    """Named file caches are listed with their hit and miss counts."""
+    source = tmp_path / "data.txt"
+    source.write_text("x")
+    cache: FileSignatureCache[str] = FileSignatureCache(2, name="test_cache")
+    cache.get_or_load(source, lambda path: path.read_text())
+    cache.get_or_load(source, lambda path: path.read_text())
+
+    assert cache_stats()["test_cache"] == {"hits": 1, "misses": 1, "entries": 1}
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client: AsyncClient) -> None:
+    """The app serves route, pool and cache metrics at /metrics."""
+    await client.get("/health")
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in response.text
+    assert 'db_pool_connections{pool="primary",state="size"}' in response.text
+    assert "# TYPE cache_requests_total counter" in response.text
+    assert 'cache_requests_total{cache="run_graph_index",result="hit"}' in response.text
+    # Ratios are not additive across workers; PromQL derives them from cache_requests_total
+    assert "cache_hit_ratio" not in response.text
@@ -0,0 +1,136 @@
+"""Tests for on-demand request profiling and the /admin/profiles endpoints."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.observability.profiling import PROFILES, ProfileStore, ProfilingMiddleware, RequestProfile, SamplingProfiler
+from src.observability.router import admin_router
+
+ADMIN_HEADERS = {"X-Admin-Token": "secret"}
+
+
+def _busy(seconds: float) -> None:
+    """Burn CPU for a while so the profiler has something to sample."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _profile(samples: dict[tuple[str, ...], int]) -> RequestProfile:
+    """Build a profile with the given sample counts."""
+    profile = RequestProfile(id="0" * 32, method="GET", path="/items", started_at=datetime.now(UTC), interval=0.001)
+    profile.samples.update(samples)
+    return profile
+
+
+class TestSamplingProfiler:
+    """Tests for the background stack sampler."""
+
+    def test_samples_the_target_thread(self) -> None:
+        """Stacks of the sampled thread are counted root first."""
+        profiler = SamplingProfiler(threading.get_ident(), interval=0.001)
+        profiler.start()
+        _busy(0.05)
+        samples = profiler.stop()
+
+        assert samples.total() > 0
+        assert any(any(frame.startswith("_busy (") for frame in stack) for stack in samples)
+
+    def test_collapsed_format(self) -> None:
+        """Profiles render as "frame;frame count" lines, heaviest first."""
+        profile = _profile({("main", "load"): 2, ("main", "load", "parse"): 5})
+
+        assert profile.collapsed() == "main;load;parse 5\nmain;load 2\n"
+
+
+class TestProfileStore:
+    """Tests for profile retention and persistence."""
+
+    def test_keeps_most_recent_profiles(self) -> None:
+        """Only max_profiles profiles are kept, newest first."""
+        store = ProfileStore(max_profiles=2)
+        for i in range(3):
+            store.add(RequestProfile(id=f"{i:032x}", method="GET", path="/", started_at=datetime.now(UTC), interval=0.001))
+
+        assert [profile.id for profile in store.recent()] == [f"{2:032x}", f"{1:032x}"]
+        assert store.collapsed(f"{0:032x}") is None
+
+    def test_reads_profiles_written_by_other_workers(self, tmp_path: Path) -> None:
+        """With a directory, profiles are served from disk after leaving memory."""
+        writer = ProfileStore(directory=tmp_path)
+        writer.add(_profile({("main",): 1}))
+
+        assert ProfileStore(directory=tmp_path).collapsed("0" * 32) == "main 1\n"
+        assert ProfileStore(directory=tmp_path).collapsed("../etc/passwd") is None
+
+
+class TestProfilingMiddleware:
+    """Tests for profiling requests on demand."""
+
+    @pytest.fixture
+    def app(self) -> Iterator[FastAPI]:
+        """App with a CPU-bound endpoint, the profiler and the admin router."""
+        app = FastAPI()
+
+        @app.get("/work")
+        async def work() -> dict[str, bool]:
+            _busy(0.05)
+            await asyncio.sleep(0)
+            return {"done": True}
+
+        app.include_router(admin_router)
+        app.add_middleware(ProfilingMiddleware, store=PROFILES, admin_token="secret", interval=0.001)
+        PROFILES.clear()
+        yield app
+        PROFILES.clear()
+
+    @pytest.mark.asyncio
+    async def test_profiles_requests_with_header_and_token(self, app: FastAPI) -> None:
+        """X-Profile: 1 with the admin token returns a profile ID for the stored profile."""
+        with patch("src.dependencies.settings.ADMIN_TOKEN", "secret"):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.get("/work", headers={"X-Profile": "1", **ADMIN_HEADERS})
+                profile_id = response.headers["X-Profile-Id"]
+                listing = (await client.get("/admin/profiles", headers=ADMIN_HEADERS)).json()
+                collapsed = (await client.get(f"/admin/profiles/{profile_id}", headers=ADMIN_HEADERS)).text
+                missing = await client.get(f"/admin/profiles/{'f' * 32}", headers=ADMIN_HEADERS)
+
+        assert response.json() == {"done": True}
+        assert listing[0]["id"] == profile_id
+        assert listing[0]["path"] == "/work"
+        assert listing[0]["sample_count"] > 0
+        assert "_busy (" in collapsed
+        assert not collapsed.startswith("ProfilingMiddleware")
+        assert missing.status_code == 404
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("headers", [{}, {"X-Profile": "1"}, {"X-Profile": "1", "X-Admin-Token": "guess"}])
+    async def test_ignores_requests_without_valid_token(self, app: FastAPI, headers: dict[str, str]) -> None:
+        """Requests without X-Profile or a valid admin token are served unprofiled."""
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/work", headers=headers)
+
+        assert response.status_code == 200
+        assert "X-Profile-Id" not in response.headers
+        assert PROFILES.recent() == []
+
+
+def test_create_app_enables_profiling_from_settings() -> None:
+    """create_app adds the profiling middleware only when PROFILING_ENABLED is set."""
+    from src.main import create_app
+
+    def middleware_classes(app: FastAPI) -> list[object]:
+        return [m.cls for m in app.user_middleware]
+
+    assert ProfilingMiddleware not in middleware_classes(create_app())
+    with patch("src.main.settings.PROFILING_ENABLED", True):
+        assert middleware_classes(create_app())[0] is ProfilingMiddleware
@@ -95,3 +95,18 @@ class TestResultsReaderService:
 
         assert result.total_count == 0
         assert len(result.results) == 0
+
+    def test_read_results_temporal_metric_values(self, tmp_path: Path) -> None:
+        """Test temporal timeline values do not break scalar extraction."""
+        jsonl_path = tmp_path / "temporal.jsonl"
+        record = {
+            "entity": [{"id": "facility", "value": "FAC001"}],
+            "metric": [{"values": {"timeline": [{"period": "202401", "value": 1.0}]}}],
+            "statistical_methods": [{"statistics": {"trending_simple_zscore": [0.1, 0.2]}}],
+        }
+        jsonl_path.write_text(json.dumps(record) + "\n")
+
+        result = ResultsReaderService().read_results(jsonl_path, offset=0, limit=10)
+
+        assert result.results[0].metric_value is None
+        assert result.results[0].z_score is None
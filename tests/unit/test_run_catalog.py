@@ -0,0 +1,141 @@
+"""Unit tests for RunCatalog."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.runs.services.run_catalog import RunCatalog
+from src.runs.services.run_discovery import RunDiscoveryService
+
+
+def _write_index(run_dir: Path, payload: dict[str, object]) -> Path:
+    """Write a results/index.json for a run directory."""
+    index_path = run_dir / "results" / "index.json"
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    index_path.write_text(json.dumps(payload))
+    return index_path
+
+
+def _bump_mtime(path: Path) -> None:
+    """Advance a file's mtime so change detection sees a new signature."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestRunCatalog:
+    """Tests for RunCatalog caching and change detection."""
+
+    @pytest.fixture
+    def runs_root(self, tmp_path: Path) -> Path:
+        """Create a graph with two runs."""
+        graph_dir = tmp_path / "test_graph"
+        _write_index(graph_dir / "20260101120000", {"nodes": [{"node_id": "a"}]})
+        _write_index(graph_dir / "20260102120000", {"nodes": [{"node_id": "a"}, {"node_id": "b"}]})
+        (graph_dir / "20260103120000").mkdir()  # No index.json - not a valid run
+        return tmp_path
+
+    def test_get_runs_summarizes_valid_runs(self, runs_root: Path) -> None:
+        """Test only runs with index.json are returned, with node counts."""
+        catalog = RunCatalog(runs_root)
+        entries = {e.run_id: e for e in catalog.get_runs("test_graph")}
+
+        assert set(entries) == {"20260101120000", "20260102120000"}
+        assert entries["20260101120000"].node_count == 1
+        assert entries["20260102120000"].node_count == 2
+
+    def test_unchanged_index_not_reparsed(self, runs_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a second call serves unchanged runs from the cache."""
+        catalog = RunCatalog(runs_root)
+        catalog.get_runs("test_graph")
+
+        calls: list[str] = []
+        original = catalog._summarize
+
+        def tracking_summarize(run_id: str, *args: object) -> object:
+            calls.append(run_id)
+            return original(run_id, *args)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(catalog, "_summarize", tracking_summarize)
+        catalog.get_runs("test_graph")
+
+        assert calls == []
+
+    def test_unchanged_graph_dir_skips_known_runs(self, runs_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test only runs without an index.json are re-checked while the graph dir is unchanged."""
+        catalog = RunCatalog(runs_root)
+        catalog.get_runs("test_graph")
+
+        stat_calls: list[str] = []
+        original = Path.stat
+
+        def tracking_stat(path: Path, *args: object, **kwargs: object) -> os.stat_result:
+            if path.name == "index.json":
+                stat_calls.append(path.parent.parent.name)
+            return original(path, *args, **kwargs)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(Path, "stat", tracking_stat)
+        run_ids = {e.run_id for e in catalog.get_runs("test_graph")}
+
+        assert run_ids == {"20260101120000", "20260102120000"}
+        assert stat_calls == ["20260103120000"]
+
+    def test_changed_index_is_reparsed_after_invalidate(self, runs_root: Path) -> None:
+        """Test an index.json rewritten in place is picked up after invalidate()."""
+        catalog = RunCatalog(runs_root)
+        catalog.get_runs("test_graph")
+
+        index_path = _write_index(runs_root / "test_graph" / "20260101120000", {"nodes": [{}, {}, {}]})
+        _bump_mtime(index_path)
+        catalog.invalidate("test_graph")
+
+        entries = {e.run_id: e for e in catalog.get_runs("test_graph")}
+        assert entries["20260101120000"].node_count == 3
+
+    def test_new_and_removed_runs_detected(self, runs_root: Path) -> None:
+        """Test runs completing, added or removed are reflected."""
+        catalog = RunCatalog(runs_root)
+        catalog.get_runs("test_graph")
+
+        graph_dir = runs_root / "test_graph"
+        _write_index(graph_dir / "20260103120000", {"nodes": []})
+        _write_index(graph_dir / "20260104120000", {"nodes": [{}]})
+        shutil.rmtree(graph_dir / "20260101120000")
+        _bump_mtime(graph_dir)
+
+        run_ids = {e.run_id for e in catalog.get_runs("test_graph")}
+        assert run_ids == {"20260102120000", "20260103120000", "20260104120000"}
+
+    def test_persisted_catalog_skips_rescan(self, runs_root: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a catalog loaded from disk does not re-read unchanged runs."""
+        persist_path = tmp_path / "cache" / "run_catalog.json"
+        RunCatalog(runs_root, persist_path=persist_path).get_runs("test_graph")
+        assert persist_path.exists()
+
+        warm = RunCatalog(runs_root, persist_path=persist_path)
+        monkeypatch.setattr(warm, "_summarize", lambda *args: pytest.fail("unexpected index.json parse"))
+
+        entries = {e.run_id: e for e in warm.get_runs("test_graph")}
+        assert entries["20260102120000"].node_count == 2
+
+    def test_persisted_catalog_for_other_root_ignored(self, runs_root: Path, tmp_path: Path) -> None:
+        """Test a persisted catalog written for a different root is ignored."""
+        persist_path = tmp_path / "run_catalog.json"
+        RunCatalog(runs_root, persist_path=persist_path).get_runs("test_graph")
+
+        other_root = tmp_path / "other"
+        other_root.mkdir()
+        catalog = RunCatalog(other_root, persist_path=persist_path)
+
+        assert catalog.get_runs("test_graph") == []
+
+    def test_discovery_uses_catalog(self, runs_root: Path) -> None:
+        """Test RunDiscoveryService reads summaries through the catalog."""
+        catalog = RunCatalog(runs_root)
+        service = RunDiscoveryService(runs_root=runs_root, catalog=catalog)
+
+        runs = service.list_runs_for_graph("test_graph")
+        assert [r.run_id for r in runs] == ["20260102120000", "20260101120000"]
+        assert "test_graph" in catalog._entries
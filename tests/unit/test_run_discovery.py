@@ -107,3 +107,45 @@ class TestRunDiscoveryService:
         assert service.list_runs_for_graph("../../../etc") == []
         assert service.list_runs_for_graph("test_graph/../../../etc") == []
         assert service.list_runs_for_graph("..") == []
+
+    def test_node_index_lookup(self, temp_runs_root: Path) -> None:
+        """Test nodes can be looked up by node_id and canonical_node_id."""
+        index_path = temp_runs_root / "test_graph" / "20260101120000" / "results" / "index.json"
+        index_path.write_text(
+            '{"created_at": "2026-01-01T12:00:00Z", "nodes": ['
+            '{"node_id": "n1", "canonical_node_id": "c1", "metric_id": "m", "result_path": "results/nodes/n1.jsonl"},'
+            '{"node_id": "n2", "canonical_node_id": "c2", "metric_id": "m", "result_path": "results/nodes/n2.jsonl"}]}'
+        )
+
+        service = RunDiscoveryService(runs_root=temp_runs_root)
+        node_index = service.get_node_index("test_graph", "20260101120000")
+
+        assert node_index is not None
+        assert len(node_index) == 2
+        assert node_index.get("n2") is node_index.get("c2")
+        assert node_index.get("missing") is None
+        assert node_index.created_at is not None and node_index.created_at.year == 2026
+
+    def test_node_index_cached_until_index_changes(self, temp_runs_root: Path) -> None:
+        """Test the node index is reused until index.json changes."""
+        index_path = temp_runs_root / "test_graph" / "20260101120000" / "results" / "index.json"
+        service = RunDiscoveryService(runs_root=temp_runs_root)
+
+        first = service.get_node_index("test_graph", "20260101120000")
+        assert first is service.get_node_index("test_graph", "20260101120000")
+
+        index_path.write_text('{"nodes": [{"node_id": "n1", "canonical_node_id": "c1"}]}')
+        refreshed = service.get_node_index("test_graph", "20260101120000")
+
+        assert refreshed is not first
+        assert refreshed is not None and refreshed.get("n1") is not None
+
+    def test_run_metadata_malformed_index(self, tmp_path: Path) -> None:
+        """Test malformed index.json yields no metadata instead of raising."""
+        run_dir = tmp_path / "broken_graph" / "20260101120000"
+        (run_dir / "results").mkdir(parents=True)
+        (run_dir / "results" / "index.json").write_text("not valid json{")
+
+        service = RunDiscoveryService(runs_root=tmp_path)
+
+        assert service.get_run_metadata("broken_graph", "20260101120000") is None
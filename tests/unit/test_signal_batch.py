@@ -0,0 +1,268 @@
+"""Unit tests for run-level signal generation.
+
+Tests cover:
+- Building and reading the memory-mapped temporal index
+- Generating a run's signals in-process and in a process pool
+- The signals CLI generate command
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from src.schemas.signal import SignalCreate
+from src.services.signal_batch import NodeSignals, TemporalIndexFile, generate_run_signals, resolve_nodes_directory
+from src.services.signal_generator import SignalGenerator
+from src.signals.cli import cli
+
+AGGREGATE_NODE_ID = "losIndex__medicareId__aggregate"
+TEMPORAL_NODE_ID = "losIndex__medicareId__dischargeMonth"
+FACILITIES = ["FACILITY001", "FACILITY002", "FACILITY003"]
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def _entity(facility: str, metric_values: Any, statistical_method: dict[str, Any]) -> dict[str, Any]:
+    """Build one entity result of a facility."""
+    return {
+        "encounters": 12000,
+        "entity": [{"dataset_field": "medicareId", "id": "medicareId", "value": facility}],
+        "metric": [{"metadata": {"metric_id": "losIndex"}, "values": metric_values}],
+        "statistical_methods": [statistical_method],
+    }
+
+
+def _write_node(path: Path, canonical_node_id: str, entity_results: list[dict[str, Any]], child_edges: list[dict[str, str]]) -> None:
+    """Write a node results JSONL file: header line plus one line per entity."""
+    header = {
+        "type": "node_metadata",
+        "canonical_node_id": canonical_node_id,
+        "canonical_child_node_ids": child_edges,
+        "canonical_parent_node_ids": [],
+    }
+    path.write_text("\n".join(json.dumps(line) for line in [header, *entity_results]))
+
+
+@pytest.fixture
+def nodes_directory(tmp_path: Path) -> Path:
+    """Create a run's nodes directory with an aggregate node and its temporal node.
+
+    Returns:
+        Path: The results/nodes directory of the run.
+    """
+    nodes_directory = tmp_path / "run" / "results" / "nodes"
+    nodes_directory.mkdir(parents=True)
+
+    temporal_entities = [
+        _entity(
+            facility,
+            {"timeline": [{"period": f"2024{month:02d}", "value": 0.9 + index * 0.05 - month * 0.01, "encounters": 1000} for month in range(1, 13)]},
+            {
+                "statistical_method": "statistical_method__simple_zscore__dischargeMonth",
+                "anomalies": [],
+                "statistics": {"peer_mean": 1.0, "peer_std": 0.1},
+            },
+        )
+        for index, facility in enumerate(FACILITIES)
+    ]
+    _write_node(nodes_directory / f"{TEMPORAL_NODE_ID}.jsonl", TEMPORAL_NODE_ID, temporal_entities, [])
+
+    aggregate_entities = [
+        _entity(
+            facility,
+            0.8 + index * 0.1,
+            {
+                "statistical_method": "statistical_method__simple_zscore",
+                "anomalies": [
+                    {
+                        "anomaly_profile": "anomaly_profiles__simple_zscore",
+                        "methods": [
+                            {
+                                "anomaly": "very_low",
+                                "anomaly_method": "method__low",
+                                "applies_to": "simple_zscore",
+                                "interpretation": {"rendered": f"Low LOS at {facility}"},
+                                "statistic_value": -2.0 + index,
+                            }
+                        ],
+                    }
+                ],
+                "statistics": {"peer_mean": 1.0, "peer_std": 0.1},
+            },
+        )
+        for index, facility in enumerate(FACILITIES)
+    ]
+    _write_node(
+        nodes_directory / f"{AGGREGATE_NODE_ID}.jsonl",
+        AGGREGATE_NODE_ID,
+        aggregate_entities,
+        [{"canonical_child_node_id": TEMPORAL_NODE_ID, "edge_type": "trends_to"}],
+    )
+
+    (nodes_directory / "broken.jsonl").write_text("{not json")
+    return nodes_directory
+
+
+def _signal_dumps(signals: list[SignalCreate]) -> list[dict[str, Any]]:
+    """Dump signals without their detection time for comparison."""
+    return [signal.model_dump(exclude={"detected_at"}) for signal in signals]
+
+
+# =============================================================================
+# TemporalIndexFile
+# =============================================================================
+
+
+class TestTemporalIndexFile:
+    """Tests for the precomputed temporal index."""
+
+    def test_build_matches_loaded_index(self, nodes_directory: Path, tmp_path: Path) -> None:
+        """Indexed z-scores equal the ones a generator computes from the node file."""
+        index_file = TemporalIndexFile.build(nodes_directory, tmp_path / "index")
+        expected = SignalGenerator(nodes_directory=nodes_directory).load_temporal_index(TEMPORAL_NODE_ID)
+
+        assert TemporalIndexFile.exists(tmp_path / "index")
+        assert list(index_file) == [TEMPORAL_NODE_ID]
+        assert expected is not None
+        temporal_index = index_file[TEMPORAL_NODE_ID]
+        assert temporal_index.keys() == expected.keys()
+        for key, z_scores in expected.items():
+            np.testing.assert_array_equal(temporal_index[key], z_scores)
+
+    def test_build_without_temporal_nodes(self, tmp_path: Path) -> None:
+        """A run without trends_to edges gives an empty index."""
+        _write_node(tmp_path / "node.jsonl", AGGREGATE_NODE_ID, [], [])
+
+        index_file = TemporalIndexFile.build(tmp_path, tmp_path / "index")
+
+        assert len(index_file) == 0
+        assert TemporalIndexFile(tmp_path / "index").get(TEMPORAL_NODE_ID) is None
+
+    def test_resolve_nodes_directory(self, nodes_directory: Path) -> None:
+        """A run directory resolves to its results/nodes; other paths are kept."""
+        run_directory = nodes_directory.parent.parent
+
+        assert resolve_nodes_directory(run_directory) == nodes_directory
+        assert resolve_nodes_directory(nodes_directory) == nodes_directory
+
+
+# =============================================================================
+# generate_run_signals
+# =============================================================================
+
+
+class TestGenerateRunSignals:
+    """Tests for run-level signal generation."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_per_node_parsing(self, nodes_directory: Path, workers: int) -> None:
+        """Every node yields the signals parse_node_results gives; broken nodes carry their error."""
+        calls: list[tuple[int, int, int]] = []
+
+        nodes = sorted(
+            generate_run_signals(nodes_directory, workers=workers, progress=lambda done, total, signals, _: calls.append((done, total, signals))),
+            key=lambda node: node.path.name,
+        )
+
+        assert [node.path.name for node in nodes] == ["broken.jsonl", f"{AGGREGATE_NODE_ID}.jsonl", f"{TEMPORAL_NODE_ID}.jsonl"]
+        broken, aggregate, temporal = nodes
+        assert broken.error is not None
+        assert broken.signals == []
+        expected = SignalGenerator(nodes_directory=nodes_directory).parse_node_results(aggregate.path)
+        assert aggregate.error is None
+        assert len(aggregate.signals) == len(FACILITIES)
+        assert _signal_dumps(aggregate.signals) == _signal_dumps(expected)
+        assert temporal == NodeSignals(path=temporal.path)
+        assert [(done, total) for done, total, _ in calls] == [(1, 3), (2, 3), (3, 3)]
+        assert calls[-1][2] == len(FACILITIES)
+
+    def test_unexpected_node_error_does_not_stop_run(self, nodes_directory: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """An unexpected exception in one node is yielded as that node's error."""
+        parse_node_results = SignalGenerator.parse_node_results
+
+        def parse_or_fail(generator: SignalGenerator, path: Path) -> list[SignalCreate]:
+            if path.name == f"{TEMPORAL_NODE_ID}.jsonl":
+                raise ArithmeticError("bad value")
+            return parse_node_results(generator, path)
+
+        monkeypatch.setattr(SignalGenerator, "parse_node_results", parse_or_fail)
+
+        nodes = {node.path.name: node for node in generate_run_signals(nodes_directory, workers=1)}
+
+        assert len(nodes) == 3
+        assert "ArithmeticError" in str(nodes[f"{TEMPORAL_NODE_ID}.jsonl"].error)
+        assert len(nodes[f"{AGGREGATE_NODE_ID}.jsonl"].signals) == len(FACILITIES)
+
+    def test_reuses_temporal_index_directory(self, nodes_directory: Path, tmp_path: Path) -> None:
+        """A given index directory is built once and then reused as is."""
+        index_directory = tmp_path / "index"
+
+        first = list(generate_run_signals(nodes_directory, workers=1, temporal_index_directory=index_directory))
+        built_at = (index_directory / "temporal_z_scores.npy").stat().st_mtime_ns
+        second = list(generate_run_signals(nodes_directory, workers=1, temporal_index_directory=index_directory))
+
+        assert (index_directory / "temporal_z_scores.npy").stat().st_mtime_ns == built_at
+        assert [_signal_dumps(node.signals) for node in first] == [_signal_dumps(node.signals) for node in second]
+
+    def test_rebuilds_stale_temporal_index(self, nodes_directory: Path, tmp_path: Path) -> None:
+        """An index from another nodes directory or from changed temporal files is rebuilt."""
+        index_directory = tmp_path / "index"
+        TemporalIndexFile.build(nodes_directory, index_directory)
+        other_directory = tmp_path / "other"
+        other_directory.mkdir()
+        temporal_path = nodes_directory / f"{TEMPORAL_NODE_ID}.jsonl"
+
+        assert TemporalIndexFile.is_current(index_directory, nodes_directory)
+        assert not TemporalIndexFile.is_current(index_directory, other_directory)
+
+        # Re-run: only the first facility's timeline is left, with new values
+        header, first_entity = temporal_path.read_text().splitlines()[:2]
+        temporal_path.write_text("\n".join([header, first_entity.replace("0.9", "0.7")]))
+
+        assert not TemporalIndexFile.is_current(index_directory, nodes_directory)
+        nodes = {node.path.name: node for node in generate_run_signals(nodes_directory, workers=1, temporal_index_directory=index_directory)}
+
+        assert TemporalIndexFile.is_current(index_directory, nodes_directory)
+        expected = SignalGenerator(nodes_directory=nodes_directory).parse_node_results(nodes_directory / f"{AGGREGATE_NODE_ID}.jsonl")
+        assert _signal_dumps(nodes[f"{AGGREGATE_NODE_ID}.jsonl"].signals) == _signal_dumps(expected)
+        assert len(TemporalIndexFile(index_directory)[TEMPORAL_NODE_ID]) == 1
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Create a Click CLI runner."""
+    return CliRunner()
+
+
+class TestGenerateCommand:
+    """Tests for the generate command."""
+
+    def test_writes_ndjson_and_fails_on_broken_nodes(self, runner: CliRunner, nodes_directory: Path, tmp_path: Path) -> None:
+        """Signals are written one per line; a broken node is reported and exits 1."""
+        output = tmp_path / "signals.ndjson"
+
+        result = runner.invoke(cli, ["generate", str(nodes_directory.parent.parent), "-o", str(output), "-w", "1"])
+
+        assert result.exit_code == 1
+        signals = [SignalCreate.model_validate_json(line) for line in output.read_text().splitlines()]
+        assert sorted(signal.facility_id for signal in signals) == FACILITIES
+        assert "3/3 nodes" in result.stderr
+        assert "broken.jsonl" in result.stderr
+
+    def test_rejects_directory_without_nodes(self, runner: CliRunner, tmp_path: Path) -> None:
+        """A directory without node files is a usage error."""
+        result = runner.invoke(cli, ["generate", str(tmp_path)])
+
+        assert result.exit_code == 2
+        assert "no node JSONL files" in result.output
@@ -490,13 +490,27 @@ class TestMissingFieldsAndMalformedInput:
         json_file = tmp_path / "test.json"
         json_file.write_text("{}")  # Create file so it exists
 
-        # Mock read_text to raise OSError
-        with patch.object(Path, "read_text", side_effect=OSError("Disk read error")), pytest.raises(SignalGeneratorError) as exc_info:
+        # Mock open to raise OSError
+        with patch.object(Path, "open", side_effect=OSError("Disk read error")), pytest.raises(SignalGeneratorError) as exc_info:
             generator.parse_node_results(json_file)
 
         assert "Failed to read file" in str(exc_info.value)
         assert "Disk read error" in str(exc_info.value)
 
+    def test_iter_node_results_streams_until_invalid_line(self, generator: SignalGenerator, tmp_path: Path, minimal_valid_node_data: dict[str, Any]) -> None:
+        """Signals are yielded line by line; an invalid line raises when it is reached."""
+        jsonl_file = tmp_path / "node.jsonl"
+        header = {"type": "node_metadata", "canonical_node_id": minimal_valid_node_data["canonical_node_id"]}
+        entity = json.dumps(minimal_valid_node_data["entity_results"][0])
+        jsonl_file.write_text("\n".join([json.dumps(header), entity, "", entity, "{ not valid json }"]))
+
+        signals = generator.iter_node_results(jsonl_file)
+
+        assert next(signals).facility == "FACILITY001"
+        assert next(signals).facility == "FACILITY001"
+        with pytest.raises(SignalGeneratorError, match="Invalid JSONL format"):
+            next(signals)
+
 
 # =============================================================================
 # Tests: Anomaly Selection
@@ -828,6 +842,15 @@ class TestCoverageEdgeCases:
         # Entity with null metric values should be skipped
         assert len(signals) == 0
 
+    def test_null_latest_timeline_value_skipped(self, generator: SignalGenerator, minimal_valid_node_data: dict[str, Any]) -> None:
+        """Test that entities whose latest timeline period is suppressed are skipped."""
+        entity = minimal_valid_node_data["entity_results"][0]
+        entity["metric"][0]["values"] = {"timeline": [{"period": "202411", "value": 1.1}, {"period": "202412", "value": None}]}
+
+        signals = generator.parse_node_results_from_dict(minimal_valid_node_data)
+
+        assert signals == []
+
     def test_validation_error_in_node_results(self, generator: SignalGenerator, tmp_path: Path) -> None:
         """Test validation error when node results have invalid schema.
 
@@ -1147,8 +1170,8 @@ class TestTemporalIntegration:
         generator = SignalGenerator(nodes_directory=tmp_path)
 
         # Load temporal node twice
-        result1 = generator._load_temporal_node("losIndex__medicareId__dischargeMonth")
-        result2 = generator._load_temporal_node("losIndex__medicareId__dischargeMonth")
+        result1 = generator.load_temporal_index("losIndex__medicareId__dischargeMonth")
+        result2 = generator.load_temporal_index("losIndex__medicareId__dischargeMonth")
 
         # Both should return same cached instance
         assert result1 is result2
@@ -1159,14 +1182,14 @@ class TestTemporalIntegration:
         """Cache stores None for missing temporal node file."""
         generator = SignalGenerator(nodes_directory=tmp_path)
 
-        result = generator._load_temporal_node("nonexistent__node")
+        result = generator.load_temporal_index("nonexistent__node")
 
         assert result is None
         assert generator._temporal_cache.get("nonexistent__node") is None
 
     def test_get_temporal_z_scores_matches_entity(self, tmp_path: Path) -> None:
         """Z-scores extracted for matching entity key."""
-        from src.schemas.signal import NodeResults
+        from src.services.signal_generator import _ENTITIES_ADAPTER
 
         temporal_node_data = {
             "canonical_node_id": "losIndex__medicareId__dischargeMonth",
@@ -1205,11 +1228,11 @@ class TestTemporalIntegration:
             ],
         }
 
-        temporal_node = NodeResults.model_validate(temporal_node_data)
+        temporal_node = _ENTITIES_ADAPTER.validate_python(temporal_node_data["entity_results"])
         generator = SignalGenerator(nodes_directory=tmp_path)
 
         # Should find matching entity
-        z_scores = generator._get_temporal_z_scores(temporal_node, ("FACILITY001", "All", None))
+        z_scores = generator._get_temporal_z_scores(generator._index_temporal_node(temporal_node), ("FACILITY001", "All", None))
         assert z_scores is not None
         assert len(z_scores) == 3
         # Z-scores computed from (value - peer_mean) / peer_std
@@ -1218,7 +1241,7 @@ class TestTemporalIntegration:
 
     def test_get_temporal_z_scores_no_match(self, tmp_path: Path) -> None:
         """Returns None when entity not found in temporal node."""
-        from src.schemas.signal import NodeResults
+        from src.services.signal_generator import _ENTITIES_ADAPTER
 
         temporal_node_data = {
             "canonical_node_id": "losIndex__medicareId__dischargeMonth",
@@ -1251,13 +1274,55 @@ class TestTemporalIntegration:
             ],
         }
 
-        temporal_node = NodeResults.model_validate(temporal_node_data)
+        temporal_node = _ENTITIES_ADAPTER.validate_python(temporal_node_data["entity_results"])
         generator = SignalGenerator(nodes_directory=tmp_path)
 
         # Non-matching entity key
-        z_scores = generator._get_temporal_z_scores(temporal_node, ("DIFFERENT_FACILITY", "All", None))
+        z_scores = generator._get_temporal_z_scores(generator._index_temporal_node(temporal_node), ("DIFFERENT_FACILITY", "All", None))
         assert z_scores is None
 
+    def test_index_temporal_node_keys_entities(self, tmp_path: Path) -> None:
+        """Temporal entities are indexed by entity key; the first timeline wins."""
+        from src.services.signal_generator import _ENTITIES_ADAPTER
+
+        def entity(service_line: str, values: list[float], statistics: dict[str, float]) -> dict[str, Any]:
+            return {
+                "encounters": 1000,
+                "entity": [
+                    {"dataset_field": "medicareId", "id": "medicareId", "value": "FACILITY001"},
+                    {"dataset_field": "vizientServiceLine", "id": "vizientServiceLine", "value": service_line},
+                ],
+                "metric": [
+                    {
+                        "metadata": {"metric_id": "losIndex"},
+                        "values": {"timeline": [{"period": f"20240{i + 1}", "value": v} for i, v in enumerate(values)]},
+                    }
+                ],
+                "statistical_methods": [
+                    {
+                        "statistical_method": "statistical_method__simple_zscore",
+                        "anomalies": [],
+                        "statistics": statistics,
+                    }
+                ],
+            }
+
+        temporal_node = _ENTITIES_ADAPTER.validate_python(
+            [
+                entity("Cardiology", [1.2, 1.4], {"peer_mean": 1.0, "peer_std": 0.2}),
+                entity("Cardiology", [9.0, 9.0], {"peer_mean": 1.0, "peer_std": 0.2}),
+                entity("Oncology", [0.8, 0.9], {}),
+            ]
+        )
+        generator = SignalGenerator(nodes_directory=tmp_path)
+
+        index = generator._index_temporal_node(temporal_node)
+
+        assert set(index) == {("FACILITY001", "Cardiology", None), ("FACILITY001", "Oncology", None)}
+        assert index[("FACILITY001", "Cardiology", None)].tolist() == pytest.approx([1.0, 2.0])
+        # Without peer statistics the timeline values are used as a proxy
+        assert index[("FACILITY001", "Oncology", None)].tolist() == pytest.approx([0.8, 0.9])
+
     def test_classification_struggling(self, tmp_path: Path) -> None:
         """Signal classified as STRUGGLING for sustained moderate z-scores."""
         # Create temporal node with sustained moderate z-scores (flat, above 0.75 but below 2.0)
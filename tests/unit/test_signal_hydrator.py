@@ -7,9 +7,11 @@ The SignalHydrator queries fct_signals table populated by dbt.
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from click.testing import CliRunner
 
 from src.db.models import SignalDomain
 from src.services.signal_hydrator import SignalHydrator
+from src.signals.cli import cli
 
 
 @pytest.fixture
@@ -151,6 +153,7 @@ class TestHydrateSignals:
         mock_fct_result = MagicMock()
         mock_fct_result.fetchall.return_value = [tuple(sample_fct_signal_row.values())]
         mock_fct_result.keys.return_value = list(sample_fct_signal_row.keys())
+        mock_fct_result.scalar_one_or_none.return_value = "20251210170210"
         mock_query_session.execute.return_value = mock_fct_result
 
         # Mock bulk upsert (no return value needed, just needs to not raise)
@@ -175,6 +178,39 @@ class TestHydrateSignals:
         assert stats["signals_created"] == 1
         assert stats["signals_skipped"] == 0
 
+    @pytest.mark.asyncio
+    async def test_hydrate_defaults_to_latest_run(self) -> None:
+        """Test that without a run_id only the latest run in fct_signals is queried."""
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = "20251211090000"
+        result.fetchall.return_value = []
+        result.keys.return_value = []
+        session.execute.return_value = result
+
+        hydrator = SignalHydrator(session_factory=MagicMock(side_effect=[_session_context(session)]))
+        await hydrator.hydrate_signals()
+
+        statements = [str(call[0][0]) for call in session.execute.call_args_list]
+        assert "max(run_id)" in statements[0]
+        assert "run_id = '20251211090000'" in statements[1]
+        assert hydrator.run_id == "20251211090000"
+
+    @pytest.mark.asyncio
+    async def test_hydrate_given_run_skips_latest_lookup(self) -> None:
+        """Test that a given run_id is hydrated without looking up the latest run."""
+        session = AsyncMock()
+        result = MagicMock()
+        result.fetchall.return_value = []
+        result.keys.return_value = []
+        session.execute.return_value = result
+
+        hydrator = SignalHydrator(run_id="20251210170210", session_factory=MagicMock(side_effect=[_session_context(session)]))
+        await hydrator.hydrate_signals()
+
+        session.execute.assert_awaited_once()
+        assert "run_id = '20251210170210'" in str(session.execute.call_args[0][0])
+
     @pytest.mark.asyncio
     async def test_hydrate_handles_empty_fct_signals(self) -> None:
         """Test hydration when fct_signals is empty."""
@@ -188,6 +224,7 @@ class TestHydrateSignals:
             mock_fct_result = MagicMock()
             mock_fct_result.fetchall.return_value = []
             mock_fct_result.keys.return_value = []
+            mock_fct_result.scalar_one_or_none.return_value = None
             mock_session.execute.return_value = mock_fct_result
 
             mock_context.__aenter__.return_value = mock_session
@@ -217,6 +254,121 @@ class TestHydrateSignals:
         assert stats["signals_processed"] == 0
 
 
+def _session_context(session: AsyncMock) -> AsyncMock:
+    """Wrap a mock session in an async context manager."""
+    context = AsyncMock()
+    context.__aenter__.return_value = session
+    context.__aexit__.return_value = None
+    return context
+
+
+class TestHydrateInDatabase:
+    """Tests for in-database (INSERT ... SELECT) hydration."""
+
+    def test_projection_query_filters(self) -> None:
+        """Test run and facility filters are bound as parameters."""
+        hydrator = SignalHydrator(run_id="20251210170210", facility_ids=["TEST001"], in_database=True)
+
+        query, params = hydrator._in_database_query()
+        assert "run_id = :run_id" in query
+        assert "facility_id = ANY(:facility_ids)" in query
+        assert params == {"run_id": "20251210170210", "facility_ids": ["TEST001"]}
+
+        query, params = hydrator._in_database_query("TEST001", chunked=True)
+        assert "facility_id = :facility_id" in query
+        assert "ANY(:facility_ids)" not in query
+        assert params == {"run_id": "20251210170210", "facility_id": "TEST001"}
+
+        query, params = hydrator._in_database_query(None, chunked=True)
+        assert "facility_id IS NULL" in query
+        assert params == {"run_id": "20251210170210"}
+
+    @pytest.mark.asyncio
+    async def test_hydrate_runs_one_statement_per_facility(self) -> None:
+        """Test each facility is upserted in its own session and counts are summed."""
+        list_session = AsyncMock()
+        list_result = MagicMock()
+        list_result.fetchall.return_value = [("TEST001", 3), ("TEST002", 5), ("TEST003", 3)]
+        list_result.scalar_one_or_none.return_value = "20251210170210"
+        list_session.execute.return_value = list_result
+
+        chunk_sessions = []
+        for counts in [(2, 1), (0, 3)]:
+            chunk_session = AsyncMock()
+            chunk_result = MagicMock()
+            chunk_result.one.return_value = counts
+            chunk_session.execute.return_value = chunk_result
+            chunk_sessions.append(chunk_session)
+
+        factory = MagicMock(side_effect=[_session_context(s) for s in [list_session, *chunk_sessions]])
+        hydrator = SignalHydrator(session_factory=factory, facility_ids=["TEST001", "TEST003"], in_database=True)
+        stats = await hydrator.hydrate_signals()
+
+        assert stats == {"signals_processed": 6, "signals_created": 2, "signals_updated": 4, "signals_skipped": 0, "chunks_failed": 0}
+        chunk_params = [s.execute.call_args[0][1] for s in chunk_sessions]
+        assert chunk_params == [{"run_id": "20251210170210", "facility_id": "TEST001"}, {"run_id": "20251210170210", "facility_id": "TEST003"}]
+        assert "max(run_id)" in str(list_session.execute.call_args_list[0][0][0])
+        statement = str(chunk_sessions[0].execute.call_args[0][0])
+        assert "INSERT INTO signals" in statement
+        assert "ON CONFLICT ON CONSTRAINT uq_signals_entity_metric_detected" in statement
+        for chunk_session in chunk_sessions:
+            chunk_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_hydrate_with_limit_uses_single_statement(self) -> None:
+        """Test a limit skips facility chunking."""
+        latest_session = AsyncMock()
+        latest_result = MagicMock()
+        latest_result.scalar_one_or_none.return_value = None
+        latest_session.execute.return_value = latest_result
+        session = AsyncMock()
+        result = MagicMock()
+        result.one.return_value = (5, 0)
+        session.execute.return_value = result
+
+        factory = MagicMock(side_effect=[_session_context(latest_session), _session_context(session)])
+        hydrator = SignalHydrator(session_factory=factory, limit=5, in_database=True)
+        stats = await hydrator.hydrate_signals()
+
+        assert stats["signals_created"] == 5
+        assert "LIMIT 5" in str(session.execute.call_args[0][0])
+
+    @pytest.mark.asyncio
+    async def test_hydrate_rolls_back_failed_chunk(self) -> None:
+        """Test a failing chunk is rolled back, its rows counted as skipped, and the rest still run."""
+        list_session = AsyncMock()
+        list_result = MagicMock()
+        list_result.fetchall.return_value = [("TEST001", 4), ("TEST002", 1)]
+        list_result.scalar_one_or_none.return_value = "20251210170210"
+        list_session.execute.return_value = list_result
+
+        failing_session = AsyncMock()
+        failing_session.execute.side_effect = Exception("deadlock detected")
+        ok_session = AsyncMock()
+        ok_result = MagicMock()
+        ok_result.one.return_value = (1, 0)
+        ok_session.execute.return_value = ok_result
+
+        factory = MagicMock(side_effect=[_session_context(s) for s in [list_session, failing_session, ok_session]])
+        stats = await SignalHydrator(session_factory=factory, in_database=True).hydrate_signals()
+
+        failing_session.rollback.assert_awaited_once()
+        assert stats["signals_created"] == 1
+        assert stats["signals_skipped"] == 4
+        assert stats["chunks_failed"] == 1
+
+    def test_cli_exits_nonzero_on_failed_chunks(self) -> None:
+        """Test the hydrate command fails when a chunk was rolled back."""
+        stats = {"signals_processed": 1, "signals_created": 1, "signals_updated": 0, "signals_skipped": 4, "chunks_failed": 1}
+
+        with patch("src.signals.cli._hydrate_async", AsyncMock(return_value=stats)):
+            result = CliRunner().invoke(cli, ["hydrate", "--in-database"])
+
+        assert result.exit_code == 1
+        assert "Signals skipped: 4" in result.output
+        assert "1 chunk(s) failed" in result.stderr
+
+
 class TestGetSignalCount:
     """Tests for signal count retrieval."""
 
@@ -458,3 +610,23 @@ class TestGetTechnicalDetails:
         )
 
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_get_technical_details_uses_given_session(self) -> None:
+        """Test that a passed-in session is used instead of opening a new one."""
+        mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.mappings.return_value.fetchone.return_value = None
+        mock_session.execute.return_value = mock_result
+        mock_session_factory = MagicMock()
+
+        hydrator = SignalHydrator(session_factory=mock_session_factory)
+        result = await hydrator.get_technical_details(
+            canonical_node_id="losIndex__medicareId__aggregate_time_period",
+            session=mock_session,
+        )
+
+        assert result is None
+        mock_session.execute.assert_awaited_once()
+        mock_session_factory.assert_not_called()
+        mock_session.close.assert_not_called()
@@ -0,0 +1,180 @@
+"""Tests for the slow-query recorder and /admin/slow-queries endpoint."""
+
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+
+from src.observability.router import admin_router
+from src.observability.slow_queries import SLOW_QUERIES, SlowQueryRecorder, is_read_only
+
+
+class TestIsReadOnly:
+    """Tests for the statement classification that gates EXPLAIN ANALYZE."""
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "SELECT * FROM signals WHERE id = $1",
+            "  with recent AS (SELECT 1) SELECT * FROM recent",
+        ],
+    )
+    def test_plain_reads(self, statement: str) -> None:
+        """SELECT and WITH statements without writes may be explained."""
+        assert is_read_only(statement)
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "UPDATE signals SET domain = $1",
+            "WITH moved AS (DELETE FROM signals RETURNING *) SELECT count(*) FROM moved",
+            "SELECT * FROM signals WHERE id = $1 FOR UPDATE",
+            "SELECT nextval('signals_id_seq')",
+            "INSERT INTO signals SELECT * FROM staging",
+        ],
+    )
+    def test_writes_and_locks(self, statement: str) -> None:
+        """Writes, data-modifying CTEs and locking reads are never re-run."""
+        assert not is_read_only(statement)
+
+
+class TestSlowQueryRecorder:
+    """Tests for the ring buffer and fingerprint summary."""
+
+    def test_buffer_is_bounded(self) -> None:
+        """The oldest executions are dropped once the buffer is full."""
+        recorder = SlowQueryRecorder(threshold_ms=100, buffer_size=3, explain_sample_rate=0)
+        for i in range(5):
+            recorder.record(f"SELECT * FROM signals WHERE id = {i}", 100 + i)
+
+        assert [entry.duration_ms for entry in recorder.entries()] == [102, 103, 104]
+
+    def test_summary_groups_by_fingerprint_with_percentiles(self) -> None:
+        """Executions differing only in values share a group with nearest-rank percentiles."""
+        recorder = SlowQueryRecorder(threshold_ms=1, explain_sample_rate=0)
+        for i in range(1, 101):
+            recorder.record(f"SELECT * FROM signals WHERE id = {i}", float(i))
+        recorder.record("SELECT count(*) FROM signals", 500.0)
+
+        summary = recorder.summary()
+
+        assert [group["fingerprint"] for group in summary] == ["SELECT count(*) FROM signals", "SELECT * FROM signals WHERE id = ?"]
+        signals = summary[1]
+        assert signals["count"] == 100
+        assert (signals["p50_ms"], signals["p95_ms"], signals["p99_ms"], signals["max_ms"]) == (50.0, 95.0, 99.0, 100.0)
+        assert signals["example"] == "SELECT * FROM signals WHERE id = 100"
+        assert signals["plan"] is None
+
+    def test_listeners_record_statements_over_threshold(self) -> None:
+        """Only statements at least threshold_ms slow are recorded."""
+        recorder = SlowQueryRecorder(threshold_ms=0, explain_sample_rate=0)
+        engine = create_engine("sqlite://")
+        recorder.install(engine)
+        recorder.install(engine)
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        recorder.threshold_ms = 60_000
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 2"))
+
+        assert [entry.fingerprint for entry in recorder.entries()] == ["SELECT ?"]
+
+    @pytest.mark.asyncio
+    async def test_explains_sampled_read_only_statements(self) -> None:
+        """Sampled reads are explained in the background; writes never are."""
+        recorder = SlowQueryRecorder(threshold_ms=1, explain_sample_rate=1)
+        with patch.object(recorder, "_explain", AsyncMock()) as explain:
+            recorder.record("UPDATE signals SET domain = $1", 50, ("x",), "postgresql+asyncpg://db")
+            read = recorder.record("SELECT * FROM signals WHERE id = $1", 50, ("abc",), "postgresql+asyncpg://db")
+            for task in list(recorder._tasks):
+                await task
+
+        explain.assert_awaited_once_with(read, ("abc",), "postgresql+asyncpg://db")
+
+    @pytest.mark.asyncio
+    async def test_failed_explain_is_recorded(self) -> None:
+        """An EXPLAIN failure is kept on the entry and frees the next sample."""
+        recorder = SlowQueryRecorder(threshold_ms=1, explain_sample_rate=1)
+        entry = recorder.record("SELECT 1", 50)
+
+        with patch("src.observability.slow_queries.create_async_engine", side_effect=RuntimeError("no database")):
+            await recorder._explain(entry, (), "postgresql+asyncpg://db")
+
+        assert entry.explain_error == "no database"
+        assert not recorder._explain_running
+
+    @pytest.mark.asyncio
+    async def test_explain_engine_uses_connection_settings(self) -> None:
+        """Behind PgBouncer the EXPLAIN connection also avoids cached named statements."""
+        recorder = SlowQueryRecorder(threshold_ms=1, explain_sample_rate=1)
+        entry = recorder.record("SELECT 1", 50)
+
+        with (
+            patch("src.observability.slow_queries.settings.DB_PGBOUNCER", True),
+            patch("src.observability.slow_queries.create_async_engine", side_effect=RuntimeError("no database")) as create,
+        ):
+            await recorder._explain(entry, (), "postgresql+asyncpg://db")
+
+        options = create.call_args.kwargs
+        assert options["poolclass"] is NullPool
+        assert "pool_size" not in options
+        assert options["connect_args"]["statement_cache_size"] == 0
+        assert options["connect_args"]["prepared_statement_cache_size"] == 0
+        assert "prepared_statement_name_func" in options["connect_args"]
+
+
+class TestSlowQueriesEndpoint:
+    """Tests for the token-guarded admin endpoint."""
+
+    @pytest.fixture
+    def app(self) -> Iterator[FastAPI]:
+        """App serving only the admin router, with an empty recorder."""
+        app = FastAPI()
+        app.include_router(admin_router)
+        SLOW_QUERIES.clear()
+        yield app
+        SLOW_QUERIES.clear()
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_admin_token(self, app: FastAPI) -> None:
+        """Admin endpoints are hidden when ADMIN_TOKEN is not configured."""
+        with patch("src.dependencies.settings.ADMIN_TOKEN", ""):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.get("/admin/slow-queries", headers={"X-Admin-Token": ""})
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_rejects_wrong_token(self, app: FastAPI) -> None:
+        """A missing or wrong X-Admin-Token is forbidden."""
+        with patch("src.dependencies.settings.ADMIN_TOKEN", "secret"):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                missing = await client.get("/admin/slow-queries")
+                wrong = await client.get("/admin/slow-queries", headers={"X-Admin-Token": "guess"})
+
+        assert (missing.status_code, wrong.status_code) == (403, 403)
+
+    @pytest.mark.asyncio
+    async def test_reports_and_clears_groups(self, app: FastAPI) -> None:
+        """The report groups the buffer by fingerprint; DELETE empties it."""
+        SLOW_QUERIES.record("SELECT * FROM signals WHERE id = 1", 120.0)
+        SLOW_QUERIES.record("SELECT * FROM signals WHERE id = 2", 80.0)
+        headers = {"X-Admin-Token": "secret"}
+
+        with patch("src.dependencies.settings.ADMIN_TOKEN", "secret"):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                report = (await client.get("/admin/slow-queries", headers=headers)).json()
+                cleared = await client.delete("/admin/slow-queries", headers=headers)
+                after = (await client.get("/admin/slow-queries", headers=headers)).json()
+
+        assert report["total"] == 2
+        assert report["groups"][0]["fingerprint"] == "SELECT * FROM signals WHERE id = ?"
+        assert report["groups"][0]["p50_ms"] == 80.0
+        assert report["groups"][0]["p99_ms"] == 120.0
+        assert cleared.status_code == 204
+        assert after["groups"] == []
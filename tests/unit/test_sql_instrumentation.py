@@ -0,0 +1,136 @@
+"""Tests for per-request SQL instrumentation."""
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, text
+
+from src.observability.sql_instrumentation import (
+    RequestQueryStats,
+    SqlInstrumentationMiddleware,
+    current_query_stats,
+    fingerprint,
+    install_sql_listeners,
+)
+
+
+def _app(queries: list[str], n_plus_one_threshold: int = 3) -> FastAPI:
+    """Build an instrumented app whose endpoint records the given statements."""
+    app = FastAPI()
+    app.add_middleware(SqlInstrumentationMiddleware, n_plus_one_threshold=n_plus_one_threshold)
+
+    @app.get("/items")
+    async def items() -> dict[str, int]:
+        stats = current_query_stats()
+        assert stats is not None
+        for statement in queries:
+            stats.record(statement, 0.002)
+        return {"count": len(queries)}
+
+    return app
+
+
+class TestFingerprint:
+    """Tests for statement normalization."""
+
+    def test_replaces_literals_and_parameters(self) -> None:
+        """Values and bind parameters do not change the fingerprint."""
+        first = fingerprint("SELECT * FROM signals WHERE id = $1 AND name = 'a' LIMIT 10")
+        second = fingerprint("SELECT *  FROM signals\nWHERE id = $2 AND name = 'b' LIMIT 25")
+        assert first == second == "SELECT * FROM signals WHERE id = ? AND name = ? LIMIT ?"
+
+    def test_collapses_in_lists_and_keeps_casts(self) -> None:
+        """Expanded IN lists of any length share a fingerprint."""
+        assert fingerprint("SELECT 1 WHERE id IN ($1::VARCHAR, $2::VARCHAR)") == "SELECT ? WHERE id IN (?...)"
+        assert fingerprint("SELECT x::text FROM t WHERE y = :y") == "SELECT x::text FROM t WHERE y = ?"
+
+
+class TestRequestQueryStats:
+    """Tests for per-request aggregation."""
+
+    def test_tracks_count_time_and_slowest(self) -> None:
+        """Stats sum durations and keep the slowest statement shape."""
+        stats = RequestQueryStats()
+        stats.record("SELECT 1", 0.001)
+        stats.record("SELECT * FROM signals WHERE id = $1", 0.005)
+
+        assert stats.query_count == 2
+        assert stats.db_time == pytest.approx(0.006)
+        assert stats.slowest_fingerprint == "SELECT * FROM signals WHERE id = ?"
+        assert stats.server_timing(stats.started + 0.01).startswith('db;dur=6.0;desc="2 queries"')
+
+    def test_listeners_record_only_inside_requests(self) -> None:
+        """Engine events record statements only while stats are in context."""
+        from src.observability.sql_instrumentation import _current_stats
+
+        engine = create_engine("sqlite://")
+        install_sql_listeners(engine)
+        install_sql_listeners(engine)
+
+        stats = RequestQueryStats()
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            token = _current_stats.set(stats)
+            try:
+                connection.execute(text("SELECT 2"))
+                connection.execute(text("SELECT 3"))
+            finally:
+                _current_stats.reset(token)
+
+        assert stats.query_count == 2
+        assert stats.shapes == {"SELECT ?": 2}
+
+
+class TestSqlInstrumentationMiddleware:
+    """Tests for the Server-Timing header and request logging."""
+
+    @pytest.mark.asyncio
+    async def test_adds_server_timing_header(self) -> None:
+        """Responses carry the request's DB time and query count."""
+        async with AsyncClient(transport=ASGITransport(app=_app(["SELECT 1", "SELECT 2"])), base_url="http://test") as client:
+            response = await client.get("/items")
+
+        assert response.status_code == 200
+        assert 'desc="2 queries"' in response.headers["server-timing"]
+        assert "total;dur=" in response.headers["server-timing"]
+
+    @pytest.mark.asyncio
+    async def test_logs_n_plus_one(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Repeating one statement shape above the threshold logs a warning."""
+        queries = [f"SELECT * FROM signal_assignments WHERE signal_id = {i}" for i in range(5)]
+        with caplog.at_level(logging.INFO, logger="src.observability.sql_instrumentation"):
+            async with AsyncClient(transport=ASGITransport(app=_app(queries)), base_url="http://test") as client:
+                await client.get("/items")
+
+        request_records = [r for r in caplog.records if r.getMessage().startswith("sql request")]
+        assert len(request_records) == 1
+        assert request_records[0].sql["query_count"] == 5  # type: ignore[attr-defined]
+
+        warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+        assert len(warnings) == 1
+        assert warnings[0].sql["n_plus_one_count"] == 5  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_no_warning_below_threshold(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Distinct or rarely repeated statements are not flagged."""
+        with caplog.at_level(logging.WARNING, logger="src.observability.sql_instrumentation"):
+            async with AsyncClient(transport=ASGITransport(app=_app(["SELECT 1", "SELECT 2", "SELECT 3"])), base_url="http://test") as client:
+                await client.get("/items")
+
+        assert not caplog.records
+
+
+def test_create_app_enables_instrumentation_from_settings() -> None:
+    """create_app adds the middleware only when SQL_INSTRUMENTATION is set."""
+    from unittest.mock import patch
+
+    from src.main import create_app
+
+    def middleware_classes(app: FastAPI) -> list[object]:
+        return [m.cls for m in app.user_middleware]
+
+    assert SqlInstrumentationMiddleware not in middleware_classes(create_app())
+    with patch("src.main.settings.SQL_INSTRUMENTATION", True):
+        assert SqlInstrumentationMiddleware in middleware_classes(create_app())